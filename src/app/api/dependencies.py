@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING
 from fastapi import HTTPException, Request, status
 
 from app.cache.redis import get_cache_client
+from app.core.config import get_settings
 from app.core.events.lifespan import get_llm_client
 from app.parsing.ingredient import IngredientParser
 
@@ -78,6 +79,8 @@ async def get_recipe_management_client(request: Request) -> RecipeManagementClie
 async def get_ingredient_parser() -> IngredientParser:
     """Get the ingredient parser with LLM client.
 
+    The per-line cache uses the Redis cache client when it is available.
+
     Returns:
         IngredientParser instance.
 
@@ -86,13 +89,30 @@ async def get_ingredient_parser() -> IngredientParser:
     """
     try:
         llm_client = get_llm_client()
-        return IngredientParser(llm_client)
     except RuntimeError:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Ingredient parsing service not available",
         ) from None
 
+    config = get_settings().llm.ingredient_parsing
+    cache_client: Redis[bytes] | None = None
+    if config.cache_enabled:
+        try:
+            cache_client = get_cache_client()
+        except RuntimeError:
+            cache_client = None
+
+    return IngredientParser(
+        llm_client,
+        cache_client=cache_client,
+        cache_ttl=config.cache_ttl,
+        chunk_size=config.chunk_size,
+        max_concurrency=config.max_concurrency,
+        fast_path=config.fast_path,
+        min_confidence=config.min_confidence,
+    )
+
 
 async def get_popular_recipes_service(request: Request) -> PopularRecipesService:
     """Get the popular recipes service from app state.
@@ -1,20 +1,23 @@
 """Admin endpoints for system management operations.
 
 Provides:
-- DELETE /admin/cache for clearing all service caches
+- DELETE /admin/cache for invalidating all or selected service cache namespaces
+- DELETE /admin/cache/local for invalidating process-local reference caches
 """
 
 from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.auth.dependencies import CurrentUser, RequirePermissions
 from app.auth.permissions import Permission
+from app.cache.local import clear_local_caches, get_local_cache_names
+from app.cache.namespaces import CacheNamespace  # noqa: TC001
 from app.cache.redis import clear_cache
 from app.observability.logging import get_logger
-from app.schemas.admin import CacheClearResponse
+from app.schemas.admin import CacheClearResponse, LocalCacheClearResponse
 
 
 logger = get_logger(__name__)
@@ -25,18 +28,24 @@ router = APIRouter(tags=["Admin"])
 @router.delete(
     "/admin/cache",
     response_model=CacheClearResponse,
-    summary="Clear all service caches",
+    summary="Clear service caches",
     description=(
-        "Clears all cached data from the service cache. This operation removes "
-        "all cached recipe data, nutritional information, and other cached lookups. "
-        "Use with caution as this may temporarily increase load on downstream services."
+        "Invalidates cached data of the selected cache namespaces (all when none "
+        "is given), such as nutritional information, allergens, LLM completions "
+        "or popular recipes. Each namespace moves to a new generation in constant "
+        "time; old entries are swept in the background. Other namespaces stay "
+        "cached, but invalidated ones temporarily increase load on downstream "
+        "services."
     ),
     responses={
         200: {
             "description": "Cache cleared successfully",
             "content": {
                 "application/json": {
-                    "example": {"message": "Cache cleared successfully"}
+                    "example": {
+                        "message": "Cache cleared successfully",
+                        "generations": {"nutrition": 3},
+                    }
                 }
             },
         },
@@ -67,17 +76,23 @@ router = APIRouter(tags=["Admin"])
 )
 async def clear_cache_endpoint(
     user: Annotated[CurrentUser, Depends(RequirePermissions(Permission.ADMIN_SYSTEM))],
+    namespace: Annotated[
+        list[CacheNamespace] | None,
+        Query(description="Cache namespaces to clear. Clears all when omitted."),
+    ] = None,
 ) -> CacheClearResponse:
-    """Clear all service caches.
+    """Clear service caches.
 
-    This endpoint clears all cached data from the Redis cache instance.
-    It requires ADMIN_SYSTEM permission (available to admin and service roles).
+    This endpoint invalidates cache namespaces in the Redis cache instance
+    by bumping their generations. It requires ADMIN_SYSTEM permission
+    (available to admin and service roles).
 
     Args:
         user: Authenticated user with ADMIN_SYSTEM permission.
+        namespace: Optional namespaces to clear.
 
     Returns:
-        CacheClearResponse with success message.
+        CacheClearResponse with success message and new generations.
 
     Raises:
         HTTPException: 401 if not authenticated.
@@ -88,10 +103,11 @@ async def clear_cache_endpoint(
         "Cache clear requested",
         user_id=user.id,
         user_roles=user.roles,
+        namespaces=namespace,
     )
 
     try:
-        await clear_cache()
+        generations = await clear_cache(namespace)
     except RuntimeError:
         logger.exception("Cache service not initialized")
         raise HTTPException(
@@ -114,6 +130,110 @@ async def clear_cache_endpoint(
     logger.info(
         "Cache cleared successfully",
         user_id=user.id,
+        generations=generations,
+    )
+
+    return CacheClearResponse(
+        message="Cache cleared successfully",
+        generations=generations,
+    )
+
+
+@router.delete(
+    "/admin/cache/local",
+    response_model=LocalCacheClearResponse,
+    summary="Invalidate process-local caches",
+    description=(
+        "Clears the in-process caches for near-static reference tables "
+        "(ingredient portions and pricing) on the instance that serves the "
+        "request. Use after updating those tables to avoid waiting for TTL expiry."
+    ),
+    responses={
+        200: {
+            "description": "Local caches cleared successfully",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "message": "Local caches cleared successfully",
+                        "cleared": {"ingredient_portions": 120},
+                    }
+                }
+            },
+        },
+        401: {
+            "description": "Authentication required",
+            "content": {
+                "application/json": {"example": {"detail": "Not authenticated"}}
+            },
+        },
+        403: {
+            "description": "Insufficient permissions",
+            "content": {
+                "application/json": {"example": {"detail": "Insufficient permissions"}}
+            },
+        },
+        404: {
+            "description": "Unknown local cache name",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "error": "NOT_FOUND",
+                        "message": "Unknown local cache: foo",
+                    }
+                }
+            },
+        },
+    },
+)
+async def clear_local_cache_endpoint(
+    user: Annotated[CurrentUser, Depends(RequirePermissions(Permission.ADMIN_SYSTEM))],
+    name: Annotated[
+        str | None,
+        Query(description="Local cache to clear. Clears all when omitted."),
+    ] = None,
+) -> LocalCacheClearResponse:
+    """Invalidate process-local reference data caches.
+
+    Requires ADMIN_SYSTEM permission (available to admin and service roles).
+
+    Args:
+        user: Authenticated user with ADMIN_SYSTEM permission.
+        name: Optional cache name to clear.
+
+    Returns:
+        LocalCacheClearResponse with entries removed per cache.
+
+    Raises:
+        HTTPException: 401 if not authenticated.
+        HTTPException: 403 if user lacks ADMIN_SYSTEM permission.
+        HTTPException: 404 if name does not match a local cache.
+    """
+    logger.info(
+        "Local cache clear requested",
+        user_id=user.id,
+        user_roles=user.roles,
+        cache=name,
+    )
+
+    try:
+        cleared = clear_local_caches(name)
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": "NOT_FOUND",
+                "message": f"Unknown local cache: {name}",
+                "available": get_local_cache_names(),
+            },
+        ) from None
+
+    logger.info(
+        "Local caches cleared",
+        user_id=user.id,
+        cleared=cleared,
     )
 
-    return CacheClearResponse(message="Cache cleared successfully")
+    return LocalCacheClearResponse(
+        message="Local caches cleared successfully",
+        cleared=cleared,
+    )
@@ -2,17 +2,19 @@
 
 Provides:
 - POST /recipes for scraping a recipe URL and saving to the Recipe Management Service
+- GET /recipes/imports/{jobId} for the status of an import queued with async=true
+- POST /recipes/batch for importing several recipe URLs, streamed back as NDJSON
 - GET /recipes/popular for fetching popular recipes from aggregated sources
 - GET /recipes/{recipeId}/nutritional-info for fetching nutritional data for a recipe
 """
 
 from __future__ import annotations
 
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 
 import orjson
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, status
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse, Response, StreamingResponse
 
 from app.api.dependencies import (
     get_allergen_service,
@@ -27,14 +29,17 @@ from app.api.dependencies import (
 from app.auth.dependencies import CurrentUser, RequirePermissions
 from app.auth.permissions import Permission
 from app.core.config import get_settings
-from app.mappers import build_downstream_recipe_request, build_recipe_response
 from app.observability.logging import get_logger
-from app.parsing.exceptions import IngredientParsingError
+from app.parsing.coalescer import IngredientParseCoalescer
 from app.parsing.ingredient import IngredientParser  # noqa: TC001
 from app.schemas import (
+    BatchCreateRecipeResult,
+    BatchCreateRecipesRequest,
     CreateRecipeRequest,
     CreateRecipeResponse,
     PopularRecipesResponse,
+    Recipe,
+    RecipeImportJobResponse,
 )
 from app.schemas.allergen import RecipeAllergenResponse
 from app.schemas.enums import IngredientUnit
@@ -43,32 +48,37 @@ from app.schemas.nutrition import (
     IngredientNutritionalInfoResponse,
     RecipeNutritionalInfoResponse,
 )
-from app.schemas.recipe import PopularRecipesData
 from app.schemas.recommendations import PairingSuggestionsResponse
 from app.schemas.shopping import RecipeShoppingInfoResponse
 from app.services.allergen.service import AllergenService  # noqa: TC001
 from app.services.nutrition.service import NutritionService  # noqa: TC001
 from app.services.pairings.exceptions import LLMGenerationError as PairingsLLMError
 from app.services.pairings.service import PairingsService, RecipeContext
+from app.services.popular.store import PopularRecipesStore
+from app.services.recipe_import import ImportStage, RecipeImporter, RecipeImportError
 from app.services.recipe_management.client import RecipeManagementClient  # noqa: TC001
 from app.services.recipe_management.exceptions import (
     RecipeManagementError,
     RecipeManagementNotFoundError,
     RecipeManagementUnavailableError,
-    RecipeManagementValidationError,
 )
 from app.services.recipe_management.schemas import (
     IngredientUnit as RecipeIngredientUnit,  # noqa: TC001
 )
-from app.services.scraping.exceptions import (
-    RecipeNotFoundError,
-    ScrapingError,
-    ScrapingFetchError,
-    ScrapingTimeoutError,
-)
 from app.services.scraping.service import RecipeScraperService  # noqa: TC001
 from app.services.shopping.service import ShoppingService  # noqa: TC001
-from app.workers.jobs import enqueue_popular_recipes_refresh
+from app.workers.jobs import (
+    enqueue_popular_recipes_refresh,
+    enqueue_recipe_scrape,
+    get_job_status,
+    get_recipe_import_progress,
+)
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from app.services.recipe_import import RecipeImportResult
 
 
 logger = get_logger(__name__)
@@ -84,9 +94,15 @@ router = APIRouter(tags=["Recipes"])
     description=(
         "Scrapes recipe data from a provided URL and stores it in the database. "
         "Supports most popular recipe websites via recipe-scrapers library and "
-        "JSON-LD structured data as a fallback."
+        "JSON-LD structured data as a fallback. With async=true the import runs "
+        "in a background worker and the response is 202 with a job ID to poll "
+        "at GET /recipes/imports/{jobId}."
     ),
     responses={
+        202: {
+            "description": "Import queued (async=true)",
+            "model": RecipeImportJobResponse,
+        },
         400: {
             "description": "Invalid URL or unsupported website",
             "content": {
@@ -113,7 +129,14 @@ async def create_recipe(
     ],
     parser: Annotated[IngredientParser, Depends(get_ingredient_parser)],
     request: Request,
-) -> CreateRecipeResponse:
+    run_async: Annotated[
+        bool,
+        Query(
+            alias="async",
+            description="Import in a background worker and return a job ID",
+        ),
+    ] = False,
+) -> CreateRecipeResponse | JSONResponse:
     """Create a recipe by scraping a URL.
 
     This endpoint:
@@ -122,6 +145,9 @@ async def create_recipe(
     3. Saves the recipe to the Recipe Management Service
     4. Returns the created recipe
 
+    With ``async=true`` these steps run in an ARQ worker instead and the
+    endpoint returns 202 with the job ID right away.
+
     Args:
         request_body: Request containing the recipe URL.
         user: Authenticated user with RECIPE_CREATE permission.
@@ -129,9 +155,10 @@ async def create_recipe(
         recipe_client: Client for downstream Recipe Management Service.
         parser: Service for parsing ingredients.
         request: The incoming HTTP request.
+        run_async: Queue the import instead of running it inline.
 
     Returns:
-        Created recipe response.
+        Created recipe response, or 202 with the import job.
 
     Raises:
         HTTPException: Various status codes depending on the error.
@@ -142,111 +169,249 @@ async def create_recipe(
         "Creating recipe from URL",
         url=url,
         user_id=user.id,
+        run_async=run_async,
     )
 
-    # Step 1: Scrape the recipe
-    try:
-        scraped = await scraper_service.scrape(url)
-    except RecipeNotFoundError:
-        logger.warning("No recipe found at URL", url=url)
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "error": "RECIPE_NOT_FOUND",
-                "message": "No recipe data found at the provided URL",
-            },
-        ) from None
-    except ScrapingTimeoutError:
-        logger.warning("Scraping timed out", url=url)
-        raise HTTPException(
-            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-            detail={
-                "error": "SCRAPING_TIMEOUT",
-                "message": "Timed out while fetching the recipe URL",
-            },
-        ) from None
-    except ScrapingFetchError as e:
-        logger.warning("Failed to fetch URL", url=url, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "error": "INVALID_RECIPE_URL",
-                "message": f"Unable to fetch the recipe URL: {e}",
-            },
-        ) from None
-    except ScrapingError as e:
-        logger.warning("Scraping failed", url=url, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "error": "SCRAPING_ERROR",
-                "message": f"Failed to scrape recipe: {e}",
-            },
-        ) from None
+    if run_async:
+        job = await enqueue_recipe_scrape(url, user.id, _forwarded_auth_token(request))
+        if job is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail={
+                    "error": "QUEUE_UNAVAILABLE",
+                    "message": "Unable to queue the recipe import",
+                },
+            )
+        queued = RecipeImportJobResponse(
+            job_id=job.job_id,
+            status="queued",
+            stage=ImportStage.QUEUED,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=queued.model_dump(mode="json"),
+            headers={"Location": f"{request.url.path}/imports/{job.job_id}"},
+        )
 
-    # Step 2: Parse ingredients with LLM
+    importer = RecipeImporter(scraper_service, parser, recipe_client)
     try:
-        parsed_ingredients = await parser.parse_batch(scraped.ingredients)
-    except IngredientParsingError as e:
-        logger.warning("Ingredient parsing failed", url=url, error=str(e))
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "INGREDIENT_PARSING_ERROR",
-                "message": "Failed to parse recipe ingredients",
-            },
-        ) from None
+        return await importer.import_recipe(url, _forwarded_auth_token(request))
+    except RecipeImportError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail) from None
 
-    # Step 3: Build downstream request and send to Recipe Management Service
-    downstream_request = build_downstream_recipe_request(scraped, parsed_ingredients)
 
-    # Extract auth token from request for forwarding
-    auth_header = request.headers.get("Authorization", "")
-    auth_token = auth_header.replace("Bearer ", "") if auth_header else ""
+@router.get(
+    "/recipes/imports/{jobId}",
+    response_model=RecipeImportJobResponse,
+    summary="Get the status of an asynchronous recipe import",
+    description=(
+        "Returns the status and current step of an import queued with "
+        "POST /recipes?async=true, and the created recipe once complete."
+    ),
+    responses={
+        401: {"description": "Authentication required"},
+        403: {"description": "Insufficient permissions"},
+        404: {"description": "Import job not found"},
+        503: {"description": "Job queue unavailable"},
+    },
+)
+async def get_recipe_import(
+    job_id: Annotated[str, Path(alias="jobId", description="Import job ID")],
+    user: Annotated[CurrentUser, Depends(RequirePermissions(Permission.RECIPE_CREATE))],
+) -> RecipeImportJobResponse:
+    """Get the status of an asynchronous recipe import.
+
+    Args:
+        job_id: Job ID returned by POST /recipes?async=true.
+        user: Authenticated user with RECIPE_CREATE permission.
+
+    Returns:
+        Job status, progress and result.
 
+    Raises:
+        HTTPException: 404 if the job is unknown or belongs to another user,
+            503 if the job queue is unavailable.
+    """
+    unavailable = HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail={
+            "error": "QUEUE_UNAVAILABLE",
+            "message": "Unable to read the import job status",
+        },
+    )
     try:
-        downstream_response = await recipe_client.create_recipe(
-            downstream_request,
-            auth_token,
-        )
-    except RecipeManagementValidationError as e:
-        logger.warning("Downstream validation failed", error=str(e))
+        progress = await get_recipe_import_progress(job_id)
+    except Exception:
+        logger.exception("Failed to read import progress", job_id=job_id)
+        raise unavailable from None
+
+    if progress is None or progress.user_id != user.id:
         raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            status_code=status.HTTP_404_NOT_FOUND,
             detail={
-                "error": "VALIDATION_ERROR",
-                "message": str(e),
+                "error": "IMPORT_JOB_NOT_FOUND",
+                "message": f"Import job {job_id} not found",
             },
-        ) from None
-    except RecipeManagementUnavailableError:
-        logger.warning("Recipe Management Service unavailable")
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail={
-                "error": "SERVICE_UNAVAILABLE",
-                "message": "Recipe Management Service is not available",
+        )
+
+    job = await get_job_status(job_id)
+    if job is None:
+        raise unavailable
+
+    return _import_job_response(job_id, job, progress.stage)
+
+
+def _import_job_response(
+    job_id: str, job: dict[str, Any], stage: ImportStage
+) -> RecipeImportJobResponse:
+    """Map ARQ job status and the task result to the API response."""
+    job_status = job["status"]
+    if job_status == "deferred":
+        # Deferred jobs are retries waiting for their delay
+        job_status = "queued"
+    if job_status != "complete":
+        return RecipeImportJobResponse(job_id=job_id, status=job_status, stage=stage)
+
+    result = job.get("result")
+    if isinstance(result, dict) and result.get("status") == "completed":
+        return RecipeImportJobResponse(
+            job_id=job_id,
+            status="complete",
+            stage=ImportStage.COMPLETE,
+            recipe=Recipe.model_validate(result["recipe"]),
+        )
+    if isinstance(result, dict) and result.get("status") == "failed":
+        return RecipeImportJobResponse(
+            job_id=job_id,
+            status="failed",
+            stage=ImportStage.FAILED,
+            error=result.get("error"),
+            message=result.get("message"),
+        )
+    return RecipeImportJobResponse(
+        job_id=job_id,
+        status="failed",
+        stage=ImportStage.FAILED,
+        error="INTERNAL_ERROR",
+        message="The import job failed unexpectedly",
+    )
+
+
+@router.post(
+    "/recipes/batch",
+    response_class=StreamingResponse,
+    summary="Create recipes from several URLs",
+    description=(
+        "Scrapes, parses and stores the recipes of several URLs concurrently. "
+        "Results are streamed as newline-delimited JSON, one line per URL in "
+        "completion order. Each line carries the URL's index in the request "
+        "and the status POST /recipes would have returned for it, so one "
+        "failing URL does not fail the batch."
+    ),
+    responses={
+        200: {
+            "description": "One JSON object per line, one line per URL",
+            "content": {
+                "application/x-ndjson": {
+                    "example": {
+                        "index": 0,
+                        "recipeUrl": "https://example.com/recipe",
+                        "status": 400,
+                        "recipe": None,
+                        "error": "RECIPE_NOT_FOUND",
+                        "message": "No recipe data found at the provided URL",
+                    }
+                }
             },
-        ) from None
-    except RecipeManagementError as e:
-        logger.exception("Recipe Management Service error")
+        },
+        400: {"description": "Too many URLs"},
+        401: {"description": "Authentication required"},
+        403: {"description": "Insufficient permissions"},
+        422: {"description": "Request validation error"},
+        503: {"description": "Service unavailable"},
+    },
+)
+async def create_recipes_batch(
+    request_body: BatchCreateRecipesRequest,
+    user: Annotated[CurrentUser, Depends(RequirePermissions(Permission.RECIPE_CREATE))],
+    scraper_service: Annotated[RecipeScraperService, Depends(get_scraper_service)],
+    recipe_client: Annotated[
+        RecipeManagementClient, Depends(get_recipe_management_client)
+    ],
+    parser: Annotated[IngredientParser, Depends(get_ingredient_parser)],
+    request: Request,
+) -> StreamingResponse:
+    """Create recipes by scraping several URLs.
+
+    URLs are imported concurrently, with a cap per host. Ingredient parsing
+    of concurrent imports is merged into shared parser batches, so the LLM
+    receives full chunks and lines shared between recipes are parsed once.
+
+    Args:
+        request_body: Request containing the recipe URLs.
+        user: Authenticated user with RECIPE_CREATE permission.
+        scraper_service: Service for scraping recipes.
+        recipe_client: Client for downstream Recipe Management Service.
+        parser: Service for parsing ingredients.
+        request: The incoming HTTP request.
+
+    Returns:
+        NDJSON stream with one BatchCreateRecipeResult per URL.
+
+    Raises:
+        HTTPException: 400 if the request has more URLs than allowed.
+    """
+    config = get_settings().scraping.batch_import
+    urls = [str(url) for url in request_body.recipe_urls]
+    if len(urls) > config.max_urls:
         raise HTTPException(
-            status_code=status.HTTP_502_BAD_GATEWAY,
+            status_code=status.HTTP_400_BAD_REQUEST,
             detail={
-                "error": "DOWNSTREAM_ERROR",
-                "message": f"Recipe Management Service error: {e}",
+                "error": "TOO_MANY_URLS",
+                "message": f"At most {config.max_urls} URLs per batch",
             },
-        ) from None
+        )
 
-    # Step 4: Build and return response
-    logger.info(
-        "Recipe created successfully",
-        recipe_id=downstream_response.id,
-        title=downstream_response.title,
-        url=url,
-        user_id=user.id,
+    logger.info("Creating recipes from URLs", count=len(urls), user_id=user.id)
+
+    coalescer = IngredientParseCoalescer(
+        parser,
+        window=config.parse_window,
+        max_lines=config.parse_max_lines,
+    )
+    importer = RecipeImporter(scraper_service, coalescer, recipe_client)
+    results = importer.import_many(
+        urls,
+        _forwarded_auth_token(request),
+        max_concurrency=config.max_concurrency,
+        max_per_host=config.max_per_host,
+    )
+    return StreamingResponse(
+        _ndjson_batch_results(results),
+        media_type="application/x-ndjson",
     )
 
-    return build_recipe_response(downstream_response, scraped, parsed_ingredients)
+
+async def _ndjson_batch_results(
+    results: AsyncIterator[RecipeImportResult],
+) -> AsyncIterator[bytes]:
+    """Serialize batch import results as NDJSON lines."""
+    async for result in results:
+        line = BatchCreateRecipeResult(
+            index=result.index,
+            recipe_url=result.url,
+            status=result.status_code,
+            recipe=result.response.recipe if result.response else None,
+            error=result.error.error if result.error else None,
+            message=result.error.message if result.error else None,
+        )
+        yield line.model_dump_json().encode() + b"\n"
+
+
+def _forwarded_auth_token(request: Request) -> str:
+    """Extract the bearer token forwarded to the Recipe Management Service."""
+    auth_header = request.headers.get("Authorization", "")
+    return auth_header.replace("Bearer ", "") if auth_header else ""
 
 
 @router.get(
@@ -322,7 +487,6 @@ async def get_popular_recipes(
     """
     settings = get_settings()
     config = settings.scraping.popular_recipes
-    cache_key = f"popular:{config.cache_key}"
 
     logger.debug(
         "Fetching popular recipes from cache",
@@ -331,30 +495,28 @@ async def get_popular_recipes(
         count_only=count_only,
     )
 
-    # Try to get from cache
+    # Try to get from cache, reading only the pages this request covers
     if cache_client:
+        store = PopularRecipesStore(
+            cache_client,
+            config.cache_key,
+            ttl=config.cache_ttl,
+            page_size=config.page_size,
+        )
         try:
-            cached_bytes = await cache_client.get(cache_key)
-            if cached_bytes:
-                data = PopularRecipesData.model_validate(orjson.loads(cached_bytes))
-                recipes = data.recipes
-
-                # Apply pagination
-                paginated_recipes = recipes[offset : offset + limit]
+            cached = await store.get_range(offset, limit, count_only=count_only)
+            if cached is not None:
+                paginated_recipes, total_count = cached
 
                 # Convert PopularRecipe to WebRecipe for response
-                web_recipes = (
-                    []
-                    if count_only
-                    else [
-                        WebRecipe(recipe_name=r.recipe_name, url=r.url)
-                        for r in paginated_recipes
-                    ]
-                )
+                web_recipes = [
+                    WebRecipe(recipe_name=r.recipe_name, url=r.url)
+                    for r in paginated_recipes
+                ]
 
                 logger.debug(
                     "Returning cached popular recipes",
-                    total_count=data.total_count,
+                    total_count=total_count,
                     returned_count=len(web_recipes),
                 )
 
@@ -362,7 +524,7 @@ async def get_popular_recipes(
                     recipes=web_recipes,
                     limit=limit,
                     offset=offset,
-                    count=data.total_count,
+                    count=total_count,
                 )
         except Exception:
             logger.exception("Error reading popular recipes from cache")
@@ -14,6 +14,8 @@ import httpx
 
 from app.auth.providers.exceptions import AuthServiceUnavailableError
 from app.auth.providers.models import IntrospectionResponse
+from app.cache.namespaces import CacheNamespace, namespaced_key
+from app.clients.http import create_http_client
 from app.observability.logging import get_logger
 
 
@@ -79,16 +81,14 @@ class AuthServiceClient:
         return f"{self.base_url}/oauth2/userinfo"
 
     async def initialize(self) -> None:
-        """Initialize the HTTP client with connection pooling."""
+        """Initialize the HTTP client on the shared connection pool."""
         if self._http_client is not None:
             return
 
-        self._http_client = httpx.AsyncClient(
+        self._http_client = create_http_client(
+            "auth_service",
+            limit_per_host=False,
             timeout=httpx.Timeout(self.timeout),
-            limits=httpx.Limits(
-                max_keepalive_connections=10,
-                max_connections=20,
-            ),
         )
         logger.info(
             "AuthServiceClient initialized",
@@ -109,7 +109,7 @@ class AuthServiceClient:
         Uses a hash of the token to avoid storing the actual token in Redis.
         """
         token_hash = hashlib.sha256(token.encode()).hexdigest()[:16]
-        return f"auth:introspect:{token_hash}"
+        return namespaced_key(CacheNamespace.AUTH_INTROSPECTION, token_hash)
 
     async def _get_cached_result(self, token: str) -> IntrospectionResponse | None:
         """Get cached introspection result if available."""
@@ -4,10 +4,29 @@ This module provides:
 - Redis connection management
 - Caching decorators for functions
 - Cache manager for direct operations
+- Batched multi-key reads and writes
+- Process-local LRU cache tier for reference data
+- Client-side near cache for hot Redis keys (server-assisted invalidation)
+- Versioned cache namespaces (O(1) invalidation)
+- Single-flight coalescing of concurrent cache misses
 - Rate limiting with SlowAPI
 """
 
+from app.cache.batch import cache_get_many, cache_set_many
+from app.cache.client_cache import ClientCachedRedis, RedisClientCache
 from app.cache.decorators import CacheManager, cache, cache_key, cached
+from app.cache.local import (
+    LocalCache,
+    clear_local_caches,
+    configure_local_caches,
+    disable_local_caches,
+)
+from app.cache.namespaces import (
+    CacheNamespace,
+    invalidate_namespaces,
+    namespaced_key,
+    sweep_orphaned_generations,
+)
 from app.cache.rate_limit import (
     limiter,
     rate_limit,
@@ -22,24 +41,36 @@ from app.cache.redis import (
     get_rate_limit_client,
     init_redis_pools,
 )
+from app.cache.single_flight import RedisSingleFlight, SingleFlight
 
 
 __all__ = [
-    # Caching
     "CacheManager",
+    "CacheNamespace",
+    "ClientCachedRedis",
+    "LocalCache",
+    "RedisClientCache",
+    "RedisSingleFlight",
+    "SingleFlight",
     "cache",
+    "cache_get_many",
     "cache_key",
+    "cache_set_many",
     "cached",
-    # Connection management
     "check_redis_health",
+    "clear_local_caches",
     "close_redis_pools",
+    "configure_local_caches",
+    "disable_local_caches",
     "get_cache_client",
     "get_queue_client",
     "get_rate_limit_client",
     "init_redis_pools",
-    # Rate limiting
+    "invalidate_namespaces",
     "limiter",
+    "namespaced_key",
     "rate_limit",
     "rate_limit_auth",
     "setup_rate_limiting",
+    "sweep_orphaned_generations",
 ]
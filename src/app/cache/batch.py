@@ -0,0 +1,60 @@
+"""Batched cache operations.
+
+This module provides multi-key helpers for services that look up many
+cache entries per request (e.g. recipe-level nutrition, allergen and
+shopping lookups):
+- A single MGET for all keys instead of one GET per key
+- A single non-transactional pipeline for all SETEX write-backs
+
+Both helpers raise on Redis errors so callers can keep their own
+error-handling and logging conventions.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from redis.asyncio import Redis
+
+
+async def cache_get_many(
+    client: Redis[Any],
+    keys: Sequence[str],
+) -> list[Any | None]:
+    """Fetch multiple cache keys in one round trip.
+
+    Args:
+        client: Redis client to read from.
+        keys: Cache keys to fetch.
+
+    Returns:
+        Values in the same order as ``keys``, with None for missing keys.
+    """
+    if not keys:
+        return []
+    return list(await client.mget(list(keys)))
+
+
+async def cache_set_many(
+    client: Redis[Any],
+    items: Mapping[str, Any],
+    ttl: int,
+) -> None:
+    """Store multiple cache entries with a TTL in one round trip.
+
+    Args:
+        client: Redis client to write to.
+        items: Mapping of cache key to serialized value.
+        ttl: Time to live in seconds applied to every entry.
+    """
+    if not items:
+        return
+
+    pipe = client.pipeline(transaction=False)
+    for key, value in items.items():
+        pipe.setex(key, ttl, value)
+    await pipe.execute()
@@ -0,0 +1,324 @@
+"""Redis client-side caching for hot read-mostly keys.
+
+Keeps values of selected key prefixes in process memory and relies on
+server-assisted invalidation (``CLIENT TRACKING`` in broadcasting mode) to
+drop them as soon as any client modifies a matching key:
+- A dedicated connection enables tracking for the configured prefixes and
+  receives the invalidation messages
+- Every invalidation evicts the named keys; a flush or a lost tracking
+  connection empties the whole near cache, and nothing is served from it
+  until tracking is re-established
+- Entries are bounded by count (LRU) and age, so a silently broken
+  connection serves a stale value for at most ``max_age`` seconds
+
+The asyncio client of redis-py does not surface RESP3 push frames on
+regular connections, so the tracking connection redirects invalidations
+to itself and reads them from the ``__redis__:invalidate`` channel. The
+server sends the same invalidations as in RESP3 push mode.
+
+This module provides:
+- RedisClientCache: Tracking connection and bounded near cache
+- ClientCachedRedis: Cache client wrapper serving GET/MGET of tracked keys
+  from the near cache
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING, Any
+
+from prometheus_client import Counter
+from redis.asyncio.connection import ConnectionPool
+from redis.exceptions import ResponseError
+
+from app.cache.local import MISSING, LocalCache
+from app.observability.logging import get_logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Sequence
+
+    from redis.asyncio import Redis
+    from redis.asyncio.connection import AbstractConnection
+
+logger = get_logger(__name__)
+
+INVALIDATE_CHANNEL = "__redis__:invalidate"
+
+# Seconds between attempts to re-establish tracking (doubles up to the max)
+RECONNECT_DELAY = 1.0
+MAX_RECONNECT_DELAY = 30.0
+
+CLIENT_CACHE_INVALIDATIONS = Counter(
+    "invalidations",
+    "Near cache invalidations, by reason (key, flush, disconnect)",
+    ["reason"],
+    namespace="recipe_scraper",
+    subsystem="redis_client_cache",
+)
+
+
+class RedisClientCache:
+    """Bounded near cache kept coherent by Redis client tracking.
+
+    Reads must take ``epoch`` before querying Redis and pass it to
+    ``store``: a value is only kept if no invalidation arrived in between,
+    so a write racing the read cannot leave a stale entry behind.
+
+    Example:
+        near_cache = RedisClientCache(url, ["nutrition:"], max_items=10000)
+        near_cache.start()
+    """
+
+    def __init__(
+        self,
+        url: str,
+        prefixes: Sequence[str],
+        *,
+        max_items: int,
+        max_age: float,
+    ) -> None:
+        """Initialize the near cache.
+
+        Args:
+            url: Redis URL of the cache database.
+            prefixes: Key prefixes to track and serve from memory.
+            max_items: Maximum number of entries before LRU eviction.
+            max_age: Seconds an entry is served without being invalidated.
+        """
+        self.prefixes = tuple(prefixes)
+        self._pool: ConnectionPool[Any] = ConnectionPool.from_url(
+            url, decode_responses=True
+        )
+        self._entries: LocalCache[str, Any] = LocalCache(
+            "redis_client_cache", max_items=max_items, ttl=max_age, register=False
+        )
+        self._epoch = 0
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def active(self) -> bool:
+        """Whether invalidations are being received."""
+        return self._entries.enabled
+
+    @property
+    def epoch(self) -> int:
+        """Counter advanced by every invalidation."""
+        return self._epoch
+
+    def tracks(self, key: Any) -> bool:
+        """Whether a key is served from the near cache right now."""
+        return (
+            self._entries.enabled
+            and isinstance(key, str)
+            and key.startswith(self.prefixes)
+        )
+
+    def get(self, key: str) -> Any:
+        """Get a cached value (None if the key was missing in Redis).
+
+        Returns:
+            The value, or MISSING if not cached.
+        """
+        return self._entries.get(key)
+
+    def store(self, key: str, value: Any, epoch: int) -> None:
+        """Cache a value read from Redis.
+
+        Args:
+            key: Tracked key.
+            value: Value returned by Redis.
+            epoch: ``epoch`` taken before the read was sent.
+        """
+        if epoch == self._epoch:
+            self._entries.set(key, value)
+
+    def discard(self, *keys: Any) -> None:
+        """Evict keys written through this process."""
+        tracked = [key for key in keys if self.tracks(key)]
+        if tracked:
+            self._epoch += 1
+        for key in tracked:
+            self._entries.discard(key)
+
+    def start(self) -> None:
+        """Start the tracking connection in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(
+                self._run(), name="redis-client-cache-tracking"
+            )
+
+    async def close(self) -> None:
+        """Stop tracking and empty the near cache."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._deactivate()
+        await self._pool.disconnect()
+
+    async def _run(self) -> None:
+        """Keep a tracking connection open, reconnecting after failures."""
+        delay = RECONNECT_DELAY
+        while True:
+            connection = self._pool.make_connection()
+            try:
+                await self._enable_tracking(connection)
+                self._entries.enabled = True
+                delay = RECONNECT_DELAY
+                logger.info("Redis client-side caching active", prefixes=self.prefixes)
+                while True:
+                    self._handle(await connection.read_response())
+            except ResponseError as e:
+                # Tracking unsupported (Redis < 6) or invalid prefixes
+                logger.warning(
+                    "Redis rejected client tracking, near cache disabled",
+                    error=str(e),
+                )
+                return
+            except Exception as e:
+                logger.warning(
+                    "Redis client tracking connection lost",
+                    error=str(e),
+                    retry_in=delay,
+                )
+            finally:
+                if self._entries.enabled:
+                    CLIENT_CACHE_INVALIDATIONS.labels(reason="disconnect").inc()
+                self._deactivate()
+                await connection.disconnect()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+    async def _enable_tracking(self, connection: AbstractConnection) -> None:
+        """Turn on broadcast tracking redirected to this connection."""
+        await connection.connect()
+        await connection.send_command("CLIENT", "ID")
+        client_id = await connection.read_response()
+
+        prefix_args = [arg for prefix in self.prefixes for arg in ("PREFIX", prefix)]
+        await connection.send_command(
+            "CLIENT", "TRACKING", "ON", "REDIRECT", client_id, "BCAST", *prefix_args
+        )
+        await connection.read_response()
+
+        await connection.send_command("SUBSCRIBE", INVALIDATE_CHANNEL)
+        await connection.read_response()
+
+    def _handle(self, message: Any) -> None:
+        """Apply an invalidation message."""
+        if not isinstance(message, list) or message[0] != "message":
+            return
+
+        self._epoch += 1
+        keys = message[2]
+        if keys is None:
+            # FLUSHDB/FLUSHALL on the server
+            self._entries.clear()
+            CLIENT_CACHE_INVALIDATIONS.labels(reason="flush").inc()
+            return
+
+        for key in keys:
+            self._entries.discard(key)
+        CLIENT_CACHE_INVALIDATIONS.labels(reason="key").inc(len(keys))
+
+    def _deactivate(self) -> None:
+        """Stop serving from memory until tracking is re-established."""
+        self._epoch += 1
+        self._entries.enabled = False
+        self._entries.clear()
+
+
+class ClientCachedRedis:
+    """Cache client wrapper serving tracked keys from a near cache.
+
+    GET and MGET of keys under a tracked prefix are answered from process
+    memory when possible, including keys missing in Redis. Writes through
+    this wrapper evict the local entries right away; writes by other
+    clients (or through pipelines) are evicted by the invalidation
+    messages. Every other command is forwarded unchanged.
+    """
+
+    def __init__(self, client: Redis[Any], near_cache: RedisClientCache) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            client: Cache Redis client.
+            near_cache: Near cache for the tracked prefixes.
+        """
+        self._client = client
+        self._near_cache = near_cache
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward every other attribute to the wrapped client."""
+        return getattr(self._client, name)
+
+    def __await__(self) -> Generator[Any, None, ClientCachedRedis]:
+        """Support ``await client`` like redis.asyncio.Redis."""
+        return self._initialize().__await__()
+
+    async def _initialize(self) -> ClientCachedRedis:
+        await self._client.initialize()
+        return self
+
+    async def get(self, name: Any) -> Any:
+        """GET, served from the near cache for tracked keys."""
+        if not self._near_cache.tracks(name):
+            return await self._client.get(name)
+
+        value = self._near_cache.get(name)
+        if value is not MISSING:
+            return value
+
+        epoch = self._near_cache.epoch
+        value = await self._client.get(name)
+        self._near_cache.store(name, value, epoch)
+        return value
+
+    async def mget(self, keys: Any, *args: Any) -> list[Any]:
+        """MGET, fetching only the keys missing from the near cache."""
+        # Like redis-py: a single key or an iterable of keys, plus more keys
+        names: list[Any] = (
+            [keys, *args] if isinstance(keys, (str, bytes)) else [*keys, *args]
+        )
+        tracked = [self._near_cache.tracks(name) for name in names]
+        if not any(tracked):
+            return await self._client.mget(names)
+
+        values = [
+            self._near_cache.get(name) if is_tracked else MISSING
+            for name, is_tracked in zip(names, tracked, strict=True)
+        ]
+        misses = [i for i, value in enumerate(values) if value is MISSING]
+        if not misses:
+            return values
+
+        epoch = self._near_cache.epoch
+        fetched = await self._client.mget([names[i] for i in misses])
+        for i, value in zip(misses, fetched, strict=True):
+            values[i] = value
+            if tracked[i]:
+                self._near_cache.store(names[i], value, epoch)
+        return values
+
+    async def set(self, name: Any, value: Any, *args: Any, **kwargs: Any) -> Any:
+        """SET, evicting the local entry."""
+        self._near_cache.discard(name)
+        return await self._client.set(name, value, *args, **kwargs)
+
+    async def setex(self, name: Any, time: Any, value: Any) -> Any:
+        """SETEX, evicting the local entry."""
+        self._near_cache.discard(name)
+        return await self._client.setex(name, time, value)
+
+    async def delete(self, *names: Any) -> Any:
+        """DEL, evicting the local entries."""
+        self._near_cache.discard(*names)
+        return await self._client.delete(*names)
+
+    async def unlink(self, *names: Any) -> Any:
+        """UNLINK, evicting the local entries."""
+        self._near_cache.discard(*names)
+        return await self._client.unlink(*names)
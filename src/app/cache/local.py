@@ -0,0 +1,272 @@
+"""Process-local LRU cache tier.
+
+This module provides a bounded, TTL-evicting in-memory cache for near-static
+reference data (portion weights, pricing tables) that would otherwise be
+queried from PostgreSQL on every request.
+
+Features:
+- LRU eviction once max_items is reached
+- Per-entry TTL expiry
+- Negative caching (None results are cached like any other value)
+- Prometheus hit/miss/eviction counters per cache
+- Registry for runtime configuration and admin invalidation
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import TYPE_CHECKING, Any, ClassVar, Final, Literal
+
+from prometheus_client import Counter
+
+from app.observability.logging import get_logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_ITEMS = 10_000
+DEFAULT_TTL_SECONDS = 3600.0
+
+
+class _Missing(Enum):
+    """Sentinel type for cache misses (None is a valid cached value)."""
+
+    MISSING = "MISSING"
+
+
+MISSING: Final = _Missing.MISSING
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+LOCAL_CACHE_HITS = Counter(
+    "hits",
+    "Process-local cache hits",
+    ["cache"],
+    namespace="recipe_scraper",
+    subsystem="local_cache",
+)
+LOCAL_CACHE_MISSES = Counter(
+    "misses",
+    "Process-local cache misses",
+    ["cache"],
+    namespace="recipe_scraper",
+    subsystem="local_cache",
+)
+LOCAL_CACHE_EVICTIONS = Counter(
+    "evictions",
+    "Process-local cache evictions",
+    ["cache", "reason"],
+    namespace="recipe_scraper",
+    subsystem="local_cache",
+)
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+
+class LocalCache[K: Hashable, V]:
+    """Bounded in-process LRU cache with per-entry TTL.
+
+    Instances register themselves by name so they can be configured from
+    settings at startup and invalidated through the admin API. Caches start
+    disabled (every lookup misses) until configure_local_caches enables them.
+
+    Example:
+        _portion_cache: LocalCache[str, Decimal | None] = LocalCache("portions")
+
+        weight = await _portion_cache.get_or_load(key, lambda: fetch(key))
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_items: int = DEFAULT_MAX_ITEMS,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        *,
+        register: bool = True,
+    ) -> None:
+        """Initialize and register the cache.
+
+        Args:
+            name: Unique cache name (used as metrics label).
+            max_items: Maximum number of entries before LRU eviction.
+            ttl: Entry lifetime in seconds.
+            register: Whether configure_local_caches and the admin API
+                manage this cache. Unregistered caches keep their own
+                bounds and are enabled by their owner.
+        """
+        self.name = name
+        self.max_items = max_items
+        self.ttl = ttl
+        self.enabled = False
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        if register:
+            _LocalCacheRegistry.caches[name] = self
+
+    def __len__(self) -> int:
+        """Return the number of stored entries (including expired ones)."""
+        return len(self._entries)
+
+    def get(self, key: K) -> V | Literal[_Missing.MISSING]:
+        """Get a cached value.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The cached value, or MISSING if absent, expired or disabled.
+        """
+        if not self.enabled:
+            return MISSING
+
+        entry = self._entries.get(key)
+        if entry is None:
+            LOCAL_CACHE_MISSES.labels(cache=self.name).inc()
+            return MISSING
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            LOCAL_CACHE_EVICTIONS.labels(cache=self.name, reason="expired").inc()
+            LOCAL_CACHE_MISSES.labels(cache=self.name).inc()
+            return MISSING
+
+        self._entries.move_to_end(key)
+        LOCAL_CACHE_HITS.labels(cache=self.name).inc()
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entries if full.
+
+        Args:
+            key: Cache key.
+            value: Value to cache (None is allowed).
+        """
+        if not self.enabled or self.max_items <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_items:
+            self._entries.popitem(last=False)
+            LOCAL_CACHE_EVICTIONS.labels(cache=self.name, reason="capacity").inc()
+
+    def discard(self, key: K) -> bool:
+        """Remove an entry if present.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            True if an entry was removed.
+        """
+        return self._entries.pop(key, None) is not None
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        """Get a cached value, loading and storing it on a miss.
+
+        Exceptions raised by the loader propagate and nothing is cached.
+
+        Args:
+            key: Cache key.
+            loader: Coroutine factory producing the value on a miss.
+
+        Returns:
+            Cached or freshly loaded value.
+        """
+        cached = self.get(key)
+        if cached is not MISSING:
+            return cached
+
+        value = await loader()
+        self.set(key, value)
+        return value
+
+    def clear(self) -> int:
+        """Remove all entries.
+
+        Returns:
+            Number of entries removed.
+        """
+        count = len(self._entries)
+        self._entries.clear()
+        return count
+
+
+# =============================================================================
+# Registry
+# =============================================================================
+
+
+# Container for registered caches (avoids global statement)
+class _LocalCacheRegistry:
+    caches: ClassVar[dict[str, LocalCache[Any, Any]]] = {}
+
+
+def configure_local_caches(*, enabled: bool, max_items: int, ttl: float) -> None:
+    """Apply settings to every registered local cache.
+
+    Should be called during application startup (lifespan).
+
+    Args:
+        enabled: Whether local caching is enabled.
+        max_items: Maximum entries per cache.
+        ttl: Entry lifetime in seconds.
+    """
+    for local_cache in _LocalCacheRegistry.caches.values():
+        local_cache.enabled = enabled
+        local_cache.max_items = max_items
+        local_cache.ttl = ttl
+        local_cache.clear()
+    logger.info(
+        "Local caches configured",
+        caches=sorted(_LocalCacheRegistry.caches),
+        enabled=enabled,
+        max_items=max_items,
+        ttl=ttl,
+    )
+
+
+def disable_local_caches() -> None:
+    """Disable and empty every registered local cache.
+
+    Should be called during application shutdown (lifespan).
+    """
+    for local_cache in _LocalCacheRegistry.caches.values():
+        local_cache.enabled = False
+        local_cache.clear()
+
+
+def clear_local_caches(name: str | None = None) -> dict[str, int]:
+    """Invalidate registered local caches.
+
+    Args:
+        name: Cache to clear. If None, clears every registered cache.
+
+    Returns:
+        Mapping of cleared cache names to the number of entries removed.
+
+    Raises:
+        KeyError: If name does not match a registered cache.
+    """
+    if name is not None:
+        return {name: _LocalCacheRegistry.caches[name].clear()}
+    return {
+        cache_name: local_cache.clear()
+        for cache_name, local_cache in _LocalCacheRegistry.caches.items()
+    }
+
+
+def get_local_cache_names() -> list[str]:
+    """Get the names of all registered local caches."""
+    return sorted(_LocalCacheRegistry.caches)
@@ -0,0 +1,245 @@
+"""Versioned cache namespaces.
+
+Cache keys of a namespace embed the namespace's current generation, so a
+whole namespace is invalidated in O(1) by incrementing its counter instead
+of deleting (or flushing) keys:
+- ``<namespace>:<key>``: generation 0, the layout used before any
+  invalidation (existing entries stay valid on rollout)
+- ``<namespace>:g<generation>:<key>``: every later generation
+
+Counters live in the ``cache:generations`` hash. Each process keeps them in
+memory, loaded at startup and refreshed in the background, so building a
+key costs no round trip; other processes pick up an invalidation within
+the refresh interval. Entries of older generations are unreachable and
+are removed by the ``cleanup_expired_cache`` sweeper (or their TTL).
+
+This module provides:
+- CacheNamespace: Namespaces invalidated as a unit
+- namespaced_key: Build a key in the current generation of a namespace
+- invalidate_namespaces: Bump namespace generations
+- sweep_orphaned_generations: SCAN+UNLINK entries of older generations
+- load_generations / start_generation_refresh / stop_generation_refresh:
+  Process lifecycle of the in-memory counters
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import re
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from prometheus_client import Counter
+
+from app.observability.logging import get_logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from redis.asyncio import Redis
+
+
+logger = get_logger(__name__)
+
+GENERATIONS_KEY = "cache:generations"
+
+# Keys scanned per SCAN call and unlinked per UNLINK call
+SWEEP_BATCH_SIZE = 500
+
+_GENERATION_PATTERN = re.compile(r"g(\d+):")
+
+CACHE_KEYS_SWEPT = Counter(
+    "keys_swept",
+    "Cache keys of superseded namespace generations removed by the sweeper",
+    ["namespace"],
+    namespace="recipe_scraper",
+    subsystem="cache_namespace",
+)
+
+
+class CacheNamespace(StrEnum):
+    """Cache key namespaces, each invalidated as a unit.
+
+    Values are the key prefixes the owning services already use.
+    """
+
+    NUTRITION = "nutrition"
+    ALLERGEN = "allergen"
+    OPEN_FOOD_FACTS = "off"
+    SUBSTITUTION = "substitution"
+    PAIRING = "pairing"
+    SHOPPING = "shopping"
+    INGREDIENT_PARSE = "ingredient_parse"
+    LLM_COMPLETION = "llm:generate"
+    AUTH_INTROSPECTION = "auth:introspect"
+    SCRAPE = "recipe:scraped"
+    POPULAR = "popular"
+
+
+class _Generations:
+    """In-memory copy of the namespace generation counters."""
+
+    current: ClassVar[dict[str, int]] = {}
+    task: ClassVar[asyncio.Task[None] | None] = None
+
+
+def namespaced_key(namespace: str, key: str) -> str:
+    """Build a cache key in the current generation of a namespace.
+
+    Args:
+        namespace: Namespace (a CacheNamespace value).
+        key: Key within the namespace.
+
+    Returns:
+        The full Redis key.
+    """
+    generation = _Generations.current.get(namespace, 0)
+    if generation == 0:
+        return f"{namespace}:{key}"
+    return f"{namespace}:g{generation}:{key}"
+
+
+def get_generations() -> dict[str, int]:
+    """Get the generations known to this process.
+
+    Returns:
+        Generation per namespace (0 for never invalidated ones).
+    """
+    return {ns.value: _Generations.current.get(ns, 0) for ns in CacheNamespace}
+
+
+async def load_generations(client: Redis[Any]) -> dict[str, int]:
+    """Read the generation counters from Redis into this process.
+
+    Args:
+        client: Cache Redis client.
+
+    Returns:
+        Generation per namespace.
+    """
+    _Generations.current = await _read_generations(client)
+    return get_generations()
+
+
+async def invalidate_namespaces(
+    client: Redis[Any],
+    namespaces: Iterable[str],
+) -> dict[str, int]:
+    """Invalidate namespaces by bumping their generations.
+
+    Takes effect immediately in this process and within the refresh
+    interval in every other one.
+
+    Args:
+        client: Cache Redis client.
+        namespaces: Namespaces to invalidate.
+
+    Returns:
+        New generation per invalidated namespace.
+    """
+    targets = [CacheNamespace(ns).value for ns in namespaces]
+    pipe = client.pipeline(transaction=True)
+    for namespace in targets:
+        pipe.hincrby(GENERATIONS_KEY, namespace, 1)
+    results = await pipe.execute()
+
+    generations = dict(zip(targets, (int(r) for r in results), strict=True))
+    _Generations.current = {**_Generations.current, **generations}
+    return generations
+
+
+async def sweep_orphaned_generations(
+    client: Redis[Any],
+    *,
+    batch_size: int = SWEEP_BATCH_SIZE,
+) -> dict[str, int]:
+    """Remove entries of superseded generations.
+
+    Scans each invalidated namespace and unlinks keys older than its
+    current generation, in batches so Redis is never blocked. Generations
+    are read from Redis, not from this process, and keys of newer
+    generations are left alone.
+
+    Args:
+        client: Cache Redis client.
+        batch_size: Keys per SCAN and per UNLINK call.
+
+    Returns:
+        Number of keys removed per namespace (only namespaces that were
+        invalidated at least once).
+    """
+    generations = await _read_generations(client)
+    swept: dict[str, int] = {}
+    for namespace in CacheNamespace:
+        current = generations.get(namespace, 0)
+        if current == 0:
+            continue
+
+        removed = 0
+        batch: list[Any] = []
+        async for key in client.scan_iter(match=f"{namespace}:*", count=batch_size):
+            name = key.decode() if isinstance(key, bytes) else key
+            if _key_generation(namespace, name) < current:
+                batch.append(key)
+            if len(batch) >= batch_size:
+                removed += await client.unlink(*batch)
+                batch = []
+        if batch:
+            removed += await client.unlink(*batch)
+
+        if removed:
+            CACHE_KEYS_SWEPT.labels(namespace=namespace.value).inc(removed)
+        swept[namespace.value] = removed
+    return swept
+
+
+def start_generation_refresh(client: Redis[Any], interval: float) -> None:
+    """Start refreshing the generation counters in the background.
+
+    Args:
+        client: Cache Redis client.
+        interval: Seconds between refreshes (0 disables refreshing).
+    """
+    if interval > 0 and _Generations.task is None:
+        _Generations.task = asyncio.create_task(
+            _refresh_loop(client, interval), name="cache-generation-refresh"
+        )
+
+
+async def stop_generation_refresh() -> None:
+    """Stop the background refresh of the generation counters."""
+    task = _Generations.task
+    if task is None:
+        return
+    _Generations.task = None
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
+
+async def _refresh_loop(client: Redis[Any], interval: float) -> None:
+    """Reload the generation counters every ``interval`` seconds."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await load_generations(client)
+        except Exception as e:
+            logger.warning("Failed to refresh cache generations", error=str(e))
+
+
+async def _read_generations(client: Redis[Any]) -> dict[str, int]:
+    """Read the generation counters from Redis."""
+    raw = await client.hgetall(GENERATIONS_KEY)
+    generations: dict[str, int] = {}
+    for field, value in raw.items():
+        name = field.decode() if isinstance(field, bytes) else field
+        generations[name] = int(value)
+    return generations
+
+
+def _key_generation(namespace: str, key: str) -> int:
+    """Generation a key of a namespace was written in."""
+    match = _GENERATION_PATTERN.match(key, len(namespace) + 1)
+    return int(match.group(1)) if match else 0
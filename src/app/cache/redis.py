@@ -3,21 +3,33 @@
 This module provides:
 - Async Redis connection pool management
 - Multiple Redis instances for different purposes (cache, queue, rate limit)
+- Opt-in client-side near cache in front of the cache client
 - Connection lifecycle management via lifespan events
+- Namespace-scoped cache invalidation
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 import redis.asyncio as redis
 from redis.asyncio.connection import ConnectionPool
 
+from app.cache.client_cache import ClientCachedRedis, RedisClientCache
+from app.cache.namespaces import (
+    CacheNamespace,
+    invalidate_namespaces,
+    load_generations,
+    start_generation_refresh,
+    stop_generation_refresh,
+)
 from app.core.config import get_settings
 from app.observability.logging import get_logger
 
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from redis.asyncio import Redis
 
 logger = get_logger(__name__)
@@ -32,6 +44,9 @@ _cache_client: Redis[Any] | None = None
 _queue_client: Redis[Any] | None = None
 _rate_limit_client: Redis[Any] | None = None
 
+# Near cache for tracked cache keys (when enabled)
+_client_cache: RedisClientCache | None = None
+
 
 async def init_redis_pools() -> None:
     """Initialize Redis connection pools.
@@ -40,6 +55,7 @@ async def init_redis_pools() -> None:
     """
     global _cache_pool, _queue_pool, _rate_limit_pool  # noqa: PLW0603
     global _cache_client, _queue_client, _rate_limit_client  # noqa: PLW0603
+    global _client_cache  # noqa: PLW0603
 
     settings = get_settings()
 
@@ -86,6 +102,24 @@ async def init_redis_pools() -> None:
         logger.exception("Failed to connect to Redis")
         raise
 
+    # Near cache for hot read-mostly keys
+    if settings.redis.client_cache_enabled and settings.redis.client_cache_prefixes:
+        _client_cache = RedisClientCache(
+            settings.redis_cache_url,
+            settings.redis.client_cache_prefixes,
+            max_items=settings.redis.client_cache_max_items,
+            max_age=settings.redis.client_cache_max_age,
+        )
+        _client_cache.start()
+        _cache_client = cast(
+            "Redis[Any]", ClientCachedRedis(_cache_client, _client_cache)
+        )
+
+    # Namespace generations are part of every versioned cache key
+    generations = await load_generations(_cache_client)
+    start_generation_refresh(_cache_client, settings.redis.generation_refresh_interval)
+    logger.debug("Loaded cache namespace generations", generations=generations)
+
 
 async def close_redis_pools() -> None:
     """Close Redis connection pools.
@@ -94,9 +128,16 @@ async def close_redis_pools() -> None:
     """
     global _cache_pool, _queue_pool, _rate_limit_pool  # noqa: PLW0603
     global _cache_client, _queue_client, _rate_limit_client  # noqa: PLW0603
+    global _client_cache  # noqa: PLW0603
 
     logger.info("Closing Redis connections")
 
+    await stop_generation_refresh()
+
+    if _client_cache:
+        await _client_cache.close()
+        _client_cache = None
+
     if _cache_client:
         await _cache_client.close()
         _cache_client = None
@@ -210,19 +251,33 @@ async def check_redis_health() -> dict[str, str]:
     return results
 
 
-async def clear_cache() -> None:
-    """Clear all keys from the cache Redis instance.
+async def clear_cache(
+    namespaces: Sequence[str] | None = None,
+) -> dict[str, int]:
+    """Invalidate cache namespaces.
 
-    This flushes the entire cache database. Only affects the cache instance,
+    Bumps the generation of each namespace instead of deleting keys, so
+    the cost does not depend on the number of cached entries and other
+    namespaces stay warm. Entries of the previous generation are removed
+    by the cleanup_expired_cache sweeper. Only affects the cache instance,
     not the queue or rate limit instances.
 
+    Args:
+        namespaces: Namespaces to invalidate. Invalidates all when omitted.
+
+    Returns:
+        New generation per invalidated namespace.
+
     Raises:
         RuntimeError: If cache client is not initialized.
+        ValueError: If a namespace is unknown.
     """
     if _cache_client is None:
         msg = "Redis cache client not initialized. Call init_redis_pools() first."
         raise RuntimeError(msg)
 
-    logger.info("Clearing cache database")
-    await _cache_client.flushdb()
-    logger.info("Cache database cleared")
+    targets = list(namespaces) if namespaces else list(CacheNamespace)
+    logger.info("Invalidating cache namespaces", namespaces=targets)
+    generations = await invalidate_namespaces(_cache_client, targets)
+    logger.info("Cache namespaces invalidated", generations=generations)
+    return generations
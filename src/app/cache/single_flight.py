@@ -0,0 +1,277 @@
+"""Request coalescing (single-flight) for expensive cache-miss work.
+
+When many requests miss the same cache key at once, only one of them (the
+leader) should do the expensive work, e.g. an LLM generation; the others
+(followers) wait for and share the leader's result.
+
+This module provides:
+- SingleFlight: coalesces concurrent calls within one process
+- RedisSingleFlight: additionally coordinates replicas through a Redis lock,
+  with followers polling the cache until the leader has written its result
+- Prometheus counters for leaders, followers and lock fallbacks
+"""
+
+from __future__ import annotations
+
+import asyncio
+import secrets
+from typing import TYPE_CHECKING
+
+from prometheus_client import Counter
+
+from app.observability.logging import get_logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from redis.asyncio import Redis
+
+logger = get_logger(__name__)
+
+DEFAULT_LOCK_TTL_SECONDS = 120.0
+DEFAULT_WAIT_TIMEOUT_SECONDS = 120.0
+DEFAULT_POLL_INTERVAL_SECONDS = 0.25
+DEFAULT_LOCK_KEY_PREFIX = "lock"
+
+# Delete the lock only if it is still held by the releasing token
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+SINGLE_FLIGHT_CALLS = Counter(
+    "calls",
+    "Single-flight calls by role (leader, follower, remote_wait, fallback)",
+    ["flight", "role"],
+    namespace="recipe_scraper",
+    subsystem="single_flight",
+)
+
+
+# =============================================================================
+# In-Process Coalescing
+# =============================================================================
+
+
+class SingleFlight[T]:
+    """Coalesce concurrent calls sharing a key into one execution.
+
+    The leader's work runs in its own task, so a cancelled caller does not
+    cancel the result the remaining followers are waiting for. Results and
+    exceptions are shared by every caller of the same flight; nothing is
+    remembered once the flight completes.
+
+    Example:
+        _flight: SingleFlight[Result | None] = SingleFlight("substitution")
+
+        result = await _flight.do(cache_key, lambda: generate(name))
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            name: Flight name (used as metrics label).
+        """
+        self.name = name
+        self._inflight: dict[str, asyncio.Task[T]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of keys currently in flight."""
+        return len(self._inflight)
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        recheck: Callable[[], Awaitable[T | None]] | None = None,
+    ) -> T:
+        """Run ``fn`` once for all concurrent callers of ``key``.
+
+        Args:
+            key: Coalescing key (usually the cache key).
+            fn: Coroutine factory doing the work on behalf of every caller.
+            recheck: Optional cache read used by cross-process variants to
+                pick up a result produced elsewhere. Unused in-process.
+
+        Returns:
+            The leader's result.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._execute(key, fn, recheck))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+            SINGLE_FLIGHT_CALLS.labels(flight=self.name, role="leader").inc()
+        else:
+            SINGLE_FLIGHT_CALLS.labels(flight=self.name, role="follower").inc()
+            logger.debug("Joined in-flight request", flight=self.name, key=key)
+
+        return await asyncio.shield(task)
+
+    async def _execute(
+        self,
+        key: str,  # noqa: ARG002 - used by subclasses
+        fn: Callable[[], Awaitable[T]],
+        recheck: Callable[[], Awaitable[T | None]] | None,  # noqa: ARG002
+    ) -> T:
+        """Do the leader's work."""
+        return await fn()
+
+    def _finish(self, key: str, task: asyncio.Task[T]) -> None:
+        """Forget a completed flight and mark its outcome as retrieved."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Avoid "exception was never retrieved" when every caller went away
+        if not task.cancelled():
+            task.exception()
+
+
+# =============================================================================
+# Cross-Replica Coalescing
+# =============================================================================
+
+
+class RedisSingleFlight[T](SingleFlight[T]):
+    """Single-flight coordinated across replicas with a Redis lock.
+
+    Within a process, calls are coalesced exactly like SingleFlight, so each
+    replica has at most one contender per key. The contender that wins
+    ``SET NX`` on the lock key does the work; the others poll ``recheck``
+    (typically a cache read) until the result appears, the lock is released,
+    or ``wait_timeout`` passes, then run the work themselves as a fallback.
+
+    Redis errors never fail the call: the work simply runs locally.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        client: Redis[bytes],
+        *,
+        lock_ttl: float = DEFAULT_LOCK_TTL_SECONDS,
+        wait_timeout: float = DEFAULT_WAIT_TIMEOUT_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        lock_prefix: str = DEFAULT_LOCK_KEY_PREFIX,
+    ) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            name: Flight name (used as metrics label).
+            client: Redis client holding the locks.
+            lock_ttl: Lock lifetime in seconds (bounds a crashed leader).
+            wait_timeout: Maximum seconds a follower waits for a remote leader.
+            poll_interval: Seconds between follower cache/lock checks.
+            lock_prefix: Prefix prepended to coalescing keys for lock keys.
+        """
+        super().__init__(name)
+        self._client = client
+        self.lock_ttl = lock_ttl
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self.lock_prefix = lock_prefix
+
+    async def _execute(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        recheck: Callable[[], Awaitable[T | None]] | None,
+    ) -> T:
+        """Acquire the replica-wide lock or wait for the remote leader."""
+        lock_key = f"{self.lock_prefix}:{key}"
+        token = secrets.token_hex(16)
+
+        try:
+            acquired = await self._client.set(
+                lock_key, token, nx=True, px=int(self.lock_ttl * 1000)
+            )
+        except Exception as e:
+            logger.warning(
+                "Single-flight lock unavailable, running locally",
+                flight=self.name,
+                key=key,
+                error=str(e),
+            )
+            return await fn()
+
+        if acquired:
+            try:
+                # Another replica may have finished between our miss and the lock
+                if recheck is not None:
+                    cached = await recheck()
+                    if cached is not None:
+                        return cached
+                return await fn()
+            finally:
+                await self._release(lock_key, token)
+
+        result = await self._wait_for_leader(key, lock_key, recheck)
+        if result is not None:
+            SINGLE_FLIGHT_CALLS.labels(flight=self.name, role="remote_wait").inc()
+            return result
+
+        SINGLE_FLIGHT_CALLS.labels(flight=self.name, role="fallback").inc()
+        logger.info(
+            "Remote single-flight leader produced no result, running locally",
+            flight=self.name,
+            key=key,
+        )
+        return await fn()
+
+    async def _wait_for_leader(
+        self,
+        key: str,
+        lock_key: str,
+        recheck: Callable[[], Awaitable[T | None]] | None,
+    ) -> T | None:
+        """Poll until the remote leader's result is readable or it gives up.
+
+        Returns:
+            The result read through ``recheck``, or None if the lock was
+            released without a result or the wait timed out.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.wait_timeout
+
+        while loop.time() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            if recheck is not None:
+                cached = await recheck()
+                if cached is not None:
+                    return cached
+            try:
+                if not await self._client.exists(lock_key):
+                    break
+            except Exception as e:
+                logger.warning(
+                    "Single-flight lock check failed",
+                    flight=self.name,
+                    key=key,
+                    error=str(e),
+                )
+                break
+
+        # The leader may have written its result just before releasing
+        if recheck is not None:
+            return await recheck()
+        return None
+
+    async def _release(self, lock_key: str, token: str) -> None:
+        """Release the lock if this call still owns it."""
+        try:
+            await self._client.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)  # type: ignore[no-untyped-call]
+        except Exception as e:
+            logger.warning(
+                "Single-flight lock release failed",
+                flight=self.name,
+                key=lock_key,
+                error=str(e),
+            )
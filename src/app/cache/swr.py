@@ -0,0 +1,154 @@
+"""Stale-while-revalidate cache entries.
+
+Entries carry two expiries:
+- A soft expiry stored inside the entry: past it the value is stale, but
+  is still served immediately while a background job regenerates it
+- A hard expiry enforced by the Redis TTL: past it the entry is gone and
+  the next reader pays for regeneration
+
+This module provides:
+- Envelope encoding/decoding (entries written before SWR are read as fresh)
+- Background revalidation scheduling through the ARQ queue, deduplicated
+  per cache key by job ID
+- Prometheus counter for stale hits
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+from prometheus_client import Counter
+
+from app.observability.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+# Marker key distinguishing SWR envelopes from plain cached JSON
+SWR_ENVELOPE_KEY = "__swr__"
+
+REVALIDATION_JOB_ID_PREFIX = "swr"
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+SWR_STALE_HITS = Counter(
+    "stale_hits",
+    "Stale cache entries served while revalidating, by enqueue outcome",
+    ["cache", "revalidation"],
+    namespace="recipe_scraper",
+    subsystem="swr",
+)
+
+
+# =============================================================================
+# Envelope
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class SWREntry:
+    """Decoded cache entry.
+
+    Attributes:
+        value: Cached JSON value.
+        soft_expires_at: Unix time after which the value is stale, or None
+            for entries written without an envelope.
+    """
+
+    value: Any
+    soft_expires_at: float | None = None
+
+    @property
+    def stale(self) -> bool:
+        """Whether the entry is past its soft expiry."""
+        return self.soft_expires_at is not None and time.time() >= self.soft_expires_at
+
+
+def encode_swr_entry(value: Any, fresh_ttl: float) -> bytes:
+    """Wrap a JSON-serializable value in an SWR envelope.
+
+    Args:
+        value: Value to cache (must be serializable by orjson).
+        fresh_ttl: Seconds until the entry becomes stale.
+
+    Returns:
+        Serialized envelope. Store it with the hard TTL as Redis expiry.
+    """
+    return orjson.dumps(
+        {SWR_ENVELOPE_KEY: time.time() + fresh_ttl, "value": value},
+    )
+
+
+def decode_swr_entry(raw: bytes | str) -> SWREntry:
+    """Decode a cached entry.
+
+    Args:
+        raw: Raw bytes or string read from Redis.
+
+    Returns:
+        Decoded entry. Plain JSON (written before SWR) is treated as fresh.
+
+    Raises:
+        orjson.JSONDecodeError: If the entry is not valid JSON.
+    """
+    data = orjson.loads(raw)
+    if isinstance(data, dict) and SWR_ENVELOPE_KEY in data:
+        return SWREntry(value=data.get("value"), soft_expires_at=data[SWR_ENVELOPE_KEY])
+    return SWREntry(value=data)
+
+
+# =============================================================================
+# Revalidation
+# =============================================================================
+
+
+async def schedule_revalidation(
+    cache: str,
+    cache_key: str,
+    function_name: str,
+    *args: Any,
+    **kwargs: Any,
+) -> bool:
+    """Enqueue a background job regenerating a stale entry.
+
+    The job ID is derived from the cache key, so concurrent stale hits for
+    the same entry enqueue a single job. Failures are logged and swallowed:
+    the caller has already got a (stale) value to serve.
+
+    Args:
+        cache: Cache name (used as metrics label).
+        cache_key: Key of the stale entry.
+        function_name: ARQ task regenerating the entry.
+        *args: Positional arguments for the task.
+        **kwargs: Keyword arguments for the task.
+
+    Returns:
+        True if a job was enqueued, False if one is already pending for this
+        key or enqueueing failed.
+    """
+    # Imported here: the worker module imports the LLM clients, which use SWR
+    from app.workers.jobs import enqueue_job  # noqa: PLC0415
+
+    job = await enqueue_job(
+        function_name,
+        *args,
+        _job_id=f"{REVALIDATION_JOB_ID_PREFIX}:{cache_key}",
+        **kwargs,
+    )
+    enqueued = job is not None
+    SWR_STALE_HITS.labels(
+        cache=cache, revalidation="enqueued" if enqueued else "skipped"
+    ).inc()
+    logger.debug(
+        "Serving stale cache entry",
+        cache=cache,
+        cache_key=cache_key,
+        revalidation_enqueued=enqueued,
+    )
+    return enqueued
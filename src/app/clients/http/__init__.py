@@ -0,0 +1,29 @@
+"""Shared outbound HTTP client package.
+
+Provides named httpx clients sending through one pooled transport with
+per-host limits, keep-alive tuning, optional HTTP/2 and DNS caching.
+"""
+
+from app.clients.http.dns import CachingNetworkBackend, DnsCache
+from app.clients.http.registry import (
+    HttpClientRegistry,
+    close_http_clients,
+    create_http_client,
+    get_http_client_registry,
+    init_http_clients,
+)
+from app.clients.http.transport import OutboundTransport, PoolStats, http2_available
+
+
+__all__ = [
+    "CachingNetworkBackend",
+    "DnsCache",
+    "HttpClientRegistry",
+    "OutboundTransport",
+    "PoolStats",
+    "close_http_clients",
+    "create_http_client",
+    "get_http_client_registry",
+    "http2_available",
+    "init_http_clients",
+]
@@ -0,0 +1,210 @@
+"""DNS result caching for outbound connections.
+
+httpcore resolves the host name for every new connection. When a popular
+refresh opens several connections to the same recipe site, each of them
+pays for the lookup. This module caches resolved addresses for a short TTL
+and plugs into httpcore as a network backend.
+
+This module provides:
+- DnsCache: TTL cache of resolved addresses per (host, port)
+- CachingNetworkBackend: httpcore network backend connecting to cached
+  addresses
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import socket
+import time
+from typing import TYPE_CHECKING
+
+import httpcore
+from prometheus_client import Counter
+
+from app.observability.logging import get_logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from httpcore import SOCKET_OPTION
+
+
+logger = get_logger(__name__)
+
+DEFAULT_DNS_TTL = 300.0
+DEFAULT_DNS_MAX_ENTRIES = 1024
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+DNS_LOOKUPS = Counter(
+    "dns_lookups",
+    "Outbound host name resolutions, by cache result",
+    ["result"],
+    namespace="recipe_scraper",
+    subsystem="http_client",
+)
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+
+class DnsCache:
+    """TTL cache of resolved addresses."""
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_DNS_TTL,
+        max_entries: int = DEFAULT_DNS_MAX_ENTRIES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds a resolution is reused.
+            max_entries: Maximum cached hosts; the oldest entry is evicted.
+        """
+        self._ttl = ttl
+        self._max_entries = max(1, max_entries)
+        self._entries: dict[tuple[str, int], tuple[float, list[str]]] = {}
+
+    def __len__(self) -> int:
+        """Number of cached hosts."""
+        return len(self._entries)
+
+    async def resolve(self, host: str, port: int) -> list[str]:
+        """Resolve a host name to its addresses.
+
+        Args:
+            host: Host name.
+            port: Port (part of the key, as getaddrinfo results may differ).
+
+        Returns:
+            Addresses in resolver order.
+
+        Raises:
+            OSError: If resolution fails (failures are not cached).
+        """
+        key = (host, port)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            DNS_LOOKUPS.labels(result="hit").inc()
+            return entry[1]
+
+        DNS_LOOKUPS.labels(result="miss").inc()
+        addresses = await self._lookup(host, port)
+        if key not in self._entries and len(self._entries) >= self._max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + self._ttl, addresses)
+        return addresses
+
+    def invalidate(self, host: str, port: int) -> None:
+        """Drop a cached resolution (e.g. after all addresses failed).
+
+        Args:
+            host: Host name.
+            port: Port.
+        """
+        self._entries.pop((host, port), None)
+
+    @staticmethod
+    async def _lookup(host: str, port: int) -> list[str]:
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, port, type=socket.SOCK_STREAM
+        )
+        addresses: list[str] = []
+        for *_, sockaddr in infos:
+            address = str(sockaddr[0])
+            if address not in addresses:
+                addresses.append(address)
+        return addresses
+
+
+# =============================================================================
+# Network Backend
+# =============================================================================
+
+
+def _is_ip_address(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+class CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """httpcore network backend resolving host names through a DnsCache.
+
+    Connections are opened to the cached addresses in order. TLS still
+    uses the original host name for SNI and certificate checks, which
+    httpcore takes from the request origin rather than from this backend.
+    """
+
+    def __init__(
+        self,
+        dns_cache: DnsCache,
+        backend: httpcore.AsyncNetworkBackend | None = None,
+    ) -> None:
+        """Initialize the backend.
+
+        Args:
+            dns_cache: Cache used for name resolution.
+            backend: Backend opening the connections (AnyIO by default).
+        """
+        self._dns_cache = dns_cache
+        self._backend = backend or httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,  # noqa: ASYNC109 - httpcore interface
+        local_address: str | None = None,
+        socket_options: Iterable[SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        """Open a TCP connection to the first reachable cached address."""
+        if _is_ip_address(host):
+            return await self._backend.connect_tcp(
+                host, port, timeout, local_address, socket_options
+            )
+
+        try:
+            addresses = await self._dns_cache.resolve(host, port)
+        except OSError as e:
+            raise httpcore.ConnectError(str(e)) from e
+
+        error: Exception | None = None
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address, port, timeout, local_address, socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                error = e
+
+        # Addresses may have moved, resolve again on the next attempt
+        self._dns_cache.invalidate(host, port)
+        logger.debug("All cached addresses failed", host=host, port=port)
+        if error is None:
+            msg = f"No addresses for {host}"
+            raise httpcore.ConnectError(msg)
+        raise error
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,  # noqa: ASYNC109 - httpcore interface
+        socket_options: Iterable[SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        """Open a Unix socket connection (no resolution involved)."""
+        return await self._backend.connect_unix_socket(path, timeout, socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        """Sleep using the wrapped backend."""
+        await self._backend.sleep(seconds)
@@ -0,0 +1,274 @@
+"""Shared outbound HTTP client registry.
+
+Every outbound client (recipe scraping, popular recipes, Open Food Facts,
+the auth service, the Recipe Management Service) gets its own
+httpx.AsyncClient for headers, timeouts and redirects, but they all send
+through one OutboundTransport: one connection pool, one DNS cache and one
+set of per-host limits. Clients of internal services (auth, Recipe
+Management) skip the per-host limit, which is meant for third-party sites.
+
+httpx only reads HTTP(S)_PROXY, ALL_PROXY and NO_PROXY for clients
+without an explicit transport, so clients mount the proxies from the
+environment themselves; proxied requests bypass the shared transport.
+
+This module provides:
+- HttpClientRegistry: Owner of the shared transport
+- init_http_clients / close_http_clients / get_http_client_registry:
+  Global registry lifecycle (lifespan, ARQ worker)
+- create_http_client: Named client on the shared transport, or on its own
+  pool when no registry is initialized (scripts, tests)
+- Prometheus gauge for pool utilization
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from httpx._utils import get_environment_proxies
+from prometheus_client import Gauge
+
+from app.clients.http.dns import DnsCache
+from app.clients.http.transport import OutboundTransport, PoolStats
+from app.core.config import get_settings
+from app.observability.logging import get_logger
+
+
+if TYPE_CHECKING:
+    from app.core.config.settings import HttpClientSettings
+
+
+logger = get_logger(__name__)
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+OUTBOUND_POOL_CONNECTIONS = Gauge(
+    "pool_connections",
+    "Connections in the shared outbound pool, by state",
+    ["state"],
+    namespace="recipe_scraper",
+    subsystem="http_client",
+)
+
+
+# =============================================================================
+# Registry
+# =============================================================================
+
+
+def _build_transport(settings: HttpClientSettings) -> OutboundTransport:
+    return OutboundTransport(
+        limits=httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry,
+        ),
+        max_connections_per_host=settings.max_connections_per_host,
+        http2=settings.http2,
+        dns_cache=DnsCache(ttl=settings.dns_cache_ttl),
+    )
+
+
+def _env_proxy_mounts(http2: bool) -> dict[str, httpx.AsyncBaseTransport | None]:
+    """Proxy transports from the environment, as httpx would mount them.
+
+    NO_PROXY patterns map to None, which routes them to the client's own
+    transport.
+    """
+    return {
+        pattern: None
+        if url is None
+        else httpx.AsyncHTTPTransport(proxy=url, http2=http2)
+        for pattern, url in get_environment_proxies().items()
+    }
+
+
+class _ClientTransport(httpx.AsyncBaseTransport):
+    """A named client's view of an OutboundTransport.
+
+    Closing a client closes its view; the transport itself is only closed
+    when the view owns it.
+    """
+
+    def __init__(
+        self,
+        transport: OutboundTransport,
+        client: str,
+        *,
+        owned: bool,
+        limit_per_host: bool,
+    ) -> None:
+        self._transport = transport
+        self._client = client
+        self._owned = owned
+        self._limit_per_host = limit_per_host
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.send_request(
+            request, client=self._client, limit_per_host=self._limit_per_host
+        )
+
+    async def aclose(self) -> None:
+        if self._owned:
+            await self._transport.aclose()
+
+
+def _client(
+    transport: _ClientTransport, http2: bool, **kwargs: Any
+) -> httpx.AsyncClient:
+    mounts = _env_proxy_mounts(http2) if kwargs.get("trust_env", True) else {}
+    return httpx.AsyncClient(transport=transport, mounts=mounts, **kwargs)
+
+
+class HttpClientRegistry:
+    """Owner of the shared outbound transport.
+
+    Example:
+        ```python
+        registry = HttpClientRegistry(settings.http_client)
+
+        client = registry.client("scraping", timeout=30.0)
+        response = await client.get("https://example.com")
+        await client.aclose()  # the shared pool stays open
+
+        await registry.aclose()
+        ```
+    """
+
+    def __init__(self, settings: HttpClientSettings) -> None:
+        """Initialize the registry and its transport.
+
+        Args:
+            settings: Pool, keep-alive, HTTP/2 and DNS cache configuration.
+        """
+        self._transport = _build_transport(settings)
+        if settings.http2 and not self._transport.http2:
+            logger.warning("HTTP/2 enabled but h2 is not installed, using HTTP/1.1")
+
+    @property
+    def transport(self) -> OutboundTransport:
+        """The shared transport."""
+        return self._transport
+
+    def client(
+        self, name: str, *, limit_per_host: bool = True, **kwargs: Any
+    ) -> httpx.AsyncClient:
+        """Create a client sending through the shared transport.
+
+        Args:
+            name: Client name for metrics.
+            limit_per_host: Apply the per-host limit (False for internal
+                services).
+            **kwargs: httpx.AsyncClient options (headers, timeout, ...).
+
+        Returns:
+            A client whose aclose() leaves the shared pool open.
+        """
+        transport = _ClientTransport(
+            self._transport, name, owned=False, limit_per_host=limit_per_host
+        )
+        return _client(transport, self._transport.http2, **kwargs)
+
+    def pool_stats(self) -> PoolStats:
+        """Snapshot of shared pool utilization."""
+        return self._transport.pool_stats()
+
+    async def aclose(self) -> None:
+        """Close the shared transport and its connections."""
+        await self._transport.aclose()
+
+
+# =============================================================================
+# Global Registry
+# =============================================================================
+
+
+class _RegistryHolder:
+    registry: HttpClientRegistry | None = None
+
+
+def init_http_clients(
+    settings: HttpClientSettings | None = None,
+) -> HttpClientRegistry:
+    """Create the global outbound HTTP client registry.
+
+    Should be called during application startup (lifespan) and ARQ worker
+    startup, before the services creating clients are initialized.
+
+    Args:
+        settings: Configuration (defaults to settings.http_client).
+
+    Returns:
+        The registry.
+    """
+    resolved = settings or get_settings().http_client
+    registry = HttpClientRegistry(resolved)
+    _RegistryHolder.registry = registry
+
+    OUTBOUND_POOL_CONNECTIONS.labels(state="active").set_function(
+        lambda: registry.pool_stats().active
+    )
+    OUTBOUND_POOL_CONNECTIONS.labels(state="idle").set_function(
+        lambda: registry.pool_stats().idle
+    )
+
+    logger.info(
+        "Outbound HTTP clients initialized",
+        max_connections=resolved.max_connections,
+        max_connections_per_host=resolved.max_connections_per_host,
+        http2=registry.transport.http2,
+        env_proxies=sorted(get_environment_proxies()),
+    )
+    return registry
+
+
+async def close_http_clients() -> None:
+    """Close the global registry's shared transport.
+
+    Should be called during application shutdown, after the services
+    using it.
+    """
+    registry, _RegistryHolder.registry = _RegistryHolder.registry, None
+    if registry is not None:
+        for state in ("active", "idle"):
+            OUTBOUND_POOL_CONNECTIONS.labels(state=state).set_function(lambda: 0)
+        await registry.aclose()
+        logger.debug("Outbound HTTP clients closed")
+
+
+def get_http_client_registry() -> HttpClientRegistry | None:
+    """Get the global registry, or None when not initialized."""
+    return _RegistryHolder.registry
+
+
+def create_http_client(
+    name: str, *, limit_per_host: bool = True, **kwargs: Any
+) -> httpx.AsyncClient:
+    """Create a named outbound HTTP client.
+
+    Uses the shared transport when the registry is initialized. Otherwise
+    (scripts, tests) the client gets its own transport with the same
+    configuration, closed together with the client.
+
+    Args:
+        name: Client name for metrics.
+        limit_per_host: Apply the per-host limit (False for internal
+            services).
+        **kwargs: httpx.AsyncClient options (headers, timeout, ...).
+
+    Returns:
+        The client. Callers close it with aclose() as usual.
+    """
+    registry = _RegistryHolder.registry
+    if registry is not None:
+        return registry.client(name, limit_per_host=limit_per_host, **kwargs)
+
+    transport = _build_transport(get_settings().http_client)
+    return _client(
+        _ClientTransport(transport, name, owned=True, limit_per_host=limit_per_host),
+        transport.http2,
+        **kwargs,
+    )
@@ -0,0 +1,305 @@
+"""Pooled outbound HTTP transport.
+
+An httpx transport tuned for talking to many third-party sites:
+- Per-host limit on concurrent requests, so a burst against one recipe
+  site queues for its warm connections instead of opening new ones; the
+  wait counts against the request's pool timeout
+- Keep-alive limits and expiry from configuration
+- Optional HTTP/2 (negotiated via ALPN with the sites that support it)
+- Host name resolution through a DnsCache
+
+This module provides:
+- OutboundTransport: The transport
+- PoolStats: Connection pool utilization snapshot
+- http2_available: Whether the optional h2 package is installed
+- Prometheus metrics for requests, per-host queueing and new connections
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import httpcore
+import httpx
+from prometheus_client import Counter, Gauge
+
+from app.clients.http.dns import CachingNetworkBackend
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    from app.clients.http.dns import DnsCache
+
+    _Trace = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 8
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+OUTBOUND_REQUESTS = Counter(
+    "requests",
+    "Outbound HTTP requests sent through the shared transport",
+    ["client"],
+    namespace="recipe_scraper",
+    subsystem="http_client",
+)
+OUTBOUND_CONNECTIONS_OPENED = Counter(
+    "connections_opened",
+    "New outbound TCP connections (requests minus these reused a connection)",
+    ["client"],
+    namespace="recipe_scraper",
+    subsystem="http_client",
+)
+OUTBOUND_ACTIVE_REQUESTS = Gauge(
+    "active_requests",
+    "Outbound requests holding a per-host slot until their response closes",
+    ["client"],
+    namespace="recipe_scraper",
+    subsystem="http_client",
+)
+OUTBOUND_WAITING_REQUESTS = Gauge(
+    "waiting_requests",
+    "Outbound requests waiting for a per-host slot",
+    ["client"],
+    namespace="recipe_scraper",
+    subsystem="http_client",
+)
+
+
+def http2_available() -> bool:
+    """Whether HTTP/2 support (the optional h2 package) is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True, slots=True)
+class PoolStats:
+    """Connection pool utilization.
+
+    Attributes:
+        active: Connections serving a request.
+        idle: Kept-alive connections available for reuse.
+        hosts: Hosts with requests in flight or queued.
+    """
+
+    active: int
+    idle: int
+    hosts: int
+
+
+# =============================================================================
+# Per-host Limiting
+# =============================================================================
+
+
+def _pool_timeout(request: httpx.Request) -> float | None:
+    """The request's pool timeout, which also bounds waiting for a host slot."""
+    timeout: dict[str, float | None] = request.extensions.get("timeout", {})
+    return timeout.get("pool")
+
+
+class _HostSlots:
+    """Concurrency slots for one host, dropped once unused."""
+
+    def __init__(self, limit: int) -> None:
+        self.semaphore = asyncio.Semaphore(limit)
+        self.users = 0
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response stream calling back once when the response is closed."""
+
+    def __init__(
+        self, stream: httpx.AsyncByteStream, release: Callable[[], None]
+    ) -> None:
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            release, self._release = self._release, None
+            if release is not None:
+                release()
+
+
+# =============================================================================
+# Transport
+# =============================================================================
+
+
+class OutboundTransport(httpx.AsyncHTTPTransport):
+    """httpx transport with per-host limits, DNS caching and pool metrics.
+
+    A request holds its host's slot until the response is closed, which
+    is when httpcore returns the connection to the pool.
+
+    Example:
+        ```python
+        transport = OutboundTransport(
+            limits=httpx.Limits(max_connections=100, keepalive_expiry=30),
+            max_connections_per_host=8,
+            http2=True,
+            dns_cache=DnsCache(ttl=300),
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get("https://example.com")
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        limits: httpx.Limits,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        http2: bool = False,
+        dns_cache: DnsCache | None = None,
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            limits: Pool-wide connection and keep-alive limits.
+            max_connections_per_host: Concurrent requests per host.
+            http2: Offer HTTP/2 via ALPN (ignored without the h2 package).
+            dns_cache: Cache for host name resolution, or None to resolve
+                on every new connection.
+        """
+        self._http2 = http2 and http2_available()
+        super().__init__(limits=limits, http2=self._http2)
+        # httpx does not expose httpcore's network backend, so build the
+        # pool here to resolve names through the DNS cache
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http2=self._http2,
+            network_backend=(
+                CachingNetworkBackend(dns_cache) if dns_cache is not None else None
+            ),
+        )
+        self._max_per_host = max(1, max_connections_per_host)
+        self._hosts: dict[str, _HostSlots] = {}
+
+    @property
+    def http2(self) -> bool:
+        """Whether HTTP/2 is offered to servers."""
+        return self._http2
+
+    def pool_stats(self) -> PoolStats:
+        """Snapshot of connection pool utilization."""
+        connections = self._pool.connections
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return PoolStats(
+            active=len(connections) - idle,
+            idle=idle,
+            hosts=len(self._hosts),
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request, waiting for a slot on its host first."""
+        return await self.send_request(request, client="default")
+
+    async def send_request(
+        self, request: httpx.Request, *, client: str, limit_per_host: bool = True
+    ) -> httpx.Response:
+        """Send a request on behalf of a named client.
+
+        Args:
+            request: Request to send.
+            client: Client name for metrics.
+            limit_per_host: Wait for a slot on the request's host first.
+                Clients of internal services opt out and are only bounded
+                by the pool.
+
+        Returns:
+            The response; its host slot is released when it is closed.
+
+        Raises:
+            httpx.PoolTimeout: No host slot freed up within the request's
+                pool timeout.
+        """
+        OUTBOUND_REQUESTS.labels(client=client).inc()
+        request.extensions = {
+            **request.extensions,
+            "trace": self._tracer(client, request.extensions.get("trace")),
+        }
+        if not limit_per_host:
+            return await super().handle_async_request(request)
+
+        release = await self._acquire(request, client)
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = _ReleasingStream(response.stream, release)
+        return response
+
+    async def _acquire(self, request: httpx.Request, client: str) -> Callable[[], None]:
+        """Wait for a slot on the request's host, within its pool timeout.
+
+        Returns:
+            Callback releasing the slot.
+        """
+        host = request.url.netloc.decode("ascii")
+        slots = self._hosts.get(host)
+        if slots is None:
+            slots = self._hosts[host] = _HostSlots(self._max_per_host)
+        slots.users += 1
+
+        waiting = OUTBOUND_WAITING_REQUESTS.labels(client=client)
+        waiting.inc()
+        try:
+            async with asyncio.timeout(_pool_timeout(request)):
+                await slots.semaphore.acquire()
+        except TimeoutError as e:
+            self._leave(host, slots)
+            msg = f"Timed out waiting for a connection slot to {host}"
+            raise httpx.PoolTimeout(msg, request=request) from e
+        except BaseException:
+            self._leave(host, slots)
+            raise
+        finally:
+            waiting.dec()
+
+        active = OUTBOUND_ACTIVE_REQUESTS.labels(client=client)
+        active.inc()
+
+        def release() -> None:
+            active.dec()
+            slots.semaphore.release()
+            self._leave(host, slots)
+
+        return release
+
+    def _leave(self, host: str, slots: _HostSlots) -> None:
+        slots.users -= 1
+        if slots.users == 0 and self._hosts.get(host) is slots:
+            del self._hosts[host]
+
+    @staticmethod
+    def _tracer(client: str, inner: _Trace | None) -> _Trace:
+        """httpcore trace hook counting new connections."""
+
+        async def trace(event: str, info: dict[str, Any]) -> None:
+            if event == "connection.connect_tcp.complete":
+                OUTBOUND_CONNECTIONS_OPENED.labels(client=client).inc()
+            if inner is not None:
+                await inner(event, info)
+
+        return trace
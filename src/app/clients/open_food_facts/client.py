@@ -11,6 +11,8 @@ from typing import TYPE_CHECKING, Final
 import httpx
 import orjson
 
+from app.cache.namespaces import namespaced_key
+from app.clients.http import create_http_client
 from app.observability.logging import get_logger
 from app.schemas.enums import Allergen
 
@@ -95,7 +97,7 @@ class OpenFoodFactsClient:
     async def initialize(self) -> None:
         """Initialize the HTTP client if not provided."""
         if self._http is None:
-            self._http = httpx.AsyncClient(timeout=10.0)
+            self._http = create_http_client("open_food_facts", timeout=10.0)
         logger.info("OpenFoodFactsClient initialized")
 
     async def shutdown(self) -> None:
@@ -215,7 +217,7 @@ class OpenFoodFactsClient:
             return None
 
         try:
-            cache_key = f"{self.CACHE_PREFIX}:{name.lower()}"
+            cache_key = namespaced_key(self.CACHE_PREFIX, name.lower())
             cached = await self._cache.get(cache_key)
             if cached:
                 return self._deserialize(cached)
@@ -229,7 +231,7 @@ class OpenFoodFactsClient:
             return
 
         try:
-            cache_key = f"{self.CACHE_PREFIX}:{name.lower()}"
+            cache_key = namespaced_key(self.CACHE_PREFIX, name.lower())
             await self._cache.setex(
                 cache_key,
                 self.CACHE_TTL,
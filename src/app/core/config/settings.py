@@ -13,7 +13,7 @@ from __future__ import annotations
 
 from enum import StrEnum
 from functools import lru_cache
-from typing import TYPE_CHECKING, Annotated
+from typing import TYPE_CHECKING, Annotated, Literal
 
 from pydantic import BaseModel, BeforeValidator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -133,7 +133,36 @@ class RedisSettings(BaseModel):
     cache_db: int = 0
     queue_db: int = 1
     rate_limit_db: int = 2
-    client_cache_max_age: int = 30
+
+    # Opt-in near cache for cache keys under client_cache_prefixes, kept
+    # coherent by server-assisted invalidation (CLIENT TRACKING, Redis 6+)
+    client_cache_enabled: bool = False
+    client_cache_prefixes: list[str] = []  # Must not overlap each other
+    client_cache_max_items: int = 10000
+    client_cache_max_age: int = 30  # Seconds an entry is served at most
+
+    # Seconds between reloads of the cache namespace generations; other
+    # processes see an invalidation after at most this delay (0 = never)
+    generation_refresh_interval: float = 5.0
+
+
+class IngredientIndexSettings(BaseModel):
+    """In-process ingredient name resolution index configuration."""
+
+    enabled: bool = True
+    refresh_interval: int = 3600  # Seconds between catalog reloads (0 = never)
+
+
+class ReferenceCacheSettings(BaseModel):
+    """Process-local cache for near-static reference tables.
+
+    Covers ingredient_portions, ingredient_pricing, food_group_pricing and
+    popular_recipe_pages.
+    """
+
+    enabled: bool = True
+    max_items: int = 10000  # Maximum entries per table cache
+    ttl: int = 3600  # Entry lifetime in seconds
 
 
 class DatabaseSettings(BaseModel):
@@ -148,6 +177,8 @@ class DatabaseSettings(BaseModel):
     max_pool_size: int = 20  # Maximum connections in pool
     command_timeout: float = 30.0  # Query timeout in seconds
     ssl: bool = False  # Enable SSL connection
+    ingredient_index: IngredientIndexSettings = IngredientIndexSettings()
+    reference_cache: ReferenceCacheSettings = ReferenceCacheSettings()
 
 
 class RateLimitingSettings(BaseModel):
@@ -193,6 +224,16 @@ class OllamaSettings(BaseModel):
     max_retries: int = 2
 
 
+class GroqRateLimitSettings(BaseModel):
+    """Shared Groq rate limiter configuration."""
+
+    burst: int = 2
+    interactive_reserve: int = 1
+    max_wait: float = 30.0
+    low_watermark: float = 0.1
+    slowdown_factor: float = 0.5
+
+
 class GroqSettings(BaseModel):
     """Groq LLM service configuration."""
 
@@ -201,6 +242,7 @@ class GroqSettings(BaseModel):
     timeout: float = 30.0
     max_retries: int = 2
     requests_per_minute: float = 30.0  # Groq free tier rate limit
+    rate_limit: GroqRateLimitSettings = GroqRateLimitSettings()
 
 
 class LLMFallbackSettings(BaseModel):
@@ -208,6 +250,11 @@ class LLMFallbackSettings(BaseModel):
 
     enabled: bool = True
     secondary_provider: str = "groq"
+    hedging_enabled: bool = True  # Hedge primary requests slower than its p95
+    hedge_min_samples: int = 20
+    latency_window: int = 100
+    circuit_failure_threshold: int = 5
+    circuit_reset_seconds: float = 30.0
 
 
 class LLMCacheSettings(BaseModel):
@@ -215,6 +262,26 @@ class LLMCacheSettings(BaseModel):
 
     enabled: bool = True
     ttl: int = 3600
+    stale_ttl: int = 0
+
+
+class LLMBatchingSettings(BaseModel):
+    """Micro-batching of structured LLM requests."""
+
+    enabled: bool = True
+    window_ms: int = 20  # Wait for compatible requests after the first one
+    max_batch_size: int = 4
+
+
+class IngredientParsingSettings(BaseModel):
+    """Ingredient parsing configuration (fast path, per-line cache, LLM chunks)."""
+
+    fast_path: bool = True  # Parse lines with the rule-based parser first
+    min_confidence: float = 0.8  # Rule-based confidence needed to skip the LLM
+    cache_enabled: bool = True
+    cache_ttl: int = 2592000  # 30 days
+    chunk_size: int = 10  # Lines per LLM request
+    max_concurrency: int = 4  # Concurrent LLM requests per batch
 
 
 class LLMSettings(BaseModel):
@@ -226,6 +293,8 @@ class LLMSettings(BaseModel):
     groq: GroqSettings = GroqSettings()
     fallback: LLMFallbackSettings = LLMFallbackSettings()
     cache: LLMCacheSettings = LLMCacheSettings()
+    batching: LLMBatchingSettings = LLMBatchingSettings()
+    ingredient_parsing: IngredientParsingSettings = IngredientParsingSettings()
 
 
 class FeaturesSettings(BaseModel):
@@ -258,6 +327,7 @@ class PopularRecipeSourceSettings(BaseModel):
     enabled: bool = True
     max_recipes: int = 100  # Max recipes to fetch from this source
     source_weight: float = 1.0  # Base weight for this source (0-1)
+    refresh_interval: int | None = None  # Seconds between fetches (None: default)
 
 
 class PopularRecipesSettings(BaseModel):
@@ -266,10 +336,15 @@ class PopularRecipesSettings(BaseModel):
     enabled: bool = True
     cache_ttl: int = 86400  # 24 hours
     cache_key: str = "popular_recipes"
+    page_size: int = 20  # Recipes per cached page
     refresh_threshold: int = 3600  # Refresh when TTL < 1 hour
+    source_refresh_interval: int = 21600  # Refetch a source every 6 hours
+    detail_fresh_ttl: int = 43200  # Reuse detail-page metrics for 12 hours
     target_total: int = 500  # Target ~500 recipes total
     fetch_timeout: float = 30.0
     max_concurrent_fetches: int = 5
+    max_body_bytes: int = 5242880  # 5 MiB, larger pages are truncated
+    stop_after_jsonld: bool = True  # Stop reading once rated Recipe JSON-LD seen
     sources: list[PopularRecipeSourceSettings] = []
     scoring: PopularRecipeScoringSettings = PopularRecipeScoringSettings()
 
@@ -283,14 +358,35 @@ class PopularRecipesSettings(BaseModel):
     max_links_to_process: int = 100
 
 
+class ParseExecutorSettings(BaseModel):
+    """Executor running CPU-bound HTML parsing off the event loop."""
+
+    mode: Literal["process", "thread", "inline"] = "process"
+    max_workers: int = 2  # Pool size for process and thread modes
+
+
+class BatchImportSettings(BaseModel):
+    """Batch recipe import (POST /recipes/batch) configuration."""
+
+    max_urls: int = 100  # URLs accepted per request
+    max_concurrency: int = 8  # Imports running at once per request
+    max_per_host: int = 2  # Imports running at once against one site
+    parse_window: float = 0.05  # Seconds to collect parse calls into one batch
+    parse_max_lines: int = 200  # Lines that trigger a merged parse early
+
+
 class ScrapingSettings(BaseModel):
     """Recipe scraping configuration."""
 
     fetch_timeout: float = 30.0
+    max_body_bytes: int = 5242880  # 5 MiB, larger pages are rejected
     max_retries: int = 2
     cache_enabled: bool = True
     cache_ttl: int = 86400  # 24 hours
     cache_max_items: int = 1000
+    validator_ttl: int = 604800  # 7 days kept past cache_ttl for revalidation
+    parse_executor: ParseExecutorSettings = ParseExecutorSettings()
+    batch_import: BatchImportSettings = BatchImportSettings()
     popular_recipes: PopularRecipesSettings = PopularRecipesSettings()
 
 
@@ -310,6 +406,17 @@ class DownstreamServicesSettings(BaseModel):
     )
 
 
+class HttpClientSettings(BaseModel):
+    """Shared outbound HTTP connection pool configuration."""
+
+    max_connections: int = 100
+    max_connections_per_host: int = 8
+    max_keepalive_connections: int = 40
+    keepalive_expiry: float = 30.0
+    http2: bool = False  # Requires the h2 package (not a dependency)
+    dns_cache_ttl: float = 300.0
+
+
 class ArqJobIdsSettings(BaseModel):
     """Centralized job IDs for ARQ background tasks.
 
@@ -378,6 +485,7 @@ class Settings(BaseSettings):
     llm: LLMSettings = LLMSettings()
     scraping: ScrapingSettings = ScrapingSettings()
     downstream_services: DownstreamServicesSettings = DownstreamServicesSettings()
+    http_client: HttpClientSettings = HttpClientSettings()
     arq: ArqSettings = ArqSettings()
 
     # =========================================================================
@@ -11,12 +11,25 @@ from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING
 
 from app.auth.providers import initialize_auth_provider, shutdown_auth_provider
-from app.cache.redis import close_redis_pools, get_cache_client, init_redis_pools
+from app.cache.local import configure_local_caches, disable_local_caches
+from app.cache.redis import (
+    close_redis_pools,
+    get_cache_client,
+    get_rate_limit_client,
+    init_redis_pools,
+)
+from app.clients.http import close_http_clients, init_http_clients
 from app.core.config import AuthMode, Settings, get_settings
 from app.database import close_database_pool, init_database_pool
+from app.database.ingredient_index import (
+    close_ingredient_index,
+    init_ingredient_index,
+)
+from app.llm.batching import LLMBatchScheduler
 from app.llm.client.fallback import FallbackLLMClient
 from app.llm.client.groq import GroqClient
 from app.llm.client.ollama import OllamaClient
+from app.llm.rate_limit import create_groq_rate_limiter
 from app.observability.logging import get_logger, setup_logging
 from app.observability.tracing import shutdown_tracing
 from app.services.allergen.service import AllergenService
@@ -24,6 +37,10 @@ from app.services.nutrition.service import NutritionService
 from app.services.pairings.service import PairingsService
 from app.services.popular.service import PopularRecipesService
 from app.services.recipe_management.client import RecipeManagementClient
+from app.services.scraping.executor import (
+    close_parse_executor,
+    init_parse_executor,
+)
 from app.services.scraping.service import RecipeScraperService
 from app.services.shopping.service import ShoppingService
 from app.services.substitution.service import SubstitutionService
@@ -73,6 +90,15 @@ async def _startup(app: FastAPI, settings: Settings) -> None:
     # Initialize database connection pool (non-critical)
     await _init_database()
 
+    # Initialize ingredient name index (optional - non-critical)
+    await _init_ingredient_index(settings)
+
+    # Configure process-local reference data caches
+    _init_local_caches(settings)
+
+    # Create the shared outbound HTTP pool (before any client is created)
+    _init_http_clients(settings)
+
     # Initialize ARQ connection pool for job enqueuing
     await _init_arq()
 
@@ -103,6 +129,9 @@ async def _startup(app: FastAPI, settings: Settings) -> None:
     # Initialize Pairings Service (optional - non-critical, requires LLM)
     await _init_pairings_service(app, cache_client)
 
+    # Start the HTML parse executor used by scraping and popular recipes
+    _init_parse_executor(settings)
+
     # Initialize Recipe Scraper Service (optional - non-critical)
     await _init_scraper_service(app, cache_client)
 
@@ -143,6 +172,31 @@ async def _init_database() -> None:
         )
 
 
+async def _init_ingredient_index(settings: Settings) -> None:
+    """Load the in-process ingredient name index (non-critical)."""
+    index_settings = settings.database.ingredient_index
+    if not index_settings.enabled:
+        logger.info("Ingredient name index disabled via configuration")
+        return
+
+    try:
+        await init_ingredient_index(index_settings.refresh_interval)
+    except Exception:
+        logger.exception(
+            "Failed to load ingredient name index - using SQL name resolution"
+        )
+
+
+def _init_local_caches(settings: Settings) -> None:
+    """Configure process-local caches for near-static reference tables."""
+    cache_settings = settings.database.reference_cache
+    configure_local_caches(
+        enabled=cache_settings.enabled,
+        max_items=cache_settings.max_items,
+        ttl=cache_settings.ttl,
+    )
+
+
 async def _init_auth(settings: Settings, cache_client: Redis[bytes] | None) -> None:
     """Initialize auth provider (critical service)."""
     try:
@@ -263,6 +317,27 @@ async def _init_pairings_service(
         app.state.pairings_service = None
 
 
+def _init_http_clients(settings: Settings) -> None:
+    """Create the shared outbound HTTP pool (clients fall back to own pools)."""
+    try:
+        init_http_clients(settings.http_client)
+    except Exception:
+        logger.exception(
+            "Failed to create shared HTTP pool - clients use their own pools"
+        )
+
+
+def _init_parse_executor(settings: Settings) -> None:
+    """Start the executor for CPU-bound HTML parsing (falls back to inline)."""
+    executor_settings = settings.scraping.parse_executor
+    try:
+        init_parse_executor(executor_settings.mode, executor_settings.max_workers)
+    except Exception:
+        logger.exception(
+            "Failed to start HTML parse executor - parsing on the event loop"
+        )
+
+
 async def _init_scraper_service(
     app: FastAPI, cache_client: Redis[bytes] | None
 ) -> None:
@@ -389,18 +464,30 @@ async def _shutdown(app: FastAPI) -> None:
         await app.state.pairings_service.shutdown()
         logger.debug("PairingsService shutdown")
 
+    # Shutdown HTML parse executor (after the services using it)
+    await close_parse_executor()
+
     # Shutdown LLM client
     await _shutdown_llm_client()
 
     # Shutdown auth provider (close HTTP connections, etc.)
     await shutdown_auth_provider()
 
+    # Close the shared outbound HTTP pool (after all its clients)
+    await close_http_clients()
+
     # Shutdown tracing (flush pending spans)
     shutdown_tracing()
 
     # Close ARQ connection pool
     await close_arq_pool()
 
+    # Stop ingredient name index refresh
+    await close_ingredient_index()
+
+    # Drop process-local reference data caches
+    disable_local_caches()
+
     # Close database connection pool
     await close_database_pool()
 
@@ -447,6 +534,16 @@ async def _init_llm_client(settings: Settings) -> None:
                 "Redis not available for LLM caching - continuing without cache"
             )
 
+    # One limiter for every Groq client, shared with other replicas via Redis
+    rate_limit_client = None
+    try:
+        rate_limit_client = get_rate_limit_client()
+    except Exception:
+        logger.warning(
+            "Redis not available for LLM rate limiting - limiting per process"
+        )
+    groq_rate_limiter = create_groq_rate_limiter(rate_limit_client, settings.llm.groq)
+
     # Create primary client based on provider setting
     primary: LLMClientProtocol
     if settings.llm.provider == "groq":
@@ -461,8 +558,10 @@ async def _init_llm_client(settings: Settings) -> None:
             max_retries=settings.llm.groq.max_retries,
             cache_client=cache_client,
             cache_ttl=settings.llm.cache.ttl,
+            cache_stale_ttl=settings.llm.cache.stale_ttl,
             cache_enabled=settings.llm.cache.enabled,
             requests_per_minute=settings.llm.groq.requests_per_minute,
+            rate_limiter=groq_rate_limiter,
         )
     else:
         # Default to Ollama
@@ -473,6 +572,7 @@ async def _init_llm_client(settings: Settings) -> None:
             max_retries=settings.llm.ollama.max_retries,
             cache_client=cache_client,
             cache_ttl=settings.llm.cache.ttl,
+            cache_stale_ttl=settings.llm.cache.stale_ttl,
             cache_enabled=settings.llm.cache.enabled,
         )
 
@@ -491,8 +591,10 @@ async def _init_llm_client(settings: Settings) -> None:
             max_retries=settings.llm.groq.max_retries,
             cache_client=cache_client,
             cache_ttl=settings.llm.cache.ttl,
+            cache_stale_ttl=settings.llm.cache.stale_ttl,
             cache_enabled=settings.llm.cache.enabled,
             requests_per_minute=settings.llm.groq.requests_per_minute,
+            rate_limiter=groq_rate_limiter,
         )
         logger.info(
             "Groq fallback client configured",
@@ -505,12 +607,24 @@ async def _init_llm_client(settings: Settings) -> None:
         )
 
     # Wrap in fallback client
-    _LLMClientHolder.client = FallbackLLMClient(
+    client: LLMClientProtocol = FallbackLLMClient(
         primary=primary,
         secondary=secondary,
         fallback_enabled=settings.llm.fallback.enabled,
+        hedging_enabled=settings.llm.fallback.hedging_enabled,
+        hedge_min_samples=settings.llm.fallback.hedge_min_samples,
+        latency_window=settings.llm.fallback.latency_window,
+        failure_threshold=settings.llm.fallback.circuit_failure_threshold,
+        reset_timeout=settings.llm.fallback.circuit_reset_seconds,
     )
-    await _LLMClientHolder.client.initialize()
+    if settings.llm.batching.enabled:
+        client = LLMBatchScheduler(
+            client,
+            window=settings.llm.batching.window_ms / 1000,
+            max_batch_size=settings.llm.batching.max_batch_size,
+        )
+    _LLMClientHolder.client = client
+    await client.initialize()
 
     primary_model = (
         settings.llm.groq.model
@@ -1,6 +1,7 @@
 """Custom middleware components."""
 
 from app.core.middleware.logging import LoggingMiddleware
+from app.core.middleware.request_context import RequestContextMiddleware
 from app.core.middleware.request_id import RequestIDMiddleware
 from app.core.middleware.security_headers import SecurityHeadersMiddleware
 from app.core.middleware.timing import TimingMiddleware
@@ -8,6 +9,7 @@ from app.core.middleware.timing import TimingMiddleware
 
 __all__ = [
     "LoggingMiddleware",
+    "RequestContextMiddleware",
     "RequestIDMiddleware",
     "SecurityHeadersMiddleware",
     "TimingMiddleware",
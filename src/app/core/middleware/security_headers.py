@@ -16,6 +16,49 @@ if TYPE_CHECKING:
     from starlette.responses import Response
     from starlette.types import ASGIApp
 
+# Headers added to every response
+STATIC_SECURITY_HEADERS: tuple[tuple[str, str], ...] = (
+    # Prevent MIME type sniffing
+    ("X-Content-Type-Options", "nosniff"),
+    # Prevent clickjacking
+    ("X-Frame-Options", "DENY"),
+    # XSS protection (legacy, but still useful for older browsers)
+    ("X-XSS-Protection", "1; mode=block"),
+    # Enforce HTTPS
+    ("Strict-Transport-Security", "max-age=31536000; includeSubDomains; preload"),
+    # Control referrer information
+    ("Referrer-Policy", "strict-origin-when-cross-origin"),
+)
+
+# Prevent caching of sensitive responses (added to /api/ paths)
+NO_CACHE_HEADERS: tuple[tuple[str, str], ...] = (
+    ("Cache-Control", "no-store, no-cache, must-revalidate, private"),
+    ("Pragma", "no-cache"),
+)
+
+DEFAULT_CONTENT_SECURITY_POLICY = (
+    "default-src 'self'; "
+    "script-src 'self' 'unsafe-inline'; "  # Allow inline scripts for Swagger UI
+    "style-src 'self' 'unsafe-inline'; "  # Allow inline styles for Swagger UI
+    "img-src 'self' data: https:; "
+    "font-src 'self'; "
+    "connect-src 'self'; "
+    "frame-ancestors 'none'; "
+    "base-uri 'self'; "
+    "form-action 'self'"
+)
+
+DEFAULT_PERMISSIONS_POLICY = (
+    "accelerometer=(), "
+    "camera=(), "
+    "geolocation=(), "
+    "gyroscope=(), "
+    "magnetometer=(), "
+    "microphone=(), "
+    "payment=(), "
+    "usb=()"
+)
+
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     """Middleware to add security headers to all responses."""
@@ -39,22 +82,8 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         """Add security headers to response."""
         response = await call_next(request)
 
-        # Prevent MIME type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-
-        # Prevent clickjacking
-        response.headers["X-Frame-Options"] = "DENY"
-
-        # XSS protection (legacy, but still useful for older browsers)
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-
-        # Enforce HTTPS
-        response.headers["Strict-Transport-Security"] = (
-            "max-age=31536000; includeSubDomains; preload"
-        )
-
-        # Control referrer information
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        for name, value in STATIC_SECURITY_HEADERS:
+            response.headers[name] = value
 
         # Content Security Policy
         response.headers["Content-Security-Policy"] = self.content_security_policy
@@ -62,38 +91,16 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         # Permissions Policy (formerly Feature Policy)
         response.headers["Permissions-Policy"] = self.permissions_policy
 
-        # Prevent caching of sensitive responses
         if request.url.path.startswith("/api/"):
-            response.headers["Cache-Control"] = (
-                "no-store, no-cache, must-revalidate, private"
-            )
-            response.headers["Pragma"] = "no-cache"
+            for name, value in NO_CACHE_HEADERS:
+                response.headers[name] = value
 
         return response
 
     def _default_csp(self) -> str:
         """Return default Content Security Policy."""
-        return (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline'; "  # Allow inline scripts for Swagger UI
-            "style-src 'self' 'unsafe-inline'; "  # Allow inline styles for Swagger UI
-            "img-src 'self' data: https:; "
-            "font-src 'self'; "
-            "connect-src 'self'; "
-            "frame-ancestors 'none'; "
-            "base-uri 'self'; "
-            "form-action 'self'"
-        )
+        return DEFAULT_CONTENT_SECURITY_POLICY
 
     def _default_permissions(self) -> str:
         """Return default Permissions Policy."""
-        return (
-            "accelerometer=(), "
-            "camera=(), "
-            "geolocation=(), "
-            "gyroscope=(), "
-            "magnetometer=(), "
-            "microphone=(), "
-            "payment=(), "
-            "usb=()"
-        )
+        return DEFAULT_PERMISSIONS_POLICY
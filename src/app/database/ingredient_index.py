@@ -0,0 +1,383 @@
+"""In-process ingredient name resolution index.
+
+This module provides:
+- A pg_trgm-compatible trigram similarity implementation
+- IngredientNameIndex: exact, prefix and trigram indexes over the
+  recipe_manager.ingredients catalog
+- Global index lifecycle (load at startup, periodic refresh) via lifespan events
+
+Name resolution mirrors the SQL fuzzy lookup used by the repositories:
+results are ranked by match type (exact > prefix > contains > trigram), then
+by similarity (descending), then by name length (shorter preferred).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import contextlib
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from app.database.connection import get_database_pool
+from app.observability.logging import get_logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from asyncpg import Pool
+
+logger = get_logger(__name__)
+
+# Match ranks, aligned with the CASE expression in the SQL fuzzy queries
+MATCH_RANK_EXACT = 0
+MATCH_RANK_PREFIX = 1
+MATCH_RANK_CONTAINS = 2
+MATCH_RANK_TRIGRAM = 3
+
+DEFAULT_MIN_SIMILARITY = 0.3
+
+_INGREDIENT_CATALOG_QUERY = """
+    SELECT ingredient_id, name
+    FROM recipe_manager.ingredients
+    WHERE name IS NOT NULL
+"""
+
+# pg_trgm treats every non-alphanumeric character as a word separator
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+
+
+def normalize_name(name: str) -> str:
+    """Normalize an ingredient name the way the SQL path compares it (LOWER)."""
+    return name.lower()
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """Extract the trigram set of a string as pg_trgm does.
+
+    Each word is lowercased and padded with two spaces in front and one
+    behind before being split into overlapping three-character chunks.
+
+    Args:
+        text: Input string.
+
+    Returns:
+        Set of trigrams.
+    """
+    result: set[str] = set()
+    for word in _WORD_PATTERN.findall(text.lower()):
+        padded = f"  {word} "
+        result.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(result)
+
+
+def similarity(a: str, b: str) -> float:
+    """Compute pg_trgm ``similarity(a, b)``.
+
+    Args:
+        a: First string.
+        b: Second string.
+
+    Returns:
+        Shared trigrams divided by the size of the trigram union (0.0-1.0).
+    """
+    ta = trigrams(a)
+    tb = trigrams(b)
+    if not ta or not tb:
+        return 0.0
+    shared = len(ta & tb)
+    return shared / (len(ta) + len(tb) - shared)
+
+
+@dataclass(frozen=True, slots=True)
+class IngredientMatch:
+    """Result of resolving a free-text name against the ingredient catalog."""
+
+    ingredient_id: int
+    name: str
+    match_rank: int
+    similarity: float
+
+
+class IngredientNameIndex:
+    """Immutable name resolution index over the ingredient catalog.
+
+    Holds three structures built once per catalog snapshot:
+    - An exact-match map of normalized name to entry
+    - A sorted array of normalized names for prefix lookups via bisection
+    - A trigram inverted index for similarity scoring
+    """
+
+    def __init__(self, entries: Iterable[tuple[int, str]]) -> None:
+        """Build the index.
+
+        Args:
+            entries: (ingredient_id, name) pairs from the catalog.
+        """
+        self._ids: list[int] = []
+        self._names: list[str] = []
+        self._normalized: list[str] = []
+        self._trigram_counts: list[int] = []
+        self._exact: dict[str, int] = {}
+        postings: defaultdict[str, list[int]] = defaultdict(list)
+
+        for ingredient_id, name in entries:
+            position = len(self._ids)
+            normalized = normalize_name(name)
+            grams = trigrams(normalized)
+
+            self._ids.append(ingredient_id)
+            self._names.append(name)
+            self._normalized.append(normalized)
+            self._trigram_counts.append(len(grams))
+            # Keep the shortest name for duplicate normalized names
+            current = self._exact.get(normalized)
+            if current is None or len(name) < len(self._names[current]):
+                self._exact[normalized] = position
+            for gram in grams:
+                postings[gram].append(position)
+
+        self._postings: dict[str, list[int]] = dict(postings)
+        self._sorted: list[tuple[str, int]] = sorted(
+            (normalized, position)
+            for position, normalized in enumerate(self._normalized)
+        )
+        self._sorted_keys: list[str] = [key for key, _ in self._sorted]
+
+    def __len__(self) -> int:
+        """Return the number of indexed ingredients."""
+        return len(self._ids)
+
+    def resolve_exact(self, name: str) -> int | None:
+        """Resolve a name by case-insensitive equality.
+
+        Args:
+            name: Ingredient name.
+
+        Returns:
+            Matching ingredient ID, or None.
+        """
+        position = self._exact.get(normalize_name(name))
+        return None if position is None else self._ids[position]
+
+    def split_exact(self, names: Iterable[str]) -> tuple[list[int], list[str]]:
+        """Resolve names by case-insensitive equality, keeping the misses.
+
+        Args:
+            names: Ingredient names.
+
+        Returns:
+            IDs of the names found, and the names not in the index.
+        """
+        ids: list[int] = []
+        missing: list[str] = []
+        for name in names:
+            ingredient_id = self.resolve_exact(name)
+            if ingredient_id is None:
+                missing.append(name)
+            else:
+                ids.append(ingredient_id)
+        return ids, missing
+
+    def resolve(
+        self,
+        name: str,
+        min_similarity: float = DEFAULT_MIN_SIMILARITY,
+    ) -> IngredientMatch | None:
+        """Resolve a name to its best matching ingredient.
+
+        Args:
+            name: Free-text ingredient name.
+            min_similarity: Minimum trigram similarity for rank-3 matches.
+
+        Returns:
+            Best IngredientMatch, or None if nothing qualifies.
+        """
+        query = normalize_name(name)
+        if not query:
+            return None
+
+        exact = self._exact.get(query)
+        if exact is not None:
+            return self._match(exact, MATCH_RANK_EXACT, 1.0)
+
+        scores = self._similarities(query)
+
+        prefix = self._prefix_positions(f"{query},")
+        if prefix:
+            return self._best(prefix, MATCH_RANK_PREFIX, scores)
+
+        contains = [
+            position
+            for position, normalized in enumerate(self._normalized)
+            if query in normalized
+        ]
+        if contains:
+            return self._best(contains, MATCH_RANK_CONTAINS, scores)
+
+        similar = [
+            position for position, score in scores.items() if score > min_similarity
+        ]
+        if similar:
+            return self._best(similar, MATCH_RANK_TRIGRAM, scores)
+
+        return None
+
+    def resolve_many(
+        self,
+        names: Iterable[str],
+        min_similarity: float = DEFAULT_MIN_SIMILARITY,
+    ) -> dict[str, IngredientMatch]:
+        """Resolve multiple names.
+
+        Args:
+            names: Free-text ingredient names.
+            min_similarity: Minimum trigram similarity for rank-3 matches.
+
+        Returns:
+            Dictionary mapping query names to their best match.
+            Names without a match are not included.
+        """
+        result: dict[str, IngredientMatch] = {}
+        for name in names:
+            if name in result:
+                continue
+            match = self.resolve(name, min_similarity)
+            if match is not None:
+                result[name] = match
+        return result
+
+    def _prefix_positions(self, prefix: str) -> list[int]:
+        """Return positions of every name starting with ``prefix``."""
+        start = bisect.bisect_left(self._sorted_keys, prefix)
+        positions: list[int] = []
+        for key, position in self._sorted[start:]:
+            if not key.startswith(prefix):
+                break
+            positions.append(position)
+        return positions
+
+    def _similarities(self, query: str) -> dict[int, float]:
+        """Score every indexed name sharing at least one trigram with ``query``."""
+        grams = trigrams(query)
+        shared: defaultdict[int, int] = defaultdict(int)
+        for gram in grams:
+            for position in self._postings.get(gram, ()):
+                shared[position] += 1
+
+        query_count = len(grams)
+        return {
+            position: count / (query_count + self._trigram_counts[position] - count)
+            for position, count in shared.items()
+        }
+
+    def _best(
+        self,
+        positions: list[int],
+        rank: int,
+        scores: dict[int, float],
+    ) -> IngredientMatch:
+        """Pick the best position by similarity (desc), then name length (asc)."""
+        best = min(
+            positions,
+            key=lambda p: (-scores.get(p, 0.0), len(self._names[p])),
+        )
+        return self._match(best, rank, scores.get(best, 0.0))
+
+    def _match(self, position: int, rank: int, score: float) -> IngredientMatch:
+        """Build an IngredientMatch for an index position."""
+        return IngredientMatch(
+            ingredient_id=self._ids[position],
+            name=self._names[position],
+            match_rank=rank,
+            similarity=score,
+        )
+
+
+# =============================================================================
+# Global Index Lifecycle
+# =============================================================================
+
+
+# Container for the global index and its refresh task (avoids global statement)
+class _IndexHolder:
+    index: IngredientNameIndex | None = None
+    refresh_task: asyncio.Task[None] | None = None
+
+
+async def load_ingredient_index(pool: Pool | None = None) -> IngredientNameIndex:
+    """Load a fresh index snapshot from the ingredient catalog.
+
+    Args:
+        pool: Optional connection pool. If None, uses global pool.
+
+    Returns:
+        Newly built IngredientNameIndex.
+    """
+    db_pool = pool if pool is not None else get_database_pool()
+    async with db_pool.acquire() as conn:
+        rows = await conn.fetch(_INGREDIENT_CATALOG_QUERY)
+    return IngredientNameIndex((row["ingredient_id"], row["name"]) for row in rows)
+
+
+async def refresh_ingredient_index() -> None:
+    """Reload the global index, keeping the previous snapshot on failure."""
+    try:
+        index = await load_ingredient_index()
+    except Exception:
+        logger.exception("Failed to refresh ingredient name index")
+        return
+    _IndexHolder.index = index
+    logger.info("Ingredient name index refreshed", ingredients=len(index))
+
+
+async def _refresh_periodically(interval: float) -> None:
+    """Refresh the global index every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        await refresh_ingredient_index()
+
+
+async def init_ingredient_index(refresh_interval: float) -> None:
+    """Load the global index and start its periodic refresh.
+
+    Should be called during application startup (lifespan), after the
+    database pool is initialized.
+
+    Args:
+        refresh_interval: Seconds between catalog reloads (<= 0 disables).
+    """
+    _IndexHolder.index = await load_ingredient_index()
+    logger.info("Ingredient name index loaded", ingredients=len(_IndexHolder.index))
+
+    if refresh_interval > 0:
+        _IndexHolder.refresh_task = asyncio.create_task(
+            _refresh_periodically(refresh_interval)
+        )
+
+
+async def close_ingredient_index() -> None:
+    """Stop the periodic refresh and drop the global index.
+
+    Should be called during application shutdown (lifespan).
+    """
+    task = _IndexHolder.refresh_task
+    if task is not None:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        _IndexHolder.refresh_task = None
+    _IndexHolder.index = None
+
+
+def get_ingredient_index() -> IngredientNameIndex | None:
+    """Get the global ingredient name index.
+
+    Returns:
+        The loaded index, or None when it is disabled or not yet loaded
+        (callers should fall back to SQL name resolution).
+    """
+    return _IndexHolder.index
@@ -11,12 +11,15 @@ from typing import TYPE_CHECKING
 from pydantic import BaseModel
 
 from app.database.connection import get_database_pool
+from app.database.ingredient_index import get_ingredient_index
 from app.observability.logging import get_logger
 
 
 if TYPE_CHECKING:
     from asyncpg import Pool, Record
 
+    from app.database.ingredient_index import IngredientNameIndex
+
 logger = get_logger(__name__)
 
 
@@ -64,20 +67,75 @@ _ALLERGEN_QUERY = """
 """
 
 
+# Batched fuzzy lookup: one best matching ingredient per query name via a
+# LATERAL subquery, then every allergen row for that ingredient.
+_ALLERGEN_FUZZY_BATCH_QUERY = """
+    SELECT
+        q.query_name,
+        i.ingredient_id,
+        i.name AS ingredient_name,
+        i.usda_food_description,
+        ap.data_source,
+        ap.confidence_score AS profile_confidence,
+        ia.allergen_type,
+        ia.presence_type,
+        ia.confidence_score,
+        ia.source_notes
+    FROM unnest($1::text[]) AS q(query_name)
+    CROSS JOIN LATERAL (
+        SELECT c.ingredient_id
+        FROM recipe_manager.ingredients c
+        JOIN recipe_manager.allergen_profiles cap
+            ON c.ingredient_id = cap.ingredient_id
+        WHERE
+            LOWER(c.name) = LOWER(q.query_name)
+            OR LOWER(c.name) LIKE LOWER(q.query_name) || ',%'
+            OR LOWER(c.name) LIKE '%' || LOWER(q.query_name) || '%'
+            OR similarity(LOWER(c.name), LOWER(q.query_name)) > $2
+        ORDER BY
+            CASE
+                WHEN LOWER(c.name) = LOWER(q.query_name) THEN 0
+                WHEN LOWER(c.name) LIKE LOWER(q.query_name) || ',%' THEN 1
+                WHEN LOWER(c.name) LIKE '%' || LOWER(q.query_name) || '%' THEN 2
+                ELSE 3
+            END,
+            similarity(LOWER(c.name), LOWER(q.query_name)) DESC,
+            LENGTH(c.name)
+        LIMIT 1
+    ) AS best
+    JOIN recipe_manager.ingredients i
+        ON i.ingredient_id = best.ingredient_id
+    JOIN recipe_manager.allergen_profiles ap
+        ON i.ingredient_id = ap.ingredient_id
+    LEFT JOIN recipe_manager.ingredient_allergens ia
+        ON ap.allergen_profile_id = ia.allergen_profile_id
+"""
+
+
 class AllergenRepository:
     """Repository for allergen data access.
 
     Uses raw asyncpg queries against the recipe_manager schema.
-    Follows the same patterns as NutritionRepository.
+    Follows the same patterns as NutritionRepository, including exact name
+    resolution through the ingredient name index when it is loaded.
+    Fuzzy matches stay in SQL because candidates are restricted to
+    ingredients that have an allergen profile.
     """
 
-    def __init__(self, pool: Pool | None = None) -> None:
+    def __init__(
+        self,
+        pool: Pool | None = None,
+        name_index: IngredientNameIndex | None = None,
+    ) -> None:
         """Initialize repository with optional connection pool.
 
         Args:
             pool: asyncpg connection pool. If None, uses global pool.
+            name_index: Optional name index. If None, uses the global index
+                when loaded, otherwise names are resolved in SQL.
         """
         self._pool = pool
+        self._name_index = name_index
 
     @property
     def pool(self) -> Pool:
@@ -86,6 +144,13 @@ class AllergenRepository:
             return self._pool
         return get_database_pool()
 
+    @property
+    def name_index(self) -> IngredientNameIndex | None:
+        """Get ingredient name index, or None if unavailable."""
+        if self._name_index is not None:
+            return self._name_index
+        return get_ingredient_index()
+
     async def get_by_ingredient_name(
         self,
         name: str,
@@ -98,10 +163,18 @@ class AllergenRepository:
         Returns:
             List of AllergenData for the ingredient, empty if not found.
         """
-        query = f"{_ALLERGEN_QUERY} WHERE LOWER(i.name) = LOWER($1)"
+        index = self.name_index
+        ingredient_id = index.resolve_exact(name) if index is not None else None
+        if ingredient_id is not None:
+            query = f"{_ALLERGEN_QUERY} WHERE i.ingredient_id = $1"
+            params: tuple[object, ...] = (ingredient_id,)
+        else:
+            # No index, or not in its snapshot (the ingredient may be newer)
+            query = f"{_ALLERGEN_QUERY} WHERE LOWER(i.name) = LOWER($1)"
+            params = (name,)
 
         async with self.pool.acquire() as conn:
-            rows = await conn.fetch(query, name)
+            rows = await conn.fetch(query, *params)
             return [
                 self._row_to_allergen_data(row)
                 for row in rows
@@ -123,13 +196,28 @@ class AllergenRepository:
         if not names:
             return {}
 
-        query = (
-            f"{_ALLERGEN_QUERY} "
-            "WHERE LOWER(i.name) = ANY(SELECT LOWER(unnest($1::text[])))"
-        )
+        index = self.name_index
+        ids, names = index.split_exact(names) if index is not None else ([], names)
 
+        queries: list[tuple[str, list[int] | list[str]]] = []
+        if ids:
+            queries.append(
+                (f"{_ALLERGEN_QUERY} WHERE i.ingredient_id = ANY($1::int[])", ids)
+            )
+        if names:
+            # No index, or not in its snapshot (the ingredients may be newer)
+            queries.append(
+                (
+                    f"{_ALLERGEN_QUERY} "
+                    "WHERE LOWER(i.name) = ANY(SELECT LOWER(unnest($1::text[])))",
+                    names,
+                )
+            )
+
+        rows = []
         async with self.pool.acquire() as conn:
-            rows = await conn.fetch(query, names)
+            for query, param in queries:
+                rows.extend(await conn.fetch(query, param))
 
         result: dict[str, list[AllergenData]] = {}
         for row in rows:
@@ -156,66 +244,38 @@ class AllergenRepository:
         Returns:
             List of AllergenData for best matching ingredient.
         """
-        fuzzy_query = """
-            WITH ranked_matches AS (
-                SELECT
-                    i.*,
-                    CASE
-                        WHEN LOWER(i.name) = LOWER($1) THEN 0
-                        WHEN LOWER(i.name) LIKE LOWER($1) || ',%' THEN 1
-                        WHEN LOWER(i.name) LIKE '%' || LOWER($1) || '%' THEN 2
-                        ELSE 3
-                    END AS match_rank,
-                    similarity(LOWER(i.name), LOWER($1)) AS sim_score
-                FROM recipe_manager.ingredients i
-                WHERE
-                    LOWER(i.name) = LOWER($1)
-                    OR LOWER(i.name) LIKE LOWER($1) || ',%'
-                    OR LOWER(i.name) LIKE '%' || LOWER($1) || '%'
-                    OR similarity(LOWER(i.name), LOWER($1)) > $2
-            )
-            SELECT
-                rm.ingredient_id,
-                rm.name AS ingredient_name,
-                rm.usda_food_description,
-                ap.data_source,
-                ap.confidence_score AS profile_confidence,
-                ia.allergen_type,
-                ia.presence_type,
-                ia.confidence_score,
-                ia.source_notes
-            FROM ranked_matches rm
-            JOIN recipe_manager.allergen_profiles ap
-                ON rm.ingredient_id = ap.ingredient_id
-            LEFT JOIN recipe_manager.ingredient_allergens ia
-                ON ap.allergen_profile_id = ia.allergen_profile_id
-            ORDER BY rm.match_rank, rm.sim_score DESC, LENGTH(rm.name)
-            LIMIT 10
-        """
+        results = await self.get_by_ingredient_names_fuzzy([name], min_similarity)
+        return results.get(name, [])
 
-        try:
-            async with self.pool.acquire() as conn:
-                rows = await conn.fetchrow(fuzzy_query, name, min_similarity)
+    async def get_by_ingredient_names_fuzzy(
+        self,
+        names: list[str],
+        min_similarity: float = 0.3,
+    ) -> dict[str, list[AllergenData]]:
+        """Get allergen data for multiple ingredients using fuzzy matching.
 
-            if rows is None:
-                return []
+        Resolves every name in a single statement: each query name picks its
+        best matching ingredient with an allergen profile through a LATERAL
+        subquery (exact > prefix > contains > trigram, then similarity, then
+        length), and all allergen rows of that ingredient are returned.
 
-            # fetchrow returns a single row, but we need to handle multiple allergens
-            # Re-run with fetch to get all allergen rows for the matched ingredient
-            async with self.pool.acquire() as conn:
-                rows = await conn.fetch(fuzzy_query, name, min_similarity)
+        Args:
+            names: Ingredient names to search.
+            min_similarity: Minimum trigram similarity threshold.
 
-            result = [
-                self._row_to_allergen_data(row)
-                for row in rows
-                if row["allergen_type"] is not None
-            ]
+        Returns:
+            Dict mapping query names to allergen data of their best match.
+            Names that don't match are not included.
+        """
+        if not names:
+            return {}
 
-            if result and result[0].ingredient_name.lower() != name.lower():
-                logger.debug(
-                    "Fuzzy match found",
-                    query=name,
-                    matched_name=result[0].ingredient_name,
+        query_names = list(dict.fromkeys(names))
+
+        try:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(
+                    _ALLERGEN_FUZZY_BATCH_QUERY, query_names, min_similarity
                 )
         except Exception as e:
             # Handle missing pg_trgm extension gracefully
@@ -225,10 +285,24 @@ class AllergenRepository:
                     "pg_trgm extension not available, fuzzy search disabled",
                     error=str(e),
                 )
-                return []
+                return {}
             raise
-        else:
-            return result
+
+        result: dict[str, list[AllergenData]] = {}
+        for row in rows:
+            if row["allergen_type"] is None:
+                continue
+            query_name = row["query_name"]
+            result.setdefault(query_name, []).append(self._row_to_allergen_data(row))
+
+        for query_name, data in result.items():
+            if data[0].ingredient_name.lower() != query_name.lower():
+                logger.debug(
+                    "Fuzzy match found",
+                    query=query_name,
+                    matched_name=data[0].ingredient_name,
+                )
+        return result
 
     @staticmethod
     def _row_to_allergen_data(row: Record) -> AllergenData:
@@ -5,19 +5,24 @@ Provides methods for querying nutrition data from the PostgreSQL database.
 
 from __future__ import annotations
 
-import asyncio
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
 
+from app.cache.local import MISSING, LocalCache
 from app.database.connection import get_database_pool
+from app.database.ingredient_index import MATCH_RANK_EXACT, get_ingredient_index
 from app.observability.logging import get_logger
 
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from asyncpg import Pool, Record
 
+    from app.database.ingredient_index import IngredientNameIndex
+
 logger = get_logger(__name__)
 
 
@@ -152,20 +157,96 @@ _NUTRITION_QUERY = """
 """
 
 
+# Batched fuzzy lookup: one best match per query name via a LATERAL subquery.
+# Ranking mirrors get_by_ingredient_name_fuzzy.
+_NUTRITION_FUZZY_BATCH_QUERY = f"""
+    SELECT q.query_name, best.*
+    FROM unnest($1::text[]) AS q(query_name)
+    CROSS JOIN LATERAL (
+        {_NUTRITION_QUERY}
+        WHERE LOWER(i.name) = LOWER(q.query_name)
+           OR LOWER(i.name) LIKE LOWER(q.query_name) || ',%'
+           OR LOWER(i.name) LIKE '%' || LOWER(q.query_name) || '%'
+           OR similarity(LOWER(i.name), LOWER(q.query_name)) > $2
+        ORDER BY
+            CASE
+                WHEN LOWER(i.name) = LOWER(q.query_name) THEN 0
+                WHEN LOWER(i.name) LIKE LOWER(q.query_name) || ',%' THEN 1
+                WHEN LOWER(i.name) LIKE '%' || LOWER(q.query_name) || '%' THEN 2
+                ELSE 3
+            END,
+            similarity(LOWER(i.name), LOWER(q.query_name)) DESC,
+            LENGTH(i.name) ASC
+        LIMIT 1
+    ) AS best
+"""  # noqa: S608 - only interpolates the static _NUTRITION_QUERY
+
+
+# Batched portion lookup: one best portion row per (name, unit, modifier)
+# request. Ranking mirrors get_portion_weight: with a modifier only matching
+# rows qualify; without one, rows without a modifier are preferred.
+_PORTION_WEIGHT_BATCH_QUERY = """
+    SELECT q.ingredient_name, q.unit, q.modifier, best.gram_weight
+    FROM unnest($1::text[], $2::text[], $3::text[])
+        AS q(ingredient_name, unit, modifier)
+    CROSS JOIN LATERAL (
+        SELECT ip.gram_weight
+        FROM recipe_manager.ingredient_portions ip
+        JOIN recipe_manager.ingredients i
+            ON i.ingredient_id = ip.ingredient_id
+        WHERE LOWER(i.name) = LOWER(q.ingredient_name)
+          AND UPPER(ip.unit) = UPPER(q.unit)
+          AND (q.modifier IS NULL OR LOWER(ip.modifier) = LOWER(q.modifier))
+        ORDER BY
+            CASE WHEN ip.modifier IS NULL THEN 0 ELSE 1 END,
+            ip.sequence_number NULLS LAST
+        LIMIT 1
+    ) AS best
+"""
+
+
+# Portion weights are near-static reference data; cache them (including
+# misses) per process, keyed by (lower(name), upper(unit), lower(modifier)).
+_PORTION_WEIGHT_CACHE: LocalCache[tuple[str, str, str | None], Decimal | None] = (
+    LocalCache("ingredient_portions")
+)
+
+
+def _portion_cache_key(
+    ingredient_name: str,
+    unit: str,
+    modifier: str | None,
+) -> tuple[str, str, str | None]:
+    """Build the normalized local cache key for a portion lookup."""
+    return ingredient_name.lower(), unit.upper(), modifier.lower() if modifier else None
+
+
 class NutritionRepository:
     """Repository for querying nutrition data.
 
     Provides methods for fetching nutrition information from the database.
     Handles NULL values from LEFT JOINs by returning None for missing data.
+
+    When an ingredient name index is loaded, names are resolved to ingredient
+    IDs in-process and the database is queried by primary key. Names missing
+    from the index snapshot still go through the SQL name lookup, so
+    ingredients added since the last refresh are found.
     """
 
-    def __init__(self, pool: Pool | None = None) -> None:
+    def __init__(
+        self,
+        pool: Pool | None = None,
+        name_index: IngredientNameIndex | None = None,
+    ) -> None:
         """Initialize repository.
 
         Args:
             pool: Optional connection pool. If None, uses global pool.
+            name_index: Optional name index. If None, uses the global index
+                when loaded, otherwise names are resolved in SQL.
         """
         self._pool = pool
+        self._name_index = name_index
 
     @property
     def pool(self) -> Pool:
@@ -174,6 +255,13 @@ class NutritionRepository:
             return self._pool
         return get_database_pool()
 
+    @property
+    def name_index(self) -> IngredientNameIndex | None:
+        """Get ingredient name index, or None if unavailable."""
+        if self._name_index is not None:
+            return self._name_index
+        return get_ingredient_index()
+
     async def get_by_ingredient_name(
         self,
         name: str,
@@ -186,6 +274,13 @@ class NutritionRepository:
         Returns:
             NutritionData if found, None otherwise.
         """
+        index = self.name_index
+        if index is not None:
+            ingredient_id = index.resolve_exact(name)
+            if ingredient_id is not None:
+                return await self.get_by_ingredient_id(ingredient_id)
+            # Not in the snapshot: the ingredient may have been added since
+
         query = f"{_NUTRITION_QUERY} WHERE LOWER(i.name) = LOWER($1) LIMIT 1"
 
         async with self.pool.acquire() as conn:
@@ -212,6 +307,16 @@ class NutritionRepository:
         if not names:
             return {}
 
+        result: dict[str, NutritionData] = {}
+        index = self.name_index
+        if index is not None:
+            ids, names = index.split_exact(names)
+            by_id = await self.get_by_ingredient_ids(ids)
+            result = {data.ingredient_name: data for data in by_id.values()}
+            # Names not in the snapshot may have been added since
+            if not names:
+                return result
+
         query = (
             f"{_NUTRITION_QUERY} "
             "WHERE LOWER(i.name) = ANY(SELECT LOWER(unnest($1::text[])))"
@@ -220,9 +325,9 @@ class NutritionRepository:
         async with self.pool.acquire() as conn:
             rows = await conn.fetch(query, names)
 
-        return {
-            row["ingredient_name"]: self._row_to_nutrition_data(row) for row in rows
-        }
+        for row in rows:
+            result[row["ingredient_name"]] = self._row_to_nutrition_data(row)
+        return result
 
     async def get_by_ingredient_name_fuzzy(
         self,
@@ -248,8 +353,20 @@ class NutritionRepository:
             Best matching NutritionData, or None if no match found.
 
         Note:
-            Requires pg_trgm extension to be enabled in the database.
+            Requires pg_trgm extension to be enabled in the database for
+            names the ingredient name index (if loaded) does not match.
         """
+        index = self.name_index
+        if index is not None:
+            match = index.resolve(name, min_similarity)
+            if match is not None:
+                if match.match_rank != MATCH_RANK_EXACT:
+                    logger.debug(
+                        "Fuzzy match found", query=name, matched_name=match.name
+                    )
+                return await self.get_by_ingredient_id(match.ingredient_id)
+            # Not in the snapshot: the ingredient may have been added since
+
         # Query uses CASE to assign match_rank, then orders by rank, similarity, length
         fuzzy_query = f"""
             {_NUTRITION_QUERY}
@@ -305,7 +422,11 @@ class NutritionRepository:
     ) -> dict[str, NutritionData]:
         """Get nutrition data for multiple ingredients using fuzzy matching.
 
-        Runs fuzzy search for each ingredient name in parallel.
+        Resolves every name in a single statement: the query names are
+        unnested and each one picks its best match through a LATERAL
+        subquery using the same ranking as get_by_ingredient_name_fuzzy
+        (exact > prefix > contains > trigram, then similarity, then length).
+        This holds one pool connection regardless of how many names are given.
 
         Args:
             names: List of ingredient names to search for.
@@ -314,21 +435,111 @@ class NutritionRepository:
         Returns:
             Dictionary mapping query names to NutritionData.
             Names that don't match are not included in the result.
+
+        Note:
+            Requires pg_trgm extension to be enabled in the database for
+            names the ingredient name index (if loaded) does not match.
         """
         if not names:
             return {}
 
-        # Run fuzzy searches in parallel
-        tasks = [
-            self.get_by_ingredient_name_fuzzy(name, min_similarity) for name in names
-        ]
-        fuzzy_results = await asyncio.gather(*tasks)
+        query_names = list(dict.fromkeys(names))
 
-        return {
-            name: data
-            for name, data in zip(names, fuzzy_results, strict=True)
-            if data is not None
-        }
+        result: dict[str, NutritionData] = {}
+        index = self.name_index
+        if index is not None:
+            matches = index.resolve_many(query_names, min_similarity)
+            by_id = await self.get_by_ingredient_ids(
+                list({match.ingredient_id for match in matches.values()})
+            )
+            for query_name, match in matches.items():
+                data = by_id.get(match.ingredient_id)
+                if data is None:
+                    continue
+                if match.match_rank != MATCH_RANK_EXACT:
+                    logger.debug(
+                        "Fuzzy match found",
+                        query=query_name,
+                        matched_name=data.ingredient_name,
+                    )
+                result[query_name] = data
+            # Names not in the snapshot may have been added since
+            query_names = [name for name in query_names if name not in matches]
+            if not query_names:
+                return result
+
+        try:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(
+                    _NUTRITION_FUZZY_BATCH_QUERY, query_names, min_similarity
+                )
+        except Exception as e:
+            # Handle missing pg_trgm extension gracefully
+            error_msg = str(e).lower()
+            if "similarity" in error_msg and "does not exist" in error_msg:
+                logger.warning(
+                    "pg_trgm extension not available, fuzzy search disabled",
+                    error=str(e),
+                )
+                return result
+            raise
+
+        for row in rows:
+            query_name = row["query_name"]
+            data = self._row_to_nutrition_data(row)
+            if data.ingredient_name.lower() != query_name.lower():
+                logger.debug(
+                    "Fuzzy match found",
+                    query=query_name,
+                    matched_name=data.ingredient_name,
+                )
+            result[query_name] = data
+        return result
+
+    async def get_by_ingredient_id(
+        self,
+        ingredient_id: int,
+    ) -> NutritionData | None:
+        """Get nutrition data for an ingredient by ID.
+
+        Args:
+            ingredient_id: Ingredient primary key.
+
+        Returns:
+            NutritionData if found, None otherwise.
+        """
+        query = f"{_NUTRITION_QUERY} WHERE i.ingredient_id = $1 LIMIT 1"
+
+        async with self.pool.acquire() as conn:
+            row = await conn.fetchrow(query, ingredient_id)
+
+        if row is None:
+            return None
+
+        return self._row_to_nutrition_data(row)
+
+    async def get_by_ingredient_ids(
+        self,
+        ingredient_ids: list[int],
+    ) -> dict[int, NutritionData]:
+        """Get nutrition data for multiple ingredients by ID.
+
+        Args:
+            ingredient_ids: Ingredient primary keys.
+
+        Returns:
+            Dictionary mapping ingredient IDs to NutritionData.
+            Missing ingredients are not included in the result.
+        """
+        if not ingredient_ids:
+            return {}
+
+        query = f"{_NUTRITION_QUERY} WHERE i.ingredient_id = ANY($1::int[])"
+
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(query, ingredient_ids)
+
+        return {row["ingredient_id"]: self._row_to_nutrition_data(row) for row in rows}
 
     async def get_by_fdc_id(self, fdc_id: int) -> NutritionData | None:
         """Get nutrition data by USDA FDC ID.
@@ -369,8 +580,15 @@ class NutritionRepository:
             Gram weight for the portion, or None if not found.
 
         Note:
-            Gracefully handles missing ingredient_portions table by returning None.
+            Results, including misses, are served from the process-local
+            ingredient_portions cache when it is enabled. Gracefully handles
+            missing ingredient_portions table by returning None.
         """
+        cache_key = _portion_cache_key(ingredient_name, unit, modifier)
+        cached = _PORTION_WEIGHT_CACHE.get(cache_key)
+        if cached is not MISSING:
+            return cached
+
         try:
             async with self.pool.acquire() as conn:
                 if modifier:
@@ -402,12 +620,6 @@ class NutritionRepository:
                         LIMIT 1
                     """
                     row = await conn.fetchrow(query, ingredient_name, unit)
-
-            if row is None:
-                return None
-
-            return Decimal(str(row["gram_weight"]))
-
         except Exception as e:
             # Handle missing table or other database errors gracefully
             error_msg = str(e).lower()
@@ -427,6 +639,87 @@ class NutritionRepository:
             )
             return None
 
+        weight = None if row is None else Decimal(str(row["gram_weight"]))
+        _PORTION_WEIGHT_CACHE.set(cache_key, weight)
+        return weight
+
+    async def get_portion_weights(
+        self,
+        portions: Sequence[tuple[str, str, str | None]],
+    ) -> dict[tuple[str, str, str | None], Decimal]:
+        """Get gram weights for multiple portion measurements in one query.
+
+        Batched form of get_portion_weight: each (ingredient_name, unit,
+        modifier) request picks its best portion row through a LATERAL
+        subquery, so a whole recipe costs a single round trip.
+
+        Args:
+            portions: (ingredient_name, unit, modifier) requests. Matching is
+                case-insensitive; modifier may be None.
+
+        Returns:
+            Dictionary mapping each request tuple (as given) to its gram
+            weight. Requests without a portion row are not included.
+
+        Note:
+            Requests already in the process-local ingredient_portions cache
+            are not queried. Gracefully handles missing ingredient_portions
+            table by returning only cached results.
+        """
+        if not portions:
+            return {}
+
+        result: dict[tuple[str, str, str | None], Decimal] = {}
+        requests: list[tuple[str, str, str | None]] = []
+        for request in dict.fromkeys(portions):
+            cached = _PORTION_WEIGHT_CACHE.get(_portion_cache_key(*request))
+            if cached is MISSING:
+                requests.append(request)
+            elif cached is not None:
+                result[request] = cached
+
+        if not requests:
+            return result
+
+        names = [name for name, _, _ in requests]
+        units = [unit for _, unit, _ in requests]
+        modifiers = [modifier for _, _, modifier in requests]
+
+        try:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(
+                    _PORTION_WEIGHT_BATCH_QUERY, names, units, modifiers
+                )
+        except Exception as e:
+            # Handle missing table or other database errors gracefully
+            error_msg = str(e).lower()
+            if "relation" in error_msg and "does not exist" in error_msg:
+                logger.debug(
+                    "ingredient_portions table not found, returning cached results",
+                    count=len(requests),
+                )
+                return result
+            # Log but don't raise - fallback to default conversion
+            logger.warning(
+                "Error looking up portion weights",
+                count=len(requests),
+                error=str(e),
+            )
+            return result
+
+        found = {
+            (row["ingredient_name"], row["unit"], row["modifier"]): Decimal(
+                str(row["gram_weight"])
+            )
+            for row in rows
+        }
+        for request in requests:
+            weight = found.get(request)
+            _PORTION_WEIGHT_CACHE.set(_portion_cache_key(*request), weight)
+            if weight is not None:
+                result[request] = weight
+        return result
+
     def _row_to_nutrition_data(self, row: Record) -> NutritionData:
         """Convert database row to NutritionData model.
 
@@ -13,11 +13,14 @@ from typing import TYPE_CHECKING
 
 from pydantic import BaseModel
 
+from app.cache.local import MISSING, LocalCache
 from app.database.connection import get_database_pool
 from app.observability.logging import get_logger
 
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from asyncpg import Pool, Record
 
 logger = get_logger(__name__)
@@ -51,6 +54,16 @@ class IngredientDetails(BaseModel):
 # =============================================================================
 
 
+# Pricing tables are near-static reference data; cache lookups (including
+# misses) per process.
+_INGREDIENT_PRICING_CACHE: LocalCache[int, PricingData | None] = LocalCache(
+    "ingredient_pricing"
+)
+_FOOD_GROUP_PRICING_CACHE: LocalCache[str, PricingData | None] = LocalCache(
+    "food_group_pricing"
+)
+
+
 class PricingRepository:
     """Repository for pricing data access.
 
@@ -79,12 +92,24 @@ class PricingRepository:
     ) -> PricingData | None:
         """Get pricing data for an ingredient by ID (Tier 1 lookup).
 
+        Served from the process-local ingredient_pricing cache when enabled.
+
         Args:
             ingredient_id: The ingredient's database ID.
 
         Returns:
             PricingData if found, None otherwise.
         """
+        return await _INGREDIENT_PRICING_CACHE.get_or_load(
+            ingredient_id,
+            lambda: self._fetch_price_by_ingredient_id(ingredient_id),
+        )
+
+    async def _fetch_price_by_ingredient_id(
+        self,
+        ingredient_id: int,
+    ) -> PricingData | None:
+        """Query Tier 1 pricing for an ingredient from the database."""
         query = """
             SELECT
                 price_per_100g,
@@ -121,12 +146,24 @@ class PricingRepository:
     ) -> PricingData | None:
         """Get average pricing data for a food group (Tier 2 fallback).
 
+        Served from the process-local food_group_pricing cache when enabled.
+
         Args:
             food_group: The food group name (e.g., "VEGETABLES", "FRUITS").
 
         Returns:
             PricingData if found, None otherwise.
         """
+        return await _FOOD_GROUP_PRICING_CACHE.get_or_load(
+            food_group,
+            lambda: self._fetch_price_by_food_group(food_group),
+        )
+
+    async def _fetch_price_by_food_group(
+        self,
+        food_group: str,
+    ) -> PricingData | None:
+        """Query Tier 2 pricing for a food group from the database."""
         query = """
             SELECT
                 avg_price_per_100g AS price_per_100g,
@@ -209,6 +246,186 @@ class PricingRepository:
                 return None
             raise
 
+    async def get_ingredient_details_by_ids(
+        self,
+        ingredient_ids: Sequence[int],
+    ) -> dict[int, IngredientDetails]:
+        """Get details (name and food group) for multiple ingredients.
+
+        Args:
+            ingredient_ids: Ingredient database IDs.
+
+        Returns:
+            Dict mapping ingredient IDs to IngredientDetails.
+            Missing ingredients are not included.
+        """
+        if not ingredient_ids:
+            return {}
+
+        query = """
+            SELECT
+                i.ingredient_id,
+                i.name,
+                np.food_group
+            FROM recipe_manager.ingredients i
+            LEFT JOIN recipe_manager.nutrition_profiles np
+                ON np.ingredient_id = i.ingredient_id
+            WHERE i.ingredient_id = ANY($1::int[])
+        """
+
+        try:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(query, list(dict.fromkeys(ingredient_ids)))
+        except Exception as e:
+            # Handle missing table gracefully
+            error_msg = str(e).lower()
+            if "relation" in error_msg and "does not exist" in error_msg:
+                logger.debug(
+                    "ingredients table not found",
+                    count=len(ingredient_ids),
+                )
+                return {}
+            raise
+
+        result: dict[int, IngredientDetails] = {}
+        for row in rows:
+            result.setdefault(
+                row["ingredient_id"],
+                IngredientDetails(
+                    ingredient_id=row["ingredient_id"],
+                    name=row["name"],
+                    food_group=row["food_group"],
+                ),
+            )
+        return result
+
+    async def get_prices_by_ingredient_ids(
+        self,
+        ingredient_ids: Sequence[int],
+    ) -> dict[int, PricingData]:
+        """Get Tier 1 pricing for multiple ingredients in one query.
+
+        IDs already in the process-local ingredient_pricing cache are not
+        queried; queried IDs (found or not) are added to it.
+
+        Args:
+            ingredient_ids: Ingredient database IDs.
+
+        Returns:
+            Dict mapping ingredient IDs to PricingData.
+            Ingredients without pricing are not included.
+        """
+        result: dict[int, PricingData] = {}
+        to_query: list[int] = []
+        for ingredient_id in dict.fromkeys(ingredient_ids):
+            cached = _INGREDIENT_PRICING_CACHE.get(ingredient_id)
+            if cached is MISSING:
+                to_query.append(ingredient_id)
+            elif cached is not None:
+                result[ingredient_id] = cached
+
+        if not to_query:
+            return result
+
+        query = """
+            SELECT
+                ingredient_id,
+                price_per_100g,
+                currency,
+                data_source,
+                source_year
+            FROM recipe_manager.ingredient_pricing
+            WHERE ingredient_id = ANY($1::int[])
+        """
+
+        try:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(query, to_query)
+        except Exception as e:
+            # Handle missing table gracefully
+            error_msg = str(e).lower()
+            if "relation" in error_msg and "does not exist" in error_msg:
+                logger.debug(
+                    "ingredient_pricing table not found",
+                    count=len(to_query),
+                )
+                return result
+            raise
+
+        found = {
+            row["ingredient_id"]: self._row_to_pricing_data(row, tier=1) for row in rows
+        }
+        for ingredient_id in to_query:
+            pricing = found.get(ingredient_id)
+            _INGREDIENT_PRICING_CACHE.set(ingredient_id, pricing)
+            if pricing is not None:
+                result[ingredient_id] = pricing
+        return result
+
+    async def get_prices_by_food_groups(
+        self,
+        food_groups: Sequence[str],
+    ) -> dict[str, PricingData]:
+        """Get Tier 2 average pricing for multiple food groups in one query.
+
+        Food groups are compared as text, so unknown group names simply do
+        not match instead of failing the enum cast for the whole batch.
+        Groups already in the process-local food_group_pricing cache are
+        not queried.
+
+        Args:
+            food_groups: Food group names (e.g., "VEGETABLES", "FRUITS").
+
+        Returns:
+            Dict mapping food group names to PricingData.
+            Groups without pricing are not included.
+        """
+        result: dict[str, PricingData] = {}
+        to_query: list[str] = []
+        for food_group in dict.fromkeys(food_groups):
+            cached = _FOOD_GROUP_PRICING_CACHE.get(food_group)
+            if cached is MISSING:
+                to_query.append(food_group)
+            elif cached is not None:
+                result[food_group] = cached
+
+        if not to_query:
+            return result
+
+        query = """
+            SELECT
+                food_group::text AS food_group,
+                avg_price_per_100g AS price_per_100g,
+                currency,
+                data_source
+            FROM recipe_manager.food_group_pricing
+            WHERE food_group::text = ANY($1::text[])
+        """
+
+        try:
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch(query, to_query)
+        except Exception as e:
+            # Handle missing table gracefully
+            error_msg = str(e).lower()
+            if "relation" in error_msg and "does not exist" in error_msg:
+                logger.debug(
+                    "food_group_pricing table not found",
+                    count=len(to_query),
+                )
+                return result
+            raise
+
+        found = {
+            row["food_group"]: self._row_to_pricing_data(row, tier=2) for row in rows
+        }
+        for food_group in to_query:
+            pricing = found.get(food_group)
+            _FOOD_GROUP_PRICING_CACHE.set(food_group, pricing)
+            if pricing is not None:
+                result[food_group] = pricing
+        return result
+
     @staticmethod
     def _row_to_pricing_data(row: Record, tier: int) -> PricingData:
         """Convert database row to PricingData DTO.
@@ -21,10 +21,7 @@ from app.cache.rate_limit import limiter, rate_limit_exceeded_handler
 from app.core.config import Settings, get_settings
 from app.core.events import lifespan
 from app.core.exceptions import setup_exception_handlers
-from app.core.middleware.logging import LoggingMiddleware
-from app.core.middleware.request_id import RequestIDMiddleware
-from app.core.middleware.security_headers import SecurityHeadersMiddleware
-from app.core.middleware.timing import TimingMiddleware
+from app.core.middleware.request_context import RequestContextMiddleware
 from app.observability.metrics import setup_metrics
 from app.observability.tracing import setup_tracing
 
@@ -86,12 +83,10 @@ def _setup_middleware(app: FastAPI, settings: Settings) -> None:
     - First added middleware runs first on response
 
     Order from request perspective:
-    1. SecurityHeadersMiddleware (adds security headers)
-    2. RequestIDMiddleware (adds request ID for tracing)
-    3. TimingMiddleware (measures request time)
-    4. LoggingMiddleware (logs requests/responses)
-    5. GZipMiddleware (compresses responses)
-    6. CORSMiddleware (handles CORS)
+    1. RequestContextMiddleware (security headers, request ID, timing and
+       request/response logging in one pure ASGI layer)
+    2. GZipMiddleware (compresses responses)
+    3. CORSMiddleware (handles CORS)
     """
     # CORS - must be added first (runs last on request, first on response)
     if settings.api.cors_origins:
@@ -107,11 +102,11 @@ def _setup_middleware(app: FastAPI, settings: Settings) -> None:
     # GZip compression for responses
     app.add_middleware(GZipMiddleware, minimum_size=1000)
 
-    # Request/response logging
+    # Request ID, timing, logging and security headers (runs first on request)
     # All paths must use the API prefix for gateway routing
     prefix = settings.api.v1_prefix
     app.add_middleware(
-        LoggingMiddleware,
+        RequestContextMiddleware,
         exclude_paths={
             f"{prefix}/health",
             f"{prefix}/ready",
@@ -119,15 +114,6 @@ def _setup_middleware(app: FastAPI, settings: Settings) -> None:
         },
     )
 
-    # Request timing
-    app.add_middleware(TimingMiddleware)
-
-    # Request ID for tracing
-    app.add_middleware(RequestIDMiddleware)
-
-    # Security headers (runs first on request)
-    app.add_middleware(SecurityHeadersMiddleware)
-
 
 def _setup_routers(app: FastAPI, settings: Settings) -> None:
     """Mount API routers.
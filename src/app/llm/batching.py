@@ -0,0 +1,402 @@
+"""Micro-batching of structured LLM requests.
+
+Substitution, pairing and ingredient parsing prompts are small, and each
+one sent on its own spends a provider rate limit slot. Under load many of
+them are in flight at once. The scheduler here holds compatible
+``generate_structured`` calls (same schema, system prompt, model and
+options) for a short window, sends them as one multi-task prompt whose
+schema is a list of the original schema, and hands each caller its own
+item of the result.
+
+Merged prompts are sent with ``skip_cache=True``: a combination of tasks
+is rarely seen twice, and the services cache their results per item
+themselves. A batch the model answers wrongly (validation or response
+error) is retried one request at a time, so batching never turns a
+request that would have succeeded into a failure.
+
+This module provides:
+- LLMBatchScheduler: LLM client wrapper that micro-batches structured calls
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from prometheus_client import Counter, Histogram
+from pydantic import BaseModel, Field, create_model
+
+from app.llm.exceptions import LLMResponseError, LLMValidationError
+from app.llm.rate_limit import current_llm_priority
+from app.observability.logging import get_logger
+
+
+if TYPE_CHECKING:
+    from app.llm.client.protocol import LLMClientProtocol
+    from app.llm.models import LLMCompletionResult
+
+
+logger = get_logger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+# Batch key: schema, model, system prompt, options JSON, skip_cache, priority
+_BatchKey = tuple[type[BaseModel], str | None, str | None, str, bool, str]
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+LLM_BATCH_SIZE = Histogram(
+    "size",
+    "Structured LLM requests merged into one provider call",
+    ["schema"],
+    namespace="recipe_scraper",
+    subsystem="llm_batch",
+    buckets=(1, 2, 3, 4, 6, 8, 12, 16),
+)
+LLM_BATCH_FALLBACKS = Counter(
+    "fallbacks",
+    "Merged LLM batches retried one request at a time",
+    ["schema"],
+    namespace="recipe_scraper",
+    subsystem="llm_batch",
+)
+
+
+# =============================================================================
+# Merged prompt and schema
+# =============================================================================
+
+
+@lru_cache(maxsize=128)
+def _batch_schema(schema: type[BaseModel], size: int) -> type[BaseModel]:
+    """Schema holding exactly ``size`` results of ``schema``, in task order."""
+    return create_model(
+        f"{schema.__name__}Batch",
+        results=(
+            list[schema],  # type: ignore[valid-type]
+            Field(
+                ...,
+                min_length=size,
+                max_length=size,
+                description="One result per task, in task order",
+            ),
+        ),
+    )
+
+
+def _batch_prompt(prompts: list[str]) -> str:
+    """Combine independent task prompts into one."""
+    tasks = "\n\n".join(
+        f"### Task {i}\n{prompt}" for i, prompt in enumerate(prompts, start=1)
+    )
+    return f"""Complete the following {len(prompts)} independent tasks.
+Each task is self-contained; do not let one task influence another.
+Return a JSON object with a "results" array of exactly {len(prompts)} items.
+Item N is the JSON object answering task N, in the format that task asks for.
+
+{tasks}"""
+
+
+def _batch_options(options: dict[str, Any] | None, size: int) -> dict[str, Any] | None:
+    """Scale the output token limit to the number of merged tasks."""
+    if not options or options.get("num_predict") is None:
+        return options
+    return {**options, "num_predict": options["num_predict"] * size}
+
+
+# =============================================================================
+# Scheduler
+# =============================================================================
+
+
+@dataclass
+class _PendingRequest:
+    """A structured request waiting for its batch to be sent."""
+
+    prompt: str
+    context: str | None
+    future: asyncio.Future[BaseModel]
+
+
+@dataclass
+class _PendingBatch:
+    """Requests sharing a batch key, and the timer that flushes them."""
+
+    options: dict[str, Any] | None = None
+    requests: list[_PendingRequest] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+
+
+class LLMBatchScheduler:
+    """LLM client that micro-batches compatible structured requests.
+
+    Wraps another LLM client (usually FallbackLLMClient) and implements
+    LLMClientProtocol. ``generate`` calls pass straight through.
+    ``generate_structured`` calls are grouped by schema, model, system
+    prompt, options, ``skip_cache`` and rate limit priority. A group is
+    sent ``window`` seconds after its first request, or as soon as it
+    reaches ``max_batch_size``. A group of one is sent unchanged.
+
+    Example:
+        ```python
+        client = LLMBatchScheduler(FallbackLLMClient(...), window=0.02)
+        # Concurrent calls within 20ms share one provider request
+        butter, eggs = await asyncio.gather(
+            client.generate_structured(butter_prompt, SubstitutionListResult),
+            client.generate_structured(eggs_prompt, SubstitutionListResult),
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        client: LLMClientProtocol,
+        *,
+        window: float = 0.02,
+        max_batch_size: int = 4,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            client: Client that sends the (merged) requests.
+            window: Seconds to wait for compatible requests after the
+                first one of a batch.
+            max_batch_size: Requests merged into one call at most.
+        """
+        self.client = client
+        self.window = window
+        self.max_batch_size = max(1, max_batch_size)
+        self._pending: dict[_BatchKey, _PendingBatch] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def initialize(self) -> None:
+        """Initialize the wrapped client."""
+        await self.client.initialize()
+        logger.info(
+            "LLMBatchScheduler initialized",
+            window_seconds=self.window,
+            max_batch_size=self.max_batch_size,
+        )
+
+    async def shutdown(self) -> None:
+        """Send pending batches, then shut down the wrapped client."""
+        for key in list(self._pending):
+            self._flush(key)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.client.shutdown()
+        logger.debug("LLMBatchScheduler shutdown")
+
+    async def generate(
+        self,
+        prompt: str,
+        *,
+        model: str | None = None,
+        system: str | None = None,
+        schema: type[T] | None = None,
+        options: dict[str, Any] | None = None,
+        skip_cache: bool = False,
+        context: str | None = None,
+    ) -> LLMCompletionResult:
+        """Generate text with the wrapped client (not batched).
+
+        Args:
+            prompt: Input prompt text.
+            model: Model override (uses client default if None).
+            system: Optional system prompt.
+            schema: Optional Pydantic model for structured JSON output.
+            options: Model-specific options (temperature, etc.).
+            skip_cache: Bypass cache if True.
+            context: Optional context identifier for logging/tracing.
+
+        Returns:
+            LLMCompletionResult from the wrapped client.
+        """
+        return await self.client.generate(
+            prompt=prompt,
+            model=model,
+            system=system,
+            schema=schema,
+            options=options,
+            skip_cache=skip_cache,
+            context=context,
+        )
+
+    async def generate_structured(
+        self,
+        prompt: str,
+        schema: type[T],
+        *,
+        model: str | None = None,
+        system: str | None = None,
+        options: dict[str, Any] | None = None,
+        skip_cache: bool = False,
+        context: str | None = None,
+    ) -> T:
+        """Generate structured output, batched with compatible requests.
+
+        Args:
+            prompt: Input prompt text.
+            schema: Pydantic model class for output structure.
+            model: Model to use (defaults to client's default model).
+            system: Optional system prompt for context.
+            options: Model-specific options.
+            skip_cache: If True, bypass cache for this request.
+            context: Optional context identifier for logging/tracing.
+
+        Returns:
+            Instance of the schema class populated from LLM response.
+
+        Raises:
+            LLMUnavailableError: If the wrapped client is unavailable.
+            LLMValidationError: If response doesn't match schema.
+        """
+        key: _BatchKey = (
+            schema,
+            model,
+            system,
+            json.dumps(options or {}, sort_keys=True, default=str),
+            skip_cache,
+            current_llm_priority().value,
+        )
+        future: asyncio.Future[BaseModel] = asyncio.get_running_loop().create_future()
+
+        batch = self._pending.setdefault(key, _PendingBatch(options=options))
+        batch.requests.append(_PendingRequest(prompt, context, future))
+        if len(batch.requests) >= self.max_batch_size:
+            self._flush(key)
+        elif batch.timer is None:
+            # The timer callback runs in this context, keeping its priority
+            batch.timer = asyncio.get_running_loop().call_later(
+                self.window, self._flush, key
+            )
+
+        return cast("T", await future)
+
+    def _flush(self, key: _BatchKey) -> None:
+        """Start sending the batch for a key."""
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+
+        schema, model, system, _, skip_cache, _ = key
+        task = asyncio.create_task(
+            self._send(
+                batch.requests,
+                schema,
+                model=model,
+                system=system,
+                options=batch.options,
+                skip_cache=skip_cache,
+            )
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(
+        self,
+        requests: list[_PendingRequest],
+        schema: type[BaseModel],
+        *,
+        model: str | None,
+        system: str | None,
+        options: dict[str, Any] | None,
+        skip_cache: bool,
+    ) -> None:
+        """Send a batch and resolve its callers' futures."""
+        LLM_BATCH_SIZE.labels(schema=schema.__name__).observe(len(requests))
+
+        if len(requests) == 1:
+            await self._send_one(
+                requests[0],
+                schema,
+                model=model,
+                system=system,
+                options=options,
+                skip_cache=skip_cache,
+            )
+            return
+
+        try:
+            merged = await self.client.generate_structured(
+                prompt=_batch_prompt([r.prompt for r in requests]),
+                schema=_batch_schema(schema, len(requests)),
+                model=model,
+                system=system,
+                options=_batch_options(options, len(requests)),
+                skip_cache=True,
+                context=f"batch:{len(requests)}:{requests[0].context}",
+            )
+        except (LLMValidationError, LLMResponseError) as e:
+            LLM_BATCH_FALLBACKS.labels(schema=schema.__name__).inc()
+            logger.warning(
+                "Batched LLM request failed, sending requests one by one",
+                schema=schema.__name__,
+                batch_size=len(requests),
+                error=str(e),
+            )
+            await asyncio.gather(
+                *[
+                    self._send_one(
+                        r,
+                        schema,
+                        model=model,
+                        system=system,
+                        options=options,
+                        skip_cache=skip_cache,
+                    )
+                    for r in requests
+                ]
+            )
+            return
+        except Exception as e:
+            for r in requests:
+                if not r.future.done():
+                    r.future.set_exception(e)
+            return
+
+        logger.debug(
+            "Sent batched LLM request",
+            schema=schema.__name__,
+            batch_size=len(requests),
+        )
+        results: list[BaseModel] = merged.results  # type: ignore[attr-defined]
+        for r, result in zip(requests, results, strict=True):
+            if not r.future.done():
+                r.future.set_result(result)
+
+    async def _send_one(
+        self,
+        request: _PendingRequest,
+        schema: type[BaseModel],
+        *,
+        model: str | None,
+        system: str | None,
+        options: dict[str, Any] | None,
+        skip_cache: bool,
+    ) -> None:
+        """Send a single request and resolve its caller's future."""
+        try:
+            result = await self.client.generate_structured(
+                prompt=request.prompt,
+                schema=schema,
+                model=model,
+                system=system,
+                options=options,
+                skip_cache=skip_cache,
+                context=request.context,
+            )
+        except Exception as e:
+            if not request.future.done():
+                request.future.set_exception(e)
+            return
+        if not request.future.done():
+            request.future.set_result(result)
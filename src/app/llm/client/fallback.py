@@ -1,12 +1,21 @@
 """Fallback LLM client that chains multiple providers.
 
 Tries primary provider first, falls back to secondary on LLMUnavailableError.
+Once the primary has enough latency samples, a request still running past
+the primary's rolling p95 is hedged to the secondary and the first good
+response wins. A provider failing repeatedly is skipped by a circuit
+breaker until its cooldown has passed.
 """
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, TypeVar
 
+from prometheus_client import Counter, Histogram
 from pydantic import BaseModel
 
 from app.llm.exceptions import LLMUnavailableError
@@ -14,6 +23,8 @@ from app.observability.logging import get_logger
 
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from app.llm.client.protocol import LLMClientProtocol
     from app.llm.models import LLMCompletionResult
 
@@ -21,6 +32,117 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+LLM_PROVIDER_LATENCY = Histogram(
+    "provider_latency_seconds",
+    "Latency of successful LLM provider calls",
+    ["provider"],
+    namespace="recipe_scraper",
+    subsystem="llm",
+    buckets=(0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0),
+)
+LLM_HEDGES = Counter(
+    "hedges",
+    "LLM requests hedged to the secondary provider",
+    ["provider"],
+    namespace="recipe_scraper",
+    subsystem="llm",
+)
+LLM_HEDGE_WINS = Counter(
+    "hedge_wins",
+    "Hedged LLM requests by the provider whose response was used",
+    ["provider"],
+    namespace="recipe_scraper",
+    subsystem="llm",
+)
+LLM_CIRCUIT_OPENS = Counter(
+    "circuit_opens",
+    "Times an LLM provider's circuit breaker opened",
+    ["provider"],
+    namespace="recipe_scraper",
+    subsystem="llm",
+)
+
+
+# =============================================================================
+# Provider health
+# =============================================================================
+
+
+@dataclass
+class _Provider:
+    """A provider client with its rolling latency and circuit breaker state."""
+
+    client: LLMClientProtocol
+    latency_window: int
+    failure_threshold: int
+    reset_timeout: float
+    name: str = ""
+    latencies: deque[float] = field(init=False)
+    failures: int = 0
+    opened_at: float | None = None
+
+    def __post_init__(self) -> None:
+        if not self.name:
+            self.name = type(self.client).__name__.removesuffix("Client").lower()
+        self.latencies = deque(maxlen=self.latency_window)
+
+    def percentile(self, q: float) -> float | None:
+        """Rolling latency percentile (0-1), or None without samples."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def allow_request(self) -> bool:
+        """Whether the circuit is closed, or open long enough for a trial."""
+        if self.opened_at is None:
+            return True
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            return False
+        # Half-open: let this request through and hold the others back
+        # until it reports back
+        self.opened_at = time.monotonic()
+        return True
+
+    def record_success(self, duration: float) -> None:
+        self.latencies.append(duration)
+        LLM_PROVIDER_LATENCY.labels(provider=self.name).observe(duration)
+        self.failures = 0
+        if self.opened_at is not None:
+            self.opened_at = None
+            logger.info("LLM provider circuit closed", provider=self.name)
+
+    def record_cancelled(self, duration: float) -> None:
+        """Keep an abandoned call's elapsed time as a censored sample.
+
+        A primary call losing a hedge is cancelled past the p95; dropping it
+        would remove a tail sample on every hedge and let the p95 (and with
+        it the hedge delay) drift down. Cancellations before the p95, such
+        as the caller going away, say little about the tail and are skipped.
+        """
+        p95 = self.percentile(0.95)
+        if p95 is not None and duration >= p95:
+            self.latencies.append(duration)
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.failure_threshold and self.opened_at is None:
+            LLM_CIRCUIT_OPENS.labels(provider=self.name).inc()
+            logger.warning(
+                "LLM provider circuit opened",
+                provider=self.name,
+                failures=self.failures,
+                reset_timeout=self.reset_timeout,
+            )
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
 
 
 class FallbackLLMClient:
@@ -38,6 +160,15 @@ class FallbackLLMClient:
     - LLMResponseError: HTTP 4xx/5xx errors
     - LLMRateLimitError: Should implement backoff, not fallback
 
+    Latency-aware routing (when a secondary is available):
+    - Hedging: once the primary has ``hedge_min_samples`` latency samples,
+      a request still running after the primary's rolling p95 is also sent
+      to the secondary. The first successful response is used and the other
+      request is cancelled.
+    - Circuit breaker: after ``failure_threshold`` consecutive
+      LLMUnavailableErrors a provider is skipped for ``reset_timeout``
+      seconds, then a single trial request decides whether it is used again.
+
     Example:
         ```python
         client = FallbackLLMClient(
@@ -54,6 +185,11 @@ class FallbackLLMClient:
         secondary: LLMClientProtocol | None = None,
         *,
         fallback_enabled: bool = True,
+        hedging_enabled: bool = True,
+        hedge_min_samples: int = 20,
+        latency_window: int = 100,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
     ) -> None:
         """Initialize the fallback client.
 
@@ -61,10 +197,28 @@ class FallbackLLMClient:
             primary: Primary LLM client (typically local Ollama).
             secondary: Fallback LLM client (typically cloud Groq).
             fallback_enabled: Master switch for fallback behavior.
+            hedging_enabled: Hedge slow primary requests to the secondary.
+            hedge_min_samples: Primary latency samples needed before hedging.
+            latency_window: Recent call latencies kept per provider for
+                the rolling percentiles (successes, and cancelled calls
+                that ran past the p95).
+            failure_threshold: Consecutive unavailability errors that open
+                a provider's circuit.
+            reset_timeout: Seconds an open circuit skips its provider.
         """
         self.primary = primary
         self.secondary = secondary
         self.fallback_enabled = fallback_enabled
+        self.hedging_enabled = hedging_enabled
+        self.hedge_min_samples = hedge_min_samples
+        self._primary = _Provider(
+            primary, latency_window, failure_threshold, reset_timeout
+        )
+        self._secondary = (
+            _Provider(secondary, latency_window, failure_threshold, reset_timeout)
+            if secondary is not None
+            else None
+        )
 
     async def initialize(self) -> None:
         """Initialize both clients."""
@@ -75,6 +229,7 @@ class FallbackLLMClient:
             "FallbackLLMClient initialized",
             has_secondary=self.secondary is not None,
             fallback_enabled=self.fallback_enabled,
+            hedging_enabled=self.hedging_enabled,
         )
 
     async def shutdown(self) -> None:
@@ -84,6 +239,16 @@ class FallbackLLMClient:
             await self.secondary.shutdown()
         logger.debug("FallbackLLMClient shutdown")
 
+    def latency_percentiles(self) -> dict[str, dict[str, float | None]]:
+        """Rolling p50/p95 latency per provider, for diagnostics."""
+        providers = [self._primary]
+        if self._secondary is not None:
+            providers.append(self._secondary)
+        return {
+            p.name: {"p50": p.percentile(0.5), "p95": p.percentile(0.95)}
+            for p in providers
+        }
+
     async def generate(
         self,
         prompt: str,
@@ -99,7 +264,8 @@ class FallbackLLMClient:
 
         Tries primary client first. If it raises LLMUnavailableError
         and fallback is enabled with a secondary client, retries
-        with the secondary client.
+        with the secondary client. Slow primary requests may be hedged
+        to the secondary (see class docstring).
 
         Args:
             prompt: Input prompt text.
@@ -118,31 +284,9 @@ class FallbackLLMClient:
             LLMValidationError: If response doesn't match schema.
             LLMResponseError: If service returns HTTP error.
         """
-        try:
-            return await self.primary.generate(
-                prompt=prompt,
-                model=model,
-                system=system,
-                schema=schema,
-                options=options,
-                skip_cache=skip_cache,
-                context=context,
-            )
-        except LLMUnavailableError as e:
-            if not self.fallback_enabled or self.secondary is None:
-                logger.exception(
-                    "Primary LLM unavailable, no fallback configured",
-                    context=context,
-                )
-                raise
-
-            logger.warning(
-                "Primary LLM unavailable, falling back to secondary",
-                context=context,
-                primary_error=str(e),
-            )
 
-            return await self.secondary.generate(
+        def call(client: LLMClientProtocol) -> Awaitable[LLMCompletionResult]:
+            return client.generate(
                 prompt=prompt,
                 model=model,
                 system=system,
@@ -152,6 +296,8 @@ class FallbackLLMClient:
                 context=context,
             )
 
+        return await self._route(call, context)
+
     async def generate_structured(
         self,
         prompt: str,
@@ -181,8 +327,9 @@ class FallbackLLMClient:
             LLMUnavailableError: If both primary and secondary fail.
             LLMValidationError: If response doesn't match schema.
         """
-        try:
-            return await self.primary.generate_structured(
+
+        def call(client: LLMClientProtocol) -> Awaitable[T]:
+            return client.generate_structured(
                 prompt=prompt,
                 schema=schema,
                 model=model,
@@ -191,26 +338,126 @@ class FallbackLLMClient:
                 skip_cache=skip_cache,
                 context=context,
             )
-        except LLMUnavailableError as e:
-            if not self.fallback_enabled or self.secondary is None:
+
+        return await self._route(call, context)
+
+    # =========================================================================
+    # Routing
+    # =========================================================================
+
+    async def _route(
+        self,
+        call: Callable[[LLMClientProtocol], Awaitable[R]],
+        context: str | None,
+    ) -> R:
+        """Send a request to the primary, the secondary, or both."""
+        secondary = self._secondary if self.fallback_enabled else None
+
+        if secondary is None:
+            try:
+                return await self._call(self._primary, call)
+            except LLMUnavailableError:
                 logger.exception(
                     "Primary LLM unavailable, no fallback configured",
                     context=context,
                 )
                 raise
 
+        if not self._primary.allow_request() and secondary.allow_request():
+            logger.debug(
+                "Primary LLM circuit open, using secondary",
+                context=context,
+                provider=secondary.name,
+            )
+            return await self._call(secondary, call)
+
+        primary_task = asyncio.create_task(self._call(self._primary, call))
+        try:
+            hedge_delay = self._hedge_delay()
+            if hedge_delay is not None:
+                await asyncio.wait({primary_task}, timeout=hedge_delay)
+            if primary_task.done() or hedge_delay is None:
+                return await self._fallback(primary_task, secondary, call, context)
+            if not secondary.allow_request():
+                return await primary_task
+            return await self._hedge(primary_task, secondary, call, context)
+        finally:
+            primary_task.cancel()
+
+    def _hedge_delay(self) -> float | None:
+        """Seconds after which a primary request is hedged, or None."""
+        if (
+            not self.hedging_enabled
+            or len(self._primary.latencies) < self.hedge_min_samples
+        ):
+            return None
+        return self._primary.percentile(0.95)
+
+    async def _fallback(
+        self,
+        primary_task: asyncio.Task[R],
+        secondary: _Provider,
+        call: Callable[[LLMClientProtocol], Awaitable[R]],
+        context: str | None,
+    ) -> R:
+        """Await the primary, falling back to the secondary if unavailable."""
+        try:
+            return await primary_task
+        except LLMUnavailableError as e:
             logger.warning(
                 "Primary LLM unavailable, falling back to secondary",
                 context=context,
                 primary_error=str(e),
             )
+            return await self._call(secondary, call)
 
-            return await self.secondary.generate_structured(
-                prompt=prompt,
-                schema=schema,
-                model=model,
-                system=system,
-                options=options,
-                skip_cache=skip_cache,
-                context=context,
-            )
+    async def _hedge(
+        self,
+        primary_task: asyncio.Task[R],
+        secondary: _Provider,
+        call: Callable[[LLMClientProtocol], Awaitable[R]],
+        context: str | None,
+    ) -> R:
+        """Race a slow primary request against the secondary."""
+        LLM_HEDGES.labels(provider=secondary.name).inc()
+        logger.info(
+            "Primary LLM slower than p95, hedging to secondary",
+            context=context,
+            primary=self._primary.name,
+            secondary=secondary.name,
+        )
+        secondary_task = asyncio.create_task(self._call(secondary, call))
+        providers = {primary_task: self._primary, secondary_task: secondary}
+        pending: set[asyncio.Task[R]] = {primary_task, secondary_task}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                winners = [t for t in done if t.exception() is None]
+                if winners:
+                    LLM_HEDGE_WINS.labels(provider=providers[winners[0]].name).inc()
+                    return winners[0].result()
+        finally:
+            secondary_task.cancel()
+
+        # Both failed: like a plain fallback, report the secondary's error
+        return secondary_task.result()
+
+    @staticmethod
+    async def _call(
+        provider: _Provider,
+        call: Callable[[LLMClientProtocol], Awaitable[R]],
+    ) -> R:
+        """Call a provider, recording its latency and availability."""
+        start = time.monotonic()
+        try:
+            result = await call(provider.client)
+        except LLMUnavailableError:
+            provider.record_failure()
+            raise
+        except asyncio.CancelledError:
+            provider.record_cancelled(time.monotonic() - start)
+            raise
+        provider.record_success(time.monotonic() - start)
+        return result
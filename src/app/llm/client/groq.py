@@ -13,9 +13,10 @@ import time
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 import httpx
-from aiolimiter import AsyncLimiter
 from pydantic import BaseModel
 
+from app.cache.namespaces import CacheNamespace, namespaced_key
+from app.cache.swr import decode_swr_entry, encode_swr_entry, schedule_revalidation
 from app.llm.exceptions import (
     LLMRateLimitError,
     LLMResponseError,
@@ -28,6 +29,13 @@ from app.llm.models import (
     GroqChatResponse,
     LLMCompletionResult,
 )
+from app.llm.output_schemas import output_schema_name
+from app.llm.rate_limit import (
+    DEFAULT_RETRY_AFTER,
+    LLMRateLimiter,
+    current_llm_priority,
+    parse_reset_duration,
+)
 from app.observability.logging import get_logger
 
 
@@ -65,8 +73,10 @@ class GroqClient:
         max_retries: int = 2,
         cache_client: Redis[Any] | None = None,
         cache_ttl: int = 3600,
+        cache_stale_ttl: int = 0,
         cache_enabled: bool = True,
         requests_per_minute: float = 30.0,
+        rate_limiter: LLMRateLimiter | None = None,
     ) -> None:
         """Initialize the Groq client.
 
@@ -78,8 +88,13 @@ class GroqClient:
             max_retries: Maximum retries for transient failures (default: 2).
             cache_client: Optional Redis client for caching responses.
             cache_ttl: Cache TTL in seconds (default: 3600 = 1 hour).
+            cache_stale_ttl: Seconds an expired entry is still served while a
+                background job regenerates it (default: 0 = disabled).
             cache_enabled: Whether to use caching (default: True).
-            requests_per_minute: Rate limit for API requests (default: 30, Groq free tier).
+            requests_per_minute: Rate limit for API requests (default: 30, Groq
+                free tier). Used only when no rate_limiter is given.
+            rate_limiter: Limiter shared with other clients and replicas
+                (default: a process-local limiter at requests_per_minute).
         """
         self.api_key = api_key
         self.model = model
@@ -88,20 +103,18 @@ class GroqClient:
         self.max_retries = max_retries
         self.cache_client = cache_client
         self.cache_ttl = cache_ttl
+        self.cache_stale_ttl = cache_stale_ttl
         self.cache_enabled = cache_enabled
         self._http_client: httpx.AsyncClient | None = None
-        # Prevent bursts: 1 request per (60/rpm) seconds instead of rpm requests per 60s
-        # With 10 RPM: allows 1 request every 6 seconds (no initial burst)
-        self._requests_per_minute = requests_per_minute
-        self._rate_limit_period = 60.0 / requests_per_minute
-        self._rate_limiter = AsyncLimiter(1, self._rate_limit_period)
-        self._last_request_time: float | None = None
+        self._rate_limiter = rate_limiter or LLMRateLimiter(
+            None, key=f"groq:{model}", requests_per_minute=requests_per_minute
+        )
         self._request_count = 0
         logger.info(
             "GroqClient rate limiter configured",
-            requests_per_minute=requests_per_minute,
-            period_seconds=self._rate_limit_period,
-            description=f"1 request per {self._rate_limit_period:.1f}s",
+            requests_per_minute=self._rate_limiter.rate * 60,
+            shared=self._rate_limiter.shared,
+            key=self._rate_limiter.key,
         )
 
     @property
@@ -153,13 +166,13 @@ class GroqClient:
         schema_str = str(schema.model_json_schema()) if schema else ""
         content = f"groq:{model}:{system or ''}:{prompt}:{schema_str}"
         content_hash = hashlib.sha256(content.encode()).hexdigest()[:16]
-        return f"llm:generate:{content_hash}"
+        return namespaced_key(CacheNamespace.LLM_COMPLETION, content_hash)
 
     async def _get_cached_result(
         self,
         cache_key: str,
-    ) -> LLMCompletionResult | None:
-        """Get cached completion result if available."""
+    ) -> tuple[LLMCompletionResult, bool] | None:
+        """Get cached completion result and whether it is stale, if available."""
         if not self.cache_enabled or not self.cache_client:
             return None
 
@@ -167,14 +180,18 @@ class GroqClient:
             cached = await self.cache_client.get(cache_key)
             if cached:
                 logger.debug("Cache hit for Groq completion", cache_key=cache_key)
-                result = LLMCompletionResult.model_validate_json(cached)
-                return LLMCompletionResult(
-                    raw_response=result.raw_response,
-                    parsed=result.parsed,
-                    model=result.model,
-                    prompt_tokens=result.prompt_tokens,
-                    completion_tokens=result.completion_tokens,
-                    cached=True,
+                entry = decode_swr_entry(cached)
+                result = LLMCompletionResult.model_validate(entry.value)
+                return (
+                    LLMCompletionResult(
+                        raw_response=result.raw_response,
+                        parsed=result.parsed,
+                        model=result.model,
+                        prompt_tokens=result.prompt_tokens,
+                        completion_tokens=result.completion_tokens,
+                        cached=True,
+                    ),
+                    entry.stale,
                 )
         except Exception as e:
             logger.warning("Failed to read from LLM cache", error=str(e))
@@ -193,8 +210,8 @@ class GroqClient:
         try:
             await self.cache_client.set(
                 cache_key,
-                result.model_dump_json(),
-                ex=self.cache_ttl,
+                encode_swr_entry(result.model_dump(mode="json"), self.cache_ttl),
+                ex=self.cache_ttl + self.cache_stale_ttl,
             )
             logger.debug(
                 "Cached Groq completion", cache_key=cache_key, ttl=self.cache_ttl
@@ -202,37 +219,51 @@ class GroqClient:
         except Exception as e:
             logger.warning("Failed to cache Groq completion", error=str(e))
 
-    async def _acquire_rate_limit(
-        self, context: str, request_num: int, attempt: int
+    async def _schedule_revalidation(
+        self,
+        cache_key: str,
+        prompt: str,
+        model: str,
+        schema: type[BaseModel] | None,
+        system: str | None,
+        options: dict[str, Any] | None,
     ) -> None:
-        """Acquire rate limiter with logging."""
-        acquire_start = time.monotonic()
-
-        if self._last_request_time is not None:
-            time_since_last = acquire_start - self._last_request_time
-            logger.debug(
-                "Rate limiter: waiting to acquire",
-                context=context,
-                request_num=request_num,
-                time_since_last_request=f"{time_since_last:.2f}s",
-                required_gap=f"{self._rate_limit_period:.1f}s",
-            )
-        else:
+        """Enqueue background regeneration of a stale cached completion."""
+        schema_name = output_schema_name(schema) if schema else None
+        if schema is not None and schema_name is None:
+            # The worker only resolves registered schemas
             logger.debug(
-                "Rate limiter: first request, acquiring immediately",
-                context=context,
-                request_num=request_num,
+                "Not revalidating completion of unregistered schema",
+                schema=schema.__name__,
             )
+            return
 
-        await self._rate_limiter.acquire()
+        await schedule_revalidation(
+            "llm",
+            cache_key,
+            "revalidate_llm_completion",
+            cache_key,
+            prompt,
+            model=model,
+            system=system,
+            schema=schema_name,
+            options=options,
+            fresh_ttl=self.cache_ttl,
+            stale_ttl=self.cache_stale_ttl,
+        )
 
-        wait_time = time.monotonic() - acquire_start
-        self._last_request_time = time.monotonic()
+    async def _acquire_rate_limit(
+        self, context: str, request_num: int, attempt: int
+    ) -> None:
+        """Acquire rate limiter with logging."""
+        priority = current_llm_priority()
+        wait_time = await self._rate_limiter.acquire(priority)
 
         logger.info(
             "Rate limiter: acquired",
             context=context,
             request_num=request_num,
+            priority=priority.value,
             wait_time=f"{wait_time:.2f}s",
             attempt=attempt + 1,
         )
@@ -264,11 +295,19 @@ class GroqClient:
                 )
 
                 request_duration = time.monotonic() - request_start
+                await self._rate_limiter.observe(response.headers, response.status_code)
 
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get("retry-after", "60"))
+                    retry_after = parse_reset_duration(
+                        response.headers.get("retry-after")
+                    )
+                    if retry_after is None:
+                        retry_after = DEFAULT_RETRY_AFTER
 
-                    # Retry with backoff if we have retries left
+                    # Retry with backoff if we have retries left. The limiter
+                    # pauses the other replicas as well; sleeping out the
+                    # pause here keeps the retry from failing fast on the
+                    # limiter's max_wait for interactive requests
                     if attempt < self.max_retries:
                         logger.warning(
                             "Groq rate limit hit, sleeping before retry",
@@ -451,12 +490,18 @@ class GroqClient:
         if not skip_cache:
             cached = await self._get_cached_result(cache_key)
             if cached is not None:
+                result, stale = cached
+                if stale:
+                    await self._schedule_revalidation(
+                        cache_key, prompt, use_model, schema, system, options
+                    )
                 logger.debug(
                     "Groq request served from cache",
                     context=ctx,
                     cache_key=cache_key[:20],
+                    stale=stale,
                 )
-                return cached
+                return result
 
         # Build messages for chat API
         messages: list[dict[str, str]] = []
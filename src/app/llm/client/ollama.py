@@ -12,6 +12,8 @@ from typing import TYPE_CHECKING, Any, TypeVar, cast
 import httpx
 from pydantic import BaseModel
 
+from app.cache.namespaces import CacheNamespace, namespaced_key
+from app.cache.swr import decode_swr_entry, encode_swr_entry, schedule_revalidation
 from app.llm.exceptions import (
     LLMRateLimitError,
     LLMResponseError,
@@ -24,6 +26,7 @@ from app.llm.models import (
     OllamaGenerateRequest,
     OllamaGenerateResponse,
 )
+from app.llm.output_schemas import output_schema_name
 from app.observability.logging import get_logger
 
 
@@ -62,6 +65,7 @@ class OllamaClient:
         max_retries: int = 2,
         cache_client: Redis[Any] | None = None,
         cache_ttl: int = 3600,
+        cache_stale_ttl: int = 0,
         cache_enabled: bool = True,
     ) -> None:
         """Initialize the Ollama client.
@@ -73,6 +77,8 @@ class OllamaClient:
             max_retries: Maximum retries for transient failures (default: 2).
             cache_client: Optional Redis client for caching responses.
             cache_ttl: Cache TTL in seconds (default: 3600 = 1 hour).
+            cache_stale_ttl: Seconds an expired entry is still served while a
+                background job regenerates it (default: 0 = disabled).
             cache_enabled: Whether to use caching (default: True).
         """
         self.base_url = base_url.rstrip("/")
@@ -81,6 +87,7 @@ class OllamaClient:
         self.max_retries = max_retries
         self.cache_client = cache_client
         self.cache_ttl = cache_ttl
+        self.cache_stale_ttl = cache_stale_ttl
         self.cache_enabled = cache_enabled
         self._http_client: httpx.AsyncClient | None = None
 
@@ -129,13 +136,13 @@ class OllamaClient:
         schema_str = str(schema.model_json_schema()) if schema else ""
         content = f"{model}:{system or ''}:{prompt}:{schema_str}"
         content_hash = hashlib.sha256(content.encode()).hexdigest()[:16]
-        return f"llm:generate:{content_hash}"
+        return namespaced_key(CacheNamespace.LLM_COMPLETION, content_hash)
 
     async def _get_cached_result(
         self,
         cache_key: str,
-    ) -> LLMCompletionResult | None:
-        """Get cached completion result if available."""
+    ) -> tuple[LLMCompletionResult, bool] | None:
+        """Get cached completion result and whether it is stale, if available."""
         if not self.cache_enabled or not self.cache_client:
             return None
 
@@ -143,15 +150,19 @@ class OllamaClient:
             cached = await self.cache_client.get(cache_key)
             if cached:
                 logger.debug("Cache hit for LLM completion", cache_key=cache_key)
-                result = LLMCompletionResult.model_validate_json(cached)
+                entry = decode_swr_entry(cached)
+                result = LLMCompletionResult.model_validate(entry.value)
                 # Return with cached=True flag
-                return LLMCompletionResult(
-                    raw_response=result.raw_response,
-                    parsed=result.parsed,
-                    model=result.model,
-                    prompt_tokens=result.prompt_tokens,
-                    completion_tokens=result.completion_tokens,
-                    cached=True,
+                return (
+                    LLMCompletionResult(
+                        raw_response=result.raw_response,
+                        parsed=result.parsed,
+                        model=result.model,
+                        prompt_tokens=result.prompt_tokens,
+                        completion_tokens=result.completion_tokens,
+                        cached=True,
+                    ),
+                    entry.stale,
                 )
         except Exception as e:
             logger.warning("Failed to read from LLM cache", error=str(e))
@@ -170,8 +181,8 @@ class OllamaClient:
         try:
             await self.cache_client.set(
                 cache_key,
-                result.model_dump_json(),
-                ex=self.cache_ttl,
+                encode_swr_entry(result.model_dump(mode="json"), self.cache_ttl),
+                ex=self.cache_ttl + self.cache_stale_ttl,
             )
             logger.debug(
                 "Cached LLM completion", cache_key=cache_key, ttl=self.cache_ttl
@@ -179,6 +190,39 @@ class OllamaClient:
         except Exception as e:
             logger.warning("Failed to cache LLM completion", error=str(e))
 
+    async def _schedule_revalidation(
+        self,
+        cache_key: str,
+        prompt: str,
+        model: str,
+        schema: type[BaseModel] | None,
+        system: str | None,
+        options: dict[str, Any] | None,
+    ) -> None:
+        """Enqueue background regeneration of a stale cached completion."""
+        schema_name = output_schema_name(schema) if schema else None
+        if schema is not None and schema_name is None:
+            # The worker only resolves registered schemas
+            logger.debug(
+                "Not revalidating completion of unregistered schema",
+                schema=schema.__name__,
+            )
+            return
+
+        await schedule_revalidation(
+            "llm",
+            cache_key,
+            "revalidate_llm_completion",
+            cache_key,
+            prompt,
+            model=model,
+            system=system,
+            schema=schema_name,
+            options=options,
+            fresh_ttl=self.cache_ttl,
+            stale_ttl=self.cache_stale_ttl,
+        )
+
     async def _execute_with_retry(
         self,
         request: OllamaGenerateRequest,
@@ -282,7 +326,12 @@ class OllamaClient:
         if not skip_cache:
             cached = await self._get_cached_result(cache_key)
             if cached is not None:
-                return cached
+                result, stale = cached
+                if stale:
+                    await self._schedule_revalidation(
+                        cache_key, prompt, use_model, schema, system, options
+                    )
+                return result
 
         # Build request with optional structured output format
         format_spec: str | dict[str, Any] | None = None
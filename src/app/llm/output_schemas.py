@@ -0,0 +1,61 @@
+"""Registry of structured output schemas.
+
+Background jobs regenerating a cached completion (stale-while-revalidate)
+receive the structured output schema by name, since job arguments are
+serialized into the queue. Names are resolved against this fixed registry
+only, so queue data can never select which code the worker imports.
+
+This module provides:
+- OUTPUT_SCHEMAS: Known structured output schemas by name
+- output_schema_name: Registry name of a schema
+- resolve_output_schema: Schema registered under a name
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from app.llm.prompts.ingredient_parsing import ParsedIngredientList
+from app.llm.prompts.pairings import PairingListResult
+from app.llm.prompts.recipe_link_extraction import ExtractedRecipeLinkList
+from app.llm.prompts.substitution import SubstitutionListResult
+
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+
+OUTPUT_SCHEMAS: dict[str, type[BaseModel]] = {
+    schema.__name__: schema
+    for schema in (
+        ExtractedRecipeLinkList,
+        PairingListResult,
+        ParsedIngredientList,
+        SubstitutionListResult,
+    )
+}
+
+
+def output_schema_name(schema: type[BaseModel]) -> str | None:
+    """Get the registry name of a schema.
+
+    Args:
+        schema: Structured output schema.
+
+    Returns:
+        The name, or None if the schema is not registered.
+    """
+    name = schema.__name__
+    return name if OUTPUT_SCHEMAS.get(name) is schema else None
+
+
+def resolve_output_schema(name: str) -> type[BaseModel] | None:
+    """Get the schema registered under a name.
+
+    Args:
+        name: Registry name.
+
+    Returns:
+        The schema, or None if no schema has that name.
+    """
+    return OUTPUT_SCHEMAS.get(name)
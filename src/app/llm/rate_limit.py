@@ -0,0 +1,494 @@
+"""Distributed rate limiting for cloud LLM providers.
+
+Groq's request and token budgets are per organisation, but every API pod
+and ARQ worker runs its own GroqClient. A per-process limiter therefore
+spends the configured budget once per replica. The limiter here keeps one
+token bucket per provider and model in Redis, updated by an atomic Lua
+script, so all replicas draw from the same budget.
+
+The bucket adapts to the provider's ``x-ratelimit-*`` response headers: it
+pauses every replica until the reset when a budget is exhausted (or on a
+429), and halves the refill rate while a budget runs low. Interactive work
+(ingredient parsing for an import the user is waiting on) may take the last
+``interactive_reserve`` tokens; background work (popular recipe link
+extraction, cache revalidation) may not, so it goes last under contention.
+
+This module provides:
+- LLMPriority: Priority classes of LLM requests
+- llm_priority: Context manager setting the priority of the enclosed calls
+- LLMRateLimiter: Shared, adaptive token bucket
+- create_groq_rate_limiter: Build the limiter from Groq settings
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+from prometheus_client import Counter, Histogram
+
+from app.llm.exceptions import LLMRateLimitError
+from app.observability.logging import get_logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+    from redis.asyncio import Redis
+
+    from app.core.config.settings import GroqSettings
+
+
+logger = get_logger(__name__)
+
+# Must match the Redis ACL key pattern (scraper:*)
+RATE_LIMIT_KEY_PREFIX = "scraper:llm:rate_limit"
+
+# Pause applied on a 429 without a usable retry-after header
+DEFAULT_RETRY_AFTER = 60.0
+
+# Idle seconds a bucket outlives its refill time in Redis
+_KEY_TTL_MARGIN = 60
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+LLM_RATE_LIMIT_WAIT = Histogram(
+    "wait_seconds",
+    "Time LLM requests waited for the shared rate limiter",
+    ["priority"],
+    namespace="recipe_scraper",
+    subsystem="llm_rate_limit",
+    buckets=(0.01, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+LLM_RATE_LIMIT_ADAPTATIONS = Counter(
+    "adaptations",
+    "Rate limiter pauses and slowdowns triggered by provider headers",
+    ["reason"],
+    namespace="recipe_scraper",
+    subsystem="llm_rate_limit",
+)
+
+
+# =============================================================================
+# Priority
+# =============================================================================
+
+
+class LLMPriority(StrEnum):
+    """Priority classes of LLM requests."""
+
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
+
+
+_priority: ContextVar[LLMPriority] = ContextVar(
+    "llm_priority", default=LLMPriority.INTERACTIVE
+)
+
+
+@contextmanager
+def llm_priority(priority: LLMPriority) -> Iterator[None]:
+    """Set the priority of LLM requests made inside the block.
+
+    Example:
+        ```python
+        with llm_priority(LLMPriority.BACKGROUND):
+            links = await extractor.extract(html, base_url)
+        ```
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_llm_priority() -> LLMPriority:
+    """Get the priority of LLM requests made in the current context."""
+    return _priority.get()
+
+
+# =============================================================================
+# Lua scripts
+# =============================================================================
+
+# Take one token if the bucket holds at least ARGV[3], else return the
+# seconds until it will. A bucket whose timestamp lies in the future is
+# paused until then. Returns a string: Lua numbers are truncated to
+# integers on the way back to Redis.
+_ACQUIRE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local need = tonumber(ARGV[3])
+local ttl = tonumber(ARGV[4])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts', 'slow_until', 'factor')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+if now < ts then
+  return tostring(ts - now)
+end
+if now < (tonumber(state[3]) or 0) then
+  rate = rate * (tonumber(state[4]) or 1)
+end
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+local wait = 0
+if tokens >= need then
+  tokens = tokens - 1
+else
+  wait = (need - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], ttl)
+return tostring(wait)
+"""
+
+# Pause the bucket for ARGV[1] seconds (leaving one token for the first
+# request after it) and/or scale its refill rate by ARGV[2] for ARGV[3]
+# seconds. A pause never shortens one already in place.
+_ADAPT_SCRIPT = """
+local pause = tonumber(ARGV[1])
+local factor = tonumber(ARGV[2])
+local slow_for = tonumber(ARGV[3])
+local ttl = tonumber(ARGV[4])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+if pause > 0 then
+  local resume = now + pause
+  local ts = tonumber(redis.call('HGET', KEYS[1], 'ts')) or 0
+  if resume > ts then
+    redis.call('HSET', KEYS[1], 'tokens', '1', 'ts', tostring(resume))
+  end
+end
+if slow_for > 0 then
+  redis.call('HSET', KEYS[1], 'factor', tostring(factor),
+    'slow_until', tostring(now + slow_for))
+end
+redis.call('EXPIRE', KEYS[1], ttl)
+return 1
+"""
+
+
+# =============================================================================
+# Header parsing
+# =============================================================================
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def parse_reset_duration(value: str | None) -> float | None:
+    """Parse a Groq reset header ("2m59.56s", "7.66s", "120ms") to seconds.
+
+    Bare numbers are read as seconds. Returns None if the value is missing
+    or malformed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(n + u for n, u in parts) != value:
+        return None
+    return sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> float | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+# =============================================================================
+# Local bucket
+# =============================================================================
+
+
+class _LocalBucket:
+    """In-process bucket with the same rules as the Lua scripts.
+
+    Used when no Redis client is configured or Redis is unreachable.
+    """
+
+    def __init__(self, capacity: float) -> None:
+        self.tokens = capacity
+        self.ts = time.monotonic()
+        self.slow_until = 0.0
+        self.factor = 1.0
+
+    def take(self, rate: float, capacity: float, need: float) -> float:
+        now = time.monotonic()
+        if now < self.ts:
+            return self.ts - now
+        if now < self.slow_until:
+            rate *= self.factor
+        tokens = min(capacity, self.tokens + (now - self.ts) * rate)
+        wait = 0.0
+        if tokens >= need:
+            tokens -= 1
+        else:
+            wait = (need - tokens) / rate
+        self.tokens, self.ts = tokens, now
+        return wait
+
+    def adapt(self, pause: float, factor: float, slow_for: float) -> None:
+        now = time.monotonic()
+        if pause > 0 and now + pause > self.ts:
+            self.tokens, self.ts = 1.0, now + pause
+        if slow_for > 0:
+            self.factor, self.slow_until = factor, now + slow_for
+
+
+# =============================================================================
+# Limiter
+# =============================================================================
+
+
+class LLMRateLimiter:
+    """Token bucket shared by every replica through Redis.
+
+    The bucket refills at ``requests_per_minute`` and holds up to ``burst``
+    tokens. Interactive requests take a token whenever one is available;
+    background requests wait until taking one still leaves
+    ``interactive_reserve`` in the bucket. Without a Redis client, or while
+    Redis is unreachable, an in-process bucket with the same rules is used.
+
+    Example:
+        ```python
+        limiter = LLMRateLimiter(
+            get_rate_limit_client(),
+            key="groq:llama-3.1-8b-instant",
+            requests_per_minute=30,
+        )
+        await limiter.acquire()
+        response = await http.post(...)
+        await limiter.observe(response.headers, response.status_code)
+        ```
+    """
+
+    def __init__(
+        self,
+        redis: Redis[Any] | None,
+        *,
+        key: str,
+        requests_per_minute: float,
+        burst: int = 2,
+        interactive_reserve: int = 1,
+        max_wait: float = 30.0,
+        low_watermark: float = 0.1,
+        slowdown_factor: float = 0.5,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            redis: Client for the rate limit database, or None for a
+                process-local bucket.
+            key: Bucket name, unique per provider budget (e.g. provider
+                and model).
+            requests_per_minute: Refill rate shared by all replicas.
+            burst: Tokens the bucket holds after being idle.
+            interactive_reserve: Tokens background requests must leave for
+                interactive ones.
+            max_wait: Seconds an interactive request waits for a token
+                before LLMRateLimitError is raised. Background requests
+                wait as long as needed.
+            low_watermark: Fraction of a provider budget below which the
+                refill rate is slowed until the budget resets.
+            slowdown_factor: Rate multiplier applied while slowed.
+        """
+        self.key = f"{RATE_LIMIT_KEY_PREFIX}:{key}"
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(max(1, burst))
+        self.reserve = float(max(0, interactive_reserve))
+        self.max_wait = max_wait
+        self.low_watermark = low_watermark
+        self.slowdown_factor = slowdown_factor
+        self._redis = redis
+        self._local = _LocalBucket(self.capacity)
+        self._acquire_script = (
+            redis.register_script(_ACQUIRE_SCRIPT) if redis is not None else None
+        )
+        self._adapt_script = (
+            redis.register_script(_ADAPT_SCRIPT) if redis is not None else None
+        )
+
+    @property
+    def shared(self) -> bool:
+        """Whether the bucket is shared through Redis."""
+        return self._redis is not None
+
+    def _need(self, priority: LLMPriority) -> float:
+        """Tokens the bucket must hold for a request of this priority."""
+        if priority is LLMPriority.INTERACTIVE:
+            return 1.0
+        return min(self.capacity, 1.0 + self.reserve)
+
+    async def acquire(self, priority: LLMPriority | None = None) -> float:
+        """Wait for a token.
+
+        Args:
+            priority: Request priority (default: the context's priority,
+                see llm_priority).
+
+        Returns:
+            Seconds spent waiting.
+
+        Raises:
+            LLMRateLimitError: If an interactive request would wait longer
+                than max_wait.
+        """
+        priority = priority or current_llm_priority()
+        need = self._need(priority)
+        start = time.monotonic()
+        deadline = (
+            start + self.max_wait if priority is LLMPriority.INTERACTIVE else None
+        )
+
+        while True:
+            wait = await self._take(need)
+            if wait <= 0:
+                waited = time.monotonic() - start
+                LLM_RATE_LIMIT_WAIT.labels(priority=priority.value).observe(waited)
+                return waited
+            if deadline is not None and time.monotonic() + wait > deadline:
+                LLM_RATE_LIMIT_WAIT.labels(priority=priority.value).observe(
+                    time.monotonic() - start
+                )
+                msg = f"LLM rate limit: no capacity within {self.max_wait:.0f}s"
+                raise LLMRateLimitError(msg)
+            await asyncio.sleep(wait)
+
+    async def observe(self, headers: Mapping[str, str], status_code: int) -> None:
+        """Adapt the bucket to a provider response.
+
+        A 429 pauses every replica for ``retry-after`` seconds. An exhausted
+        request or token budget pauses them until its reset; one below the
+        low watermark slows the refill rate until its reset.
+
+        Args:
+            headers: Response headers.
+            status_code: Response status code.
+        """
+        pause = 0.0
+        slow_for = 0.0
+        reason: str | None = None
+
+        if status_code == 429:
+            retry_after = parse_reset_duration(headers.get("retry-after"))
+            pause = DEFAULT_RETRY_AFTER if retry_after is None else retry_after
+            reason = "retry_after"
+
+        for budget in ("requests", "tokens"):
+            remaining = _header_number(headers, f"x-ratelimit-remaining-{budget}")
+            reset = parse_reset_duration(headers.get(f"x-ratelimit-reset-{budget}"))
+            if remaining is None or reset is None:
+                continue
+            limit = _header_number(headers, f"x-ratelimit-limit-{budget}")
+            if remaining <= 0:
+                if reset > pause:
+                    pause = reset
+                    reason = reason or f"{budget}_exhausted"
+            elif limit and remaining < limit * self.low_watermark:
+                slow_for = max(slow_for, reset)
+                reason = reason or f"{budget}_low"
+
+        if pause <= 0 and slow_for <= 0:
+            return
+
+        LLM_RATE_LIMIT_ADAPTATIONS.labels(reason=reason or "unknown").inc()
+        logger.info(
+            "Adapting LLM rate limit to provider headers",
+            key=self.key,
+            reason=reason,
+            pause_seconds=round(pause, 2),
+            slow_seconds=round(slow_for, 2),
+        )
+        await self._adapt(pause, slow_for)
+
+    # =========================================================================
+    # Bucket access
+    # =========================================================================
+
+    def _ttl(self, extra: float = 0.0) -> int:
+        return math.ceil(self.capacity / self.rate + extra) + _KEY_TTL_MARGIN
+
+    async def _take(self, need: float) -> float:
+        if self._acquire_script is not None:
+            try:
+                result = await self._acquire_script(
+                    keys=[self.key],
+                    args=[self.rate, self.capacity, need, self._ttl()],
+                )
+                return float(result)
+            except Exception as e:
+                logger.warning(
+                    "Shared LLM rate limiter unavailable, limiting locally",
+                    key=self.key,
+                    error=str(e),
+                )
+        return self._local.take(self.rate, self.capacity, need)
+
+    async def _adapt(self, pause: float, slow_for: float) -> None:
+        self._local.adapt(pause, self.slowdown_factor, slow_for)
+        if self._adapt_script is None:
+            return
+        try:
+            await self._adapt_script(
+                keys=[self.key],
+                args=[
+                    pause,
+                    self.slowdown_factor,
+                    slow_for,
+                    self._ttl(max(pause, slow_for)),
+                ],
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to adapt shared LLM rate limiter",
+                key=self.key,
+                error=str(e),
+            )
+
+
+def create_groq_rate_limiter(
+    redis: Redis[Any] | None, settings: GroqSettings
+) -> LLMRateLimiter:
+    """Create the limiter for the configured Groq model.
+
+    Every Groq client of a process should share the returned limiter.
+
+    Args:
+        redis: Client for the rate limit database, or None for a
+            process-local bucket.
+        settings: Groq settings.
+
+    Returns:
+        Limiter keyed by the Groq model.
+    """
+    return LLMRateLimiter(
+        redis,
+        key=f"groq:{settings.model}",
+        requests_per_minute=settings.requests_per_minute,
+        burst=settings.rate_limit.burst,
+        interactive_reserve=settings.rate_limit.interactive_reserve,
+        max_wait=settings.rate_limit.max_wait,
+        low_watermark=settings.rate_limit.low_watermark,
+        slowdown_factor=settings.rate_limit.slowdown_factor,
+    )
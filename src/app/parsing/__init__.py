@@ -1,6 +1,18 @@
 """Parsing utilities module."""
 
+from app.parsing.coalescer import IngredientParseCoalescer
 from app.parsing.ingredient import IngredientParser
+from app.parsing.rules import (
+    IngredientRuleParser,
+    RuleParseResult,
+    parse_ingredient_line,
+)
 
 
-__all__ = ["IngredientParser"]
+__all__ = [
+    "IngredientParseCoalescer",
+    "IngredientParser",
+    "IngredientRuleParser",
+    "RuleParseResult",
+    "parse_ingredient_line",
+]
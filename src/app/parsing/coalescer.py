@@ -0,0 +1,195 @@
+"""Merging of concurrent ingredient parse requests.
+
+A batch import parses the ingredients of many recipes at about the same
+time. Parsed one recipe at a time, each recipe sends its own partly filled
+LLM chunks, and lines shared between recipes ("1 tsp salt") are parsed more
+than once. The coalescer collects the requests arriving within a short
+window and sends them to the parser as one deduplicated batch, so the LLM
+sees full chunks.
+
+This module provides:
+- IngredientParseCoalescer: Drop-in for IngredientParser.parse_batch that
+  merges concurrent calls
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from prometheus_client import Counter
+
+from app.observability.logging import get_logger
+
+
+if TYPE_CHECKING:
+    from app.llm.prompts import ParsedIngredient
+    from app.parsing.ingredient import IngredientParser
+
+
+logger = get_logger(__name__)
+
+DEFAULT_COALESCE_WINDOW = 0.05
+DEFAULT_COALESCE_MAX_LINES = 200
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+COALESCED_PARSE_REQUESTS = Counter(
+    "coalesced_requests",
+    "parse_batch calls served by a merged batch",
+    namespace="recipe_scraper",
+    subsystem="ingredient_parser",
+)
+COALESCED_PARSE_BATCHES = Counter(
+    "coalesced_batches",
+    "Merged batches sent to the ingredient parser",
+    namespace="recipe_scraper",
+    subsystem="ingredient_parser",
+)
+
+
+# =============================================================================
+# Coalescer
+# =============================================================================
+
+
+class _Request:
+    """One caller's lines and the future receiving its results."""
+
+    __slots__ = ("future", "lines")
+
+    def __init__(
+        self, lines: list[str], future: asyncio.Future[list[ParsedIngredient]]
+    ) -> None:
+        self.lines = lines
+        self.future = future
+
+
+class IngredientParseCoalescer:
+    """Merge concurrent parse_batch calls into shared parser batches.
+
+    Calls arriving within ``window`` seconds of the first one are parsed
+    together; a batch is sent early once it holds ``max_lines`` lines. If a
+    merged batch fails, its requests are retried one by one so a single
+    bad recipe does not fail the others.
+
+    Example:
+        ```python
+        coalescer = IngredientParseCoalescer(parser, window=0.05)
+        first, second = await asyncio.gather(
+            coalescer.parse_batch(["2 cups flour", "1 tsp salt"]),
+            coalescer.parse_batch(["1 tsp salt", "3 eggs"]),
+        )
+        # One parser call with ["2 cups flour", "1 tsp salt", "3 eggs"]
+        ```
+    """
+
+    def __init__(
+        self,
+        parser: IngredientParser,
+        *,
+        window: float = DEFAULT_COALESCE_WINDOW,
+        max_lines: int = DEFAULT_COALESCE_MAX_LINES,
+    ) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            parser: Parser receiving the merged batches.
+            window: Seconds to wait for more requests before parsing.
+            max_lines: Lines that trigger parsing without waiting.
+        """
+        self._parser = parser
+        self._window = max(0.0, window)
+        self._max_lines = max(1, max_lines)
+        self._pending: list[_Request] = []
+        self._pending_lines = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def parse_batch(self, ingredients: list[str]) -> list[ParsedIngredient]:
+        """Parse ingredient lines as part of the next merged batch.
+
+        Args:
+            ingredients: Raw ingredient strings.
+
+        Returns:
+            Parsed ingredients in the same order as input.
+
+        Raises:
+            IngredientParsingError: If parsing these lines fails.
+        """
+        if not ingredients:
+            return []
+
+        loop = asyncio.get_running_loop()
+        request = _Request(ingredients, loop.create_future())
+        self._pending.append(request)
+        self._pending_lines += len(ingredients)
+
+        if self._pending_lines >= self._max_lines:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+
+        return await request.future
+
+    def _flush(self) -> None:
+        """Send the pending requests to the parser as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending, self._pending_lines = self._pending, [], 0
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._parse(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _parse(self, batch: list[_Request]) -> None:
+        lines = list(dict.fromkeys(line for r in batch for line in r.lines))
+        COALESCED_PARSE_BATCHES.inc()
+        COALESCED_PARSE_REQUESTS.inc(len(batch))
+        logger.debug(
+            "Parsing merged ingredient batch",
+            requests=len(batch),
+            lines=len(lines),
+        )
+
+        try:
+            results = await self._parser.parse_batch(lines)
+        except Exception as e:
+            if len(batch) == 1:
+                _set_exception(batch[0], e)
+                return
+            logger.warning(
+                "Merged ingredient batch failed, parsing requests separately",
+                requests=len(batch),
+                error=str(e),
+            )
+            await asyncio.gather(*[self._parse_alone(r) for r in batch])
+            return
+
+        parsed = dict(zip(lines, results, strict=True))
+        for request in batch:
+            if not request.future.done():
+                request.future.set_result([parsed[line] for line in request.lines])
+
+    async def _parse_alone(self, request: _Request) -> None:
+        if request.future.done():
+            return
+        try:
+            results = await self._parser.parse_batch(request.lines)
+        except Exception as e:
+            _set_exception(request, e)
+        else:
+            if not request.future.done():
+                request.future.set_result(results)
+
+
+def _set_exception(request: _Request, error: Exception) -> None:
+    if not request.future.done():
+        request.future.set_exception(error)
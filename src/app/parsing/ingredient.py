@@ -2,12 +2,25 @@
 
 This module provides a service class for parsing raw ingredient strings
 into structured data suitable for the Recipe Management Service.
+
+Lines are resolved in three stages, cheapest first:
+1. Rule-based parser (app.parsing.rules), accepted above a confidence threshold
+2. Per-line Redis cache of previously parsed lines
+3. LLM, with the remaining lines split into concurrent chunks
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 from typing import TYPE_CHECKING
 
+import orjson
+from prometheus_client import Counter
+from pydantic import ValidationError
+
+from app.cache.batch import cache_get_many, cache_set_many
+from app.cache.namespaces import namespaced_key
 from app.llm.exceptions import (
     LLMTimeoutError,
     LLMUnavailableError,
@@ -24,14 +37,41 @@ from app.parsing.exceptions import (
     IngredientParsingTimeoutError,
     IngredientParsingValidationError,
 )
+from app.parsing.rules import IngredientRuleParser
 
 
 if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
     from app.llm.client.protocol import LLMClientProtocol
 
 
 logger = get_logger(__name__)
 
+INGREDIENT_CACHE_KEY_PREFIX = "ingredient_parse"
+DEFAULT_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60  # 30 days
+DEFAULT_CHUNK_SIZE = 10
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MIN_CONFIDENCE = 0.8
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+INGREDIENT_LINES_PARSED = Counter(
+    "lines_parsed",
+    "Ingredient lines parsed, by resolution stage (rules, cache, llm)",
+    ["source"],
+    namespace="recipe_scraper",
+    subsystem="ingredient_parser",
+)
+
+
+# =============================================================================
+# Parser
+# =============================================================================
+
 
 class IngredientParser:
     """Service for parsing raw ingredient strings into structured data.
@@ -43,9 +83,13 @@ class IngredientParser:
     - Optional flag
     - Notes (preparation notes, size descriptors, etc.)
 
+    Lines the rule-based parser handles with enough confidence skip the LLM,
+    and LLM results are cached per line, so recipes sharing most of their
+    lines with earlier ones only send the new lines to the LLM.
+
     Example:
         ```python
-        parser = IngredientParser(llm_client)
+        parser = IngredientParser(llm_client, cache_client=redis)
         ingredients = await parser.parse_batch(
             [
                 "2 cups all-purpose flour, sifted",
@@ -57,13 +101,38 @@ class IngredientParser:
         ```
     """
 
-    def __init__(self, llm_client: LLMClientProtocol) -> None:
+    def __init__(
+        self,
+        llm_client: LLMClientProtocol,
+        *,
+        cache_client: Redis[bytes] | None = None,
+        cache_ttl: int = DEFAULT_CACHE_TTL_SECONDS,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        fast_path: bool = True,
+        min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+        rules: IngredientRuleParser | None = None,
+    ) -> None:
         """Initialize the ingredient parser.
 
         Args:
             llm_client: LLM client for generating structured output.
+            cache_client: Optional Redis client for the per-line cache.
+            cache_ttl: Per-line cache TTL in seconds.
+            chunk_size: Maximum lines sent to the LLM in one prompt.
+            max_concurrency: Maximum concurrent LLM chunk requests.
+            fast_path: Parse lines with the rule-based parser first.
+            min_confidence: Minimum rule-based confidence to skip the LLM.
+            rules: Rule-based parser (default tables if omitted).
         """
         self._llm_client = llm_client
+        self._cache_client = cache_client
+        self._cache_ttl = cache_ttl
+        self._chunk_size = max(1, chunk_size)
+        self._max_concurrency = max(1, max_concurrency)
+        self._fast_path = fast_path
+        self._min_confidence = min_confidence
+        self._rules = rules or IngredientRuleParser()
         self._prompt = IngredientParsingPrompt()
 
     async def parse_batch(
@@ -76,7 +145,8 @@ class IngredientParser:
 
         Args:
             ingredients: List of raw ingredient strings to parse.
-            skip_cache: If True, bypass LLM cache for this request.
+            skip_cache: If True, bypass the per-line and LLM caches for
+                reads (results are still written back).
 
         Returns:
             List of ParsedIngredient objects in the same order as input.
@@ -95,9 +165,107 @@ class IngredientParser:
             skip_cache=skip_cache,
         )
 
+        parsed: dict[str, ParsedIngredient] = {}
+        pending: list[str] = []
+        for line in dict.fromkeys(ingredients):
+            ruled = self._parse_with_rules(line) if self._fast_path else None
+            if ruled is not None:
+                parsed[line] = ruled
+            else:
+                pending.append(line)
+        INGREDIENT_LINES_PARSED.labels(source="rules").inc(len(parsed))
+
+        if pending and not skip_cache:
+            cached = await self._get_many_from_cache(pending)
+            INGREDIENT_LINES_PARSED.labels(source="cache").inc(len(cached))
+            parsed.update(cached)
+            pending = [line for line in pending if line not in cached]
+
+        if pending:
+            generated = await self._parse_with_llm(pending, skip_cache=skip_cache)
+            INGREDIENT_LINES_PARSED.labels(source="llm").inc(len(generated))
+            parsed.update(generated)
+            await self._cache_many(generated)
+
+        logger.debug(
+            "Successfully parsed ingredients",
+            count=len(ingredients),
+            llm_lines=len(pending),
+        )
+        return [parsed[line] for line in ingredients]
+
+    async def parse_single(
+        self,
+        ingredient: str,
+        *,
+        skip_cache: bool = False,
+    ) -> ParsedIngredient:
+        """Parse a single ingredient string.
+
+        Convenience method for parsing a single ingredient.
+
+        Args:
+            ingredient: Raw ingredient string to parse.
+            skip_cache: If True, bypass LLM cache for this request.
+
+        Returns:
+            ParsedIngredient object.
+
+        Raises:
+            IngredientParsingError: If parsing fails.
+        """
+        results = await self.parse_batch([ingredient], skip_cache=skip_cache)
+        return results[0]
+
+    def _parse_with_rules(self, line: str) -> ParsedIngredient | None:
+        """Parse a line with the rule-based parser if it is confident enough."""
+        result = self._rules.parse(line)
+        if result.confidence < self._min_confidence:
+            return None
+        return result.ingredient
+
+    # =========================================================================
+    # LLM
+    # =========================================================================
+
+    async def _parse_with_llm(
+        self,
+        lines: list[str],
+        *,
+        skip_cache: bool,
+    ) -> dict[str, ParsedIngredient]:
+        """Parse lines with the LLM in concurrent chunks.
+
+        Returns:
+            Dict mapping each line to its parsed ingredient.
+        """
+        chunks = [
+            lines[i : i + self._chunk_size]
+            for i in range(0, len(lines), self._chunk_size)
+        ]
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def parse_with_semaphore(chunk: list[str]) -> list[ParsedIngredient]:
+            async with semaphore:
+                return await self._parse_chunk(chunk, skip_cache=skip_cache)
+
+        results = await asyncio.gather(*[parse_with_semaphore(c) for c in chunks])
+
+        parsed: dict[str, ParsedIngredient] = {}
+        for chunk, chunk_result in zip(chunks, results, strict=True):
+            parsed.update(zip(chunk, chunk_result, strict=True))
+        return parsed
+
+    async def _parse_chunk(
+        self,
+        lines: list[str],
+        *,
+        skip_cache: bool,
+    ) -> list[ParsedIngredient]:
+        """Parse one chunk of lines with a single LLM request."""
         try:
             result = await self._llm_client.generate_structured(
-                prompt=self._prompt.format(ingredients=ingredients),
+                prompt=self._prompt.format(ingredients=lines),
                 schema=ParsedIngredientList,
                 system=self._prompt.system_prompt,
                 options=self._prompt.get_options(),
@@ -127,43 +295,72 @@ class IngredientParser:
             raise IngredientParsingError(error_msg) from e
 
         # Validate output count matches input (outside try to satisfy TRY301)
-        if len(result.ingredients) != len(ingredients):
+        if len(result.ingredients) != len(lines):
             logger.warning(
                 "Ingredient count mismatch",
-                input_count=len(ingredients),
+                input_count=len(lines),
                 output_count=len(result.ingredients),
             )
             msg = (
-                f"Expected {len(ingredients)} parsed ingredients, "
+                f"Expected {len(lines)} parsed ingredients, "
                 f"got {len(result.ingredients)}"
             )
             raise IngredientParsingValidationError(msg)
 
-        logger.debug(
-            "Successfully parsed ingredients",
-            count=len(result.ingredients),
-        )
         return result.ingredients
 
-    async def parse_single(
-        self,
-        ingredient: str,
-        *,
-        skip_cache: bool = False,
-    ) -> ParsedIngredient:
-        """Parse a single ingredient string.
+    # =========================================================================
+    # Per-Line Cache
+    # =========================================================================
 
-        Convenience method for parsing a single ingredient.
+    @staticmethod
+    def _make_cache_key(line: str) -> str:
+        """Generate the per-line cache key (case and whitespace insensitive)."""
+        normalized = " ".join(line.lower().split())
+        digest = hashlib.sha256(normalized.encode()).hexdigest()[:32]
+        return namespaced_key(INGREDIENT_CACHE_KEY_PREFIX, digest)
 
-        Args:
-            ingredient: Raw ingredient string to parse.
-            skip_cache: If True, bypass LLM cache for this request.
+    async def _get_many_from_cache(
+        self,
+        lines: list[str],
+    ) -> dict[str, ParsedIngredient]:
+        """Look up parsed lines in the cache with a single MGET."""
+        if self._cache_client is None:
+            return {}
 
-        Returns:
-            ParsedIngredient object.
+        try:
+            values = await cache_get_many(
+                self._cache_client, [self._make_cache_key(line) for line in lines]
+            )
+        except Exception as e:
+            logger.warning("Ingredient cache read failed", error=str(e))
+            return {}
+
+        cached: dict[str, ParsedIngredient] = {}
+        for line, value in zip(lines, values, strict=True):
+            if value is None:
+                continue
+            try:
+                cached[line] = ParsedIngredient.model_validate_json(value)
+            except ValidationError:
+                logger.debug("Ignoring invalid cached ingredient", line=line)
+        return cached
+
+    async def _cache_many(self, parsed: dict[str, ParsedIngredient]) -> None:
+        """Store parsed lines in the cache with a single pipeline."""
+        if self._cache_client is None or not parsed:
+            return
 
-        Raises:
-            IngredientParsingError: If parsing fails.
-        """
-        results = await self.parse_batch([ingredient], skip_cache=skip_cache)
-        return results[0]
+        try:
+            await cache_set_many(
+                self._cache_client,
+                {
+                    self._make_cache_key(line): orjson.dumps(
+                        ingredient.model_dump(mode="json")
+                    )
+                    for line, ingredient in parsed.items()
+                },
+                self._cache_ttl,
+            )
+        except Exception as e:
+            logger.warning("Ingredient cache write failed", error=str(e))
@@ -0,0 +1,559 @@
+"""Deterministic, table-driven ingredient line parser.
+
+Parses the common shapes of recipe ingredient lines without an LLM:
+- Quantities: integers, decimals, fractions, mixed numbers, unicode
+  fractions ("1½"), number words ("a", "two") and ranges ("1-2", "1 to 2")
+- Units: the IngredientUnit vocabulary with common spellings, attached
+  units ("200g") and package sizes ("1 (14 oz) can", "12 oz bag")
+- Modifiers: size, freshness and preparation words, parentheticals and
+  trailing comma clauses are moved to notes; "optional" sets is_optional
+
+Every result carries a confidence score in [0, 1]. Callers send lines
+below their confidence threshold to the LLM.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from pydantic import ValidationError
+
+from app.llm.prompts import IngredientUnit, ParsedIngredient
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+# =============================================================================
+# Tables
+# =============================================================================
+
+UNICODE_FRACTIONS: Mapping[str, str] = {
+    "½": "1/2",
+    "⅓": "1/3",
+    "⅔": "2/3",
+    "¼": "1/4",
+    "¾": "3/4",
+    "⅕": "1/5",
+    "⅖": "2/5",
+    "⅗": "3/5",
+    "⅘": "4/5",
+    "⅙": "1/6",
+    "⅚": "5/6",
+    "⅛": "1/8",
+    "⅜": "3/8",
+    "⅝": "5/8",
+    "⅞": "7/8",
+}
+
+NUMBER_WORDS: Mapping[str, float] = {
+    "a": 1.0,
+    "an": 1.0,
+    "one": 1.0,
+    "two": 2.0,
+    "three": 3.0,
+    "four": 4.0,
+    "five": 5.0,
+    "six": 6.0,
+    "seven": 7.0,
+    "eight": 8.0,
+    "nine": 9.0,
+    "ten": 10.0,
+    "eleven": 11.0,
+    "twelve": 12.0,
+    "dozen": 12.0,
+    "half": 0.5,
+}
+
+# Spellings per unit, matched case-insensitively with a trailing "." removed
+UNIT_SPELLINGS: Mapping[IngredientUnit, tuple[str, ...]] = {
+    IngredientUnit.G: ("g", "gr", "gram", "grams", "gramme", "grammes"),
+    IngredientUnit.KG: ("kg", "kgs", "kilo", "kilos", "kilogram", "kilograms"),
+    IngredientUnit.OZ: ("oz", "ounce", "ounces"),
+    IngredientUnit.LB: ("lb", "lbs", "pound", "pounds"),
+    IngredientUnit.ML: (
+        "ml",
+        "milliliter",
+        "milliliters",
+        "millilitre",
+        "millilitres",
+    ),
+    IngredientUnit.L: ("l", "liter", "liters", "litre", "litres"),
+    IngredientUnit.CUP: ("c", "cup", "cups"),
+    IngredientUnit.TBSP: (
+        "tbsp",
+        "tbsps",
+        "tbs",
+        "tbl",
+        "tablespoon",
+        "tablespoons",
+    ),
+    IngredientUnit.TSP: ("tsp", "tsps", "teaspoon", "teaspoons"),
+    IngredientUnit.PIECE: ("piece", "pieces", "pc", "pcs"),
+    IngredientUnit.CLOVE: ("clove", "cloves"),
+    IngredientUnit.SLICE: ("slice", "slices"),
+    IngredientUnit.PINCH: ("pinch", "pinches", "dash", "dashes"),
+    IngredientUnit.CAN: ("can", "cans", "tin", "tins"),
+    IngredientUnit.BOTTLE: ("bottle", "bottles"),
+    IngredientUnit.PACKET: (
+        "packet",
+        "packets",
+        "package",
+        "packages",
+        "pkg",
+        "pkgs",
+        "envelope",
+        "envelopes",
+    ),
+}
+
+# Two-word units, checked before single-word units
+MULTI_WORD_UNITS: Mapping[tuple[str, str], IngredientUnit] = {
+    ("fl", "oz"): IngredientUnit.OZ,
+    ("fluid", "ounce"): IngredientUnit.OZ,
+    ("fluid", "ounces"): IngredientUnit.OZ,
+}
+
+# Spellings whose case carries meaning ("T" tablespoon vs "t" teaspoon)
+CASE_SENSITIVE_UNITS: Mapping[str, IngredientUnit] = {
+    "T": IngredientUnit.TBSP,
+    "t": IngredientUnit.TSP,
+}
+
+# Units that may follow the name, with the names they follow ("2 garlic
+# cloves"); elsewhere the word is part of the name ("5 whole cloves")
+TRAILING_UNITS: Mapping[IngredientUnit, frozenset[str]] = {
+    IngredientUnit.CLOVE: frozenset({"garlic"}),
+    IngredientUnit.SLICE: frozenset(
+        {
+            "bacon",
+            "bread",
+            "cheese",
+            "ginger",
+            "ham",
+            "lemon",
+            "lime",
+            "onion",
+            "orange",
+            "pineapple",
+            "tomato",
+        }
+    ),
+}
+
+# Units naming a package rather than an amount
+PACKAGE_UNITS: frozenset[IngredientUnit] = frozenset(
+    {IngredientUnit.CAN, IngredientUnit.BOTTLE, IngredientUnit.PACKET}
+)
+
+# Containers without an IngredientUnit ("1 stick butter"); after a measured
+# amount they are a note ("12 oz bag chocolate chips")
+CONTAINER_WORDS: frozenset[str] = frozenset(
+    {
+        "bag",
+        "bags",
+        "block",
+        "blocks",
+        "box",
+        "boxes",
+        "carton",
+        "cartons",
+        "container",
+        "containers",
+        "jar",
+        "jars",
+        "stick",
+        "sticks",
+        "tub",
+        "tubs",
+    }
+)
+
+# Leading words moved from the name to notes ("2 large eggs")
+MODIFIERS: frozenset[str] = frozenset(
+    {
+        # Size
+        "small",
+        "medium",
+        "large",
+        "extra-large",
+        "jumbo",
+        "heaping",
+        "level",
+        "scant",
+        # Freshness
+        "fresh",
+        "frozen",
+        "dried",
+        "ripe",
+        "cold",
+        "warm",
+        "hot",
+        "room-temperature",
+        # Preparation
+        "chopped",
+        "diced",
+        "minced",
+        "sliced",
+        "grated",
+        "shredded",
+        "crushed",
+        "melted",
+        "softened",
+        "beaten",
+        "peeled",
+        "cubed",
+        "halved",
+        "quartered",
+        "toasted",
+        "sifted",
+        "packed",
+        # Adverbs of preparation
+        "finely",
+        "roughly",
+        "coarsely",
+        "thinly",
+        "freshly",
+        "lightly",
+        "firmly",
+    }
+)
+
+# Words in a name that signal alternatives or vague amounts
+AMBIGUOUS_WORDS: frozenset[str] = frozenset(
+    {
+        "or",
+        "and",
+        "to",
+        "taste",
+        "needed",
+        "for",
+        "plus",
+        "each",
+        "about",
+        "few",
+        "some",
+        "handful",
+        "bunch",
+        "sprig",
+        "sprigs",
+        "splash",
+        "drizzle",
+        "knob",
+    }
+)
+
+# First words of comma clauses that are notes ("salt, to taste")
+NOTE_LEADING_WORDS: frozenset[str] = frozenset(
+    {"to", "for", "at", "cut", "plus", "divided", "such", "about"}
+)
+
+_OPTIONAL_RE = re.compile(
+    r"\(\s*optional\s*\)|,?\s*\boptional\b|,?\s*\bif desired\b", re.IGNORECASE
+)
+_PARENTHETICAL_RE = re.compile(r"\(([^()]*)\)")
+_ATTACHED_UNIT_RE = re.compile(r"(\d)([a-zA-Z])")
+_DASH_RE = re.compile(r"\s*[-‐‑‒–—]\s*(?=\d)")  # noqa: RUF001 - unicode dashes
+_NUMBER_RE = re.compile(r"^\d+(?:\.\d+)?$")
+_FRACTION_RE = re.compile(r"^(\d+)/(\d+)$")
+_RANGE_RE = re.compile(r"^([\d./]+)-([\d./]+)$")
+_NAME_CHARS_RE = re.compile(r"^[a-z][a-z'&-]*$")
+
+# Confidence penalties
+_PENALTY_IMPLIED_QUANTITY = 0.2
+_PENALTY_RANGE = 0.1
+_PENALTY_UNITLESS_PHRASE = 0.15
+_PENALTY_LONG_NAME = 0.3
+_PENALTY_UNUSUAL_WORD = 0.3
+_PENALTY_AMBIGUOUS = 0.5
+_PENALTY_UNCLEAR_CLAUSE = 0.3
+_PENALTY_CONTAINER = 0.5
+_MAX_NAME_WORDS = 4
+
+
+# =============================================================================
+# Parser
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class RuleParseResult:
+    """Outcome of rule-based parsing.
+
+    Attributes:
+        ingredient: Parsed ingredient, or None if the line is not parseable.
+        confidence: Score in [0, 1]; 0 when ingredient is None.
+    """
+
+    ingredient: ParsedIngredient | None
+    confidence: float
+
+
+_UNPARSEABLE = RuleParseResult(ingredient=None, confidence=0.0)
+
+
+class IngredientRuleParser:
+    """Table-driven ingredient line parser.
+
+    Lookup tables are compiled into dicts and sets once per instance, so
+    parsing a line is a handful of regex substitutions and dict lookups.
+
+    Example:
+        ```python
+        rules = IngredientRuleParser()
+        result = rules.parse("1½ cups all-purpose flour, sifted")
+        # result.ingredient.quantity == 1.5, unit CUP, notes "sifted"
+        # result.confidence == 1.0
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        unit_spellings: Mapping[IngredientUnit, tuple[str, ...]] = UNIT_SPELLINGS,
+        modifiers: frozenset[str] = MODIFIERS,
+    ) -> None:
+        """Compile the lookup tables.
+
+        Args:
+            unit_spellings: Accepted spellings per unit.
+            modifiers: Leading name words moved to notes.
+        """
+        self._units: dict[str, IngredientUnit] = {
+            spelling: unit
+            for unit, spellings in unit_spellings.items()
+            for spelling in spellings
+        }
+        self._modifiers = modifiers
+        self._fraction_table = str.maketrans(
+            {char: f" {fraction}" for char, fraction in UNICODE_FRACTIONS.items()}
+        )
+
+    def parse(self, line: str) -> RuleParseResult:
+        """Parse one ingredient line.
+
+        Args:
+            line: Raw ingredient string.
+
+        Returns:
+            Parsed ingredient with its confidence score.
+        """
+        text, notes, clause, is_optional = self._preprocess(line)
+        tokens = text.split()
+        if not tokens:
+            return _UNPARSEABLE
+
+        confidence = 1.0
+        if clause:
+            # "butter, softened" vs "boneless, skinless chicken breasts"
+            if not self._is_note_clause(clause):
+                confidence -= _PENALTY_UNCLEAR_CLAUSE
+            notes.append(clause)
+        quantity, index, is_range = self._read_quantity(tokens)
+        if is_range:
+            confidence -= _PENALTY_RANGE
+
+        unit, index = self._read_unit(tokens, index)
+        if quantity is None:
+            if unit is None:
+                return _UNPARSEABLE
+            # "pinch of salt"
+            quantity = 1.0
+            confidence -= _PENALTY_IMPLIED_QUANTITY
+
+        if unit is not None and self._is_package(tokens, index):
+            # "12 oz bag chocolate chips": the amount is already measured
+            notes.insert(0, tokens[index].lower())
+            index += 1
+
+        if index < len(tokens) and tokens[index].lower() == "of":
+            index += 1
+
+        name_tokens = [token.lower() for token in tokens[index:]]
+        leading: list[str] = []
+        while name_tokens and name_tokens[0] in self._modifiers:
+            leading.append(name_tokens.pop(0))
+        if leading:
+            notes.insert(0, " ".join(leading))
+
+        if unit is None:
+            unit = self._read_trailing_unit(name_tokens)
+
+        if not name_tokens or (unit is None and name_tokens[0] in self._units):
+            return _UNPARSEABLE
+        if unit is None:
+            unit = IngredientUnit.PIECE
+            if len(name_tokens) > 2:
+                confidence -= _PENALTY_UNITLESS_PHRASE
+
+        confidence -= self._name_penalty(name_tokens)
+
+        try:
+            ingredient = ParsedIngredient(
+                name=" ".join(name_tokens),
+                quantity=quantity,
+                unit=unit,
+                is_optional=is_optional,
+                notes=", ".join(notes) or None,
+            )
+        except ValidationError:
+            return _UNPARSEABLE
+
+        return RuleParseResult(
+            ingredient=ingredient,
+            confidence=round(max(0.0, min(1.0, confidence)), 2),
+        )
+
+    def _preprocess(self, line: str) -> tuple[str, list[str], str, bool]:
+        """Normalize a line and split off optional markers and notes.
+
+        Returns:
+            Remaining text, parenthetical notes, the clause after the first
+            comma, and whether the line is optional.
+        """
+        text = line.translate(self._fraction_table)
+        text = _DASH_RE.sub("-", text)
+        text = _ATTACHED_UNIT_RE.sub(r"\1 \2", text)
+
+        text, optional_count = _OPTIONAL_RE.subn("", text)
+        notes = [
+            note.strip() for note in _PARENTHETICAL_RE.findall(text) if note.strip()
+        ]
+        text = _PARENTHETICAL_RE.sub(" ", text)
+
+        text, _, clause = text.partition(",")
+        return text, notes, clause.strip(" ,;"), optional_count > 0
+
+    def _is_note_clause(self, clause: str) -> bool:
+        """Whether a comma clause reads like a preparation note."""
+        first = clause.split(maxsplit=1)[0].lower()
+        return (
+            first in self._modifiers
+            or first in NOTE_LEADING_WORDS
+            or first.endswith(("ed", "ly"))
+        )
+
+    def _read_quantity(self, tokens: list[str]) -> tuple[float | None, int, bool]:
+        """Read a leading quantity.
+
+        Returns:
+            Quantity (None if absent), index of the next token, and whether
+            the quantity was a range (its upper bound is used).
+        """
+        first = _to_number(tokens[0])
+        if first is None:
+            range_match = _RANGE_RE.match(tokens[0])
+            if range_match:
+                upper = _to_number(range_match[2])
+                if upper is not None:
+                    return upper, 1, True
+            word = NUMBER_WORDS.get(tokens[0].lower())
+            return word, (1 if word is not None else 0), False
+
+        index = 1
+        # Mixed number: "1 1/2"
+        if index < len(tokens) and _FRACTION_RE.match(tokens[index]):
+            fraction = _to_number(tokens[index])
+            if fraction is not None and fraction < 1:
+                first += fraction
+                index += 1
+
+        # Spelled range: "1 to 2"
+        if index + 1 < len(tokens) and tokens[index].lower() == "to":
+            upper = _to_number(tokens[index + 1])
+            if upper is not None:
+                return upper, index + 2, True
+
+        return first, index, False
+
+    def _read_unit(
+        self, tokens: list[str], index: int
+    ) -> tuple[IngredientUnit | None, int]:
+        """Read a unit at ``index``.
+
+        Returns:
+            Unit (None if absent) and index of the next token.
+        """
+        if index + 1 < len(tokens):
+            pair = (tokens[index].lower(), tokens[index + 1].lower().rstrip("."))
+            if pair in MULTI_WORD_UNITS:
+                return MULTI_WORD_UNITS[pair], index + 2
+        if index < len(tokens):
+            unit = self._lookup_unit(tokens[index])
+            # A trailing unit word alone is the name, not a unit ("2 cups")
+            if unit is not None and index + 1 < len(tokens):
+                return unit, index + 1
+        return None, index
+
+    def _read_trailing_unit(self, name_tokens: list[str]) -> IngredientUnit | None:
+        """Read and remove a unit following the name ("2 garlic cloves").
+
+        Returns:
+            Unit, or None if the name does not end in a unit it takes.
+        """
+        if len(name_tokens) < 2:
+            return None
+        unit = self._lookup_unit(name_tokens[-1])
+        if unit is None or name_tokens[-2] not in TRAILING_UNITS.get(unit, ()):
+            return None
+        name_tokens.pop()
+        return unit
+
+    def _is_package(self, tokens: list[str], index: int) -> bool:
+        """Whether a package word followed by a name is at ``index``."""
+        if index + 1 >= len(tokens):
+            return False
+        word = tokens[index].lower()
+        return word in CONTAINER_WORDS or self._lookup_unit(word) in PACKAGE_UNITS
+
+    def _lookup_unit(self, token: str) -> IngredientUnit | None:
+        """Map a token to a unit, honoring case-sensitive spellings."""
+        stripped = token.rstrip(".")
+        if stripped in CASE_SENSITIVE_UNITS:
+            return CASE_SENSITIVE_UNITS[stripped]
+        return self._units.get(stripped.lower())
+
+    @staticmethod
+    def _name_penalty(name_tokens: list[str]) -> float:
+        """Score how unusual an ingredient name looks."""
+        penalty = 0.0
+        if len(name_tokens) > _MAX_NAME_WORDS:
+            penalty += _PENALTY_LONG_NAME
+        if any(not _NAME_CHARS_RE.match(token) for token in name_tokens):
+            penalty += _PENALTY_UNUSUAL_WORD
+        if AMBIGUOUS_WORDS.intersection(name_tokens):
+            penalty += _PENALTY_AMBIGUOUS
+        if name_tokens[0] in CONTAINER_WORDS:
+            # "1 stick butter" has no unit in the vocabulary
+            penalty += _PENALTY_CONTAINER
+        return penalty
+
+
+def _to_number(token: str) -> float | None:
+    """Convert "2", "2.5" or "1/2" to a positive float, else None."""
+    if _NUMBER_RE.match(token):
+        value = float(token)
+        return value if value > 0 else None
+    fraction = _FRACTION_RE.match(token)
+    if fraction and int(fraction[2]) != 0:
+        value = int(fraction[1]) / int(fraction[2])
+        return value if value > 0 else None
+    return None
+
+
+_DEFAULT_PARSER = IngredientRuleParser()
+
+
+def parse_ingredient_line(line: str) -> RuleParseResult:
+    """Parse one ingredient line with the default rule tables.
+
+    Args:
+        line: Raw ingredient string.
+
+    Returns:
+        Parsed ingredient with its confidence score.
+    """
+    return _DEFAULT_PARSER.parse(line)
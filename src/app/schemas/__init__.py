@@ -4,7 +4,7 @@ This module exports all schema classes for the Recipe Scraper API.
 """
 
 # Admin schemas
-from app.schemas.admin import CacheClearResponse
+from app.schemas.admin import CacheClearResponse, LocalCacheClearResponse
 
 # Auth schemas (existing)
 # Allergen schemas
@@ -76,10 +76,13 @@ from app.schemas.nutrition import (
 
 # Recipe schemas
 from app.schemas.recipe import (
+    BatchCreateRecipeResult,
+    BatchCreateRecipesRequest,
     CreateRecipeRequest,
     CreateRecipeResponse,
     PopularRecipesResponse,
     Recipe,
+    RecipeImportJobResponse,
     RecipeStep,
 )
 
@@ -108,6 +111,8 @@ __all__ = [
     "AllergenDataSource",
     "AllergenInfo",
     "AllergenPresenceType",
+    "BatchCreateRecipeResult",
+    "BatchCreateRecipesRequest",
     "CacheClearResponse",
     "ConversionRatio",
     "CreateRecipeRequest",
@@ -129,6 +134,7 @@ __all__ = [
     "IngredientShoppingInfoResponse",
     "IngredientSubstitution",
     "IngredientUnit",
+    "LocalCacheClearResponse",
     "MacroNutrients",
     "Minerals",
     "NutrientUnit",
@@ -143,6 +149,7 @@ __all__ = [
     "ReadinessStatus",
     "Recipe",
     "RecipeAllergenResponse",
+    "RecipeImportJobResponse",
     "RecipeNutritionalInfoResponse",
     "RecipeShoppingInfoResponse",
     "RecipeStep",
@@ -18,3 +18,23 @@ class CacheClearResponse(APIResponse):
         description="Success message",
         examples=["Cache cleared successfully"],
     )
+    generations: dict[str, int] = Field(
+        ...,
+        description="New generation per invalidated cache namespace",
+        examples=[{"nutrition": 3, "allergen": 2}],
+    )
+
+
+class LocalCacheClearResponse(APIResponse):
+    """Response model for process-local cache invalidation."""
+
+    message: str = Field(
+        ...,
+        description="Success message",
+        examples=["Local caches cleared successfully"],
+    )
+    cleared: dict[str, int] = Field(
+        ...,
+        description="Entries removed per local cache",
+        examples=[{"ingredient_portions": 120, "ingredient_pricing": 45}],
+    )
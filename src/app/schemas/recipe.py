@@ -182,6 +182,44 @@ class CreateRecipeResponse(APIResponse):
     recipe: Recipe = Field(..., description="Created recipe data")
 
 
+class BatchCreateRecipesRequest(APIRequest):
+    """Request to create recipes from several URLs."""
+
+    recipe_urls: list[HttpUrl] = Field(
+        ...,
+        min_length=1,
+        description="URLs of recipes to scrape",
+    )
+
+
+class BatchCreateRecipeResult(APIResponse):
+    """Outcome for one URL of a batch, streamed as one NDJSON line."""
+
+    index: int = Field(..., ge=0, description="Position of the URL in the request")
+    recipe_url: str = Field(..., description="URL of the recipe")
+    status: int = Field(..., description="HTTP status POST /recipes would return")
+    recipe: Recipe | None = Field(default=None, description="Created recipe data")
+    error: str | None = Field(default=None, description="Error code on failure")
+    message: str | None = Field(default=None, description="Error message on failure")
+
+
+class RecipeImportJobResponse(APIResponse):
+    """Status of an asynchronous recipe import (POST /recipes?async=true)."""
+
+    job_id: str = Field(..., description="Import job ID")
+    status: str = Field(
+        ...,
+        description="Job status: queued, in_progress, complete, failed or unknown",
+    )
+    stage: str | None = Field(
+        default=None,
+        description="Import step: queued, scraping, parsing, saving, complete, failed",
+    )
+    recipe: Recipe | None = Field(default=None, description="Created recipe data")
+    error: str | None = Field(default=None, description="Error code on failure")
+    message: str | None = Field(default=None, description="Error message on failure")
+
+
 class PopularRecipesResponse(APIResponse):
     """Paginated list of popular recipes."""
 
@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING
 
 import orjson
 
+from app.cache.batch import cache_get_many, cache_set_many
+from app.cache.namespaces import namespaced_key
 from app.clients.open_food_facts.client import OpenFoodFactsClient
 from app.database.repositories.allergen import AllergenData, AllergenRepository
 from app.observability.logging import get_logger
@@ -105,26 +107,10 @@ class AllergenService:
             logger.debug("Cache hit for allergen data", ingredient=name)
             return cached
 
-        # Tier 1: Database lookup (exact then fuzzy)
-        db_result = await self._get_from_database(name)
-        if db_result:
-            await self._cache_result(name, db_result)
-            return db_result
-
-        # Tier 2: Open Food Facts API
-        off_result = await self._get_from_open_food_facts(name)
-        if off_result:
-            await self._cache_result(name, off_result)
-            return off_result
-
-        # Tier 3: LLM inference (placeholder)
-        llm_result = await self._get_from_llm(name)
-        if llm_result:
-            await self._cache_result(name, llm_result)
-            return llm_result
-
-        logger.info("No allergen data found", ingredient=name)
-        return None
+        result = await self._lookup_uncached(name)
+        if result:
+            await self._cache_result(name, result)
+        return result
 
     async def get_recipe_allergens(
         self,
@@ -143,19 +129,35 @@ class AllergenService:
         ingredient_results: dict[str, IngredientAllergenResponse] = {}
         missing: list[int] = []
 
-        # Fetch allergens for each ingredient
+        cached: dict[str, IngredientAllergenResponse] = {}
+        to_cache: dict[str, IngredientAllergenResponse] = {}
+        if self._initialized:
+            names = [ingredient.name for ingredient in ingredients if ingredient.name]
+            cached = await self._get_many_from_cache(names)
+        else:
+            logger.warning("AllergenService not initialized")
+
+        # Fetch allergens for each ingredient, running the tiered lookup
+        # only for cache misses
         for ingredient in ingredients:
             if not ingredient.name:
                 if ingredient.ingredient_id:
                     missing.append(ingredient.ingredient_id)
                 continue
 
-            result = await self.get_ingredient_allergens(ingredient.name)
+            result = cached.get(ingredient.name) or to_cache.get(ingredient.name)
+            if result is None and self._initialized:
+                result = await self._lookup_uncached(ingredient.name)
+                if result:
+                    to_cache[ingredient.name] = result
+
             if result:
                 ingredient_results[ingredient.name] = result
             elif ingredient.ingredient_id:
                 missing.append(ingredient.ingredient_id)
 
+        await self._cache_many_results(to_cache)
+
         # Aggregate allergens
         contains, may_contain, all_allergens = self._aggregate_allergens(
             list(ingredient_results.values())
@@ -186,6 +188,57 @@ class AllergenService:
             logger.exception("Cache lookup failed")
         return None
 
+    async def _get_many_from_cache(
+        self,
+        names: list[str],
+    ) -> dict[str, IngredientAllergenResponse]:
+        """Try to get allergen data for multiple ingredients from cache."""
+        if not self._cache or not names:
+            return {}
+
+        try:
+            values = await cache_get_many(
+                self._cache, [self._make_cache_key(name) for name in names]
+            )
+        except Exception:
+            logger.exception("Cache batch lookup failed")
+            return {}
+
+        results: dict[str, IngredientAllergenResponse] = {}
+        for name, data in zip(names, values, strict=True):
+            if not data:
+                continue
+            try:
+                results[name] = IngredientAllergenResponse.model_validate(
+                    orjson.loads(data)
+                )
+            except Exception:
+                logger.exception("Cache lookup failed")
+        return results
+
+    async def _lookup_uncached(
+        self,
+        name: str,
+    ) -> IngredientAllergenResponse | None:
+        """Run the tiered lookup (DB → Open Food Facts → LLM) for one name."""
+        # Tier 1: Database lookup (exact then fuzzy)
+        db_result = await self._get_from_database(name)
+        if db_result:
+            return db_result
+
+        # Tier 2: Open Food Facts API
+        off_result = await self._get_from_open_food_facts(name)
+        if off_result:
+            return off_result
+
+        # Tier 3: LLM inference (placeholder)
+        llm_result = await self._get_from_llm(name)
+        if llm_result:
+            return llm_result
+
+        logger.info("No allergen data found", ingredient=name)
+        return None
+
     async def _get_from_database(
         self,
         name: str,
@@ -262,10 +315,28 @@ class AllergenService:
         except Exception:
             logger.exception("Cache write failed")
 
+    async def _cache_many_results(
+        self,
+        results: dict[str, IngredientAllergenResponse],
+    ) -> None:
+        """Cache allergen results for multiple ingredients in one pipeline."""
+        if not self._cache or not results:
+            return
+
+        try:
+            payload = {
+                self._make_cache_key(name): orjson.dumps(result.model_dump(mode="json"))
+                for name, result in results.items()
+            }
+            await cache_set_many(self._cache, payload, ALLERGEN_CACHE_TTL_SECONDS)
+            logger.debug("Cached allergen data (batch)", count=len(payload))
+        except Exception:
+            logger.exception("Cache batch write failed")
+
     def _make_cache_key(self, name: str) -> str:
         """Create cache key for an ingredient."""
         normalized = name.lower().strip()
-        return f"{ALLERGEN_CACHE_KEY_PREFIX}:{normalized}"
+        return namespaced_key(ALLERGEN_CACHE_KEY_PREFIX, normalized)
 
     def _transform_db_to_response(
         self,
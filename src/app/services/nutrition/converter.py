@@ -22,6 +22,8 @@ from app.services.nutrition.exceptions import ConversionError
 
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from app.database.repositories.nutrition import NutritionRepository
     from app.schemas.enums import IngredientUnit
     from app.schemas.ingredient import Quantity
@@ -97,6 +99,56 @@ class UnitConverter:
         # Count units - try database lookup first, then fallback
         return await self._convert_count_to_grams(amount, unit, ingredient_name)
 
+    async def to_grams_batch(
+        self,
+        items: Sequence[tuple[Quantity, str]],
+    ) -> list[Decimal | None]:
+        """Convert multiple quantities to grams with one portion lookup.
+
+        Collects the portion weights needed by every volume and count item
+        and fetches them in a single repository call, then applies the same
+        conversion rules as to_grams.
+
+        Args:
+            items: (quantity, ingredient_name) pairs to convert.
+
+        Returns:
+            Amounts in grams, in the same order as items. An entry is None
+            when to_grams would have raised ConversionError for that item.
+        """
+        weights = await self._get_portion_weights(
+            [
+                (ingredient_name, quantity.measurement)
+                for quantity, ingredient_name in items
+                if quantity.measurement not in WEIGHT_UNITS
+            ]
+        )
+
+        results: list[Decimal | None] = []
+        for quantity, ingredient_name in items:
+            unit = quantity.measurement
+            amount = Decimal(str(quantity.amount))
+            try:
+                if unit in WEIGHT_UNITS:
+                    grams = self._convert_weight_to_grams(amount, unit)
+                else:
+                    weight_per_unit = weights.get(
+                        self._portion_key(ingredient_name, unit)
+                    )
+                    if weight_per_unit is not None:
+                        grams = amount * weight_per_unit
+                    elif unit in VOLUME_UNITS:
+                        grams = self._fallback_volume_to_grams(
+                            amount, unit, ingredient_name
+                        )
+                    else:
+                        grams = amount * FALLBACK_COUNT_WEIGHT_G
+            except ConversionError:
+                results.append(None)
+            else:
+                results.append(grams)
+        return results
+
     def _convert_weight_to_grams(
         self,
         amount: Decimal,
@@ -152,6 +204,27 @@ class UnitConverter:
             return portion_weight
 
         # Fallback: convert volume to ml, then assume 1 g/ml (water density)
+        return self._fallback_volume_to_grams(amount, unit, ingredient_name)
+
+    def _fallback_volume_to_grams(
+        self,
+        amount: Decimal,
+        unit: IngredientUnit,
+        ingredient_name: str,
+    ) -> Decimal:
+        """Convert volume to grams assuming water density (1 g/ml).
+
+        Args:
+            amount: Numeric amount.
+            unit: Volume unit (ML, L, CUP, TBSP, TSP).
+            ingredient_name: Ingredient name (for error context).
+
+        Returns:
+            Amount in grams.
+
+        Raises:
+            ConversionError: If unit is not recognized.
+        """
         pint_unit = PINT_UNIT_MAP.get(unit)
         if pint_unit is None:
             msg = f"Unknown volume unit: {unit.value}"
@@ -225,6 +298,32 @@ class UnitConverter:
 
         return amount * weight_per_unit
 
+    async def _get_portion_weights(
+        self,
+        lookups: list[tuple[str, IngredientUnit]],
+    ) -> dict[tuple[str, str], Decimal]:
+        """Look up portion weights for several ingredients in one query.
+
+        Args:
+            lookups: (ingredient_name, unit) pairs.
+
+        Returns:
+            Weight per unit keyed by _portion_key. Missing pairs are omitted.
+        """
+        if self._nutrition_repo is None or not lookups:
+            return {}
+
+        keys = list(dict.fromkeys(self._portion_key(n, u) for n, u in lookups))
+        weights = await self._nutrition_repo.get_portion_weights(
+            [(name, unit, None) for name, unit in keys]
+        )
+        return {(name, unit): weight for (name, unit, _), weight in weights.items()}
+
+    @staticmethod
+    def _portion_key(ingredient_name: str, unit: IngredientUnit) -> tuple[str, str]:
+        """Build the normalized (name, unit) key used for portion lookups."""
+        return ingredient_name.lower().strip(), str(unit)
+
     def is_weight_unit(self, unit: IngredientUnit) -> bool:
         """Check if a unit is a weight unit.
 
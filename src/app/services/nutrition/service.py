@@ -14,6 +14,8 @@ from typing import TYPE_CHECKING, Any
 
 import orjson
 
+from app.cache.batch import cache_get_many, cache_set_many
+from app.cache.namespaces import namespaced_key
 from app.cache.redis import get_cache_client
 from app.database.repositories.nutrition import NutritionData, NutritionRepository
 from app.observability.logging import get_logger
@@ -57,6 +59,7 @@ class NutritionService:
     Cache Strategy:
     - Cache key: "nutrition:{ingredient_name}"
     - TTL: 30 days
+    - Recipe lookups use one MGET and one pipelined write-back
     - Caches raw database data (NutritionData), not scaled values
     - Scaling applied at response time based on requested quantity
     """
@@ -186,13 +189,14 @@ class NutritionService:
         # Batch fetch nutrition data
         nutrition_map = await self._get_batch_nutrition_data(names)
 
-        # Process each ingredient
+        # Resolve quantities for ingredients with nutrition data
         per_ingredient: dict[str, IngredientNutritionalInfoResponse] = {}
         missing_ingredients: list[int] = []
         food_groups_set: set[FoodGroup] = set()
         totals = self._create_zero_totals()
         total_grams = Decimal(0)
 
+        matched: list[tuple[Ingredient, str, NutritionData, Quantity]] = []
         for ingredient in ingredients:
             if not ingredient.name:
                 if ingredient.ingredient_id:
@@ -210,13 +214,20 @@ class NutritionService:
                 amount=100,
                 measurement=IngredientUnit.G,
             )
+            matched.append((ingredient, ingredient.name, nutrition_data, quantity))
 
-            try:
-                grams = await self._converter.to_grams(quantity, ingredient.name)
-            except ConversionError:
+        # Convert every quantity with a single portion weight lookup
+        grams_list = await self._converter.to_grams_batch(
+            [(quantity, name) for _, name, _, quantity in matched]
+        )
+
+        for (ingredient, name, nutrition_data, quantity), grams in zip(
+            matched, grams_list, strict=True
+        ):
+            if grams is None:
                 logger.warning(
                     "Skipping ingredient due to conversion error",
-                    ingredient=ingredient.name,
+                    ingredient=name,
                 )
                 if ingredient.ingredient_id:
                     missing_ingredients.append(ingredient.ingredient_id)
@@ -228,7 +239,7 @@ class NutritionService:
                 grams=grams,
             )
 
-            per_ingredient[ingredient.name] = response
+            per_ingredient[name] = response
             if response.food_group:
                 food_groups_set.add(response.food_group)
             self._accumulate_totals(totals, response)
@@ -310,9 +321,10 @@ class NutritionService:
         """Get nutrition data for multiple ingredients.
 
         Uses a multi-tier lookup strategy:
-        1. Check cache for each name
+        1. Check cache for all names with a single MGET
         2. Batch exact match in database
         3. Fuzzy search for any remaining misses
+        4. Write all database hits back to cache in one pipeline
 
         Args:
             names: List of ingredient names.
@@ -324,18 +336,12 @@ class NutritionService:
         if not names:
             return {}
 
-        result: dict[str, NutritionData] = {}
-        cache_misses: list[str] = []
-
-        # Check cache for each ingredient
-        for name in names:
-            cached = await self._get_from_cache(name)
-            if cached is not None:
-                result[name] = cached
-            else:
-                cache_misses.append(name)
+        result = await self._get_many_from_cache(names)
+        cache_misses = [name for name in names if name not in result]
 
         if cache_misses and self._repository is not None:
+            to_cache: dict[str, NutritionData] = {}
+
             # Batch query database for exact matches
             db_results = await self._repository.get_by_ingredient_names(cache_misses)
 
@@ -347,8 +353,7 @@ class NutritionService:
                 # Check if this query name got an exact match
                 data = db_results.get(name)
                 if data is not None:
-                    await self._save_to_cache(name, data)
-                    result[name] = data
+                    to_cache[name] = data
                 else:
                     still_missing.append(name)
 
@@ -365,8 +370,10 @@ class NutritionService:
                         matched_name=data.ingredient_name,
                     )
                     # Cache under original query name
-                    await self._save_to_cache(query_name, data)
-                    result[query_name] = data
+                    to_cache[query_name] = data
+
+            await self._save_many_to_cache(to_cache)
+            result.update(to_cache)
 
         return result
 
@@ -417,6 +424,67 @@ class NutritionService:
         except Exception:
             logger.exception("Cache write error", key=cache_key)
 
+    async def _get_many_from_cache(
+        self,
+        names: list[str],
+    ) -> dict[str, NutritionData]:
+        """Get nutrition data for multiple ingredients from cache.
+
+        Args:
+            names: Ingredient names.
+
+        Returns:
+            Dictionary mapping query names to cached NutritionData.
+            Names that aren't cached are not included.
+        """
+        if self._cache_client is None or not names:
+            return {}
+
+        cache_keys = [self._make_cache_key(name) for name in names]
+
+        try:
+            cached_values = await cache_get_many(self._cache_client, cache_keys)
+        except Exception:
+            logger.exception("Cache batch read error", count=len(cache_keys))
+            return {}
+
+        result: dict[str, NutritionData] = {}
+        for name, cache_key, cached_bytes in zip(
+            names, cache_keys, cached_values, strict=True
+        ):
+            if not cached_bytes:
+                continue
+            try:
+                result[name] = NutritionData.model_validate(orjson.loads(cached_bytes))
+            except Exception:
+                logger.exception("Cache read error", key=cache_key)
+
+        logger.debug("Cache batch read", hits=len(result), total=len(names))
+        return result
+
+    async def _save_many_to_cache(self, items: dict[str, NutritionData]) -> None:
+        """Save nutrition data for multiple ingredients to cache.
+
+        Args:
+            items: Mapping of ingredient name to NutritionData.
+        """
+        if self._cache_client is None or not items:
+            return
+
+        try:
+            payload = {
+                self._make_cache_key(name): orjson.dumps(data.model_dump(mode="json"))
+                for name, data in items.items()
+            }
+            await cache_set_many(
+                self._cache_client,
+                payload,
+                NUTRITION_CACHE_TTL_SECONDS,
+            )
+            logger.debug("Cached nutrition data (batch)", count=len(payload))
+        except Exception:
+            logger.exception("Cache batch write error", count=len(items))
+
     def _make_cache_key(self, name: str) -> str:
         """Create cache key for an ingredient.
 
@@ -428,7 +496,7 @@ class NutritionService:
         """
         # Normalize name for consistent caching
         normalized = name.lower().strip()
-        return f"{NUTRITION_CACHE_KEY_PREFIX}:{normalized}"
+        return namespaced_key(NUTRITION_CACHE_KEY_PREFIX, normalized)
 
     # =========================================================================
     # Transformation
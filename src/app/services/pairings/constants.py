@@ -2,6 +2,7 @@
 
 Contains:
 - Cache configuration for pairing data
+- Request coalescing for concurrent cache misses
 - Generation limits for LLM output
 """
 
@@ -15,9 +16,22 @@ from typing import Final
 # =============================================================================
 
 PAIRINGS_CACHE_KEY_PREFIX: Final[str] = "pairing"
+# Entries are served fresh until the soft expiry, then served stale while a
+# background job regenerates them, until the hard expiry (Redis TTL).
+PAIRINGS_CACHE_FRESH_SECONDS: Final[int] = 20 * 60 * 60  # 20 hours
 PAIRINGS_CACHE_TTL_SECONDS: Final[int] = 24 * 60 * 60  # 24 hours
 
 
+# =============================================================================
+# Request Coalescing
+# =============================================================================
+
+# Lock held by the replica generating a missing entry; other replicas wait
+# for the cached result instead of issuing their own LLM call.
+PAIRINGS_LOCK_TTL_SECONDS: Final[int] = 120
+PAIRINGS_LOCK_WAIT_SECONDS: Final[float] = 120.0
+
+
 # =============================================================================
 # LLM Generation Limits
 # =============================================================================
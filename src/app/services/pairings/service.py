@@ -2,18 +2,20 @@
 
 Provides methods for:
 - Recipe pairing lookup based on flavor profiles and cuisine types
-- Redis caching with 24-hour TTL
+- Redis caching with stale-while-revalidate (fresh 20 hours, kept 24 hours)
+- Single-flight coalescing of concurrent cache misses
 - Pagination at response time
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import TYPE_CHECKING
 
-import orjson
-
+from app.cache.namespaces import namespaced_key
 from app.cache.redis import get_cache_client
+from app.cache.single_flight import RedisSingleFlight, SingleFlight
+from app.cache.swr import decode_swr_entry, encode_swr_entry, schedule_revalidation
 from app.llm.exceptions import (
     LLMRateLimitError,
     LLMTimeoutError,
@@ -29,8 +31,11 @@ from app.observability.logging import get_logger
 from app.schemas.ingredient import WebRecipe
 from app.schemas.recommendations import PairingSuggestionsResponse
 from app.services.pairings.constants import (
+    PAIRINGS_CACHE_FRESH_SECONDS,
     PAIRINGS_CACHE_KEY_PREFIX,
     PAIRINGS_CACHE_TTL_SECONDS,
+    PAIRINGS_LOCK_TTL_SECONDS,
+    PAIRINGS_LOCK_WAIT_SECONDS,
 )
 from app.services.pairings.exceptions import (
     LLMGenerationError,
@@ -70,9 +75,12 @@ class PairingsService:
 
     Cache Strategy:
     - Cache key: "pairing:{recipe_id}"
-    - TTL: 24 hours
+    - Fresh for 20 hours, then served stale while an ARQ job regenerates it,
+      until the 24-hour Redis TTL expires
     - Caches raw LLM output (PairingListResult), not paginated responses
     - Pagination applied at response time based on limit/offset
+    - Concurrent misses for the same key share one LLM generation
+      (in-process, and across replicas through a Redis lock)
     """
 
     def __init__(
@@ -89,6 +97,9 @@ class PairingsService:
         self._cache_client = cache_client
         self._llm_client = llm_client
         self._prompt = RecipePairingPrompt()
+        self._single_flight: SingleFlight[PairingListResult | None] = SingleFlight(
+            "pairings"
+        )
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -102,6 +113,14 @@ class PairingsService:
             except RuntimeError:
                 logger.warning("Redis not available, caching disabled")
 
+        if self._cache_client is not None:
+            self._single_flight = RedisSingleFlight(
+                "pairings",
+                self._cache_client,
+                lock_ttl=PAIRINGS_LOCK_TTL_SECONDS,
+                wait_timeout=PAIRINGS_LOCK_WAIT_SECONDS,
+            )
+
         self._initialized = True
         logger.info("PairingsService initialized")
 
@@ -174,13 +193,61 @@ class PairingsService:
             LLMGenerationError: If LLM fails to generate.
         """
         # Check cache first
-        cached = await self._get_from_cache(context.recipe_id)
+        cached = await self._get_cache_entry(context.recipe_id)
         if cached is not None:
-            logger.debug("Cache hit", recipe_id=context.recipe_id)
-            return cached
+            result, stale = cached
+            logger.debug("Cache hit", recipe_id=context.recipe_id, stale=stale)
+            if stale:
+                await schedule_revalidation(
+                    "pairings",
+                    self._make_cache_key(context.recipe_id),
+                    "revalidate_pairings",
+                    asdict(context),
+                )
+            return result
 
-        # Cache miss - generate via LLM
+        # Cache miss - generate via LLM, once per key for concurrent callers
         logger.debug("Cache miss, generating via LLM", recipe_id=context.recipe_id)
+        return await self._single_flight.do(
+            self._make_cache_key(context.recipe_id),
+            lambda: self._generate_and_cache(context),
+            recheck=lambda: self._get_from_cache(context.recipe_id),
+        )
+
+    async def refresh_pairings(
+        self,
+        context: RecipeContext,
+    ) -> PairingListResult | None:
+        """Regenerate and re-cache pairings for a recipe.
+
+        Used by the background revalidation job for stale cache entries.
+
+        Args:
+            context: Recipe context for generation.
+
+        Returns:
+            Fresh pairing list result, or None on failure.
+
+        Raises:
+            LLMGenerationError: If LLM fails to generate.
+        """
+        return await self._generate_and_cache(context)
+
+    async def _generate_and_cache(
+        self,
+        context: RecipeContext,
+    ) -> PairingListResult | None:
+        """Generate pairings via LLM and cache the result.
+
+        Args:
+            context: Recipe context for generation.
+
+        Returns:
+            Pairing list result, or None on failure.
+
+        Raises:
+            LLMGenerationError: If LLM fails to generate.
+        """
         result = await self._generate_pairings(context)
 
         # Cache the result
@@ -281,7 +348,7 @@ class PairingsService:
     # =========================================================================
 
     async def _get_from_cache(self, recipe_id: int) -> PairingListResult | None:
-        """Get pairing data from cache.
+        """Get pairing data from cache, fresh or stale.
 
         Args:
             recipe_id: Recipe ID.
@@ -289,6 +356,20 @@ class PairingsService:
         Returns:
             PairingListResult or None if not cached.
         """
+        cached = await self._get_cache_entry(recipe_id)
+        return None if cached is None else cached[0]
+
+    async def _get_cache_entry(
+        self, recipe_id: int
+    ) -> tuple[PairingListResult, bool] | None:
+        """Get pairing data from cache along with its staleness.
+
+        Args:
+            recipe_id: Recipe ID.
+
+        Returns:
+            Tuple of (PairingListResult, is_stale), or None if not cached.
+        """
         if self._cache_client is None:
             return None
 
@@ -297,8 +378,8 @@ class PairingsService:
         try:
             cached_bytes = await self._cache_client.get(cache_key)
             if cached_bytes:
-                data = orjson.loads(cached_bytes)
-                return PairingListResult.model_validate(data)
+                entry = decode_swr_entry(cached_bytes)
+                return PairingListResult.model_validate(entry.value), entry.stale
         except Exception:
             logger.exception("Cache read error", key=cache_key)
 
@@ -317,7 +398,9 @@ class PairingsService:
         cache_key = self._make_cache_key(recipe_id)
 
         try:
-            json_bytes = orjson.dumps(data.model_dump(mode="json"))
+            json_bytes = encode_swr_entry(
+                data.model_dump(mode="json"), PAIRINGS_CACHE_FRESH_SECONDS
+            )
             await self._cache_client.setex(
                 cache_key,
                 PAIRINGS_CACHE_TTL_SECONDS,
@@ -336,7 +419,7 @@ class PairingsService:
         Returns:
             Cache key string.
         """
-        return f"{PAIRINGS_CACHE_KEY_PREFIX}:{recipe_id}"
+        return namespaced_key(PAIRINGS_CACHE_KEY_PREFIX, str(recipe_id))
 
     # =========================================================================
     # Transformation
@@ -7,19 +7,25 @@ from recipe pages without site-specific configuration using:
 3. Common HTML patterns (class/id heuristics) - last resort
 
 All fields are optional - returns None for any metric not found.
+
+Each page is parsed once into a PageDocument (lxml soup, decoded JSON-LD
+blocks and an itemprop/itemtype/class/id index) shared by the recipe-page
+check and every extraction step.
 """
 
 from __future__ import annotations
 
-import json
 import re
+from functools import cached_property
 from typing import Any
 from urllib.parse import urlparse
 
+import orjson
 from bs4 import BeautifulSoup, Tag
 
 from app.observability.logging import get_logger
 from app.schemas.recipe import RecipeEngagementMetrics
+from app.services.scraping.executor import decode_html
 
 
 logger = get_logger(__name__)
@@ -30,7 +36,7 @@ logger = get_logger(__name__)
 # =============================================================================
 
 
-def extract_engagement_metrics(html: str) -> RecipeEngagementMetrics:
+def extract_engagement_metrics(html: str | PageDocument) -> RecipeEngagementMetrics:
     """Extract engagement metrics dynamically from HTML.
 
     Extraction priority (first successful source wins for each metric):
@@ -39,69 +45,71 @@ def extract_engagement_metrics(html: str) -> RecipeEngagementMetrics:
     3. Common HTML patterns (class/id heuristics)
 
     Args:
-        html: Raw HTML content of the recipe page.
+        html: Raw HTML content of the recipe page, or its parsed document.
 
     Returns:
         RecipeEngagementMetrics with any found values (all fields optional).
     """
+    doc = html if isinstance(html, PageDocument) else PageDocument(html)
     metrics = RecipeEngagementMetrics()
 
     # 1. Try JSON-LD first (most reliable)
-    jsonld_data = _extract_jsonld_recipe(html)
-    if jsonld_data:
-        _extract_from_jsonld(jsonld_data, metrics)
+    if doc.recipe_jsonld:
+        _extract_from_jsonld(doc.recipe_jsonld, metrics)
 
     # 2. Try microdata for missing values
-    soup = BeautifulSoup(html, "html.parser")
-    _extract_from_microdata(soup, metrics)
+    _extract_from_microdata(doc, metrics)
 
     # 3. Fallback to HTML patterns for any still-missing values
-    _extract_from_html_patterns(soup, metrics)
+    _extract_from_html_patterns(doc, metrics)
 
     return metrics
 
 
-def is_recipe_page(html: str) -> bool:
+def is_recipe_page(html: str | PageDocument) -> bool:
     """Check if a page contains Recipe schema.org data.
 
     Uses JSON-LD and microdata detection to identify actual recipe pages.
     Category pages typically use CollectionPage or ItemList schema instead.
 
     Args:
-        html: Raw HTML content of the page.
+        html: Raw HTML content of the page, or its parsed document.
 
     Returns:
         True if page appears to be a recipe page, False otherwise.
     """
-    # Check for Recipe JSON-LD (most reliable)
-    jsonld_recipe = _extract_jsonld_recipe(html)
-    if jsonld_recipe:
-        return True
+    doc = html if isinstance(html, PageDocument) else PageDocument(html)
 
-    # Check for Recipe microdata
-    soup = BeautifulSoup(html, "lxml")
-    recipe_itemtype = soup.find(
-        attrs={"itemtype": lambda x: x is not None and "Recipe" in str(x)}
-    )
-    if recipe_itemtype:
+    # Check for Recipe JSON-LD (most reliable), then Recipe microdata
+    if doc.recipe_jsonld or doc.has_recipe_itemtype:
         return True
 
     # Fallback: check for recipe content structure
     # (ingredients list + instructions = likely a recipe)
-    has_ingredients = soup.find(
-        attrs={"class": lambda x: x is not None and "ingredient" in str(x).lower()}
-    )
-    has_instructions = soup.find(
-        attrs={
-            "class": lambda x: x is not None
-            and any(
-                kw in str(x).lower()
-                for kw in ["instruction", "direction", "step", "method"]
-            )
-        }
+    has_ingredients = bool(doc.find_by_class("ingredient"))
+    has_instructions = any(
+        doc.find_by_class(kw) for kw in ("instruction", "direction", "step", "method")
     )
 
-    return bool(has_ingredients and has_instructions)
+    return has_ingredients and has_instructions
+
+
+def analyze_recipe_page(html: str | bytes) -> RecipeEngagementMetrics | None:
+    """Check a page is a recipe page and extract its engagement metrics.
+
+    Parses the page once and runs both steps off the same document, so a
+    fetched page is also shipped to the HTML parse executor once.
+
+    Args:
+        html: Raw HTML content (or page bytes) of the page.
+
+    Returns:
+        RecipeEngagementMetrics, or None if the page is not a recipe page.
+    """
+    doc = PageDocument(html)
+    if not is_recipe_page(doc):
+        return None
+    return extract_engagement_metrics(doc)
 
 
 def extract_recipe_links(html: str, base_url: str) -> list[tuple[str, str]]:
@@ -189,33 +197,114 @@ def extract_recipe_links(html: str, base_url: str) -> list[tuple[str, str]]:
 
 
 # =============================================================================
-# JSON-LD Extraction
+# Parsed Document
 # =============================================================================
 
 
-def _extract_jsonld_recipe(html: str) -> dict[str, Any] | None:
-    """Find and extract Recipe schema from JSON-LD blocks.
+class PageDocument:
+    """A recipe page parsed once for all extraction steps.
 
-    Args:
-        html: Raw HTML content.
+    Builds the lxml soup and, in a single pass over its tags, an index of
+    itemprop/itemtype attributes, class and id names, and JSON-LD blocks.
+    JSON-LD is decoded on first use. Class and id lookups are substring
+    matches on lowercased names, cached per keyword.
 
-    Returns:
-        Recipe JSON-LD dictionary if found, None otherwise.
+    Example:
+        ```python
+        doc = PageDocument(html)
+        if is_recipe_page(doc):
+            metrics = extract_engagement_metrics(doc)
+        ```
     """
-    # Find all JSON-LD script blocks
-    pattern = r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>'
-    matches = re.findall(pattern, html, re.DOTALL | re.IGNORECASE)
-
-    for match in matches:
-        try:
-            data = json.loads(match.strip())
-            recipe = _find_recipe_in_jsonld(data)
+
+    def __init__(self, html: str | bytes) -> None:
+        """Parse the page and build the attribute index.
+
+        Args:
+            html: Raw HTML content (or page bytes).
+        """
+        self.soup = BeautifulSoup(decode_html(html), "lxml")
+        self._itemprops: dict[str, Tag] = {}
+        self._has_recipe_itemtype = False
+        self._classes: list[tuple[Tag, tuple[str, ...]]] = []
+        self._ids: list[tuple[Tag, str]] = []
+        self._jsonld_sources: list[str] = []
+        self._class_matches: dict[str, list[Tag]] = {}
+        self._id_matches: dict[str, list[Tag]] = {}
+
+        for tag in self.soup.find_all(True):
+            itemprop = tag.get("itemprop")
+            if itemprop:
+                self._itemprops.setdefault(str(itemprop), tag)
+            itemtype = tag.get("itemtype")
+            if itemtype and "Recipe" in str(itemtype):
+                self._has_recipe_itemtype = True
+            classes = tag.get("class")
+            if classes:
+                self._classes.append((tag, tuple(str(c).lower() for c in classes)))
+            tag_id = tag.get("id")
+            if tag_id:
+                self._ids.append((tag, str(tag_id).lower()))
+            if tag.name == "script" and (
+                str(tag.get("type", "")).strip().lower() == "application/ld+json"
+            ):
+                self._jsonld_sources.append(tag.get_text())
+
+    @cached_property
+    def jsonld(self) -> list[Any]:
+        """Decoded JSON-LD blocks (invalid blocks are skipped)."""
+        blocks: list[Any] = []
+        for source in self._jsonld_sources:
+            try:
+                blocks.append(orjson.loads(source.strip()))
+            except orjson.JSONDecodeError:
+                continue
+        return blocks
+
+    @cached_property
+    def recipe_jsonld(self) -> dict[str, Any] | None:
+        """First schema.org Recipe found in the JSON-LD blocks."""
+        for block in self.jsonld:
+            recipe = _find_recipe_in_jsonld(block)
             if recipe:
                 return recipe
-        except json.JSONDecodeError:
-            continue
+        return None
 
-    return None
+    @property
+    def has_recipe_itemtype(self) -> bool:
+        """Whether any element declares a Recipe microdata itemtype."""
+        return self._has_recipe_itemtype
+
+    def itemprop(self, name: str) -> Tag | None:
+        """First element with the given itemprop."""
+        return self._itemprops.get(name)
+
+    def find_by_class(self, keyword: str) -> list[Tag]:
+        """Elements with a class name containing keyword, in document order."""
+        keyword = keyword.lower()
+        matches = self._class_matches.get(keyword)
+        if matches is None:
+            matches = [
+                tag
+                for tag, classes in self._classes
+                if any(keyword in name for name in classes)
+            ]
+            self._class_matches[keyword] = matches
+        return matches
+
+    def find_by_id(self, keyword: str) -> list[Tag]:
+        """Elements with an id containing keyword, in document order."""
+        keyword = keyword.lower()
+        matches = self._id_matches.get(keyword)
+        if matches is None:
+            matches = [tag for tag, tag_id in self._ids if keyword in tag_id]
+            self._id_matches[keyword] = matches
+        return matches
+
+
+# =============================================================================
+# JSON-LD Extraction
+# =============================================================================
 
 
 def _find_recipe_in_jsonld(data: Any) -> dict[str, Any] | None:
@@ -295,30 +384,30 @@ def _extract_from_jsonld(
 
 
 def _extract_from_microdata(
-    soup: BeautifulSoup, metrics: RecipeEngagementMetrics
+    doc: PageDocument, metrics: RecipeEngagementMetrics
 ) -> None:
     """Extract metrics from microdata (itemprop attributes).
 
     Args:
-        soup: Parsed HTML.
+        doc: Parsed page.
         metrics: Metrics object to populate (modified in place).
     """
     # Rating value
     if metrics.rating is None:
-        elem = soup.find(attrs={"itemprop": "ratingValue"})
-        if elem and isinstance(elem, Tag):
+        elem = doc.itemprop("ratingValue")
+        if elem is not None:
             metrics.rating = _parse_float(_get_element_value(elem), max_val=5.0)
 
     # Rating count
     if metrics.rating_count is None:
-        elem = soup.find(attrs={"itemprop": "ratingCount"})
-        if elem and isinstance(elem, Tag):
+        elem = doc.itemprop("ratingCount")
+        if elem is not None:
             metrics.rating_count = _parse_int(_get_element_value(elem))
 
     # Review count
     if metrics.reviews is None:
-        elem = soup.find(attrs={"itemprop": "reviewCount"})
-        if elem and isinstance(elem, Tag):
+        elem = doc.itemprop("reviewCount")
+        if elem is not None:
             metrics.reviews = _parse_int(_get_element_value(elem))
 
 
@@ -354,38 +443,38 @@ def _get_element_value(elem: Tag) -> str | None:
 
 
 def _extract_from_html_patterns(
-    soup: BeautifulSoup, metrics: RecipeEngagementMetrics
+    doc: PageDocument, metrics: RecipeEngagementMetrics
 ) -> None:
     """Extract metrics from common HTML patterns.
 
     Uses class/id name heuristics to find metric values.
 
     Args:
-        soup: Parsed HTML.
+        doc: Parsed page.
         metrics: Metrics object to populate (modified in place).
     """
     # Rating
     if metrics.rating is None:
-        metrics.rating = _find_rating_in_html(soup)
+        metrics.rating = _find_rating_in_html(doc)
 
     # Rating count
     if metrics.rating_count is None:
         metrics.rating_count = _find_count_in_html(
-            soup,
+            doc,
             ["rating-count", "ratings-count", "ratingcount", "num-ratings", "ratings"],
         )
 
     # Reviews
     if metrics.reviews is None:
         metrics.reviews = _find_count_in_html(
-            soup,
+            doc,
             ["review-count", "reviews-count", "reviewcount", "num-reviews", "reviews"],
         )
 
     # Favorites/saves
     if metrics.favorites is None:
         metrics.favorites = _find_count_in_html(
-            soup,
+            doc,
             [
                 "favorites",
                 "saves",
@@ -397,26 +486,18 @@ def _extract_from_html_patterns(
         )
 
 
-def _find_rating_in_html(soup: BeautifulSoup) -> float | None:
+def _find_rating_in_html(doc: PageDocument) -> float | None:
     """Find star rating in HTML using common patterns.
 
     Args:
-        soup: Parsed HTML.
+        doc: Parsed page.
 
     Returns:
         Rating value (0-5) or None.
     """
     # Look for elements with rating-related class names
-    patterns = [
-        re.compile(r"rating", re.IGNORECASE),
-        re.compile(r"stars?", re.IGNORECASE),
-        re.compile(r"score", re.IGNORECASE),
-    ]
-
-    for pattern in patterns:
-        # Check class attributes
-        elems = soup.find_all(class_=pattern)
-        for elem in elems:
+    for keyword in ("rating", "star", "score"):
+        for elem in doc.find_by_class(keyword):
             # Skip if it's likely a count (has "count" in class)
             class_attr = elem.get("class")
             if isinstance(class_attr, list):
@@ -509,29 +590,19 @@ def _parse_rating_from_text(text: str) -> float | None:
     return None
 
 
-def _find_count_in_html(soup: BeautifulSoup, keywords: list[str]) -> int | None:
+def _find_count_in_html(doc: PageDocument, keywords: list[str]) -> int | None:
     """Find a count value in HTML using class/id patterns.
 
     Args:
-        soup: Parsed HTML.
+        doc: Parsed page.
         keywords: List of keywords to search for in class/id names.
 
     Returns:
         Count value or None.
     """
     for keyword in keywords:
-        pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-
-        # Search by class
-        elems = soup.find_all(class_=pattern)
-        for elem in elems:
-            count = _extract_count_from_element(elem)
-            if count is not None:
-                return count
-
-        # Search by id
-        elems = soup.find_all(id=pattern)
-        for elem in elems:
+        # Search by class, then by id
+        for elem in (*doc.find_by_class(keyword), *doc.find_by_id(keyword)):
             count = _extract_count_from_element(elem)
             if count is not None:
                 return count
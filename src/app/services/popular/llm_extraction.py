@@ -24,6 +24,7 @@ from app.llm.prompts.recipe_link_extraction import (
     ExtractedRecipeLinkList,
     RecipeLinkExtractionPrompt,
 )
+from app.llm.rate_limit import LLMPriority, llm_priority
 from app.observability.logging import get_logger
 from app.services.popular.extraction import _resolve_url, extract_recipe_links
 
@@ -95,7 +96,10 @@ class RecipeLinkExtractor:
             return extract_recipe_links(html, base_url)
 
         try:
-            return await self._extract_with_llm(html, base_url, context)
+            # Link extraction is background work: it yields the shared LLM
+            # rate limit to interactive requests
+            with llm_priority(LLMPriority.BACKGROUND):
+                return await self._extract_with_llm(html, base_url, context)
         except (LLMUnavailableError, LLMTimeoutError, LLMRateLimitError) as e:
             logger.warning(
                 "LLM unavailable or rate limited, using regex fallback",
@@ -2,18 +2,24 @@
 
 This service fetches popular/trending recipes from multiple configurable
 sources, extracts engagement metrics dynamically, normalizes scores
-across sources, and caches results for efficient retrieval.
+across sources, and caches results for efficient retrieval. Detail-page
+metrics are kept with the page validators: recent ones are reused without
+a request, older ones are revalidated so unchanged pages are answered with
+a 304. Each source's scored result is cached on its own, so a refresh only
+refetches the sources that are due and rebuilds the ranking from the rest.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import httpx
-import orjson
 
+from app.cache.namespaces import CacheNamespace, namespaced_key
+from app.clients.http import create_http_client
 from app.core.config import get_settings
 from app.observability.logging import get_logger
 from app.schemas.recipe import (
@@ -25,14 +31,17 @@ from app.services.popular.exceptions import (
     PopularRecipesFetchError,
     PopularRecipesParseError,
 )
-from app.services.popular.extraction import (
-    extract_engagement_metrics,
-    is_recipe_page,
-)
+from app.services.popular.extraction import analyze_recipe_page
 from app.services.popular.llm_extraction import RecipeLinkExtractor
+from app.services.popular.store import PopularRecipesStore, PopularSourceStore
+from app.services.scraping.executor import get_parse_executor
+from app.services.scraping.fetch import RecipeJsonLdDetector, fetch_html
+from app.services.scraping.validators import PageValidatorStore
 
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from redis.asyncio import Redis
 
     from app.core.config.settings import (
@@ -40,9 +49,13 @@ if TYPE_CHECKING:
         PopularRecipesSettings,
     )
     from app.llm.client.protocol import LLMClientProtocol
+    from app.services.popular.store import SourceResult
 
 logger = get_logger(__name__)
 
+# Seconds a ranking rebuild may hold (or wait for) the rebuild lock
+REBUILD_LOCK_TIMEOUT = 60
+
 # Browser-like headers for fetching
 DEFAULT_HEADERS = {
     "User-Agent": (
@@ -80,11 +93,38 @@ class PopularRecipesService:
         self._llm_client = llm_client
         self._http_client: httpx.AsyncClient | None = None
         self._extractor: RecipeLinkExtractor | None = None
-        self._config: PopularRecipesSettings = get_settings().scraping.popular_recipes
+        settings = get_settings()
+        self._config: PopularRecipesSettings = settings.scraping.popular_recipes
+        self._store = (
+            PopularRecipesStore(
+                cache_client,
+                self._config.cache_key,
+                ttl=self._config.cache_ttl,
+                page_size=self._config.page_size,
+            )
+            if cache_client
+            else None
+        )
+        self._source_store = (
+            PopularSourceStore(
+                cache_client, self._config.cache_key, ttl=self._config.cache_ttl
+            )
+            if cache_client
+            else None
+        )
+        # Recent detail-page metrics are reused as is, older ones revalidated
+        self._page_cache = PageValidatorStore(
+            cache_client,
+            "popular:page",
+            fresh_ttl=self._config.detail_fresh_ttl,
+            retention_ttl=settings.scraping.validator_ttl,
+            namespace=CacheNamespace.POPULAR,
+        )
 
     async def initialize(self) -> None:
         """Initialize HTTP client and other resources."""
-        self._http_client = httpx.AsyncClient(
+        self._http_client = create_http_client(
+            "popular_recipes",
             headers=DEFAULT_HEADERS,
             timeout=httpx.Timeout(self._config.fetch_timeout),
             follow_redirects=True,
@@ -123,6 +163,8 @@ class PopularRecipesService:
     ) -> tuple[list[PopularRecipe], int]:
         """Get popular recipes with pagination.
 
+        Only the cached pages covering the requested slice are read.
+
         Args:
             limit: Maximum number of recipes to return.
             offset: Starting index for pagination.
@@ -131,6 +173,10 @@ class PopularRecipesService:
         Returns:
             Tuple of (recipes list, total count).
         """
+        cached = await self._get_range_from_cache(offset, limit, count_only)
+        if cached is not None:
+            return cached
+
         data = await self._get_or_refresh_cache()
 
         total_count = data.total_count
@@ -147,31 +193,61 @@ class PopularRecipesService:
 
         Forces a refresh on the next request.
         """
-        if self._cache_client:
-            cache_key = f"popular:{self._config.cache_key}"
-            await self._cache_client.delete(cache_key)
+        if self._store:
+            await self._store.delete()
             logger.info("Popular recipes cache invalidated")
 
-    async def refresh_cache(self) -> PopularRecipesData:
-        """Force refresh the cache by fetching fresh data.
+    async def refresh_cache(
+        self, sources: Collection[str] | None = None
+    ) -> PopularRecipesData:
+        """Refresh sources and rebuild the cached ranking.
 
         Unlike get_popular_recipes which checks cache first, this method
-        always fetches fresh data from sources and updates the cache.
-        Used by background workers to proactively refresh before expiry.
+        always fetches the given sources and updates the cache. Other
+        sources contribute their cached results, so one source can be
+        refreshed on its own. Used by background workers to proactively
+        refresh before expiry.
+
+        Args:
+            sources: Names of the sources to fetch (all enabled if None).
 
         Returns:
-            Freshly fetched and cached popular recipes data.
+            Freshly built and cached popular recipes data.
         """
-        logger.info("Force refreshing popular recipes cache")
-        data = await self._fetch_all_sources()
-        await self._save_to_cache(data)
+        logger.info(
+            "Refreshing popular recipes cache",
+            sources=sorted(sources) if sources is not None else "all",
+        )
+        fetched, errors = await self._refresh_sources(sources)
+        # Concurrent per-source refreshes rebuild one at a time, so the
+        # last rebuild sees every stored source result
+        async with self._rebuild_lock():
+            data = await self._merge_sources(fetched, errors)
+            await self._save_to_cache(data)
         return data
 
+    async def get_stale_sources(self) -> list[str]:
+        """Get the enabled sources due for a refetch.
+
+        A source is due when it has no cached result or its result is older
+        than its refresh interval.
+
+        Returns:
+            Names of the sources to refresh.
+        """
+        enabled = [s for s in self._config.sources if s.enabled]
+        results = await self._get_source_results([s.name for s in enabled])
+        return [
+            s.name
+            for s in enabled
+            if s.name not in results or results[s.name].age >= self._refresh_interval(s)
+        ]
+
     async def _get_or_refresh_cache(self) -> PopularRecipesData:
-        """Get data from cache or fetch fresh data.
+        """Get data from cache or build fresh data.
 
         Returns:
-            Cached or freshly fetched popular recipes data.
+            Cached or freshly built popular recipes data.
         """
         # Try cache first
         cached = await self._get_from_cache()
@@ -182,30 +258,44 @@ class PopularRecipesService:
             )
             return cached
 
-        # Cache miss - fetch fresh data
+        # Cache miss - fetch the sources that are due, reuse the others
         logger.info("Cache miss - fetching popular recipes from sources")
-        data = await self._fetch_all_sources()
+        data = await self._fetch_all_sources(await self.get_stale_sources())
 
         # Save to cache
         await self._save_to_cache(data)
 
         return data
 
+    async def _get_range_from_cache(
+        self, offset: int, limit: int, count_only: bool
+    ) -> tuple[list[PopularRecipe], int] | None:
+        """Get a slice of the cached ranking if available.
+
+        Returns:
+            Tuple of (recipes list, total count), or None on a cache miss.
+        """
+        if not self._store:
+            return None
+
+        try:
+            return await self._store.get_range(offset, limit, count_only=count_only)
+        except Exception:
+            logger.exception("Error reading from cache")
+
+        return None
+
     async def _get_from_cache(self) -> PopularRecipesData | None:
         """Get cached data if available.
 
         Returns:
             Cached data or None if not found.
         """
-        if not self._cache_client:
+        if not self._store:
             return None
 
-        cache_key = f"popular:{self._config.cache_key}"
         try:
-            cached_bytes = await self._cache_client.get(cache_key)
-            if cached_bytes:
-                data = orjson.loads(cached_bytes)
-                return PopularRecipesData.model_validate(data)
+            return await self._store.load()
         except Exception:
             logger.exception("Error reading from cache")
 
@@ -217,36 +307,51 @@ class PopularRecipesService:
         Args:
             data: Data to cache.
         """
-        if not self._cache_client:
+        if not self._store:
             return
 
-        cache_key = f"popular:{self._config.cache_key}"
         try:
-            json_bytes = orjson.dumps(data.model_dump())
-            await self._cache_client.setex(
-                cache_key,
-                self._config.cache_ttl,
-                json_bytes,
-            )
+            meta = await self._store.save(data)
             logger.info(
                 "Cached popular recipes",
                 total_count=data.total_count,
+                pages=meta.page_count,
+                version=meta.version,
                 ttl=self._config.cache_ttl,
             )
         except Exception:
             logger.exception("Error saving to cache")
 
-    async def _fetch_all_sources(self) -> PopularRecipesData:
-        """Fetch recipes from all enabled sources concurrently.
+    async def _fetch_all_sources(
+        self, sources: Collection[str] | None = None
+    ) -> PopularRecipesData:
+        """Fetch sources and build the ranking without caching it.
+
+        Args:
+            sources: Names of the sources to fetch (all enabled if None).
 
         Returns:
             Aggregated and scored recipes data.
         """
-        enabled_sources = [s for s in self._config.sources if s.enabled]
+        fetched, errors = await self._refresh_sources(sources)
+        return await self._merge_sources(fetched, errors)
 
-        if not enabled_sources:
-            logger.warning("No enabled sources configured")
-            return PopularRecipesData()
+    async def _refresh_sources(
+        self, sources: Collection[str] | None = None
+    ) -> tuple[dict[str, list[PopularRecipe]], dict[str, str]]:
+        """Fetch sources concurrently and cache each successful result.
+
+        Args:
+            sources: Names of the sources to fetch (all enabled if None).
+
+        Returns:
+            Tuple of (recipes by fetched source, error by failed source).
+        """
+        to_fetch = [
+            s
+            for s in self._config.sources
+            if s.enabled and (sources is None or s.name in sources)
+        ]
 
         # Limit concurrent fetches
         semaphore = asyncio.Semaphore(self._config.max_concurrent_fetches)
@@ -271,24 +376,67 @@ class PopularRecipesService:
                     )
                     return source.name, str(e)
                 else:
+                    await self._save_source_result(source.name, recipes)
                     return source.name, recipes
 
         # Fetch all sources concurrently
-        results = await asyncio.gather(
-            *[fetch_with_semaphore(s) for s in enabled_sources]
-        )
+        results = await asyncio.gather(*[fetch_with_semaphore(s) for s in to_fetch])
 
         # Separate successes and failures
-        all_recipes: list[PopularRecipe] = []
-        sources_fetched: list[str] = []
+        fetched: dict[str, list[PopularRecipe]] = {}
         fetch_errors: dict[str, str] = {}
-
         for source_name, result in results:
             if isinstance(result, list):
-                all_recipes.extend(result)
-                sources_fetched.append(source_name)
+                fetched[source_name] = result
             else:
                 fetch_errors[source_name] = result
+        return fetched, fetch_errors
+
+    async def _merge_sources(
+        self,
+        fetched: dict[str, list[PopularRecipe]],
+        fetch_errors: dict[str, str],
+    ) -> PopularRecipesData:
+        """Combine source results into one scored ranking.
+
+        Sources not fetched now (or failing now) contribute their last
+        cached result; sources without one are left out.
+
+        Args:
+            fetched: Recipes by source fetched in this refresh.
+            fetch_errors: Error by source that failed in this refresh.
+
+        Returns:
+            Aggregated and scored recipes data.
+        """
+        enabled_sources = [s for s in self._config.sources if s.enabled]
+
+        if not enabled_sources:
+            logger.warning("No enabled sources configured")
+            return PopularRecipesData()
+
+        reused = await self._get_source_results(
+            [s.name for s in enabled_sources if s.name not in fetched]
+        )
+
+        all_recipes: list[PopularRecipe] = []
+        sources_fetched: list[str] = []
+        for source in enabled_sources:
+            if source.name in fetched:
+                recipes = fetched[source.name]
+            elif source.name in reused:
+                recipes = reused[source.name].recipes
+            else:
+                continue
+            all_recipes.extend(recipes)
+            sources_fetched.append(source.name)
+
+        if reused:
+            logger.info(
+                "Reusing cached source results",
+                sources=sorted(reused),
+                failed=sorted(set(reused) & set(fetch_errors)),
+            )
 
         if not all_recipes:
             logger.warning(
@@ -314,6 +462,53 @@ class PopularRecipesService:
             fetch_errors=fetch_errors,
         )
 
+    async def _get_source_results(self, names: list[str]) -> dict[str, SourceResult]:
+        """Get cached per-source results.
+
+        Returns:
+            Results by source name; empty if the cache is unavailable.
+        """
+        if not self._source_store or not names:
+            return {}
+
+        try:
+            return await self._source_store.get_many(names)
+        except Exception:
+            logger.exception("Error reading source results from cache")
+
+        return {}
+
+    async def _save_source_result(
+        self, source: str, recipes: list[PopularRecipe]
+    ) -> None:
+        """Cache a freshly fetched source result."""
+        if not self._source_store:
+            return
+
+        try:
+            await self._source_store.put(source, recipes)
+        except Exception:
+            logger.exception("Error saving source result to cache", source=source)
+
+    def _refresh_interval(self, source: PopularRecipeSourceSettings) -> int:
+        """Seconds a source result is reused before the source is refetched."""
+        if source.refresh_interval is not None:
+            return source.refresh_interval
+        return self._config.source_refresh_interval
+
+    def _rebuild_lock(self) -> contextlib.AbstractAsyncContextManager[Any]:
+        """Cross-process lock serializing ranking rebuilds."""
+        if not self._cache_client:
+            return contextlib.nullcontext()
+        lock_key = namespaced_key(
+            CacheNamespace.POPULAR, f"{self._config.cache_key}:rebuild"
+        )
+        return self._cache_client.lock(
+            lock_key,
+            timeout=REBUILD_LOCK_TIMEOUT,
+            blocking_timeout=REBUILD_LOCK_TIMEOUT,
+        )
+
     async def _fetch_source(
         self, source: PopularRecipeSourceSettings
     ) -> list[PopularRecipe]:
@@ -336,8 +531,12 @@ class PopularRecipesService:
         url = f"{source.base_url.rstrip('/')}{source.popular_endpoint}"
 
         try:
-            response = await self._http_client.get(url)
-            response.raise_for_status()
+            page = await fetch_html(
+                self._http_client,
+                url,
+                max_bytes=self._config.max_body_bytes,
+                truncate=True,
+            )
         except httpx.HTTPStatusError as e:
             msg = f"HTTP {e.response.status_code} from {url}"
             raise PopularRecipesFetchError(
@@ -347,7 +546,7 @@ class PopularRecipesService:
             msg = f"Request failed for {url}: {e}"
             raise PopularRecipesFetchError(msg, source=source.name) from e
 
-        html = response.text
+        html = page.text
 
         # Extract recipe links from listing page using LLM or regex fallback
         if not self._extractor:
@@ -415,24 +614,23 @@ class PopularRecipesService:
         if not self._http_client:
             return []
 
+        http_client = self._http_client
         semaphore = asyncio.Semaphore(self._config.max_concurrent_fetches)
 
         async def fetch_one(rank: int, name: str, url: str) -> PopularRecipe | None:
             async with semaphore:
                 metrics = RecipeEngagementMetrics()
                 try:
-                    response = await self._http_client.get(url)  # type: ignore[union-attr]
-                    if response.is_success:
-                        # Validate this is actually a recipe page
-                        if not is_recipe_page(response.text):
-                            logger.debug(
-                                "Skipping non-recipe page",
-                                url=url,
-                                source=source.name,
-                            )
-                            return None
-
-                        metrics = extract_engagement_metrics(response.text)
+                    page_metrics = await self._fetch_page_metrics(http_client, url)
+                    if page_metrics is None:
+                        logger.debug(
+                            "Skipping non-recipe page",
+                            url=url,
+                            source=source.name,
+                        )
+                        return None
+
+                    metrics = page_metrics
                 except Exception:
                     # Log but continue - we'll use position-only scoring
                     logger.debug(
@@ -460,6 +658,61 @@ class PopularRecipesService:
         # Filter out None results
         return [r for r in results if r is not None]
 
+    async def _fetch_page_metrics(
+        self, http_client: httpx.AsyncClient, url: str
+    ) -> RecipeEngagementMetrics | None:
+        """Fetch a recipe page and extract its engagement metrics.
+
+        Metrics stored within ``detail_fresh_ttl`` are reused without a
+        request. Older pages cached with validators are fetched
+        conditionally; a 304 reuses the stored metrics without downloading
+        or parsing the page.
+
+        Args:
+            http_client: HTTP client to use.
+            url: Recipe page URL.
+
+        Returns:
+            Engagement metrics, or None if the page is not a recipe page.
+        """
+        cached = await self._page_cache.get(url)
+        if cached is not None and cached.fresh:
+            if cached.value is None:
+                return None
+            return RecipeEngagementMetrics.model_validate(cached.value)
+        validators = cached.validators if cached else None
+
+        # Detail pages only need the rated Recipe JSON-LD block when it
+        # exists, so stop reading once it has arrived
+        page = await fetch_html(
+            http_client,
+            url,
+            max_bytes=self._config.max_body_bytes,
+            truncate=True,
+            stop_when=RecipeJsonLdDetector()
+            if self._config.stop_after_jsonld
+            else None,
+            validators=validators,
+        )
+
+        if page.not_modified and cached is not None:
+            self._page_cache.record("not_modified")
+            await self._page_cache.put(url, cached.value, page.validators or validators)
+            if cached.value is None:
+                return None
+            return RecipeEngagementMetrics.model_validate(cached.value)
+        if validators:
+            self._page_cache.record("modified")
+
+        # Validate this is a recipe page and extract metrics off the event loop
+        metrics = await get_parse_executor().run(
+            "engagement", analyze_recipe_page, page.content
+        )
+        await self._page_cache.put(
+            url, metrics.model_dump() if metrics else None, page.validators
+        )
+        return metrics
+
     def _score_source_recipes(
         self,
         recipes: list[PopularRecipe],
@@ -0,0 +1,367 @@
+"""Paged Redis storage for the popular recipes ranking.
+
+The refreshed ranking is stored in fixed-size pages instead of one blob,
+so a page request reads and validates only the records it returns:
+- ``popular:<key>``: small metadata record (version, page size, counts,
+  fetch info). It carries the cache TTL watched by the refresh cron job
+- ``popular:<key>:<version>:<page>``: JSON list of compact records
+
+Every save writes the pages of a new random version first and then
+switches the metadata to it in the same transaction. Pages of the
+previous version are kept for a short grace period so readers that
+already hold the old metadata can finish.
+
+Pages are immutable per version, so decoded pages are also kept in a
+process-local L1 cache keyed by version. A request costs one small GET of
+the metadata plus, on an L1 miss, one MGET of the pages it covers.
+
+The ranking is rebuilt from per-source results stored under
+``popular:<key>:source:<name>`` with their fetch time, so a refresh only
+refetches the sources that are due and reuses the others.
+
+All keys belong to the ``popular`` cache namespace: once it has been
+invalidated, its generation follows the prefix (``popular:g<n>:<key>``).
+
+This module provides:
+- PopularRecipesMeta: Metadata of the stored ranking
+- PopularRecipesStore: Reads and writes the paged layout
+- SourceResult: Scored recipes of one source and their fetch time
+- PopularSourceStore: Per-source results used to rebuild the ranking
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from app.cache.batch import cache_get_many
+from app.cache.local import MISSING, LocalCache
+from app.cache.namespaces import CacheNamespace, namespaced_key
+from app.schemas.recipe import PopularRecipe, PopularRecipesData
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from redis.asyncio import Redis
+
+
+DEFAULT_PAGE_SIZE = 20
+
+# Seconds pages of a replaced version stay readable
+PREVIOUS_VERSION_GRACE = 60
+
+# Decoded pages by (cache key, version, page number)
+_PAGE_CACHE: LocalCache[tuple[str, str, int], list[PopularRecipe]] = LocalCache(
+    "popular_recipe_pages"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PopularRecipesMeta:
+    """Metadata of the stored popular recipes ranking.
+
+    Attributes:
+        version: Random token identifying the current set of pages.
+        page_size: Records per page.
+        record_count: Number of stored records.
+        total_count: Reported number of ranked recipes.
+        last_updated: ISO timestamp of the refresh.
+        sources_fetched: Sources fetched successfully.
+        fetch_errors: Error message per failed source.
+    """
+
+    version: str
+    page_size: int
+    record_count: int
+    total_count: int
+    last_updated: str
+    sources_fetched: list[str] = field(default_factory=list)
+    fetch_errors: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def page_count(self) -> int:
+        """Number of stored pages."""
+        return -(-self.record_count // self.page_size)
+
+
+class PopularRecipesStore:
+    """Paged, versioned storage of the popular recipes ranking.
+
+    Redis errors propagate so callers keep their own error handling and
+    logging conventions.
+    """
+
+    def __init__(
+        self,
+        client: Redis[bytes],
+        cache_key: str,
+        *,
+        ttl: int,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            client: Redis cache client.
+            cache_key: Configured cache key (without the ``popular:`` prefix).
+            ttl: Lifetime of a saved ranking in seconds.
+            page_size: Records per page for new saves.
+        """
+        self._client = client
+        self._cache_key = cache_key
+        self._ttl = ttl
+        self._page_size = max(1, page_size)
+
+    @property
+    def meta_key(self) -> str:
+        """Redis key of the metadata record."""
+        return namespaced_key(CacheNamespace.POPULAR, self._cache_key)
+
+    def page_key(self, version: str, page: int) -> str:
+        """Redis key of one page of a version."""
+        return namespaced_key(
+            CacheNamespace.POPULAR, f"{self._cache_key}:{version}:{page}"
+        )
+
+    async def get_meta(self) -> PopularRecipesMeta | None:
+        """Read the metadata of the stored ranking.
+
+        Returns:
+            The metadata, or None if nothing is stored. A blob left by the
+            previous single-key layout also reads as None, so it is
+            replaced by the next refresh.
+        """
+        raw = await self._client.get(self.meta_key)
+        if not raw:
+            return None
+        fields = orjson.loads(raw)
+        if "version" not in fields:
+            return None
+        return PopularRecipesMeta(**fields)
+
+    async def get_range(
+        self,
+        offset: int,
+        limit: int,
+        *,
+        count_only: bool = False,
+    ) -> tuple[list[PopularRecipe], int] | None:
+        """Read a slice of the ranking.
+
+        Args:
+            offset: Index of the first recipe.
+            limit: Maximum number of recipes.
+            count_only: If True, skip reading pages.
+
+        Returns:
+            Tuple of (recipes, total count), or None if nothing is stored
+            or a page of the current version has expired.
+        """
+        meta = await self.get_meta()
+        if meta is None:
+            return None
+        if count_only or limit <= 0 or offset >= meta.record_count:
+            return [], meta.total_count
+
+        end = min(offset + limit, meta.record_count)
+        first_page = offset // meta.page_size
+        last_page = (end - 1) // meta.page_size
+        pages = await self._get_pages(meta, range(first_page, last_page + 1))
+        if pages is None:
+            return None
+
+        records = [recipe for page in pages for recipe in page]
+        start = offset - first_page * meta.page_size
+        return records[start : start + end - offset], meta.total_count
+
+    async def load(self) -> PopularRecipesData | None:
+        """Read the whole ranking.
+
+        Returns:
+            The stored data, or None if nothing (complete) is stored.
+        """
+        meta = await self.get_meta()
+        if meta is None:
+            return None
+        pages = await self._get_pages(meta, range(meta.page_count))
+        if pages is None:
+            return None
+
+        return PopularRecipesData(
+            recipes=[recipe for page in pages for recipe in page],
+            total_count=meta.total_count,
+            last_updated=meta.last_updated,
+            sources_fetched=meta.sources_fetched,
+            fetch_errors=meta.fetch_errors,
+        )
+
+    async def save(self, data: PopularRecipesData) -> PopularRecipesMeta:
+        """Store a ranking as a new version.
+
+        Args:
+            data: Ranking to store.
+
+        Returns:
+            Metadata of the stored version.
+        """
+        previous = await self.get_meta()
+        meta = PopularRecipesMeta(
+            version=uuid.uuid4().hex[:16],
+            page_size=self._page_size,
+            record_count=len(data.recipes),
+            total_count=data.total_count,
+            last_updated=data.last_updated,
+            sources_fetched=list(data.sources_fetched),
+            fetch_errors=dict(data.fetch_errors),
+        )
+
+        pipe = self._client.pipeline(transaction=True)
+        # Pages outlive the metadata so a reader never sees a dangling version
+        page_ttl = self._ttl + PREVIOUS_VERSION_GRACE
+        for page in range(meta.page_count):
+            start = page * meta.page_size
+            records = data.recipes[start : start + meta.page_size]
+            pipe.setex(
+                self.page_key(meta.version, page),
+                page_ttl,
+                orjson.dumps([_compact(r) for r in records]),
+            )
+        pipe.setex(self.meta_key, self._ttl, orjson.dumps(asdict(meta)))
+        if previous is not None:
+            for page in range(previous.page_count):
+                pipe.expire(
+                    self.page_key(previous.version, page), PREVIOUS_VERSION_GRACE
+                )
+        await pipe.execute()
+        return meta
+
+    async def delete(self) -> None:
+        """Delete the stored ranking."""
+        meta = await self.get_meta()
+        keys = [self.meta_key]
+        if meta is not None:
+            keys.extend(
+                self.page_key(meta.version, page) for page in range(meta.page_count)
+            )
+        await self._client.delete(*keys)
+
+    async def _get_pages(
+        self, meta: PopularRecipesMeta, pages: range
+    ) -> list[list[PopularRecipe]] | None:
+        """Read decoded pages of a version, from L1 where possible.
+
+        Returns:
+            Pages in order, or None if one of them is missing in Redis.
+        """
+        found: dict[int, list[PopularRecipe]] = {}
+        missing: list[int] = []
+        for page in pages:
+            cached = _PAGE_CACHE.get((self._cache_key, meta.version, page))
+            if cached is MISSING:
+                missing.append(page)
+            else:
+                found[page] = cached
+
+        if missing:
+            raw_pages = await cache_get_many(
+                self._client, [self.page_key(meta.version, page) for page in missing]
+            )
+            for page, raw in zip(missing, raw_pages, strict=True):
+                if raw is None:
+                    return None
+                records = [PopularRecipe.model_validate(r) for r in orjson.loads(raw)]
+                _PAGE_CACHE.set((self._cache_key, meta.version, page), records)
+                found[page] = records
+
+        return [found[page] for page in pages]
+
+
+@dataclass(frozen=True, slots=True)
+class SourceResult:
+    """Scored recipes of one source.
+
+    Attributes:
+        recipes: Recipes scored within the source, best first.
+        fetched_at: Unix time of the fetch.
+    """
+
+    recipes: list[PopularRecipe]
+    fetched_at: float
+
+    @property
+    def age(self) -> float:
+        """Seconds since the fetch."""
+        return time.time() - self.fetched_at
+
+
+class PopularSourceStore:
+    """Per-source results of the popular recipes refresh.
+
+    Results are kept for ``ttl`` seconds, past their refresh interval, so a
+    source that fails to refresh keeps contributing its last result.
+    Redis errors propagate.
+    """
+
+    def __init__(self, client: Redis[bytes], cache_key: str, *, ttl: int) -> None:
+        """Initialize the store.
+
+        Args:
+            client: Redis cache client.
+            cache_key: Configured cache key (without the ``popular:`` prefix).
+            ttl: Seconds a result is kept.
+        """
+        self._client = client
+        self._cache_key = cache_key
+        self._ttl = ttl
+
+    def key(self, source: str) -> str:
+        """Redis key of a source result."""
+        return namespaced_key(
+            CacheNamespace.POPULAR, f"{self._cache_key}:source:{source}"
+        )
+
+    async def get_many(self, sources: Sequence[str]) -> dict[str, SourceResult]:
+        """Read the stored results of several sources.
+
+        Args:
+            sources: Source names.
+
+        Returns:
+            Results by source name, without sources that have none.
+        """
+        raw_results = await cache_get_many(
+            self._client, [self.key(source) for source in sources]
+        )
+        results: dict[str, SourceResult] = {}
+        for source, raw in zip(sources, raw_results, strict=True):
+            if raw is None:
+                continue
+            entry = orjson.loads(raw)
+            results[source] = SourceResult(
+                recipes=[PopularRecipe.model_validate(r) for r in entry["recipes"]],
+                fetched_at=entry["fetched_at"],
+            )
+        return results
+
+    async def put(self, source: str, recipes: list[PopularRecipe]) -> None:
+        """Store a freshly fetched source result.
+
+        Args:
+            source: Source name.
+            recipes: Recipes scored within the source.
+        """
+        entry = {
+            "fetched_at": time.time(),
+            "recipes": [_compact(r) for r in recipes],
+        }
+        await self._client.set(self.key(source), orjson.dumps(entry), ex=self._ttl)
+
+
+def _compact(recipe: PopularRecipe) -> dict[str, Any]:
+    """Serialize a recipe without default-valued fields."""
+    return recipe.model_dump(exclude_defaults=True)
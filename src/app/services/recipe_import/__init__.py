@@ -0,0 +1,11 @@
+"""Recipe import (scrape, parse, save) module."""
+
+from app.services.recipe_import.exceptions import RecipeImportError
+from app.services.recipe_import.service import (
+    ImportStage,
+    RecipeImporter,
+    RecipeImportResult,
+)
+
+
+__all__ = ["ImportStage", "RecipeImportError", "RecipeImportResult", "RecipeImporter"]
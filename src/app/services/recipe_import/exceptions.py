@@ -0,0 +1,36 @@
+"""Recipe import exceptions.
+
+This module defines the error raised when importing a recipe URL fails.
+It carries the HTTP status and error body the endpoint layer returns, so
+single and batch imports report failures the same way.
+"""
+
+from __future__ import annotations
+
+
+class RecipeImportError(Exception):
+    """Raised when a recipe URL cannot be imported.
+
+    Attributes:
+        status_code: HTTP status describing the failure.
+        error: Machine-readable error code (e.g. "RECIPE_NOT_FOUND").
+        message: Human-readable message.
+    """
+
+    def __init__(self, status_code: int, error: str, message: str) -> None:
+        """Initialize the error.
+
+        Args:
+            status_code: HTTP status describing the failure.
+            error: Machine-readable error code.
+            message: Human-readable message.
+        """
+        super().__init__(message)
+        self.status_code = status_code
+        self.error = error
+        self.message = message
+
+    @property
+    def detail(self) -> dict[str, str]:
+        """Error body in the API's error format."""
+        return {"error": self.error, "message": self.message}
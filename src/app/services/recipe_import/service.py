@@ -0,0 +1,330 @@
+"""Recipe import pipeline.
+
+Importing a recipe URL takes three steps: scrape the page, parse the
+ingredients, and save the recipe to the Recipe Management Service. This
+module runs that pipeline for one URL (POST /recipes) or for many URLs
+concurrently (POST /recipes/batch).
+
+This module provides:
+- RecipeImporter: Single and batch import
+- RecipeImportResult: Outcome of one URL in a batch
+- ImportStage: Pipeline stages reported to progress callbacks
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING, Protocol
+from urllib.parse import urlsplit
+
+from fastapi import status
+from prometheus_client import Counter
+
+from app.mappers import build_downstream_recipe_request, build_recipe_response
+from app.observability.logging import get_logger
+from app.parsing.exceptions import IngredientParsingError
+from app.services.recipe_import.exceptions import RecipeImportError
+from app.services.recipe_management.exceptions import (
+    RecipeManagementError,
+    RecipeManagementUnavailableError,
+    RecipeManagementValidationError,
+)
+from app.services.scraping.exceptions import (
+    RecipeNotFoundError,
+    ScrapingError,
+    ScrapingFetchError,
+    ScrapingTimeoutError,
+)
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+
+    from app.llm.prompts import ParsedIngredient
+    from app.schemas import CreateRecipeResponse
+    from app.services.recipe_management.client import RecipeManagementClient
+    from app.services.scraping.models import ScrapedRecipe
+    from app.services.scraping.service import RecipeScraperService
+
+
+logger = get_logger(__name__)
+
+DEFAULT_BATCH_MAX_CONCURRENCY = 8
+DEFAULT_BATCH_MAX_PER_HOST = 2
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+BATCH_RECIPE_IMPORTS = Counter(
+    "batch_imports",
+    "Recipe URLs imported through batch requests, by outcome",
+    ["outcome"],
+    namespace="recipe_scraper",
+    subsystem="recipe_import",
+)
+
+
+class ImportStage(StrEnum):
+    """Stages of a recipe import, in order."""
+
+    QUEUED = "queued"
+    SCRAPING = "scraping"
+    PARSING = "parsing"
+    SAVING = "saving"
+    COMPLETE = "complete"
+    FAILED = "failed"
+
+
+class IngredientBatchParser(Protocol):
+    """Anything parsing ingredient lines in order (parser or coalescer)."""
+
+    async def parse_batch(self, ingredients: list[str]) -> list[ParsedIngredient]:
+        """Parse raw ingredient lines, returning results in input order."""
+        ...
+
+
+@dataclass(frozen=True, slots=True)
+class RecipeImportResult:
+    """Outcome of importing one URL of a batch.
+
+    Attributes:
+        index: Position of the URL in the request.
+        url: The recipe URL.
+        response: Created recipe, when the import succeeded.
+        error: Failure, when it did not.
+    """
+
+    index: int
+    url: str
+    response: CreateRecipeResponse | None = None
+    error: RecipeImportError | None = None
+
+    @property
+    def status_code(self) -> int:
+        """HTTP status the URL would have received from POST /recipes."""
+        if self.error is not None:
+            return self.error.status_code
+        return status.HTTP_201_CREATED
+
+
+# =============================================================================
+# Importer
+# =============================================================================
+
+
+class RecipeImporter:
+    """Scrape, parse and save recipes.
+
+    Failures are raised as RecipeImportError with the status and error body
+    POST /recipes returns for them.
+
+    Example:
+        ```python
+        importer = RecipeImporter(scraper, parser, recipe_client)
+        response = await importer.import_recipe(url, auth_token)
+
+        # Many URLs, results in completion order
+        async for result in importer.import_many(urls, auth_token):
+            print(result.index, result.status_code)
+        ```
+    """
+
+    def __init__(
+        self,
+        scraper: RecipeScraperService,
+        parser: IngredientBatchParser,
+        recipe_client: RecipeManagementClient,
+    ) -> None:
+        """Initialize the importer.
+
+        Args:
+            scraper: Service for scraping recipes.
+            parser: Ingredient parser, or a coalescer merging the parse
+                calls of concurrent imports.
+            recipe_client: Client for the Recipe Management Service.
+        """
+        self._scraper = scraper
+        self._parser = parser
+        self._recipe_client = recipe_client
+
+    async def import_recipe(
+        self,
+        url: str,
+        auth_token: str,
+        *,
+        on_stage: Callable[[ImportStage], Awaitable[None]] | None = None,
+    ) -> CreateRecipeResponse:
+        """Import one recipe URL.
+
+        Args:
+            url: Recipe URL to scrape.
+            auth_token: Bearer token forwarded to the Recipe Management Service.
+            on_stage: Optional callback awaited as each step starts
+                (SCRAPING, PARSING, SAVING).
+
+        Returns:
+            The created recipe.
+
+        Raises:
+            RecipeImportError: If any step fails.
+        """
+        if on_stage is not None:
+            await on_stage(ImportStage.SCRAPING)
+        scraped = await self._scrape(url)
+        if on_stage is not None:
+            await on_stage(ImportStage.PARSING)
+        parsed_ingredients = await self._parse(url, scraped)
+        if on_stage is not None:
+            await on_stage(ImportStage.SAVING)
+        downstream_request = build_downstream_recipe_request(
+            scraped, parsed_ingredients
+        )
+
+        try:
+            downstream_response = await self._recipe_client.create_recipe(
+                downstream_request,
+                auth_token,
+            )
+        except RecipeManagementValidationError as e:
+            logger.warning("Downstream validation failed", error=str(e))
+            raise RecipeImportError(
+                status.HTTP_422_UNPROCESSABLE_ENTITY, "VALIDATION_ERROR", str(e)
+            ) from None
+        except RecipeManagementUnavailableError:
+            logger.warning("Recipe Management Service unavailable")
+            raise RecipeImportError(
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+                "SERVICE_UNAVAILABLE",
+                "Recipe Management Service is not available",
+            ) from None
+        except RecipeManagementError as e:
+            logger.exception("Recipe Management Service error")
+            raise RecipeImportError(
+                status.HTTP_502_BAD_GATEWAY,
+                "DOWNSTREAM_ERROR",
+                f"Recipe Management Service error: {e}",
+            ) from None
+
+        logger.info(
+            "Recipe created successfully",
+            recipe_id=downstream_response.id,
+            title=downstream_response.title,
+            url=url,
+        )
+        return build_recipe_response(downstream_response, scraped, parsed_ingredients)
+
+    async def import_many(
+        self,
+        urls: Sequence[str],
+        auth_token: str,
+        *,
+        max_concurrency: int = DEFAULT_BATCH_MAX_CONCURRENCY,
+        max_per_host: int = DEFAULT_BATCH_MAX_PER_HOST,
+    ) -> AsyncIterator[RecipeImportResult]:
+        """Import many recipe URLs concurrently.
+
+        A URL waits for a slot on its host before taking one of the overall
+        slots, so a batch dominated by one site does not hold up the others.
+        Closing the iterator early cancels the imports still running.
+
+        Args:
+            urls: Recipe URLs.
+            auth_token: Bearer token forwarded to the Recipe Management Service.
+            max_concurrency: Imports running at once.
+            max_per_host: Imports running at once against one host.
+
+        Yields:
+            One result per URL, in completion order.
+        """
+        overall = asyncio.Semaphore(max(1, max_concurrency))
+        per_host = max(1, max_per_host)
+        hosts: dict[str, asyncio.Semaphore] = {}
+        results: asyncio.Queue[RecipeImportResult] = asyncio.Queue()
+
+        async def run(index: int, url: str) -> None:
+            host = urlsplit(url).hostname or ""
+            host_slots = hosts.setdefault(host, asyncio.Semaphore(per_host))
+            async with host_slots, overall:
+                results.put_nowait(await self._import_result(index, url, auth_token))
+
+        tasks = [asyncio.create_task(run(i, url)) for i, url in enumerate(urls)]
+        try:
+            for _ in tasks:
+                yield await results.get()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    # =========================================================================
+    # Steps
+    # =========================================================================
+
+    async def _scrape(self, url: str) -> ScrapedRecipe:
+        try:
+            return await self._scraper.scrape(url)
+        except RecipeNotFoundError:
+            logger.warning("No recipe found at URL", url=url)
+            raise RecipeImportError(
+                status.HTTP_400_BAD_REQUEST,
+                "RECIPE_NOT_FOUND",
+                "No recipe data found at the provided URL",
+            ) from None
+        except ScrapingTimeoutError:
+            logger.warning("Scraping timed out", url=url)
+            raise RecipeImportError(
+                status.HTTP_504_GATEWAY_TIMEOUT,
+                "SCRAPING_TIMEOUT",
+                "Timed out while fetching the recipe URL",
+            ) from None
+        except ScrapingFetchError as e:
+            logger.warning("Failed to fetch URL", url=url, error=str(e))
+            raise RecipeImportError(
+                status.HTTP_400_BAD_REQUEST,
+                "INVALID_RECIPE_URL",
+                f"Unable to fetch the recipe URL: {e}",
+            ) from None
+        except ScrapingError as e:
+            logger.warning("Scraping failed", url=url, error=str(e))
+            raise RecipeImportError(
+                status.HTTP_400_BAD_REQUEST,
+                "SCRAPING_ERROR",
+                f"Failed to scrape recipe: {e}",
+            ) from None
+
+    async def _parse(self, url: str, scraped: ScrapedRecipe) -> list[ParsedIngredient]:
+        try:
+            return await self._parser.parse_batch(scraped.ingredients)
+        except IngredientParsingError as e:
+            logger.warning("Ingredient parsing failed", url=url, error=str(e))
+            raise RecipeImportError(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "INGREDIENT_PARSING_ERROR",
+                "Failed to parse recipe ingredients",
+            ) from None
+
+    async def _import_result(
+        self, index: int, url: str, auth_token: str
+    ) -> RecipeImportResult:
+        """Import one URL of a batch, capturing failures in the result."""
+        try:
+            response = await self.import_recipe(url, auth_token)
+        except RecipeImportError as e:
+            BATCH_RECIPE_IMPORTS.labels(outcome="error").inc()
+            return RecipeImportResult(index=index, url=url, error=e)
+        except Exception:
+            logger.exception("Unexpected error importing recipe", url=url)
+            BATCH_RECIPE_IMPORTS.labels(outcome="error").inc()
+            error = RecipeImportError(
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "INTERNAL_ERROR",
+                "Unexpected error importing the recipe",
+            )
+            return RecipeImportResult(index=index, url=url, error=error)
+
+        BATCH_RECIPE_IMPORTS.labels(outcome="created").inc()
+        return RecipeImportResult(index=index, url=url, response=response)
@@ -9,6 +9,7 @@ from __future__ import annotations
 import httpx
 import orjson
 
+from app.clients.http import create_http_client
 from app.core.config import get_settings
 from app.observability.logging import get_logger
 from app.services.recipe_management.exceptions import (
@@ -65,7 +66,9 @@ class RecipeManagementClient:
     async def initialize(self) -> None:
         """Initialize HTTP client."""
         timeout = self._settings.downstream_services.recipe_management.timeout
-        self._http_client = httpx.AsyncClient(
+        self._http_client = create_http_client(
+            "recipe_management",
+            limit_per_host=False,
             timeout=httpx.Timeout(timeout),
             headers={
                 "Content-Type": "application/json",
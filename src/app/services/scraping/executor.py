@@ -0,0 +1,250 @@
+"""Off-loop executor for CPU-bound HTML parsing.
+
+BeautifulSoup/lxml parsing of a 1-2 MB recipe page blocks the event loop
+for tens of milliseconds. This module runs such work in a process pool,
+a thread pool, or inline (tests), selected by configuration.
+
+This module provides:
+- ParseExecutorMode: Supported execution modes
+- HtmlParseExecutor: Async facade over the configured pool
+- decode_html: Decode fetched page bytes inside the worker
+- init_parse_executor / close_parse_executor / get_parse_executor:
+  Global executor lifecycle (lifespan, ARQ worker)
+
+Functions submitted to a process pool must be module-level so they can be
+pickled, and take and return picklable values (page bytes in, pydantic
+models out).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import StrEnum
+from functools import partial
+from typing import TYPE_CHECKING
+
+from bs4 import UnicodeDammit
+from prometheus_client import Gauge, Histogram
+
+from app.observability.logging import get_logger
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_WORKERS = 2
+
+
+class ParseExecutorMode(StrEnum):
+    """Where HTML parsing runs.
+
+    - PROCESS: Process pool, parsing runs in parallel with the event loop
+    - THREAD: Thread pool, keeps the loop responsive but shares the GIL
+    - INLINE: On the event loop (tests, debugging)
+    """
+
+    PROCESS = "process"
+    THREAD = "thread"
+    INLINE = "inline"
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+PARSE_QUEUE_DEPTH = Gauge(
+    "queue_depth",
+    "HTML parse tasks submitted and not yet finished",
+    namespace="recipe_scraper",
+    subsystem="html_parser",
+)
+PARSE_DURATION = Histogram(
+    "parse_duration_seconds",
+    "HTML parse task duration including queue wait",
+    ["task"],
+    namespace="recipe_scraper",
+    subsystem="html_parser",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+
+# =============================================================================
+# Executor
+# =============================================================================
+
+
+class HtmlParseExecutor:
+    """Runs HTML parsing functions off the event loop.
+
+    Example:
+        ```python
+        executor = HtmlParseExecutor(ParseExecutorMode.PROCESS, max_workers=2)
+        executor.start()
+
+        metrics = await executor.run("engagement", analyze_recipe_page, content)
+
+        await executor.shutdown()
+        ```
+    """
+
+    def __init__(
+        self,
+        mode: ParseExecutorMode = ParseExecutorMode.INLINE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        """Initialize the executor (the pool is created by start()).
+
+        Args:
+            mode: Where parsing runs.
+            max_workers: Pool size for process and thread modes.
+        """
+        self._mode = mode
+        self._max_workers = max(1, max_workers)
+        self._pool: Executor | None = None
+        self._pending = 0
+
+    @property
+    def mode(self) -> ParseExecutorMode:
+        """Configured execution mode."""
+        return self._mode
+
+    @property
+    def queue_depth(self) -> int:
+        """Tasks submitted and not yet finished."""
+        return self._pending
+
+    def start(self) -> None:
+        """Create the worker pool (no-op for inline mode)."""
+        if self._pool is not None or self._mode == ParseExecutorMode.INLINE:
+            return
+        if self._mode == ParseExecutorMode.PROCESS:
+            self._pool = ProcessPoolExecutor(max_workers=self._max_workers)
+        else:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="html-parser"
+            )
+        logger.info(
+            "HTML parse executor started",
+            mode=self._mode.value,
+            max_workers=self._max_workers,
+        )
+
+    async def shutdown(self) -> None:
+        """Shut down the worker pool, waiting for running tasks."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+            logger.debug("HTML parse executor shutdown")
+
+    async def run[**P, R](
+        self,
+        task: str,
+        func: Callable[P, R],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        """Run a parsing function and return its result.
+
+        Runs inline when the pool has not been started.
+
+        Args:
+            task: Task name for the duration metric.
+            func: Module-level parsing function.
+            *args: Positional arguments for func.
+            **kwargs: Keyword arguments for func.
+
+        Returns:
+            The function's result. Exceptions raised by func propagate.
+        """
+        self._pending += 1
+        PARSE_QUEUE_DEPTH.inc()
+        started = time.perf_counter()
+        try:
+            if self._pool is None:
+                return func(*args, **kwargs)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._pool, partial(func, *args, **kwargs)
+            )
+        finally:
+            self._pending -= 1
+            PARSE_QUEUE_DEPTH.dec()
+            PARSE_DURATION.labels(task=task).observe(time.perf_counter() - started)
+
+
+def decode_html(html: str | bytes) -> str:
+    """Decode fetched page bytes, sniffing the declared charset.
+
+    Called inside parsing functions so decoding also runs off the loop.
+
+    Args:
+        html: Raw page bytes (or already decoded text).
+
+    Returns:
+        Decoded HTML text.
+    """
+    if isinstance(html, str):
+        return html
+    dammit = UnicodeDammit(html, known_definite_encodings=["utf-8"], is_html=True)
+    if dammit.unicode_markup is None:
+        return html.decode("utf-8", errors="replace")
+    return dammit.unicode_markup
+
+
+# =============================================================================
+# Global Executor
+# =============================================================================
+
+
+class _ExecutorHolder:
+    executor: HtmlParseExecutor | None = None
+
+
+_INLINE_EXECUTOR = HtmlParseExecutor(ParseExecutorMode.INLINE)
+
+
+def init_parse_executor(
+    mode: ParseExecutorMode | str,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> HtmlParseExecutor:
+    """Create and start the global parse executor.
+
+    Should be called during application startup (lifespan) and ARQ worker
+    startup.
+
+    Args:
+        mode: Where parsing runs.
+        max_workers: Pool size for process and thread modes.
+
+    Returns:
+        The started executor.
+    """
+    executor = HtmlParseExecutor(ParseExecutorMode(mode), max_workers)
+    executor.start()
+    _ExecutorHolder.executor = executor
+    return executor
+
+
+async def close_parse_executor() -> None:
+    """Shut down the global parse executor.
+
+    Should be called during application shutdown.
+    """
+    executor, _ExecutorHolder.executor = _ExecutorHolder.executor, None
+    if executor is not None:
+        await executor.shutdown()
+
+
+def get_parse_executor() -> HtmlParseExecutor:
+    """Get the global parse executor.
+
+    Returns:
+        The started executor, or an inline executor when none was
+        initialized (scripts, tests).
+    """
+    return _ExecutorHolder.executor or _INLINE_EXECUTOR
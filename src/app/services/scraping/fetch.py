@@ -0,0 +1,206 @@
+"""Streaming, size-capped HTML fetching.
+
+Some recipe sites serve multi-megabyte pages padded with inline ads. This
+module reads responses as a stream, enforces a maximum body size, and can
+stop reading once the caller has what it needs.
+
+This module provides:
+- FetchedPage: Body bytes plus how the read ended
+- ResponseTooLargeError: Raised when a capped body must not be truncated
+- RecipeJsonLdDetector: Stop condition for pages whose Recipe JSON-LD
+  block with aggregateRating has been read
+- fetch_html: Stream a page with a size cap and optional stop condition,
+  conditionally when validators of a cached copy are given
+
+Bodies stay bytes; decoding happens once, in the HTML parse executor or
+via FetchedPage.text.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import httpx
+from prometheus_client import Counter
+
+from app.services.scraping.validators import PageValidators
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+DEFAULT_MAX_BODY_BYTES = 5 * 1024 * 1024  # 5 MiB
+
+# Complete JSON-LD script blocks (ASCII markers, matched on raw bytes)
+_JSONLD_BLOCK_RE = re.compile(
+    rb"<script[^>]*application/ld\+json[^>]*>(.*?)</script\s*>",
+    re.DOTALL | re.IGNORECASE,
+)
+_JSONLD_OPEN_RE = re.compile(rb"<script[^>]*application/ld\+json[^>]*>", re.IGNORECASE)
+_RECIPE_TYPE_RE = re.compile(rb'"@type"\s*:\s*(?:\[[^\]]*)?"Recipe"')
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+FETCH_EARLY_STOPS = Counter(
+    "fetch_early_stops",
+    "HTML fetches that stopped reading before the end of the body",
+    ["reason"],
+    namespace="recipe_scraper",
+    subsystem="scraping",
+)
+
+
+# =============================================================================
+# Fetching
+# =============================================================================
+
+
+class ResponseTooLargeError(Exception):
+    """Raised when a response body exceeds the configured maximum size."""
+
+    def __init__(self, url: str, max_bytes: int) -> None:
+        """Initialize with the offending URL and the limit."""
+        self.url = url
+        self.max_bytes = max_bytes
+        super().__init__(f"Response from {url} exceeds {max_bytes} bytes")
+
+
+@dataclass(frozen=True, slots=True)
+class FetchedPage:
+    """A fetched HTML body.
+
+    Attributes:
+        content: Body bytes read.
+        encoding: Charset from the Content-Type header, if any.
+        truncated: Reading stopped at the size cap.
+        stopped_early: Reading stopped because the stop condition was met.
+        validators: ETag/Last-Modified of the response, if sent.
+        not_modified: The server answered 304 to a conditional request;
+            content is empty and the cached copy is still current.
+    """
+
+    content: bytes
+    encoding: str | None = None
+    truncated: bool = False
+    stopped_early: bool = False
+    validators: PageValidators | None = None
+    not_modified: bool = False
+
+    @property
+    def text(self) -> str:
+        """Body decoded with the response charset (UTF-8 by default)."""
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+
+class RecipeJsonLdDetector:
+    """Stop condition met once a Recipe JSON-LD block with ratings is read.
+
+    Each call resumes where a block could still be completing: at an
+    unterminated JSON-LD block, or else at the last tag start. Bytes
+    outside JSON-LD blocks are therefore scanned a bounded number of
+    times, and detection stays linear in the body size.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scan position."""
+        self._scanned = 0
+
+    def __call__(self, buffer: bytearray) -> bool:
+        """Check newly received data for a rated Recipe JSON-LD block.
+
+        Args:
+            buffer: Body bytes received so far.
+
+        Returns:
+            True if a complete Recipe block containing aggregateRating
+            has been received.
+        """
+        for match in _JSONLD_BLOCK_RE.finditer(buffer, self._scanned):
+            self._scanned = match.end()
+            block = match.group(1)
+            if b"aggregateRating" in block and _RECIPE_TYPE_RE.search(block):
+                return True
+
+        opening = _JSONLD_OPEN_RE.search(buffer, self._scanned)
+        if opening is not None:
+            # Unterminated block: wait for its closing tag
+            self._scanned = opening.start()
+        else:
+            # Only a tag still being received can start a block
+            tag = buffer.rfind(b"<", self._scanned)
+            self._scanned = tag if tag >= 0 else len(buffer)
+        return False
+
+
+async def fetch_html(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    max_bytes: int = DEFAULT_MAX_BODY_BYTES,
+    truncate: bool = False,
+    stop_when: Callable[[bytearray], bool] | None = None,
+    validators: PageValidators | None = None,
+) -> FetchedPage:
+    """Stream an HTML page, enforcing a maximum body size.
+
+    Args:
+        client: HTTP client to use.
+        url: Page URL.
+        max_bytes: Maximum body bytes to read.
+        truncate: Return the first max_bytes of an oversized body instead
+            of raising.
+        stop_when: Called with the bytes received so far after each chunk;
+            reading stops when it returns True.
+        validators: Validators of a cached copy; sent as If-None-Match /
+            If-Modified-Since.
+
+    Returns:
+        The fetched page, with not_modified set (and no content) on a 304.
+
+    Raises:
+        httpx.HTTPStatusError: On a non-2xx response.
+        httpx.RequestError: On transport errors and timeouts.
+        ResponseTooLargeError: If the body exceeds max_bytes and truncate
+            is False.
+    """
+    headers = validators.request_headers() if validators else None
+    buffer = bytearray()
+    async with client.stream("GET", url, headers=headers) as response:
+        received = PageValidators.from_headers(response.headers)
+        if response.status_code == httpx.codes.NOT_MODIFIED and validators:
+            return FetchedPage(b"", validators=received, not_modified=True)
+        response.raise_for_status()
+        encoding = response.charset_encoding
+
+        declared = response.headers.get("content-length", "")
+        if declared.isdigit() and int(declared) > max_bytes and not truncate:
+            raise ResponseTooLargeError(url, max_bytes)
+
+        async for chunk in response.aiter_bytes():
+            buffer += chunk
+            if len(buffer) > max_bytes:
+                if not truncate:
+                    raise ResponseTooLargeError(url, max_bytes)
+                FETCH_EARLY_STOPS.labels(reason="max_size").inc()
+                return FetchedPage(
+                    bytes(buffer[:max_bytes]),
+                    encoding,
+                    truncated=True,
+                    validators=received,
+                )
+            if stop_when is not None and stop_when(buffer):
+                FETCH_EARLY_STOPS.labels(reason="condition").inc()
+                return FetchedPage(
+                    bytes(buffer),
+                    encoding,
+                    stopped_early=True,
+                    validators=received,
+                )
+
+    return FetchedPage(bytes(buffer), encoding, validators=received)
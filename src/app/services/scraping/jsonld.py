@@ -12,25 +12,30 @@ import re
 from typing import Any
 
 from app.observability.logging import get_logger
+from app.services.scraping.executor import decode_html
 from app.services.scraping.models import ScrapedRecipe
 
 
 logger = get_logger(__name__)
 
 
-def extract_recipe_from_jsonld(html: str, source_url: str) -> ScrapedRecipe | None:
+def extract_recipe_from_jsonld(
+    html: str | bytes, source_url: str
+) -> ScrapedRecipe | None:
     """Extract recipe data from JSON-LD in HTML.
 
     Searches for schema.org/Recipe structured data in the HTML and
     extracts relevant fields.
 
     Args:
-        html: HTML content to parse.
+        html: HTML content (or raw page bytes) to parse.
         source_url: Original URL for the recipe.
 
     Returns:
         ScrapedRecipe if found, None otherwise.
     """
+    html = decode_html(html)
+
     # Find all JSON-LD script blocks
     jsonld_pattern = (
         r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>'
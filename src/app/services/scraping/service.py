@@ -3,6 +3,11 @@
 This module provides the main recipe scraping functionality using:
 1. recipe-scrapers library as the primary extractor (400+ supported sites)
 2. JSON-LD structured data as a fallback
+
+HTML parsing runs on the HTML parse executor (see executor.py) so large
+pages do not block the event loop. Cached recipes keep the page's ETag and
+Last-Modified validators; expired entries are revalidated with a
+conditional request, and a 304 only refreshes the cache entry.
 """
 
 from __future__ import annotations
@@ -10,9 +15,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 import httpx
-import orjson
 from recipe_scrapers import WebsiteNotImplementedError, scrape_html
 
+from app.clients.http import create_http_client
 from app.core.config import get_settings
 from app.observability.logging import get_logger
 from app.services.scraping.exceptions import (
@@ -21,8 +26,11 @@ from app.services.scraping.exceptions import (
     ScrapingParseError,
     ScrapingTimeoutError,
 )
+from app.services.scraping.executor import decode_html, get_parse_executor
+from app.services.scraping.fetch import FetchedPage, ResponseTooLargeError, fetch_html
 from app.services.scraping.jsonld import extract_recipe_from_jsonld
 from app.services.scraping.models import ScrapedRecipe
+from app.services.scraping.validators import PageValidatorStore
 
 
 if TYPE_CHECKING:
@@ -30,6 +38,8 @@ if TYPE_CHECKING:
 
     from redis.asyncio import Redis
 
+    from app.services.scraping.validators import PageValidators, ValidatedEntry
+
 
 logger = get_logger(__name__)
 
@@ -64,10 +74,17 @@ class RecipeScraperService:
         self._settings = get_settings()
         self._cache_client = cache_client
         self._http_client: httpx.AsyncClient | None = None
+        self._cache = PageValidatorStore(
+            cache_client,
+            "recipe:scraped",
+            fresh_ttl=self._settings.scraping.cache_ttl,
+            retention_ttl=self._settings.scraping.validator_ttl,
+        )
 
     async def initialize(self) -> None:
         """Initialize HTTP client and other resources."""
-        self._http_client = httpx.AsyncClient(
+        self._http_client = create_http_client(
+            "scraping",
             timeout=httpx.Timeout(self._settings.scraping.fetch_timeout),
             follow_redirects=True,
             headers={
@@ -116,19 +133,31 @@ class RecipeScraperService:
             RecipeNotFoundError: If no recipe data found on the page.
             ScrapingParseError: If parsing the recipe data fails.
         """
+        use_cache = bool(self._cache_client and self._settings.scraping.cache_enabled)
+
         # Check cache first
-        if (
-            not skip_cache
-            and self._cache_client
-            and self._settings.scraping.cache_enabled
-        ):
+        cached: ValidatedEntry | None = None
+        if use_cache and not skip_cache:
             cached = await self._get_from_cache(url)
-            if cached:
+            if cached is not None and cached.fresh:
                 logger.debug("Cache hit for recipe URL", url=url)
-                return cached
+                return ScrapedRecipe.model_validate(cached.value)
 
-        # Fetch HTML
-        html = await self._fetch_html(url)
+        # Fetch HTML, conditionally when an expired copy has validators
+        page = await self._fetch_html(url, cached.validators if cached else None)
+
+        if page.not_modified and cached is not None:
+            logger.debug("Recipe page not modified", url=url)
+            self._cache.record("not_modified")
+            unchanged = ScrapedRecipe.model_validate(cached.value)
+            await self._save_to_cache(
+                url, unchanged, page.validators or cached.validators
+            )
+            return unchanged
+        if cached is not None and cached.validators:
+            self._cache.record("modified")
+
+        html = page.content
 
         # Try recipe-scrapers first
         recipe = await self._extract_with_recipe_scrapers(url, html)
@@ -144,22 +173,30 @@ class RecipeScraperService:
             raise RecipeNotFoundError(error_msg)
 
         # Cache the result
-        if self._cache_client and self._settings.scraping.cache_enabled:
-            await self._save_to_cache(url, recipe)
+        if use_cache:
+            await self._save_to_cache(url, recipe, page.validators)
 
         return recipe
 
-    async def _fetch_html(self, url: str) -> str:
-        """Fetch HTML content from URL.
+    async def _fetch_html(
+        self,
+        url: str,
+        validators: PageValidators | None = None,
+    ) -> FetchedPage:
+        """Stream HTML content from URL, capped at scraping.max_body_bytes.
 
         Args:
             url: The URL to fetch.
+            validators: Validators of a cached copy, for a conditional
+                request.
 
         Returns:
-            HTML content as string.
+            The fetched page; its content is raw HTML bytes (decoded by the
+            parsing functions), or empty when not_modified is set.
 
         Raises:
-            ScrapingFetchError: If the request fails.
+            ScrapingFetchError: If the request fails or the page exceeds
+                scraping.max_body_bytes.
             ScrapingTimeoutError: If the request times out.
         """
         if not self._http_client:
@@ -167,8 +204,12 @@ class RecipeScraperService:
             raise RuntimeError(msg)
 
         try:
-            response = await self._http_client.get(url)
-            response.raise_for_status()
+            page = await fetch_html(
+                self._http_client,
+                url,
+                max_bytes=self._settings.scraping.max_body_bytes,
+                validators=validators,
+            )
 
         except httpx.TimeoutException as e:
             logger.warning("Request timed out", url=url, error=str(e))
@@ -189,14 +230,17 @@ class RecipeScraperService:
             error_msg = f"Failed to fetch {url}: {e}"
             raise ScrapingFetchError(error_msg) from e
 
+        except ResponseTooLargeError as e:
+            logger.warning("Response too large", url=url, max_bytes=e.max_bytes)
+            raise ScrapingFetchError(str(e)) from e
+
         else:
-            html: str = response.text
-            return html
+            return page
 
     async def _extract_with_recipe_scrapers(
         self,
         url: str,
-        html: str,
+        html: str | bytes,
     ) -> ScrapedRecipe | None:
         """Extract recipe using recipe-scrapers library.
 
@@ -211,25 +255,8 @@ class RecipeScraperService:
             ScrapingParseError: If parsing fails for a supported site.
         """
         try:
-            scraper = scrape_html(html, org_url=url)
-
-            # Extract all available fields
-            recipe = ScrapedRecipe(
-                title=scraper.title(),  # type: ignore[no-untyped-call]
-                description=self._safe_call_str_field(scraper.description),
-                servings=self._safe_call_str_field(scraper.yields),
-                prep_time=self._safe_call_int_field(scraper.prep_time),
-                cook_time=self._safe_call_int_field(scraper.cook_time),
-                total_time=self._safe_call_int_field(scraper.total_time),
-                ingredients=scraper.ingredients() or [],  # type: ignore[no-untyped-call]
-                instructions=self._parse_instructions(scraper.instructions_list()),
-                image_url=self._safe_call_str_field(scraper.image),
-                source_url=url,
-                author=self._safe_call_str_field(scraper.author),
-                cuisine=self._safe_call_str_field(scraper.cuisine),
-                category=self._safe_call_str_field(scraper.category),
-                keywords=self._parse_keywords(self._safe_call_str(scraper.keywords)),
-                yields=self._safe_call_str_field(scraper.yields),
+            recipe = await get_parse_executor().run(
+                "recipe_scrapers", self._scrape_recipe_html, html, url
             )
 
             logger.info(
@@ -258,7 +285,7 @@ class RecipeScraperService:
     async def _extract_with_jsonld(
         self,
         url: str,
-        html: str,
+        html: str | bytes,
     ) -> ScrapedRecipe | None:
         """Extract recipe using JSON-LD structured data.
 
@@ -270,7 +297,9 @@ class RecipeScraperService:
             ScrapedRecipe if extraction succeeds, None otherwise.
         """
         try:
-            return extract_recipe_from_jsonld(html, url)
+            return await get_parse_executor().run(
+                "jsonld", extract_recipe_from_jsonld, html, url
+            )
         except Exception as e:
             logger.debug(
                 "JSON-LD extraction failed",
@@ -279,7 +308,40 @@ class RecipeScraperService:
             )
             return None
 
-    def _safe_call_str_field(self, func: Callable[[], Any]) -> str | None:
+    @classmethod
+    def _scrape_recipe_html(cls, html: str | bytes, url: str) -> ScrapedRecipe:
+        """Extract a recipe with recipe-scrapers (runs on the parse executor).
+
+        Args:
+            html: HTML content (or raw page bytes).
+            url: Original URL (needed for site detection).
+
+        Returns:
+            ScrapedRecipe with all available fields.
+        """
+        scraper = scrape_html(decode_html(html), org_url=url)
+
+        # Extract all available fields
+        return ScrapedRecipe(
+            title=scraper.title(),  # type: ignore[no-untyped-call]
+            description=cls._safe_call_str_field(scraper.description),
+            servings=cls._safe_call_str_field(scraper.yields),
+            prep_time=cls._safe_call_int_field(scraper.prep_time),
+            cook_time=cls._safe_call_int_field(scraper.cook_time),
+            total_time=cls._safe_call_int_field(scraper.total_time),
+            ingredients=scraper.ingredients() or [],  # type: ignore[no-untyped-call]
+            instructions=cls._parse_instructions(scraper.instructions_list()),
+            image_url=cls._safe_call_str_field(scraper.image),
+            source_url=url,
+            author=cls._safe_call_str_field(scraper.author),
+            cuisine=cls._safe_call_str_field(scraper.cuisine),
+            category=cls._safe_call_str_field(scraper.category),
+            keywords=cls._parse_keywords(cls._safe_call_str(scraper.keywords)),
+            yields=cls._safe_call_str_field(scraper.yields),
+        )
+
+    @staticmethod
+    def _safe_call_str_field(func: Callable[[], Any]) -> str | None:
         """Safely call a scraper method expecting string result.
 
         Args:
@@ -299,7 +361,8 @@ class RecipeScraperService:
                 return result if result else None
             return str(result) if result else None
 
-    def _safe_call_int_field(self, func: Callable[[], Any]) -> int | None:
+    @staticmethod
+    def _safe_call_int_field(func: Callable[[], Any]) -> int | None:
         """Safely call a scraper method expecting integer result.
 
         Args:
@@ -323,7 +386,8 @@ class RecipeScraperService:
             except (ValueError, TypeError):
                 return None
 
-    def _safe_call_str(self, func: Callable[[], Any]) -> str | list[str] | None:
+    @staticmethod
+    def _safe_call_str(func: Callable[[], Any]) -> str | list[str] | None:
         """Safely call a scraper method expecting string/list result.
 
         Args:
@@ -342,7 +406,8 @@ class RecipeScraperService:
         except Exception:
             return None
 
-    def _parse_instructions(self, instructions: list[str] | None) -> list[str]:
+    @staticmethod
+    def _parse_instructions(instructions: list[str] | None) -> list[str]:
         """Parse and clean instruction list.
 
         Args:
@@ -355,7 +420,8 @@ class RecipeScraperService:
             return []
         return [inst.strip() for inst in instructions if inst and inst.strip()]
 
-    def _parse_keywords(self, keywords: str | list[str] | None) -> list[str]:
+    @staticmethod
+    def _parse_keywords(keywords: str | list[str] | None) -> list[str]:
         """Parse keywords into a list.
 
         Args:
@@ -370,44 +436,31 @@ class RecipeScraperService:
             return [k.strip() for k in keywords if k and k.strip()]
         return [k.strip() for k in keywords.split(",") if k.strip()]
 
-    async def _get_from_cache(self, url: str) -> ScrapedRecipe | None:
-        """Get cached recipe data.
+    async def _get_from_cache(self, url: str) -> ValidatedEntry | None:
+        """Get the cached recipe entry, fresh or awaiting revalidation.
 
         Args:
             url: Recipe URL as cache key.
 
         Returns:
-            Cached ScrapedRecipe or None.
+            Cache entry holding the recipe data and page validators, or None.
         """
-        if not self._cache_client:
+        entry = await self._cache.get(url)
+        if entry is None or not isinstance(entry.value, dict):
             return None
+        return entry
 
-        try:
-            cache_key = f"recipe:scraped:{url}"
-            data = await self._cache_client.get(cache_key)
-            if data:
-                return ScrapedRecipe.model_validate(orjson.loads(data))
-        except Exception as e:
-            logger.debug("Cache read failed", url=url, error=str(e))
-        return None
-
-    async def _save_to_cache(self, url: str, recipe: ScrapedRecipe) -> None:
-        """Save recipe to cache.
+    async def _save_to_cache(
+        self,
+        url: str,
+        recipe: ScrapedRecipe,
+        validators: PageValidators | None = None,
+    ) -> None:
+        """Save recipe to cache with the page's validators.
 
         Args:
             url: Recipe URL as cache key.
             recipe: Recipe data to cache.
+            validators: ETag/Last-Modified of the page, if sent.
         """
-        if not self._cache_client:
-            return
-
-        try:
-            cache_key = f"recipe:scraped:{url}"
-            await self._cache_client.set(
-                cache_key,
-                orjson.dumps(recipe.model_dump()),
-                ex=self._settings.scraping.cache_ttl,
-            )
-            logger.debug("Cached scraped recipe", url=url)
-        except Exception as e:
-            logger.debug("Cache write failed", url=url, error=str(e))
+        await self._cache.put(url, recipe.model_dump(), validators)
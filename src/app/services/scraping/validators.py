@@ -0,0 +1,252 @@
+"""HTTP validator store for conditional page fetches.
+
+Results derived from a fetched page (a scraped recipe, engagement metrics)
+are cached together with the page's ETag and Last-Modified validators.
+Entries carry two expiries:
+- A freshness expiry stored inside the entry: until then the value is
+  served without touching the origin
+- A retention expiry enforced by the Redis TTL: until then an expired
+  entry can be revalidated with If-None-Match / If-Modified-Since, and a
+  304 Not Modified refreshes it without downloading or parsing the page
+
+This module provides:
+- PageValidators: ETag/Last-Modified pair and conditional request headers
+- ValidatedEntry: Cached value plus validators and freshness
+- PageValidatorStore: Redis-backed store shared by the scraping services
+- Prometheus counter for conditional fetch outcomes
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from prometheus_client import Counter
+
+from app.cache.namespaces import namespaced_key
+from app.observability.logging import get_logger
+
+
+if TYPE_CHECKING:
+    import httpx
+    from redis.asyncio import Redis
+
+
+logger = get_logger(__name__)
+
+# Marker key distinguishing validator envelopes from plain cached JSON
+VALIDATORS_ENVELOPE_KEY = "__validators__"
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+CONDITIONAL_FETCHES = Counter(
+    "conditional_fetches",
+    "Page fetches revalidating a cached entry, by outcome",
+    ["cache", "result"],
+    namespace="recipe_scraper",
+    subsystem="scraping",
+)
+
+
+# =============================================================================
+# Validators
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class PageValidators:
+    """HTTP cache validators of a fetched page.
+
+    Attributes:
+        etag: ETag response header.
+        last_modified: Last-Modified response header.
+    """
+
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @classmethod
+    def from_headers(cls, headers: httpx.Headers) -> PageValidators | None:
+        """Read validators from response headers.
+
+        Args:
+            headers: Response headers.
+
+        Returns:
+            The validators, or None if the response carries neither.
+        """
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        if etag is None and last_modified is None:
+            return None
+        return cls(etag=etag, last_modified=last_modified)
+
+    def request_headers(self) -> dict[str, str]:
+        """Conditional request headers for these validators."""
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass(frozen=True, slots=True)
+class ValidatedEntry:
+    """Decoded validator store entry.
+
+    Attributes:
+        value: Cached JSON value.
+        validators: Validators of the page the value was derived from.
+        fresh_until: Unix time after which the value must be revalidated,
+            or None for entries written without an envelope.
+    """
+
+    value: Any
+    validators: PageValidators | None = None
+    fresh_until: float | None = None
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the value can be served without revalidation."""
+        return self.fresh_until is None or time.time() < self.fresh_until
+
+
+# =============================================================================
+# Store
+# =============================================================================
+
+
+class PageValidatorStore:
+    """Redis store of page-derived values and their HTTP validators.
+
+    Read and write failures are logged and swallowed, like the other
+    service caches: a failing cache only costs a full fetch.
+
+    Example:
+        ```python
+        store = PageValidatorStore(redis, "recipe:scraped", fresh_ttl=86400)
+
+        entry = await store.get(url)
+        page = await fetch_html(client, url, validators=entry.validators)
+        if page.not_modified:
+            await store.put(url, entry.value, page.validators or entry.validators)
+        ```
+    """
+
+    def __init__(
+        self,
+        cache_client: Redis[bytes] | None,
+        prefix: str,
+        *,
+        fresh_ttl: int,
+        retention_ttl: int,
+        namespace: str | None = None,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            cache_client: Redis client, or None to disable the store.
+            prefix: Cache key prefix (also the metrics label).
+            fresh_ttl: Seconds a value is served without revalidation.
+            retention_ttl: Seconds an expired value is kept for
+                revalidation.
+            namespace: Cache namespace the keys are versioned in, when the
+                prefix is nested in one (defaults to the prefix itself).
+        """
+        self._cache_client = cache_client
+        self._prefix = prefix
+        self._fresh_ttl = fresh_ttl
+        self._retention_ttl = retention_ttl
+        self._namespace = namespace or prefix
+        sub_prefix = prefix.removeprefix(self._namespace).removeprefix(":")
+        self._key_prefix = f"{sub_prefix}:" if sub_prefix else ""
+
+    def _key(self, url: str) -> str:
+        return namespaced_key(self._namespace, f"{self._key_prefix}{url}")
+
+    async def get(self, url: str) -> ValidatedEntry | None:
+        """Get the entry for a page URL.
+
+        Args:
+            url: Page URL.
+
+        Returns:
+            The entry (fresh or not), or None if absent or unreadable.
+        """
+        if not self._cache_client:
+            return None
+
+        try:
+            raw = await self._cache_client.get(self._key(url))
+            if raw is None:
+                return None
+            data = orjson.loads(raw)
+        except Exception as e:
+            logger.debug("Validator store read failed", url=url, error=str(e))
+            return None
+
+        if not isinstance(data, dict) or VALIDATORS_ENVELOPE_KEY not in data:
+            # Written before validators were stored: fresh until its TTL ends
+            return ValidatedEntry(value=data)
+
+        validators = data.get("validators") or {}
+        return ValidatedEntry(
+            value=data.get("value"),
+            validators=PageValidators(**validators) if validators else None,
+            fresh_until=data[VALIDATORS_ENVELOPE_KEY],
+        )
+
+    async def put(
+        self,
+        url: str,
+        value: Any,
+        validators: PageValidators | None,
+    ) -> None:
+        """Store a value, restarting its freshness and retention.
+
+        Also used after a 304 to refresh an entry without re-parsing.
+
+        Args:
+            url: Page URL.
+            value: JSON-serializable value derived from the page.
+            validators: Validators of the page, if it sent any.
+        """
+        if not self._cache_client:
+            return
+
+        envelope = {
+            VALIDATORS_ENVELOPE_KEY: time.time() + self._fresh_ttl,
+            "value": value,
+            "validators": (
+                {
+                    "etag": validators.etag,
+                    "last_modified": validators.last_modified,
+                }
+                if validators
+                else None
+            ),
+        }
+        # Entries without validators cannot be revalidated, keep them
+        # only while fresh
+        ttl = self._fresh_ttl + (self._retention_ttl if validators else 0)
+        if ttl <= 0:
+            return
+
+        try:
+            await self._cache_client.set(self._key(url), orjson.dumps(envelope), ex=ttl)
+        except Exception as e:
+            logger.debug("Validator store write failed", url=url, error=str(e))
+
+    def record(self, result: str) -> None:
+        """Count a conditional fetch outcome.
+
+        Args:
+            result: "not_modified" or "modified".
+        """
+        CONDITIONAL_FETCHES.labels(cache=self._prefix, result=result).inc()
@@ -2,6 +2,7 @@
 
 Provides methods for:
 - Single ingredient pricing lookup
+- Batched recipe pricing lookup (fixed number of round trips per recipe)
 - Two-tier lookup strategy (direct ingredient → food group fallback)
 - Redis caching with 24-hour TTL
 - Unit conversion and price scaling
@@ -9,11 +10,14 @@ Provides methods for:
 
 from __future__ import annotations
 
+import asyncio
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
 import orjson
 
+from app.cache.batch import cache_get_many, cache_set_many
+from app.cache.namespaces import namespaced_key
 from app.cache.redis import get_cache_client
 from app.database.repositories.nutrition import NutritionRepository
 from app.database.repositories.shopping import PricingRepository
@@ -38,6 +42,8 @@ from app.services.shopping.exceptions import IngredientNotFoundError
 if TYPE_CHECKING:
     from redis.asyncio import Redis
 
+    from app.database.repositories.shopping import IngredientDetails, PricingData
+
 logger = get_logger(__name__)
 
 
@@ -162,12 +168,7 @@ class ShoppingService:
                 ingredient.food_group
             )
 
-        # Calculate price if pricing data available
-        estimated_price: str | None = None
-        price_confidence: float | None = None
-        data_source: str | None = None
-        currency = "USD"
-
+        grams: Decimal | None = None
         if pricing is not None:
             # Convert quantity to grams
             try:
@@ -181,43 +182,7 @@ class ShoppingService:
                 )
                 raise
 
-            # Calculate price: (grams / 100) * price_per_100g
-            price = self._calculate_price(pricing.price_per_100g, grams)
-            estimated_price = f"{price:.2f}"
-            currency = pricing.currency
-            data_source = pricing.data_source
-
-            # Set confidence based on tier
-            if pricing.tier == 1:
-                price_confidence = float(TIER_1_CONFIDENCE)
-            else:
-                price_confidence = float(TIER_2_CONFIDENCE)
-
-            logger.debug(
-                "Price calculated",
-                ingredient_id=ingredient_id,
-                ingredient_name=ingredient.name,
-                tier=pricing.tier,
-                price=estimated_price,
-                grams=float(grams),
-            )
-        else:
-            logger.debug(
-                "No pricing data available",
-                ingredient_id=ingredient_id,
-                ingredient_name=ingredient.name,
-                food_group=ingredient.food_group,
-            )
-
-        # Build response
-        response = IngredientShoppingInfoResponse(
-            ingredient_name=ingredient.name,
-            quantity=quantity,
-            estimated_price=estimated_price,
-            price_confidence=price_confidence,
-            data_source=data_source,
-            currency=currency,
-        )
+        response = self._build_response(ingredient, quantity, pricing, grams)
 
         # Cache the result
         await self._cache_result(cache_key, response)
@@ -243,10 +208,8 @@ class ShoppingService:
             logger.error(msg)
             raise RuntimeError(msg)
 
-        ingredient_shopping: dict[str, IngredientShoppingInfoResponse] = {}
-        total_cost = Decimal("0.00")
-        missing_ingredients: list[int] = []
-
+        # Resolve valid ingredients to (name, id, quantity, cache key)
+        entries: list[tuple[str, int, Quantity, str]] = []
         for ingredient in ingredients:
             # Skip ingredients without ID or name
             if ingredient.ingredient_id is None or ingredient.name is None:
@@ -258,29 +221,52 @@ class ShoppingService:
                 )
                 continue
 
-            try:
-                shopping_info = await self.get_ingredient_shopping_info(
-                    ingredient_id=ingredient.ingredient_id,
-                    quantity=ingredient.quantity,
-                )
-                ingredient_shopping[ingredient.name] = shopping_info
+            quantity = ingredient.quantity or Quantity(
+                amount=100.0, measurement=IngredientUnit.G
+            )
+            cache_key = self._make_cache_key(ingredient.ingredient_id, quantity)
+            entries.append(
+                (ingredient.name, ingredient.ingredient_id, quantity, cache_key)
+            )
 
-                # Add to total if price available
-                if shopping_info.estimated_price is not None:
-                    total_cost += Decimal(shopping_info.estimated_price)
-                else:
-                    missing_ingredients.append(ingredient.ingredient_id)
+        # One MGET for every cache key, then one batched computation for misses
+        responses = await self._get_many_from_cache(
+            list(dict.fromkeys(entry[3] for entry in entries))
+        )
+        misses = {
+            cache_key: (ingredient_id, quantity)
+            for _, ingredient_id, quantity, cache_key in entries
+            if cache_key not in responses
+        }
+        if misses:
+            computed = await self._compute_many(misses)
+            await self._cache_many(computed)
+            responses.update(computed)
+
+        ingredient_shopping: dict[str, IngredientShoppingInfoResponse] = {}
+        total_cost = Decimal("0.00")
+        missing_ingredients: list[int] = []
 
-            except IngredientNotFoundError:
+        for name, ingredient_id, _, cache_key in entries:
+            shopping_info = responses.get(cache_key)
+            if shopping_info is None:
                 logger.warning(
                     "Ingredient not found for recipe shopping",
                     recipe_id=recipe_id,
-                    ingredient_id=ingredient.ingredient_id,
-                    ingredient_name=ingredient.name,
+                    ingredient_id=ingredient_id,
+                    ingredient_name=name,
                 )
-                missing_ingredients.append(ingredient.ingredient_id)
+                missing_ingredients.append(ingredient_id)
                 continue
 
+            ingredient_shopping[name] = shopping_info
+
+            # Add to total if price available
+            if shopping_info.estimated_price is not None:
+                total_cost += Decimal(shopping_info.estimated_price)
+            else:
+                missing_ingredients.append(ingredient_id)
+
         logger.info(
             "Calculated recipe shopping info",
             recipe_id=recipe_id,
@@ -297,6 +283,153 @@ class ShoppingService:
             missing_ingredients=missing_ingredients if missing_ingredients else None,
         )
 
+    async def _compute_many(
+        self,
+        lookups: dict[str, tuple[int, Quantity]],
+    ) -> dict[str, IngredientShoppingInfoResponse]:
+        """Compute shopping info for many uncached lookups at once.
+
+        Issues a fixed number of round trips regardless of ingredient count:
+        ingredient details and Tier 1 prices are fetched concurrently, Tier 2
+        prices in one query for the remaining food groups, and all unit
+        conversions share one portion-weight lookup.
+
+        Args:
+            lookups: Mapping of cache key to (ingredient_id, quantity).
+
+        Returns:
+            Mapping of cache key to response. Keys whose ingredient does not
+            exist are not included.
+
+        Raises:
+            ConversionError: If unit conversion fails for a priced ingredient.
+        """
+        if self._repository is None:
+            msg = "ShoppingService not initialized"
+            raise RuntimeError(msg)
+
+        ingredient_ids = list(
+            dict.fromkeys(ingredient_id for ingredient_id, _ in lookups.values())
+        )
+        details, direct_prices = await asyncio.gather(
+            self._repository.get_ingredient_details_by_ids(ingredient_ids),
+            self._repository.get_prices_by_ingredient_ids(ingredient_ids),
+        )
+
+        # Fallback to Tier 2 for found ingredients without direct pricing
+        food_groups = [
+            found.food_group
+            for ingredient_id, found in details.items()
+            if ingredient_id not in direct_prices and found.food_group
+        ]
+        group_prices = (
+            await self._repository.get_prices_by_food_groups(food_groups)
+            if food_groups
+            else {}
+        )
+
+        resolved: dict[str, tuple[IngredientDetails, Quantity, PricingData | None]] = {}
+        for cache_key, (ingredient_id, quantity) in lookups.items():
+            found = details.get(ingredient_id)
+            if found is None:
+                continue
+            pricing = direct_prices.get(ingredient_id)
+            if pricing is None and found.food_group:
+                pricing = group_prices.get(found.food_group)
+            resolved[cache_key] = (found, quantity, pricing)
+
+        # Convert every priced quantity in one batch
+        priced = [
+            (cache_key, found, quantity)
+            for cache_key, (found, quantity, pricing) in resolved.items()
+            if pricing is not None
+        ]
+        grams_by_key: dict[str, Decimal] = {}
+        converted = await self._convert_many_to_grams(
+            [(quantity, found.name) for _, found, quantity in priced]
+        )
+        for (cache_key, found, quantity), grams in zip(priced, converted, strict=True):
+            if grams is None:
+                logger.warning(
+                    "Unit conversion failed for shopping info",
+                    ingredient_id=found.ingredient_id,
+                    ingredient_name=found.name,
+                    unit=str(quantity.measurement),
+                )
+                msg = f"Cannot convert {quantity.measurement} to grams for {found.name}"
+                raise ConversionError(
+                    msg, ingredient=found.name, unit=str(quantity.measurement)
+                )
+            grams_by_key[cache_key] = grams
+
+        return {
+            cache_key: self._build_response(
+                found, quantity, pricing, grams_by_key.get(cache_key)
+            )
+            for cache_key, (found, quantity, pricing) in resolved.items()
+        }
+
+    def _build_response(
+        self,
+        ingredient: IngredientDetails,
+        quantity: Quantity,
+        pricing: PricingData | None,
+        grams: Decimal | None,
+    ) -> IngredientShoppingInfoResponse:
+        """Build a shopping info response from pricing and converted grams.
+
+        Args:
+            ingredient: Ingredient details.
+            quantity: Requested quantity.
+            pricing: Tier 1 or Tier 2 pricing, or None if unavailable.
+            grams: Quantity converted to grams (required when pricing is set).
+
+        Returns:
+            Shopping information with estimated price.
+        """
+        estimated_price: str | None = None
+        price_confidence: float | None = None
+        data_source: str | None = None
+        currency = "USD"
+
+        if pricing is not None and grams is not None:
+            # Calculate price: (grams / 100) * price_per_100g
+            price = self._calculate_price(pricing.price_per_100g, grams)
+            estimated_price = f"{price:.2f}"
+            currency = pricing.currency
+            data_source = pricing.data_source
+
+            # Set confidence based on tier
+            if pricing.tier == 1:
+                price_confidence = float(TIER_1_CONFIDENCE)
+            else:
+                price_confidence = float(TIER_2_CONFIDENCE)
+
+            logger.debug(
+                "Price calculated",
+                ingredient_id=ingredient.ingredient_id,
+                ingredient_name=ingredient.name,
+                tier=pricing.tier,
+                price=estimated_price,
+                grams=float(grams),
+            )
+        else:
+            logger.debug(
+                "No pricing data available",
+                ingredient_id=ingredient.ingredient_id,
+                ingredient_name=ingredient.name,
+                food_group=ingredient.food_group,
+            )
+
+        return IngredientShoppingInfoResponse(
+            ingredient_name=ingredient.name,
+            quantity=quantity,
+            estimated_price=estimated_price,
+            price_confidence=price_confidence,
+            data_source=data_source,
+            currency=currency,
+        )
+
     async def _convert_to_grams(
         self,
         quantity: Quantity,
@@ -315,16 +448,42 @@ class ShoppingService:
             ConversionError: If conversion fails.
         """
         if self._converter is None:
-            # Fallback: assume 1:1 for grams, rough estimates for others
-            if quantity.measurement == IngredientUnit.G:
-                return Decimal(str(quantity.amount))
-            if quantity.measurement == IngredientUnit.KG:
-                return Decimal(str(quantity.amount)) * Decimal(1000)
-            # Default to 100g per unit for unknown conversions
-            return Decimal(str(quantity.amount)) * Decimal(100)
+            return self._estimate_grams(quantity)
 
         return await self._converter.to_grams(quantity, ingredient_name)
 
+    async def _convert_many_to_grams(
+        self,
+        items: list[tuple[Quantity, str]],
+    ) -> list[Decimal | None]:
+        """Convert multiple quantities to grams with one portion lookup.
+
+        Args:
+            items: (quantity, ingredient_name) pairs to convert.
+
+        Returns:
+            Amounts in grams in the same order as items, with None for
+            quantities that could not be converted.
+        """
+        if not items:
+            return []
+        if self._converter is None:
+            return [self._estimate_grams(quantity) for quantity, _ in items]
+        return await self._converter.to_grams_batch(items)
+
+    @staticmethod
+    def _estimate_grams(quantity: Quantity) -> Decimal:
+        """Estimate grams without a converter.
+
+        Assumes 1:1 for grams and rough estimates for other units.
+        """
+        if quantity.measurement == IngredientUnit.G:
+            return Decimal(str(quantity.amount))
+        if quantity.measurement == IngredientUnit.KG:
+            return Decimal(str(quantity.amount)) * Decimal(1000)
+        # Default to 100g per unit for unknown conversions
+        return Decimal(str(quantity.amount)) * Decimal(100)
+
     def _calculate_price(
         self,
         price_per_100g: Decimal,
@@ -355,7 +514,10 @@ class ShoppingService:
         Returns:
             Cache key string.
         """
-        return f"{SHOPPING_CACHE_KEY_PREFIX}:{ingredient_id}:{quantity.amount}:{quantity.measurement}"
+        return namespaced_key(
+            SHOPPING_CACHE_KEY_PREFIX,
+            f"{ingredient_id}:{quantity.amount}:{quantity.measurement}",
+        )
 
     async def _get_from_cache(
         self,
@@ -388,6 +550,50 @@ class ShoppingService:
             )
             return None
 
+    async def _get_many_from_cache(
+        self,
+        cache_keys: list[str],
+    ) -> dict[str, IngredientShoppingInfoResponse]:
+        """Get cached shopping info for multiple keys with one MGET.
+
+        Args:
+            cache_keys: Cache keys to look up.
+
+        Returns:
+            Dictionary mapping cache keys to cached responses.
+            Keys that aren't cached are not included.
+        """
+        if self._cache_client is None or not cache_keys:
+            return {}
+
+        try:
+            cached_values = await cache_get_many(self._cache_client, cache_keys)
+        except Exception as e:
+            logger.warning(
+                "Cache batch read failed",
+                count=len(cache_keys),
+                error=str(e),
+            )
+            return {}
+
+        result: dict[str, IngredientShoppingInfoResponse] = {}
+        for cache_key, data in zip(cache_keys, cached_values, strict=True):
+            if data is None:
+                continue
+            try:
+                result[cache_key] = IngredientShoppingInfoResponse.model_validate(
+                    orjson.loads(data)
+                )
+            except Exception as e:
+                logger.warning(
+                    "Cache read failed",
+                    cache_key=cache_key,
+                    error=str(e),
+                )
+
+        logger.debug("Cache batch read", hits=len(result), total=len(cache_keys))
+        return result
+
     async def _cache_result(
         self,
         cache_key: str,
@@ -420,3 +626,36 @@ class ShoppingService:
                 cache_key=cache_key,
                 error=str(e),
             )
+
+    async def _cache_many(
+        self,
+        responses: dict[str, IngredientShoppingInfoResponse],
+    ) -> None:
+        """Cache multiple shopping info responses in one pipeline.
+
+        Args:
+            responses: Mapping of cache key to response.
+        """
+        if self._cache_client is None or not responses:
+            return
+
+        try:
+            await cache_set_many(
+                self._cache_client,
+                {
+                    cache_key: orjson.dumps(response.model_dump(by_alias=True))
+                    for cache_key, response in responses.items()
+                },
+                SHOPPING_CACHE_TTL_SECONDS,
+            )
+            logger.debug(
+                "Cached shopping info batch",
+                count=len(responses),
+                ttl=SHOPPING_CACHE_TTL_SECONDS,
+            )
+        except Exception as e:
+            logger.warning(
+                "Cache batch write failed",
+                count=len(responses),
+                error=str(e),
+            )
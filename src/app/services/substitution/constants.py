@@ -2,6 +2,7 @@
 
 Contains:
 - Cache configuration for substitution data
+- Request coalescing for concurrent cache misses
 - Generation limits for LLM output
 """
 
@@ -15,9 +16,22 @@ from typing import Final
 # =============================================================================
 
 SUBSTITUTION_CACHE_KEY_PREFIX: Final[str] = "substitution"
+# Entries are served fresh until the soft expiry, then served stale while a
+# background job regenerates them, until the hard expiry (Redis TTL).
+SUBSTITUTION_CACHE_FRESH_SECONDS: Final[int] = 6 * 24 * 60 * 60  # 6 days
 SUBSTITUTION_CACHE_TTL_SECONDS: Final[int] = 7 * 24 * 60 * 60  # 7 days
 
 
+# =============================================================================
+# Request Coalescing
+# =============================================================================
+
+# Lock held by the replica generating a missing entry; other replicas wait
+# for the cached result instead of issuing their own LLM call.
+SUBSTITUTION_LOCK_TTL_SECONDS: Final[int] = 120
+SUBSTITUTION_LOCK_WAIT_SECONDS: Final[float] = 120.0
+
+
 # =============================================================================
 # LLM Generation Limits
 # =============================================================================
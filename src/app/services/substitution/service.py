@@ -2,7 +2,8 @@
 
 Provides methods for:
 - Single ingredient substitution lookup
-- Redis caching with 7-day TTL
+- Redis caching with stale-while-revalidate (fresh 6 days, kept 7 days)
+- Single-flight coalescing of concurrent cache misses
 - Pagination at response time
 """
 
@@ -10,9 +11,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-import orjson
-
+from app.cache.namespaces import namespaced_key
 from app.cache.redis import get_cache_client
+from app.cache.single_flight import RedisSingleFlight, SingleFlight
+from app.cache.swr import decode_swr_entry, encode_swr_entry, schedule_revalidation
 from app.database.repositories.nutrition import NutritionRepository
 from app.llm.exceptions import (
     LLMRateLimitError,
@@ -33,8 +35,11 @@ from app.schemas.recommendations import (
     RecommendedSubstitutionsResponse,
 )
 from app.services.substitution.constants import (
+    SUBSTITUTION_CACHE_FRESH_SECONDS,
     SUBSTITUTION_CACHE_KEY_PREFIX,
     SUBSTITUTION_CACHE_TTL_SECONDS,
+    SUBSTITUTION_LOCK_TTL_SECONDS,
+    SUBSTITUTION_LOCK_WAIT_SECONDS,
 )
 from app.services.substitution.exceptions import (
     LLMGenerationError,
@@ -60,9 +65,12 @@ class SubstitutionService:
 
     Cache Strategy:
     - Cache key: "substitution:{ingredient_name_normalized}"
-    - TTL: 7 days
+    - Fresh for 6 days, then served stale while an ARQ job regenerates it,
+      until the 7-day Redis TTL expires
     - Caches raw LLM output (SubstitutionListResult), not paginated responses
     - Pagination applied at response time based on limit/offset
+    - Concurrent misses for the same key share one LLM generation
+      (in-process, and across replicas through a Redis lock)
     """
 
     def __init__(
@@ -82,6 +90,9 @@ class SubstitutionService:
         self._llm_client = llm_client
         self._nutrition_repository = nutrition_repository
         self._prompt = IngredientSubstitutionPrompt()
+        self._single_flight: SingleFlight[SubstitutionListResult | None] = SingleFlight(
+            "substitution"
+        )
         self._initialized = False
 
     async def initialize(self) -> None:
@@ -98,6 +109,14 @@ class SubstitutionService:
         if self._nutrition_repository is None:
             self._nutrition_repository = NutritionRepository()
 
+        if self._cache_client is not None:
+            self._single_flight = RedisSingleFlight(
+                "substitution",
+                self._cache_client,
+                lock_ttl=SUBSTITUTION_LOCK_TTL_SECONDS,
+                wait_timeout=SUBSTITUTION_LOCK_WAIT_SECONDS,
+            )
+
         self._initialized = True
         logger.info("SubstitutionService initialized")
 
@@ -208,13 +227,76 @@ class SubstitutionService:
             LLMGenerationError: If LLM fails to generate.
         """
         # Check cache first
-        cached = await self._get_from_cache(ingredient_name)
+        cached = await self._get_cache_entry(ingredient_name)
         if cached is not None:
-            logger.debug("Cache hit", ingredient=ingredient_name)
-            return cached
+            result, stale = cached
+            logger.debug("Cache hit", ingredient=ingredient_name, stale=stale)
+            if stale:
+                await schedule_revalidation(
+                    "substitution",
+                    self._make_cache_key(ingredient_name),
+                    "revalidate_substitutions",
+                    ingredient_name,
+                    food_group,
+                )
+            return result
 
-        # Cache miss - generate via LLM
+        # Cache miss - generate via LLM, once per key for concurrent callers
         logger.debug("Cache miss, generating via LLM", ingredient=ingredient_name)
+        return await self._single_flight.do(
+            self._make_cache_key(ingredient_name),
+            lambda: self._generate_and_cache(
+                ingredient_name=ingredient_name,
+                food_group=food_group,
+                quantity=quantity,
+            ),
+            recheck=lambda: self._get_from_cache(ingredient_name),
+        )
+
+    async def refresh_substitutions(
+        self,
+        ingredient_name: str,
+        food_group: str | None = None,
+    ) -> SubstitutionListResult | None:
+        """Regenerate and re-cache substitutions for an ingredient.
+
+        Used by the background revalidation job for stale cache entries.
+
+        Args:
+            ingredient_name: Resolved ingredient name.
+            food_group: Optional food group for context.
+
+        Returns:
+            Fresh substitution list result, or None on failure.
+
+        Raises:
+            LLMGenerationError: If LLM fails to generate.
+        """
+        return await self._generate_and_cache(
+            ingredient_name=ingredient_name,
+            food_group=food_group,
+            quantity=None,
+        )
+
+    async def _generate_and_cache(
+        self,
+        ingredient_name: str,
+        food_group: str | None,
+        quantity: Quantity | None,
+    ) -> SubstitutionListResult | None:
+        """Generate substitutions via LLM and cache the result.
+
+        Args:
+            ingredient_name: Resolved ingredient name.
+            food_group: Optional food group for context.
+            quantity: Optional quantity for context.
+
+        Returns:
+            Substitution list result, or None on failure.
+
+        Raises:
+            LLMGenerationError: If LLM fails to generate.
+        """
         result = await self._generate_substitutions(
             ingredient_name=ingredient_name,
             food_group=food_group,
@@ -331,7 +413,7 @@ class SubstitutionService:
     async def _get_from_cache(
         self, ingredient_name: str
     ) -> SubstitutionListResult | None:
-        """Get substitution data from cache.
+        """Get substitution data from cache, fresh or stale.
 
         Args:
             ingredient_name: Ingredient name.
@@ -339,6 +421,20 @@ class SubstitutionService:
         Returns:
             SubstitutionListResult or None if not cached.
         """
+        cached = await self._get_cache_entry(ingredient_name)
+        return None if cached is None else cached[0]
+
+    async def _get_cache_entry(
+        self, ingredient_name: str
+    ) -> tuple[SubstitutionListResult, bool] | None:
+        """Get substitution data from cache along with its staleness.
+
+        Args:
+            ingredient_name: Ingredient name.
+
+        Returns:
+            Tuple of (SubstitutionListResult, is_stale), or None if not cached.
+        """
         if self._cache_client is None:
             return None
 
@@ -347,8 +443,11 @@ class SubstitutionService:
         try:
             cached_bytes = await self._cache_client.get(cache_key)
             if cached_bytes:
-                data = orjson.loads(cached_bytes)
-                return SubstitutionListResult.model_validate(data)
+                entry = decode_swr_entry(cached_bytes)
+                return (
+                    SubstitutionListResult.model_validate(entry.value),
+                    entry.stale,
+                )
         except Exception:
             logger.exception("Cache read error", key=cache_key)
 
@@ -369,7 +468,9 @@ class SubstitutionService:
         cache_key = self._make_cache_key(ingredient_name)
 
         try:
-            json_bytes = orjson.dumps(data.model_dump(mode="json"))
+            json_bytes = encode_swr_entry(
+                data.model_dump(mode="json"), SUBSTITUTION_CACHE_FRESH_SECONDS
+            )
             await self._cache_client.setex(
                 cache_key,
                 SUBSTITUTION_CACHE_TTL_SECONDS,
@@ -390,7 +491,7 @@ class SubstitutionService:
         """
         # Normalize name for consistent caching
         normalized = ingredient_name.lower().strip()
-        return f"{SUBSTITUTION_CACHE_KEY_PREFIX}:{normalized}"
+        return namespaced_key(SUBSTITUTION_CACHE_KEY_PREFIX, normalized)
 
     # =========================================================================
     # Transformation
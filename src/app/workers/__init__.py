@@ -8,6 +8,7 @@ from app.workers.jobs import (
     enqueue_recipe_scrape,
     get_arq_pool,
     get_job_status,
+    get_recipe_import_progress,
 )
 
 
@@ -19,5 +20,6 @@ __all__ = [
     "enqueue_recipe_scrape",
     "get_arq_pool",
     "get_job_status",
+    "get_recipe_import_progress",
     "get_redis_settings",
 ]
@@ -16,20 +16,39 @@ from arq import cron
 from arq.connections import RedisSettings
 from redis.asyncio import Redis
 
+from app.cache.namespaces import (
+    load_generations,
+    start_generation_refresh,
+    stop_generation_refresh,
+)
+from app.clients.http import close_http_clients, init_http_clients
 from app.core.config import get_settings
+from app.llm.batching import LLMBatchScheduler
 from app.llm.client.fallback import FallbackLLMClient
 from app.llm.client.groq import GroqClient
 from app.llm.client.ollama import OllamaClient
+from app.llm.rate_limit import create_groq_rate_limiter
 from app.observability.logging import get_logger, setup_logging
+from app.services.recipe_management.client import RecipeManagementClient
+from app.services.scraping.executor import (
+    close_parse_executor,
+    init_parse_executor,
+)
+from app.services.scraping.service import RecipeScraperService
 from app.workers.tasks.example import (
     cleanup_expired_cache,
-    process_recipe_scrape,
     send_notification,
 )
 from app.workers.tasks.popular_recipes import (
     check_and_refresh_popular_recipes,
     refresh_popular_recipes,
 )
+from app.workers.tasks.recipe_import import process_recipe_scrape
+from app.workers.tasks.revalidation import (
+    revalidate_llm_completion,
+    revalidate_pairings,
+    revalidate_substitutions,
+)
 
 
 if TYPE_CHECKING:
@@ -76,8 +95,32 @@ async def startup(ctx: dict[str, Any]) -> None:
     )
     logger.debug("Initialized cache client for worker")
 
+    # Namespace generations are part of every versioned cache key
+    await load_generations(ctx["cache_client"])
+    start_generation_refresh(
+        ctx["cache_client"], settings.redis.generation_refresh_interval
+    )
+
+    # Shared outbound HTTP pool for popular recipes and scraping tasks
+    init_http_clients(settings.http_client)
+
+    # Start the HTML parse executor for popular recipes refreshes
+    init_parse_executor(
+        settings.scraping.parse_executor.mode,
+        settings.scraping.parse_executor.max_workers,
+    )
+
+    # Scraper and Recipe Management client for asynchronous recipe imports
+    await _init_import_clients(ctx)
+
     # Initialize LLM client for recipe extraction
     if settings.llm.enabled:
+        # Groq budget shared with the API pods and other workers
+        ctx["rate_limit_client"] = Redis.from_url(settings.redis_rate_limit_url)
+        groq_rate_limiter = create_groq_rate_limiter(
+            ctx["rate_limit_client"], settings.llm.groq
+        )
+
         # Create primary client based on provider setting
         primary: LLMClientProtocol
         if settings.llm.provider == "groq":
@@ -93,6 +136,7 @@ async def startup(ctx: dict[str, Any]) -> None:
                 timeout=settings.llm.groq.timeout,
                 max_retries=settings.llm.groq.max_retries,
                 requests_per_minute=settings.llm.groq.requests_per_minute,
+                rate_limiter=groq_rate_limiter,
             )
         else:
             # Default to Ollama
@@ -118,6 +162,7 @@ async def startup(ctx: dict[str, Any]) -> None:
                 timeout=settings.llm.groq.timeout,
                 max_retries=settings.llm.groq.max_retries,
                 requests_per_minute=settings.llm.groq.requests_per_minute,
+                rate_limiter=groq_rate_limiter,
             )
             await secondary.initialize()
             logger.debug(
@@ -125,11 +170,23 @@ async def startup(ctx: dict[str, Any]) -> None:
                 model=settings.llm.groq.model,
             )
 
-        ctx["llm_client"] = FallbackLLMClient(
+        llm_client: LLMClientProtocol = FallbackLLMClient(
             primary=primary,
             secondary=secondary,
             fallback_enabled=settings.llm.fallback.enabled,
+            hedging_enabled=settings.llm.fallback.hedging_enabled,
+            hedge_min_samples=settings.llm.fallback.hedge_min_samples,
+            latency_window=settings.llm.fallback.latency_window,
+            failure_threshold=settings.llm.fallback.circuit_failure_threshold,
+            reset_timeout=settings.llm.fallback.circuit_reset_seconds,
         )
+        if settings.llm.batching.enabled:
+            llm_client = LLMBatchScheduler(
+                llm_client,
+                window=settings.llm.batching.window_ms / 1000,
+                max_batch_size=settings.llm.batching.max_batch_size,
+            )
+        ctx["llm_client"] = llm_client
         primary_model = (
             settings.llm.groq.model
             if settings.llm.provider == "groq"
@@ -147,6 +204,25 @@ async def startup(ctx: dict[str, Any]) -> None:
         logger.debug("LLM client disabled")
 
 
+async def _init_import_clients(ctx: dict[str, Any]) -> None:
+    """Initialize the clients used by process_recipe_scrape."""
+    try:
+        scraper_service = RecipeScraperService(cache_client=ctx["cache_client"])
+        await scraper_service.initialize()
+        ctx["scraper_service"] = scraper_service
+    except Exception:
+        logger.exception("Failed to initialize scraper for recipe imports")
+        ctx["scraper_service"] = None
+
+    try:
+        recipe_client = RecipeManagementClient()
+        await recipe_client.initialize()
+        ctx["recipe_client"] = recipe_client
+    except Exception:
+        logger.exception("Failed to initialize Recipe Management client for imports")
+        ctx["recipe_client"] = None
+
+
 async def shutdown(ctx: dict[str, Any]) -> None:
     """Worker shutdown handler.
 
@@ -158,6 +234,7 @@ async def shutdown(ctx: dict[str, Any]) -> None:
     logger.info("ARQ worker shutting down")
 
     # Close cache client
+    await stop_generation_refresh()
     if ctx.get("cache_client"):
         await ctx["cache_client"].close()
         logger.debug("Closed cache client")
@@ -166,6 +243,20 @@ async def shutdown(ctx: dict[str, Any]) -> None:
     if ctx.get("llm_client"):
         await ctx["llm_client"].shutdown()
         logger.debug("Closed LLM client")
+    if ctx.get("rate_limit_client"):
+        await ctx["rate_limit_client"].close()
+
+    # Close recipe import clients
+    if ctx.get("scraper_service"):
+        await ctx["scraper_service"].shutdown()
+    if ctx.get("recipe_client"):
+        await ctx["recipe_client"].shutdown()
+
+    # Shut down the HTML parse executor
+    await close_parse_executor()
+
+    # Close the shared outbound HTTP pool
+    await close_http_clients()
 
 
 # Redis key names - must match Redis ACL pattern (scraper:*)
@@ -229,12 +320,15 @@ class WorkerSettings:
         process_recipe_scrape,
         refresh_popular_recipes,
         check_and_refresh_popular_recipes,
+        revalidate_substitutions,
+        revalidate_pairings,
+        revalidate_llm_completion,
     ]
 
     # Cron jobs (scheduled tasks)
     cron_jobs: ClassVar[list[CronJob]] = [
-        # Run cache cleanup every hour at minute 0
-        cron(cleanup_expired_cache, hour=None, minute=0),  # type: ignore[arg-type]
+        # Sweep superseded cache namespace generations every hour at minute 0
+        cron(cleanup_expired_cache, hour=None, minute=0),
         # Check popular recipes cache TTL every 30 minutes
         cron(check_and_refresh_popular_recipes, minute={0, 30}),
     ]
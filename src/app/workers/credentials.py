@@ -0,0 +1,82 @@
+"""Caller credentials for asynchronous recipe imports.
+
+The worker saves the imported recipe to the Recipe Management Service on
+behalf of the caller, so it needs the caller's bearer token. ARQ persists
+job arguments (and keeps them with the result), so the token is never a
+job argument: it is kept under its own short-lived key in the queue
+database, which expires together with the job and is deleted as soon as
+the import has finished.
+
+This module provides:
+- IMPORT_JOB_EXPIRES: Lifetime of an unstarted import job and its credential
+- store_import_credential: Keep the caller's token for a job (API on enqueue)
+- get_import_credential: Read the token for a job (worker)
+- delete_import_credential: Drop the token once the import has finished
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from app.observability.logging import get_logger
+
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+logger = get_logger(__name__)
+
+# Must match the Redis ACL key pattern (scraper:*)
+IMPORT_CREDENTIAL_KEY_PREFIX = "scraper:queue:import-credential"
+
+# Seconds an import job may wait in the queue; the credential expires with it
+IMPORT_JOB_EXPIRES = 3600
+
+
+def _key(job_id: str) -> str:
+    return f"{IMPORT_CREDENTIAL_KEY_PREFIX}:{job_id}"
+
+
+async def store_import_credential(
+    redis: Redis[bytes], job_id: str, auth_token: str
+) -> None:
+    """Keep the caller's bearer token for an import job.
+
+    Args:
+        redis: Client for the queue database.
+        job_id: ARQ job ID.
+        auth_token: Bearer token forwarded to the Recipe Management Service.
+    """
+    await redis.set(_key(job_id), auth_token, ex=IMPORT_JOB_EXPIRES)
+
+
+async def get_import_credential(redis: Redis[bytes], job_id: str) -> str:
+    """Read the caller's bearer token for an import job.
+
+    Args:
+        redis: Client for the queue database.
+        job_id: ARQ job ID.
+
+    Returns:
+        The token, or "" if none was stored or it expired.
+    """
+    value = await redis.get(_key(job_id))
+    if value is None:
+        return ""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+async def delete_import_credential(redis: Redis[bytes], job_id: str) -> None:
+    """Drop the caller's bearer token once the import has finished.
+
+    Errors are logged and swallowed; the token expires on its own.
+
+    Args:
+        redis: Client for the queue database.
+        job_id: ARQ job ID.
+    """
+    try:
+        await redis.delete(_key(job_id))
+    except Exception:
+        logger.warning("Failed to delete import credential", job_id=job_id)
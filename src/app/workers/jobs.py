@@ -7,6 +7,7 @@ from the main application.
 from __future__ import annotations
 
 import contextlib
+import uuid
 from typing import Any
 
 from arq.connections import ArqRedis, create_pool
@@ -14,7 +15,14 @@ from arq.jobs import Job
 
 from app.core.config import get_settings
 from app.observability.logging import get_logger
+from app.services.recipe_import import ImportStage
 from app.workers.arq import ARQ_QUEUE_NAME, get_redis_settings
+from app.workers.credentials import (
+    IMPORT_JOB_EXPIRES,
+    delete_import_credential,
+    store_import_credential,
+)
+from app.workers.progress import ImportProgress, get_import_progress, set_import_stage
 
 
 logger = get_logger(__name__)
@@ -132,23 +140,60 @@ async def enqueue_notification(
 async def enqueue_recipe_scrape(
     url: str,
     user_id: str,
+    auth_token: str = "",
 ) -> Job | None:
-    """Enqueue a recipe scraping job.
+    """Enqueue a recipe import job.
 
-    Convenience wrapper for the process_recipe_scrape task.
+    Convenience wrapper for the process_recipe_scrape task. The job's
+    progress record (stage "queued", owner) is written before enqueueing so
+    the worker's updates always follow it. The bearer token is not a job
+    argument: it is stored separately and expires with the job.
 
     Args:
-        url: The URL to scrape.
-        user_id: The user who requested the scrape.
+        url: The URL to import.
+        user_id: The user who requested the import.
+        auth_token: Bearer token the worker forwards to the Recipe
+            Management Service.
 
     Returns:
         Job instance if enqueued successfully.
     """
-    return await enqueue_job(
+    job_id = uuid.uuid4().hex
+    try:
+        pool = await get_arq_pool()
+        if auth_token:
+            await store_import_credential(pool, job_id, auth_token)
+    except Exception:
+        logger.exception("Failed to connect to job queue")
+        return None
+    await set_import_stage(pool, job_id, ImportStage.QUEUED, user_id=user_id)
+
+    job = await enqueue_job(
         "process_recipe_scrape",
         url,
         user_id,
+        _job_id=job_id,
+        _expires=IMPORT_JOB_EXPIRES,
     )
+    if job is None and auth_token:
+        await delete_import_credential(pool, job_id)
+    return job
+
+
+async def get_recipe_import_progress(job_id: str) -> ImportProgress | None:
+    """Get the stage and owner of a recipe import job.
+
+    Args:
+        job_id: The job ID to check.
+
+    Returns:
+        The progress, or None if the job is unknown or its record expired.
+
+    Raises:
+        RedisError: If the queue database is unreachable.
+    """
+    pool = await get_arq_pool()
+    return await get_import_progress(pool, job_id)
 
 
 async def get_job_status(job_id: str) -> dict[str, Any] | None:
@@ -212,3 +257,26 @@ async def enqueue_popular_recipes_refresh() -> Job | None:
         "refresh_popular_recipes",
         _job_id=job_id,
     )
+
+
+async def enqueue_popular_source_refresh(source: str) -> Job | None:
+    """Enqueue a refresh of one popular recipes source.
+
+    The job ID is derived from the popular recipes refresh job ID and the
+    source name, so each source has at most one pending refresh while
+    different sources refresh concurrently.
+
+    Args:
+        source: Name of the source to refetch.
+
+    Returns:
+        Job instance if enqueued successfully.
+    """
+    settings = get_settings()
+    job_id = f"{settings.arq.job_ids.popular_recipes_refresh}:{source}"
+
+    return await enqueue_job(
+        "refresh_popular_recipes",
+        _job_id=job_id,
+        sources=[source],
+    )
@@ -0,0 +1,108 @@
+"""Progress records for asynchronous recipe imports.
+
+ARQ reports whether a job is queued, running or complete, but not which
+step of the import it is on or who enqueued it. Each import job gets a
+small Redis hash in the queue database holding its current stage and the
+user who enqueued it, which the status endpoint uses for progress and for
+checking ownership.
+
+This module provides:
+- ImportProgress: Stage and owner of an import job
+- set_import_stage: Record a job's stage (API on enqueue, worker as it runs)
+- get_import_progress: Read a job's progress record
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from app.observability.logging import get_logger
+from app.services.recipe_import import ImportStage
+
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+logger = get_logger(__name__)
+
+# Must match the Redis ACL key pattern (scraper:*)
+IMPORT_PROGRESS_KEY_PREFIX = "scraper:queue:import"
+
+# Outlives queueing under load plus ARQ's keep_result
+IMPORT_PROGRESS_TTL = 86400
+
+
+@dataclass(frozen=True, slots=True)
+class ImportProgress:
+    """Progress of an import job.
+
+    Attributes:
+        stage: Current stage.
+        user_id: User who enqueued the job.
+    """
+
+    stage: ImportStage
+    user_id: str | None
+
+
+def _key(job_id: str) -> str:
+    return f"{IMPORT_PROGRESS_KEY_PREFIX}:{job_id}"
+
+
+def _text(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+async def set_import_stage(
+    redis: Redis[bytes],
+    job_id: str,
+    stage: ImportStage,
+    *,
+    user_id: str | None = None,
+) -> None:
+    """Record the stage of an import job.
+
+    Errors are logged and swallowed; progress is informational and must not
+    fail the import.
+
+    Args:
+        redis: Client for the queue database.
+        job_id: ARQ job ID.
+        stage: Stage the job entered.
+        user_id: Owner, recorded when the job is enqueued.
+    """
+    mapping: dict[str | bytes, bytes | float | int | str] = {"stage": stage.value}
+    if user_id is not None:
+        mapping["user_id"] = user_id
+    try:
+        pipe = redis.pipeline(transaction=False)
+        pipe.hset(_key(job_id), mapping=mapping)
+        pipe.expire(_key(job_id), IMPORT_PROGRESS_TTL)
+        await pipe.execute()
+    except Exception:
+        logger.warning("Failed to record import progress", job_id=job_id)
+
+
+async def get_import_progress(
+    redis: Redis[bytes], job_id: str
+) -> ImportProgress | None:
+    """Read the progress record of an import job.
+
+    Args:
+        redis: Client for the queue database.
+        job_id: ARQ job ID.
+
+    Returns:
+        The progress, or None if the job is unknown or its record expired.
+    """
+    raw = await redis.hgetall(_key(job_id))
+    if not raw:
+        return None
+    fields = {_text(k): _text(v) for k, v in raw.items()}
+    try:
+        stage = ImportStage(fields.get("stage", ""))
+    except ValueError:
+        return None
+    return ImportProgress(stage=stage, user_id=fields.get("user_id"))
@@ -3,14 +3,22 @@
 from app.workers.tasks.example import (
     cleanup_expired_cache,
     get_job_result,
-    process_recipe_scrape,
     send_notification,
 )
+from app.workers.tasks.recipe_import import process_recipe_scrape
+from app.workers.tasks.revalidation import (
+    revalidate_llm_completion,
+    revalidate_pairings,
+    revalidate_substitutions,
+)
 
 
 __all__ = [
     "cleanup_expired_cache",
     "get_job_result",
     "process_recipe_scrape",
+    "revalidate_llm_completion",
+    "revalidate_pairings",
+    "revalidate_substitutions",
     "send_notification",
 ]
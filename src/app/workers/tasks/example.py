@@ -1,18 +1,21 @@
-"""Example background tasks.
+"""Example and maintenance background tasks.
 
 This module provides example task functions that demonstrate
-how to write ARQ-compatible async tasks.
+how to write ARQ-compatible async tasks, and the hourly cache
+cleanup job.
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from app.cache.namespaces import sweep_orphaned_generations
 from app.observability.logging import get_logger
 
 
 if TYPE_CHECKING:
     from arq.jobs import Job
+    from redis.asyncio import Redis
 
 logger = get_logger(__name__)
 
@@ -53,66 +56,37 @@ async def send_notification(
     }
 
 
-async def cleanup_expired_cache(_ctx: dict[str, Any]) -> dict[str, Any]:
-    """Clean up expired cache entries.
+async def cleanup_expired_cache(ctx: dict[str, Any]) -> dict[str, Any]:
+    """Remove cache entries of superseded namespace generations.
 
-    This is typically run as a cron job to maintain cache hygiene.
+    Runs hourly as a cron job. Invalidating a cache namespace only bumps
+    its generation, so the entries of older generations are unreachable
+    but still use memory until their TTL; this sweeps them with SCAN and
+    UNLINK.
 
     Args:
-        _ctx: ARQ worker context containing shared state (unused).
+        ctx: ARQ worker context containing:
+            - cache_client: Redis client for caching
 
     Returns:
         Result dict with cleanup statistics.
     """
-    logger.info("Starting cache cleanup")
+    cache_client: Redis[bytes] | None = ctx.get("cache_client")
+    if not cache_client:
+        logger.warning("Cache client not available, skipping cache cleanup")
+        return {"status": "skipped", "reason": "no_cache_client"}
 
-    # TODO: Implement actual cache cleanup logic
-    # This would scan and remove expired entries, orphaned keys, etc.
+    logger.info("Starting cache cleanup")
 
-    cleaned_count = 0
+    swept = await sweep_orphaned_generations(cache_client)
+    cleaned_count = sum(swept.values())
 
-    logger.info("Cache cleanup complete", cleaned_count=cleaned_count)
+    logger.info("Cache cleanup complete", cleaned_count=cleaned_count, swept=swept)
 
     return {
         "status": "completed",
         "cleaned_count": cleaned_count,
-    }
-
-
-async def process_recipe_scrape(
-    _ctx: dict[str, Any],
-    url: str,
-    user_id: str,
-) -> dict[str, Any]:
-    """Process a recipe scraping request.
-
-    Args:
-        _ctx: ARQ worker context containing shared state (unused).
-        url: The URL to scrape.
-        user_id: The user who requested the scrape.
-
-    Returns:
-        Result dict with scraped recipe data or error.
-    """
-    logger.info(
-        "Processing recipe scrape",
-        url=url,
-        user_id=user_id,
-    )
-
-    # TODO: Implement actual recipe scraping logic
-    # This would:
-    # 1. Fetch the URL
-    # 2. Parse the HTML for recipe data
-    # 3. Extract structured recipe information
-    # 4. Store in database/cache
-    # 5. Notify user of completion
-
-    return {
-        "status": "completed",
-        "url": url,
-        "user_id": user_id,
-        "recipe": None,  # Would contain scraped recipe data
+        "namespaces": swept,
     }
 
 
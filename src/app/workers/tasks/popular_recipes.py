@@ -1,14 +1,15 @@
 """Popular recipes background tasks.
 
 This module provides ARQ tasks for:
-- Refreshing the popular recipes cache
-- Proactive cache refresh via cron job
+- Refreshing the popular recipes cache (all sources or a subset)
+- Proactive cache refresh via cron job, scheduling one job per due source
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
+from app.cache.namespaces import CacheNamespace, namespaced_key
 from app.core.config import get_settings
 from app.observability.logging import get_logger
 from app.services.popular.service import PopularRecipesService
@@ -22,8 +23,11 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-async def refresh_popular_recipes(ctx: dict[str, Any]) -> dict[str, Any]:
-    """Fetch and cache popular recipes from all sources.
+async def refresh_popular_recipes(
+    ctx: dict[str, Any],
+    sources: list[str] | None = None,
+) -> dict[str, Any]:
+    """Fetch sources and rebuild the cached popular recipes.
 
     This task performs the CPU-intensive work of:
     1. Fetching HTML from configured recipe sources
@@ -31,8 +35,10 @@ async def refresh_popular_recipes(ctx: dict[str, Any]) -> dict[str, Any]:
     3. Fetching individual recipe pages for metrics
     4. Scoring and caching the results
 
+    Sources not fetched contribute their cached results to the ranking.
+
     Called by:
-    - Cron job (proactive refresh when TTL < threshold)
+    - Cron job (one job per due source, or a rebuild when TTL < threshold)
     - Endpoint (on cache miss via job enqueue)
 
     Args:
@@ -40,6 +46,7 @@ async def refresh_popular_recipes(ctx: dict[str, Any]) -> dict[str, Any]:
             - cache_client: Redis client for caching
             - llm_client: LLM client for extraction (optional)
             - settings: Application settings
+        sources: Names of the sources to fetch (all enabled if None).
 
     Returns:
         Result dict with status, recipe count, and sources processed.
@@ -47,7 +54,7 @@ async def refresh_popular_recipes(ctx: dict[str, Any]) -> dict[str, Any]:
     cache_client: Redis[bytes] | None = ctx.get("cache_client")
     llm_client: LLMClientProtocol | None = ctx.get("llm_client")
 
-    logger.info("Starting popular recipes refresh")
+    logger.info("Starting popular recipes refresh", sources=sources)
 
     # Create and initialize service
     service = PopularRecipesService(
@@ -58,7 +65,7 @@ async def refresh_popular_recipes(ctx: dict[str, Any]) -> dict[str, Any]:
 
     try:
         # Force refresh (fetch and cache)
-        data = await service.refresh_cache()
+        data = await service.refresh_cache(sources)
 
         logger.info(
             "Popular recipes refresh completed",
@@ -80,9 +87,15 @@ async def refresh_popular_recipes(ctx: dict[str, Any]) -> dict[str, Any]:
 
 
 async def check_and_refresh_popular_recipes(ctx: dict[str, Any]) -> dict[str, Any]:
-    """Cron job: Check cache TTL and refresh if expiring soon.
+    """Cron job: Schedule due source refreshes and check cache TTL.
+
+    Runs periodically (e.g., every 30 minutes). Each source whose cached
+    result is missing or older than its refresh interval gets its own
+    refresh job, so sources are refetched independently and one slow or
+    failing source does not hold up the others.
 
-    Runs periodically (e.g., every 30 minutes). Refreshes the cache if:
+    When no source is due, the ranking is rebuilt from the cached source
+    results if:
     - Cache key doesn't exist
     - TTL is below the configured threshold (default: 1 hour)
 
@@ -92,8 +105,12 @@ async def check_and_refresh_popular_recipes(ctx: dict[str, Any]) -> dict[str, An
         ctx: ARQ worker context containing shared dependencies.
 
     Returns:
-        Result dict with status and TTL information.
+        Result dict with status and the scheduled sources or TTL information.
     """
+    # Imported here: the job helpers import the worker settings, which
+    # import this module
+    from app.workers.jobs import enqueue_popular_source_refresh  # noqa: PLC0415
+
     cache_client: Redis[bytes] | None = ctx.get("cache_client")
     settings = get_settings()
     config = settings.scraping.popular_recipes
@@ -102,7 +119,22 @@ async def check_and_refresh_popular_recipes(ctx: dict[str, Any]) -> dict[str, An
         logger.warning("Cache client not available, skipping TTL check")
         return {"status": "skipped", "reason": "no_cache_client"}
 
-    cache_key = f"popular:{config.cache_key}"
+    service = PopularRecipesService(cache_client=cache_client)
+    stale_sources = await service.get_stale_sources()
+    if stale_sources:
+        scheduled = [
+            source
+            for source in stale_sources
+            if await enqueue_popular_source_refresh(source) is not None
+        ]
+        logger.info(
+            "Scheduled popular recipes source refreshes",
+            sources=scheduled,
+            due=stale_sources,
+        )
+        return {"status": "scheduled", "sources": scheduled}
+
+    cache_key = namespaced_key(CacheNamespace.POPULAR, config.cache_key)
 
     # Check TTL
     ttl = await cache_client.ttl(cache_key)
@@ -112,22 +144,22 @@ async def check_and_refresh_popular_recipes(ctx: dict[str, Any]) -> dict[str, An
     #  -1 if key exists but has no expiry
     #  >= 0 for remaining TTL in seconds
     if ttl == -2:
-        logger.info("Cache key missing, triggering refresh", cache_key=cache_key)
-        return await refresh_popular_recipes(ctx)
+        logger.info("Cache key missing, triggering rebuild", cache_key=cache_key)
+        return await refresh_popular_recipes(ctx, sources=[])
 
     if ttl == -1:
         logger.warning(
-            "Cache key has no expiry, triggering refresh", cache_key=cache_key
+            "Cache key has no expiry, triggering rebuild", cache_key=cache_key
         )
-        return await refresh_popular_recipes(ctx)
+        return await refresh_popular_recipes(ctx, sources=[])
 
     if ttl < config.refresh_threshold:
         logger.info(
-            "Cache expiring soon, triggering refresh",
+            "Cache expiring soon, triggering rebuild",
             ttl_remaining=ttl,
             threshold=config.refresh_threshold,
         )
-        return await refresh_popular_recipes(ctx)
+        return await refresh_popular_recipes(ctx, sources=[])
 
     logger.debug(
         "Cache healthy, skipping refresh",
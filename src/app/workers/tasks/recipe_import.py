@@ -0,0 +1,158 @@
+"""Asynchronous recipe import task.
+
+``POST /recipes?async=true`` enqueues process_recipe_scrape instead of
+importing inline, so the request returns before the scrape and LLM parsing
+(often 5-30 s under Groq rate limiting). The worker runs the same
+RecipeImporter pipeline as the endpoint and records its progress for
+``GET /recipes/imports/{jobId}``. The caller's bearer token is read from
+its own short-lived key (app.workers.credentials), never from the job
+arguments, and deleted once the import has finished.
+
+This module provides:
+- process_recipe_scrape: ARQ task importing one recipe URL
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from arq import Retry
+from fastapi import status
+
+from app.core.config import get_settings
+from app.observability.logging import get_logger
+from app.parsing.ingredient import IngredientParser
+from app.services.recipe_import import ImportStage, RecipeImporter, RecipeImportError
+from app.workers.credentials import delete_import_credential, get_import_credential
+from app.workers.progress import set_import_stage
+
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+    from app.llm.client.protocol import LLMClientProtocol
+    from app.services.recipe_management.client import RecipeManagementClient
+    from app.services.scraping.service import RecipeScraperService
+
+
+logger = get_logger(__name__)
+
+# Failures worth another attempt (downstream unavailable, fetch timeout)
+RETRYABLE_STATUS_CODES = frozenset(
+    {status.HTTP_503_SERVICE_UNAVAILABLE, status.HTTP_504_GATEWAY_TIMEOUT}
+)
+# Attempts before a retryable failure is reported (WorkerSettings.max_tries)
+MAX_IMPORT_TRIES = 3
+RETRY_DELAY_SECONDS = 10
+
+
+def _build_importer(ctx: dict[str, Any]) -> RecipeImporter | None:
+    """Build the importer from the worker's shared clients."""
+    scraper: RecipeScraperService | None = ctx.get("scraper_service")
+    recipe_client: RecipeManagementClient | None = ctx.get("recipe_client")
+    llm_client: LLMClientProtocol | None = ctx.get("llm_client")
+    if scraper is None or recipe_client is None or llm_client is None:
+        return None
+
+    config = get_settings().llm.ingredient_parsing
+    cache_client: Redis[bytes] | None = (
+        ctx.get("cache_client") if config.cache_enabled else None
+    )
+    parser = IngredientParser(
+        llm_client,
+        cache_client=cache_client,
+        cache_ttl=config.cache_ttl,
+        chunk_size=config.chunk_size,
+        max_concurrency=config.max_concurrency,
+        fast_path=config.fast_path,
+        min_confidence=config.min_confidence,
+    )
+    return RecipeImporter(scraper, parser, recipe_client)
+
+
+def _failed(url: str, error: RecipeImportError) -> dict[str, Any]:
+    return {
+        "status": "failed",
+        "url": url,
+        "status_code": error.status_code,
+        "error": error.error,
+        "message": error.message,
+    }
+
+
+async def process_recipe_scrape(
+    ctx: dict[str, Any],
+    url: str,
+    user_id: str,
+) -> dict[str, Any]:
+    """Scrape a recipe URL, parse its ingredients and save it.
+
+    Import failures are returned as a "failed" result rather than raised,
+    so ARQ does not retry them; only timeouts and an unavailable Recipe
+    Management Service are retried.
+
+    Args:
+        ctx: ARQ worker context (scraper_service, recipe_client, llm_client,
+            cache_client, redis, job_id, job_try).
+        url: The URL to import.
+        user_id: The user who requested the import.
+
+    Returns:
+        Result dict with status "completed" and the created recipe, or
+        status "failed" with the error.
+
+    Raises:
+        Retry: If a retryable failure has attempts left.
+    """
+    job_id: str | None = ctx.get("job_id")
+    queue: Redis[bytes] | None = ctx.get("redis")
+
+    async def record(stage: ImportStage) -> None:
+        if queue is not None and job_id is not None:
+            await set_import_stage(queue, job_id, stage)
+
+    async def finish(stage: ImportStage) -> None:
+        await record(stage)
+        if queue is not None and job_id is not None:
+            await delete_import_credential(queue, job_id)
+
+    logger.info("Processing recipe import", url=url, user_id=user_id, job_id=job_id)
+
+    importer = _build_importer(ctx)
+    if importer is None:
+        logger.warning("Recipe import unavailable on this worker", url=url)
+        await finish(ImportStage.FAILED)
+        return _failed(
+            url,
+            RecipeImportError(
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+                "SERVICE_UNAVAILABLE",
+                "Recipe import is not available",
+            ),
+        )
+
+    auth_token = ""
+    if queue is not None and job_id is not None:
+        auth_token = await get_import_credential(queue, job_id)
+
+    try:
+        response = await importer.import_recipe(url, auth_token, on_stage=record)
+    except RecipeImportError as e:
+        job_try: int = ctx.get("job_try", 1)
+        if e.status_code in RETRYABLE_STATUS_CODES and job_try < MAX_IMPORT_TRIES:
+            logger.info("Retrying recipe import", url=url, job_try=job_try)
+            await record(ImportStage.QUEUED)
+            raise Retry(defer=RETRY_DELAY_SECONDS * job_try) from e
+        await finish(ImportStage.FAILED)
+        return _failed(url, e)
+    except Exception:
+        await finish(ImportStage.FAILED)
+        raise
+
+    await finish(ImportStage.COMPLETE)
+    return {
+        "status": "completed",
+        "url": url,
+        "user_id": user_id,
+        "recipe": response.recipe.model_dump(mode="json"),
+    }
@@ -0,0 +1,184 @@
+"""Stale-while-revalidate background tasks.
+
+This module provides ARQ tasks regenerating stale cache entries that were
+served to a caller:
+- Ingredient substitutions
+- Recipe pairings
+- Raw LLM completions
+
+Tasks are enqueued by ``app.cache.swr.schedule_revalidation`` with a job ID
+derived from the cache key, so each stale entry is regenerated at most once
+at a time.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from app.cache.swr import encode_swr_entry
+from app.llm.output_schemas import resolve_output_schema
+from app.llm.rate_limit import LLMPriority, llm_priority
+from app.observability.logging import get_logger
+from app.services.pairings.service import PairingsService, RecipeContext
+from app.services.substitution.service import SubstitutionService
+
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+    from app.llm.client.protocol import LLMClientProtocol
+
+logger = get_logger(__name__)
+
+
+async def revalidate_substitutions(
+    ctx: dict[str, Any],
+    ingredient_name: str,
+    food_group: str | None = None,
+) -> dict[str, Any]:
+    """Regenerate cached substitutions for an ingredient.
+
+    Args:
+        ctx: ARQ worker context (cache_client, llm_client).
+        ingredient_name: Resolved ingredient name.
+        food_group: Optional food group for context.
+
+    Returns:
+        Result dict with status.
+    """
+    cache_client: Redis[bytes] | None = ctx.get("cache_client")
+    llm_client: LLMClientProtocol | None = ctx.get("llm_client")
+
+    if cache_client is None or llm_client is None:
+        logger.warning(
+            "Cannot revalidate substitutions without cache and LLM clients",
+            ingredient=ingredient_name,
+        )
+        return {"status": "skipped", "reason": "no_clients"}
+
+    service = SubstitutionService(cache_client=cache_client, llm_client=llm_client)
+    await service.initialize()
+    try:
+        with llm_priority(LLMPriority.BACKGROUND):
+            result = await service.refresh_substitutions(ingredient_name, food_group)
+    finally:
+        await service.shutdown()
+
+    if result is None:
+        return {"status": "failed", "ingredient": ingredient_name}
+    return {
+        "status": "completed",
+        "ingredient": ingredient_name,
+        "substitution_count": len(result.substitutions),
+    }
+
+
+async def revalidate_pairings(
+    ctx: dict[str, Any],
+    context: dict[str, Any],
+) -> dict[str, Any]:
+    """Regenerate cached pairings for a recipe.
+
+    Args:
+        ctx: ARQ worker context (cache_client, llm_client).
+        context: Serialized RecipeContext fields.
+
+    Returns:
+        Result dict with status.
+    """
+    cache_client: Redis[bytes] | None = ctx.get("cache_client")
+    llm_client: LLMClientProtocol | None = ctx.get("llm_client")
+    recipe_context = RecipeContext(**context)
+
+    if cache_client is None or llm_client is None:
+        logger.warning(
+            "Cannot revalidate pairings without cache and LLM clients",
+            recipe_id=recipe_context.recipe_id,
+        )
+        return {"status": "skipped", "reason": "no_clients"}
+
+    service = PairingsService(cache_client=cache_client, llm_client=llm_client)
+    await service.initialize()
+    try:
+        with llm_priority(LLMPriority.BACKGROUND):
+            result = await service.refresh_pairings(recipe_context)
+    finally:
+        await service.shutdown()
+
+    if result is None:
+        return {"status": "failed", "recipe_id": recipe_context.recipe_id}
+    return {
+        "status": "completed",
+        "recipe_id": recipe_context.recipe_id,
+        "pairing_count": len(result.pairings),
+    }
+
+
+async def revalidate_llm_completion(
+    ctx: dict[str, Any],
+    cache_key: str,
+    prompt: str,
+    *,
+    model: str,
+    system: str | None = None,
+    schema: str | None = None,
+    options: dict[str, Any] | None = None,
+    fresh_ttl: int,
+    stale_ttl: int,
+) -> dict[str, Any]:
+    """Regenerate a cached LLM completion.
+
+    The worker's LLM client has no cache of its own, so the fresh result is
+    written back under the original cache key here.
+
+    Args:
+        ctx: ARQ worker context (cache_client, llm_client).
+        cache_key: Cache key of the stale completion.
+        prompt: Original prompt.
+        model: Model that produced the cached completion.
+        system: Original system prompt.
+        schema: Registry name of the structured output schema.
+        options: Original model options.
+        fresh_ttl: Seconds until the new entry becomes stale.
+        stale_ttl: Seconds the new entry is served stale after that.
+
+    Returns:
+        Result dict with status.
+    """
+    cache_client: Redis[bytes] | None = ctx.get("cache_client")
+    llm_client: LLMClientProtocol | None = ctx.get("llm_client")
+
+    if cache_client is None or llm_client is None:
+        logger.warning(
+            "Cannot revalidate LLM completion without cache and LLM clients",
+            cache_key=cache_key[:20],
+        )
+        return {"status": "skipped", "reason": "no_clients"}
+
+    schema_class = resolve_output_schema(schema) if schema else None
+    if schema and schema_class is None:
+        logger.warning(
+            "Cannot revalidate LLM completion of unknown schema",
+            cache_key=cache_key[:20],
+            schema=schema,
+        )
+        return {"status": "skipped", "reason": "unknown_schema"}
+
+    with llm_priority(LLMPriority.BACKGROUND):
+        result = await llm_client.generate(
+            prompt,
+            model=model,
+            schema=schema_class,
+            system=system,
+            options=options,
+            skip_cache=True,
+            context="revalidate",
+        )
+    await cache_client.set(
+        cache_key,
+        encode_swr_entry(result.model_dump(mode="json"), fresh_ttl),
+        ex=fresh_ttl + stale_ttl,
+    )
+
+    logger.debug("Revalidated LLM completion", cache_key=cache_key[:20])
+    return {"status": "completed", "cache_key": cache_key}
@@ -18,6 +18,7 @@ from prometheus_client import REGISTRY
 from testcontainers.postgres import PostgresContainer
 from testcontainers.redis import RedisContainer
 
+import app.cache.namespaces as namespaces_module
 import app.cache.redis as redis_module
 import app.database.connection as db_module
 from app.auth.jwt import create_access_token
@@ -197,10 +198,12 @@ async def reset_redis_state() -> AsyncGenerator[None]:
     redis_module._cache_client = None
     redis_module._queue_client = None
     redis_module._rate_limit_client = None
+    namespaces_module._Generations.current = {}
 
     yield
 
     await close_redis_pools()
+    namespaces_module._Generations.current = {}
 
 
 @pytest.fixture(autouse=True)
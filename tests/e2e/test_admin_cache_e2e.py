@@ -3,7 +3,7 @@
 Tests cover full system integration including:
 - Middleware stack (request ID, security headers, logging)
 - Authentication with real JWT tokens
-- Cache clearing with real Redis
+- Namespace invalidation and sweeping with real Redis
 - Permission enforcement
 """
 
@@ -16,11 +16,13 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 
 from app.auth.dependencies import CurrentUser, get_current_user
+from app.cache.namespaces import GENERATIONS_KEY, CacheNamespace, namespaced_key
 from app.cache.redis import (
     close_redis_pools,
     get_cache_client,
     init_redis_pools,
 )
+from app.workers.tasks.example import cleanup_expired_cache
 
 
 if TYPE_CHECKING:
@@ -71,6 +73,7 @@ async def admin_e2e_client(
             yield ac
     finally:
         app.dependency_overrides.pop(get_current_user, None)
+        await get_cache_client().delete(GENERATIONS_KEY)
         await close_redis_pools()
 
 
@@ -136,27 +139,31 @@ class TestAdminCacheE2E:
         self,
         admin_e2e_client: AsyncClient,
     ) -> None:
-        """Should actually clear all cached data."""
+        """Should make all cached data unreachable, then sweep it."""
         # Add test data to cache
         cache_client = get_cache_client()
-        await cache_client.set("e2e:test:key1", "value1")
-        await cache_client.set("e2e:test:key2", "value2")
-        await cache_client.set("e2e:popular:recipes", '{"data": "cached"}')
-
-        # Verify data exists
-        assert await cache_client.exists("e2e:test:key1") == 1
-        assert await cache_client.exists("e2e:test:key2") == 1
-        assert await cache_client.exists("e2e:popular:recipes") == 1
+        keys = [
+            namespaced_key(CacheNamespace.NUTRITION, "e2e flour"),
+            namespaced_key(CacheNamespace.LLM_COMPLETION, "e2e"),
+            namespaced_key(CacheNamespace.POPULAR, "e2e_recipes"),
+        ]
+        for key in keys:
+            await cache_client.set(key, '{"data": "cached"}')
 
         # Clear cache
         response = await admin_e2e_client.delete("/api/v1/recipe-scraper/admin/cache")
 
         assert response.status_code == 200
 
-        # Verify all data is cleared
-        assert await cache_client.exists("e2e:test:key1") == 0
-        assert await cache_client.exists("e2e:test:key2") == 0
-        assert await cache_client.exists("e2e:popular:recipes") == 0
+        # Verify no entry is reachable under its namespace any more
+        assert namespaced_key(CacheNamespace.NUTRITION, "e2e flour") != keys[0]
+        assert namespaced_key(CacheNamespace.LLM_COMPLETION, "e2e") != keys[1]
+        assert namespaced_key(CacheNamespace.POPULAR, "e2e_recipes") != keys[2]
+
+        # Verify the hourly sweeper removes the superseded entries
+        result = await cleanup_expired_cache({"cache_client": cache_client})
+        assert result["cleaned_count"] >= len(keys)
+        assert await cache_client.exists(*keys) == 0
 
     @pytest.mark.asyncio
     async def test_cache_clear_returns_proper_json(
@@ -208,7 +215,8 @@ class TestAdminCacheE2E:
         for i in range(3):
             # Add some data
             cache_client = get_cache_client()
-            await cache_client.set(f"e2e:iter{i}:key", f"value{i}")
+            key = namespaced_key(CacheNamespace.ALLERGEN, f"e2e iter{i}")
+            await cache_client.set(key, f"value{i}")
 
             # Clear it
             response = await admin_e2e_client.delete(
@@ -217,7 +225,9 @@ class TestAdminCacheE2E:
             assert response.status_code == 200
 
             # Verify cleared
-            assert await cache_client.exists(f"e2e:iter{i}:key") == 0
+            new_key = namespaced_key(CacheNamespace.ALLERGEN, f"e2e iter{i}")
+            assert new_key != key
+            assert await cache_client.exists(new_key) == 0
 
     @pytest.mark.asyncio
     async def test_cache_clear_idempotent(
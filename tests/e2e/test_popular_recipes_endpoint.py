@@ -8,18 +8,19 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import orjson
 import pytest
 import respx
 from httpx import Response
 
 from app.api.dependencies import get_redis_cache_client
+from app.core.config import get_settings
 from app.schemas.recipe import (
     PopularRecipe,
     PopularRecipesData,
     RecipeEngagementMetrics,
 )
 from app.services.popular.service import PopularRecipesService
+from app.services.popular.store import PopularRecipesStore
 
 
 if TYPE_CHECKING:
@@ -81,13 +82,23 @@ SAMPLE_RECIPE_HTML = """
 """
 
 
-def _create_mock_cache_client(cached_data: PopularRecipesData | None) -> AsyncMock:
-    """Create a mock cache client with optional cached data."""
+async def _create_mock_cache_client(
+    cached_data: PopularRecipesData | None,
+) -> AsyncMock:
+    """Create a dict-backed mock cache client with optional cached data."""
+    stored: dict[str, bytes] = {}
     mock_client = AsyncMock()
+    mock_client.get = AsyncMock(side_effect=stored.get)
+    mock_client.mget = AsyncMock(side_effect=lambda keys: [stored.get(k) for k in keys])
+    mock_client.pipeline = MagicMock()
+    mock_client.pipeline.return_value.setex = MagicMock(
+        side_effect=lambda key, _ttl, value: stored.__setitem__(key, value)
+    )
+    mock_client.pipeline.return_value.execute = AsyncMock()
     if cached_data:
-        mock_client.get = AsyncMock(return_value=orjson.dumps(cached_data.model_dump()))
-    else:
-        mock_client.get = AsyncMock(return_value=None)
+        config = get_settings().scraping.popular_recipes
+        store = PopularRecipesStore(mock_client, config.cache_key, ttl=config.cache_ttl)
+        await store.save(cached_data)
     return mock_client
 
 
@@ -134,7 +145,7 @@ class TestPopularRecipesEndpointE2E:
     ) -> None:
         """Should return list of popular recipes from cache."""
         cached_data = _create_sample_cached_data()
-        mock_cache = _create_mock_cache_client(cached_data)
+        mock_cache = await _create_mock_cache_client(cached_data)
 
         # Override the dependency at FastAPI level
         app = client._transport.app  # type: ignore[union-attr]
@@ -158,7 +169,7 @@ class TestPopularRecipesEndpointE2E:
     ) -> None:
         """Should accept pagination parameters."""
         cached_data = _create_sample_cached_data()
-        mock_cache = _create_mock_cache_client(cached_data)
+        mock_cache = await _create_mock_cache_client(cached_data)
 
         app = client._transport.app  # type: ignore[union-attr]
         app.dependency_overrides[get_redis_cache_client] = lambda: mock_cache
@@ -181,7 +192,7 @@ class TestPopularRecipesEndpointE2E:
     ) -> None:
         """Should return only count when countOnly is true."""
         cached_data = _create_sample_cached_data(total_count=500)
-        mock_cache = _create_mock_cache_client(cached_data)
+        mock_cache = await _create_mock_cache_client(cached_data)
 
         app = client._transport.app  # type: ignore[union-attr]
         app.dependency_overrides[get_redis_cache_client] = lambda: mock_cache
@@ -204,7 +215,7 @@ class TestPopularRecipesEndpointE2E:
     ) -> None:
         """Should validate limit parameter bounds."""
         cached_data = _create_sample_cached_data()
-        mock_cache = _create_mock_cache_client(cached_data)
+        mock_cache = await _create_mock_cache_client(cached_data)
 
         app = client._transport.app  # type: ignore[union-attr]
         app.dependency_overrides[get_redis_cache_client] = lambda: mock_cache
@@ -225,7 +236,7 @@ class TestPopularRecipesEndpointE2E:
     ) -> None:
         """Should validate offset parameter bounds."""
         cached_data = _create_sample_cached_data()
-        mock_cache = _create_mock_cache_client(cached_data)
+        mock_cache = await _create_mock_cache_client(cached_data)
 
         app = client._transport.app  # type: ignore[union-attr]
         app.dependency_overrides[get_redis_cache_client] = lambda: mock_cache
@@ -245,7 +256,7 @@ class TestPopularRecipesEndpointE2E:
         client: AsyncClient,
     ) -> None:
         """Should return 503 when cache is empty (triggers background refresh)."""
-        mock_cache = _create_mock_cache_client(None)
+        mock_cache = await _create_mock_cache_client(None)
 
         app = client._transport.app  # type: ignore[union-attr]
         app.dependency_overrides[get_redis_cache_client] = lambda: mock_cache
@@ -267,7 +278,7 @@ class TestPopularRecipesEndpointE2E:
     ) -> None:
         """Should return response in correct schema format."""
         cached_data = _create_sample_cached_data()
-        mock_cache = _create_mock_cache_client(cached_data)
+        mock_cache = await _create_mock_cache_client(cached_data)
 
         app = client._transport.app  # type: ignore[union-attr]
         app.dependency_overrides[get_redis_cache_client] = lambda: mock_cache
@@ -306,7 +317,7 @@ class TestPopularRecipesNoAuth:
     ) -> None:
         """Should not require authentication header."""
         cached_data = _create_sample_cached_data(recipes=[], total_count=0)
-        mock_cache = _create_mock_cache_client(cached_data)
+        mock_cache = await _create_mock_cache_client(cached_data)
 
         app = client._transport.app  # type: ignore[union-attr]
         app.dependency_overrides[get_redis_cache_client] = lambda: mock_cache
@@ -391,7 +402,7 @@ class TestEmptyResults:
     ) -> None:
         """Should return empty list when no recipes available."""
         cached_data = _create_sample_cached_data(recipes=[], total_count=0)
-        mock_cache = _create_mock_cache_client(cached_data)
+        mock_cache = await _create_mock_cache_client(cached_data)
 
         app = client._transport.app  # type: ignore[union-attr]
         app.dependency_overrides[get_redis_cache_client] = lambda: mock_cache
@@ -0,0 +1,46 @@
+"""Sample ingredient lines for parser tests and benchmarks."""
+
+from __future__ import annotations
+
+
+# Lines as they appear on typical recipe pages, incl. ones that need the LLM
+TYPICAL_RECIPE_LINES = [
+    "2 1/4 cups all-purpose flour",
+    "1 tsp baking soda",
+    "1 tsp salt",
+    "1 cup butter, softened",
+    "3/4 cup granulated sugar",
+    "3/4 cup packed brown sugar",
+    "1 tsp vanilla extract",
+    "2 large eggs",
+    "2 cups semisweet chocolate chips",
+    "1 cup chopped nuts (optional)",
+    "1½ lbs ground beef",
+    "1 medium onion, diced",
+    "3 cloves garlic, minced",
+    "1 (14.5 oz) can diced tomatoes",
+    "2 tbsp olive oil",
+    "Salt and pepper to taste",
+    "1/4 cup fresh parsley, chopped",
+    "a pinch of red pepper flakes",
+    "8 oz spaghetti",
+    "1/2 cup grated Parmesan cheese",
+    "Juice of 1 lemon",
+    "2-3 sprigs fresh thyme",
+    "1 bunch cilantro",
+    "Freshly ground black pepper",
+    "4 boneless, skinless chicken breasts",
+    "1 cup chicken broth or water",
+    "200g plain flour",
+    "500ml whole milk",
+    "2 T honey",
+    "1 t ground cinnamon",
+]
+
+# Lines the rule-based parser scores low, so they are handed to the LLM
+LLM_BOUND_LINES = [
+    "Salt and pepper to taste",
+    "4 boneless, skinless chicken breasts cut into 1-inch strips",
+    "1 cup chicken broth or water, plus more as needed",
+    "2-3 sprigs fresh thyme or 1 tsp dried thyme",
+]
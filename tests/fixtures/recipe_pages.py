@@ -0,0 +1,118 @@
+"""Recipe and listing pages shaped like saved pages from popular sources.
+
+Pages carry the markup that makes real pages expensive to analyze: large
+navigation and comment sections with many class-bearing elements around
+the recipe content, and ratings expressed as JSON-LD, microdata or plain
+class-named elements.
+"""
+
+from __future__ import annotations
+
+
+def _chrome(sections: int) -> str:
+    """Navigation, related-recipe cards and comments surrounding a recipe."""
+    nav = "".join(
+        f'<li class="nav-item menu-link"><a href="/category/{i}">Category {i}</a></li>'
+        for i in range(40)
+    )
+    cards = "".join(
+        f'<div class="card related-card"><a class="card-link" href="/recipe/{i}">'
+        f'<span class="card-title">Related recipe {i}</span></a>'
+        f'<p class="card-excerpt">{"Tasty and quick. " * 8}</p></div>'
+        for i in range(sections)
+    )
+    comments = "".join(
+        f'<div class="comment" id="comment-{i}"><span class="comment-author">'
+        f'Cook {i}</span><p class="comment-body">{"Loved it, will make again. " * 6}'
+        f"</p></div>"
+        for i in range(sections * 2)
+    )
+    return (
+        f'<header class="site-header"><ul class="nav">{nav}</ul></header>'
+        f'<aside class="sidebar">{cards}</aside>'
+        f'<section class="comments-section">{comments}</section>'
+    )
+
+
+def _body(title: str) -> str:
+    ingredients = "".join(
+        f'<li class="ingredient-item">{i + 1} cups ingredient {i}</li>'
+        for i in range(12)
+    )
+    steps = "".join(
+        f'<li class="instruction-step">Step {i + 1}. {"Stir gently. " * 10}</li>'
+        for i in range(8)
+    )
+    return (
+        f'<h1 class="recipe-title">{title}</h1>'
+        f'<ul class="ingredients-list">{ingredients}</ul>'
+        f'<ol class="instructions-list">{steps}</ol>'
+    )
+
+
+def jsonld_recipe_page(sections: int = 60) -> str:
+    """Recipe page with an @graph JSON-LD block carrying aggregateRating."""
+    jsonld = (
+        '{"@context": "https://schema.org", "@graph": ['
+        '{"@type": "WebSite", "name": "Site"},'
+        '{"@type": "BreadcrumbList", "itemListElement": []},'
+        '{"@type": ["Recipe"], "name": "Braised Short Ribs",'
+        ' "aggregateRating": {"@type": "AggregateRating", "ratingValue": "4.8",'
+        ' "ratingCount": "2,314", "reviewCount": "1,877"}}]}'
+    )
+    return (
+        "<html><head><title>Braised Short Ribs</title>"
+        '<script type="application/ld+json">{"@type": "Organization"}</script>'
+        f'<script type="application/ld+json">{jsonld}</script></head>'
+        f"<body>{_chrome(sections)}<main>{_body('Braised Short Ribs')}</main>"
+        '<div class="favorites-count" data-count="9120">9.1k saves</div>'
+        "</body></html>"
+    )
+
+
+def microdata_recipe_page(sections: int = 60) -> str:
+    """Recipe page with schema.org microdata instead of JSON-LD."""
+    return (
+        "<html><head><title>Lemon Tart</title></head><body>"
+        f"{_chrome(sections)}"
+        '<main itemscope itemtype="https://schema.org/Recipe">'
+        f"{_body('Lemon Tart')}"
+        '<div itemprop="aggregateRating" itemscope>'
+        '<meta itemprop="ratingValue" content="4.6">'
+        '<span itemprop="ratingCount">812</span>'
+        '<span itemprop="reviewCount">433</span></div>'
+        "</main></body></html>"
+    )
+
+
+def class_pattern_recipe_page(sections: int = 60) -> str:
+    """Recipe page without structured data, rated via class-named elements."""
+    return (
+        "<html><head><title>Weeknight Dal</title></head><body>"
+        f"{_chrome(sections)}<main>{_body('Weeknight Dal')}"
+        '<div class="recipe-rating" aria-label="Rated 4.4 out of 5 stars"></div>'
+        '<span class="rating-count">(1,024)</span>'
+        '<span class="review-count">516 reviews</span>'
+        '<span class="save-count">3,300</span>'
+        "</main></body></html>"
+    )
+
+
+def listing_page(sections: int = 60) -> str:
+    """Category page that is not a recipe page."""
+    return (
+        "<html><head><title>Dinner Recipes</title>"
+        '<script type="application/ld+json">'
+        '{"@type": "CollectionPage", "name": "Dinner"}</script></head>'
+        f"<body>{_chrome(sections)}</body></html>"
+    )
+
+
+def saved_recipe_pages(sections: int = 60) -> list[str]:
+    """One page of each kind."""
+    return [
+        jsonld_recipe_page(sections),
+        microdata_recipe_page(sections),
+        class_pattern_recipe_page(sections),
+        listing_page(sections),
+    ]
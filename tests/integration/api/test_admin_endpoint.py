@@ -1,7 +1,7 @@
 """Integration tests for admin endpoints.
 
 Tests cover:
-- Cache clear with real Redis
+- Cache clear with real Redis (all or selected namespaces)
 - Authentication flow
 - Error scenarios
 """
@@ -15,6 +15,12 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 
 from app.auth.dependencies import CurrentUser, get_current_user
+from app.cache.namespaces import (
+    GENERATIONS_KEY,
+    CacheNamespace,
+    namespaced_key,
+    sweep_orphaned_generations,
+)
 from app.cache.redis import (
     close_redis_pools,
     get_cache_client,
@@ -71,6 +77,7 @@ async def admin_cache_client(
             yield ac
     finally:
         app.dependency_overrides.pop(get_current_user, None)
+        await get_cache_client().delete(GENERATIONS_KEY)
         await close_redis_pools()
 
 
@@ -122,15 +129,13 @@ class TestCacheClearEndpoint:
         self,
         admin_cache_client: AsyncClient,
     ) -> None:
-        """Should clear cache with admin authentication."""
+        """Should invalidate cached entries with admin authentication."""
         # Add some test data to cache
         cache_client = get_cache_client()
-        await cache_client.set("test:key1", "value1")
-        await cache_client.set("test:key2", "value2")
-
-        # Verify data exists
-        assert await cache_client.exists("test:key1") == 1
-        assert await cache_client.exists("test:key2") == 1
+        key1 = namespaced_key(CacheNamespace.NUTRITION, "flour")
+        key2 = namespaced_key(CacheNamespace.ALLERGEN, "flour")
+        await cache_client.set(key1, "value1")
+        await cache_client.set(key2, "value2")
 
         # Clear cache via endpoint
         response = await admin_cache_client.delete(
@@ -141,10 +146,50 @@ class TestCacheClearEndpoint:
         assert response.status_code == 200
         data = response.json()
         assert data["message"] == "Cache cleared successfully"
+        assert data["generations"]["nutrition"] >= 1
+
+        # Entries are no longer reachable under their namespaces
+        assert namespaced_key(CacheNamespace.NUTRITION, "flour") != key1
+        assert (
+            await cache_client.get(namespaced_key(CacheNamespace.NUTRITION, "flour"))
+            is None
+        )
+
+        # The sweeper removes the superseded generation
+        await sweep_orphaned_generations(cache_client)
+        assert await cache_client.exists(key1, key2) == 0
+
+    @pytest.mark.asyncio
+    async def test_clears_only_selected_namespace(
+        self,
+        admin_cache_client: AsyncClient,
+    ) -> None:
+        """Should keep other namespaces cached."""
+        nutrition_key = namespaced_key(CacheNamespace.NUTRITION, "sugar")
+        popular_key = namespaced_key(CacheNamespace.POPULAR, "popular_recipes")
+
+        response = await admin_cache_client.delete(
+            "/api/v1/recipe-scraper/admin/cache",
+            params={"namespace": "popular"},
+        )
+
+        assert response.status_code == 200
+        assert list(response.json()["generations"]) == ["popular"]
+        assert namespaced_key(CacheNamespace.NUTRITION, "sugar") == nutrition_key
+        assert namespaced_key(CacheNamespace.POPULAR, "popular_recipes") != popular_key
+
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_namespace(
+        self,
+        admin_cache_client: AsyncClient,
+    ) -> None:
+        """Should return 422 for names that are not cache namespaces."""
+        response = await admin_cache_client.delete(
+            "/api/v1/recipe-scraper/admin/cache",
+            params={"namespace": "unknown"},
+        )
 
-        # Verify cache is empty
-        assert await cache_client.exists("test:key1") == 0
-        assert await cache_client.exists("test:key2") == 0
+        assert response.status_code == 422
 
     @pytest.mark.asyncio
     async def test_cache_clear_is_idempotent(
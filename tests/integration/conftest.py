@@ -16,6 +16,7 @@ from prometheus_client import REGISTRY
 from redis.asyncio import Redis
 from testcontainers.redis import RedisContainer
 
+import app.cache.namespaces as namespaces_module
 import app.cache.redis as redis_module
 from app.auth.jwt import create_access_token
 from app.cache.redis import close_redis_pools
@@ -201,11 +202,13 @@ async def reset_redis_state() -> AsyncGenerator[None]:
     redis_module._cache_client = None
     redis_module._queue_client = None
     redis_module._rate_limit_client = None
+    namespaces_module._Generations.current = {}
 
     yield
 
     # Close any connections and reset state after test
     await close_redis_pools()
+    namespaces_module._Generations.current = {}
 
 
 @pytest.fixture(autouse=True)
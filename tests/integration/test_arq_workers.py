@@ -18,6 +18,12 @@ import pytest
 from arq.connections import ArqRedis, RedisSettings, create_pool
 
 import app.workers.jobs as jobs_module
+from app.cache.namespaces import (
+    GENERATIONS_KEY,
+    CacheNamespace,
+    invalidate_namespaces,
+    namespaced_key,
+)
 from app.workers.arq import (
     ARQ_QUEUE_NAME,
     WorkerSettings,
@@ -35,14 +41,16 @@ from app.workers.jobs import (
 )
 from app.workers.tasks.example import (
     cleanup_expired_cache,
-    process_recipe_scrape,
     send_notification,
 )
+from app.workers.tasks.recipe_import import process_recipe_scrape
 
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
 
+    from redis.asyncio import Redis
+
     from app.core.config import Settings
 
 
@@ -210,6 +218,23 @@ class TestJobEnqueuing:
         assert job is not None
         assert job.job_id is not None
 
+    @pytest.mark.asyncio
+    async def test_enqueue_recipe_scrape_keeps_token_out_of_job(
+        self, setup_arq: None
+    ) -> None:
+        """Should not persist the caller's token with the job."""
+        job = await enqueue_recipe_scrape(
+            url="https://example.com/recipe",
+            user_id="user-789",
+            auth_token="secret-token",
+        )
+
+        assert job is not None
+        info = await job.info()
+        assert info is not None
+        assert "secret-token" not in info.args
+        assert "secret-token" not in info.kwargs.values()
+
     @pytest.mark.asyncio
     async def test_enqueued_job_has_valid_id(self, setup_arq: None) -> None:
         """Should create job with valid UUID-like ID."""
@@ -324,18 +349,34 @@ class TestTaskExecution:
         assert result["channel"] == "email"
 
     @pytest.mark.asyncio
-    async def test_cleanup_expired_cache_task(self) -> None:
-        """Should execute cleanup_expired_cache task."""
-        ctx: dict = {}
+    async def test_cleanup_expired_cache_task(self, cache: Redis[bytes]) -> None:
+        """Should unlink entries of superseded namespace generations."""
+        old_key = namespaced_key(CacheNamespace.NUTRITION, "cleanup flour")
+        await cache.set(old_key, b"{}")
+        await invalidate_namespaces(cache, [CacheNamespace.NUTRITION])
+        new_key = namespaced_key(CacheNamespace.NUTRITION, "cleanup flour")
+        await cache.set(new_key, b"{}")
+
+        try:
+            result = await cleanup_expired_cache({"cache_client": cache})
+
+            assert result["status"] == "completed"
+            assert result["cleaned_count"] >= 1
+            assert await cache.exists(old_key) == 0
+            assert await cache.exists(new_key) == 1
+        finally:
+            await cache.delete(new_key, GENERATIONS_KEY)
 
-        result = await cleanup_expired_cache(ctx)
+    @pytest.mark.asyncio
+    async def test_cleanup_expired_cache_without_client(self) -> None:
+        """Should skip the sweep without a cache client."""
+        result = await cleanup_expired_cache({})
 
-        assert result["status"] == "completed"
-        assert "cleaned_count" in result
+        assert result["status"] == "skipped"
 
     @pytest.mark.asyncio
     async def test_process_recipe_scrape_task(self) -> None:
-        """Should execute process_recipe_scrape task."""
+        """Should report imports as unavailable without worker clients."""
         ctx: dict = {}
 
         result = await process_recipe_scrape(
@@ -344,9 +385,9 @@ class TestTaskExecution:
             user_id="user-456",
         )
 
-        assert result["status"] == "completed"
+        assert result["status"] == "failed"
         assert result["url"] == "https://example.com/recipe"
-        assert result["user_id"] == "user-456"
+        assert result["error"] == "SERVICE_UNAVAILABLE"
 
 
 class TestWorkerLifecycle:
@@ -364,6 +405,7 @@ class TestWorkerLifecycle:
             await startup(ctx)
 
         assert "settings" in ctx
+        await shutdown(ctx)
 
     @pytest.mark.asyncio
     async def test_shutdown_handler(self) -> None:
@@ -19,6 +19,7 @@ from app.schemas.recipe import (
     RecipeEngagementMetrics,
 )
 from app.services.popular.service import PopularRecipesService
+from app.services.popular.store import PopularSourceStore
 from app.workers.tasks.popular_recipes import (
     check_and_refresh_popular_recipes,
     refresh_popular_recipes,
@@ -39,6 +40,7 @@ def mock_settings() -> MagicMock:
     mock.scraping.popular_recipes.enabled = True
     mock.scraping.popular_recipes.cache_ttl = 60  # Short TTL for testing
     mock.scraping.popular_recipes.cache_key = "test_popular_recipes"
+    mock.scraping.popular_recipes.page_size = 20
     mock.scraping.popular_recipes.target_total = 100
     mock.scraping.popular_recipes.fetch_timeout = 10.0
     mock.scraping.popular_recipes.max_concurrent_fetches = 2
@@ -51,7 +53,10 @@ def mock_settings() -> MagicMock:
     source.enabled = True
     source.max_recipes = 10
     source.source_weight = 1.0
+    source.refresh_interval = None
     mock.scraping.popular_recipes.sources = [source]
+    mock.scraping.popular_recipes.source_refresh_interval = 3600
+    mock.scraping.popular_recipes.detail_fresh_ttl = 0
 
     # Scoring weights
     mock.scraping.popular_recipes.scoring.rating_weight = 0.35
@@ -330,6 +335,36 @@ class TestWorkerTasksIntegration:
         mock_settings.scraping.popular_recipes.refresh_threshold = 3600
         return mock_settings
 
+    @staticmethod
+    async def _store_fresh_source(cache: Redis[bytes], settings: MagicMock) -> None:
+        """Store a just-fetched result for the configured source."""
+        config = settings.scraping.popular_recipes
+        await PopularSourceStore(cache, config.cache_key, ttl=60).put("TestSource", [])
+
+    async def test_check_and_refresh_schedules_due_sources(
+        self, cache: Redis[bytes], worker_mock_settings: MagicMock
+    ) -> None:
+        """Should enqueue one refresh per source without a cached result."""
+        worker_mock_settings.scraping.popular_recipes.cache_key = "due_source_test"
+        ctx = {"cache_client": cache}
+        mock_enqueue = AsyncMock(return_value=MagicMock())
+
+        with (
+            patch(
+                "app.workers.tasks.popular_recipes.get_settings",
+                return_value=worker_mock_settings,
+            ),
+            patch(
+                "app.services.popular.service.get_settings",
+                return_value=worker_mock_settings,
+            ),
+            patch("app.workers.jobs.enqueue_popular_source_refresh", mock_enqueue),
+        ):
+            result = await check_and_refresh_popular_recipes(ctx)
+
+        assert result == {"status": "scheduled", "sources": ["TestSource"]}
+        mock_enqueue.assert_awaited_once_with("TestSource")
+
     async def test_check_and_refresh_skips_healthy_cache(
         self, cache: Redis[bytes], worker_mock_settings: MagicMock
     ) -> None:
@@ -355,11 +390,19 @@ class TestWorkerTasksIntegration:
             ex=7200,  # 2 hours (above 1 hour threshold)
         )
 
+        await self._store_fresh_source(cache, worker_mock_settings)
+
         ctx = {"cache_client": cache}
 
-        with patch(
-            "app.workers.tasks.popular_recipes.get_settings",
-            return_value=worker_mock_settings,
+        with (
+            patch(
+                "app.workers.tasks.popular_recipes.get_settings",
+                return_value=worker_mock_settings,
+            ),
+            patch(
+                "app.services.popular.service.get_settings",
+                return_value=worker_mock_settings,
+            ),
         ):
             result = await check_and_refresh_popular_recipes(ctx)
 
@@ -395,6 +438,7 @@ class TestWorkerTasksIntegration:
 
         # Mock the service to avoid real HTTP calls
         mock_service = AsyncMock()
+        mock_service.get_stale_sources.return_value = []
         mock_service.refresh_cache.return_value = PopularRecipesData(
             recipes=[
                 PopularRecipe(
@@ -440,6 +484,7 @@ class TestWorkerTasksIntegration:
         ctx = {"cache_client": cache}
 
         mock_service = AsyncMock()
+        mock_service.get_stale_sources.return_value = []
         mock_service.refresh_cache.return_value = PopularRecipesData(
             recipes=[
                 PopularRecipe(
@@ -541,11 +586,19 @@ class TestWorkerTasksIntegration:
             ex=3600,  # Exactly at threshold
         )
 
+        await self._store_fresh_source(cache, worker_mock_settings)
+
         ctx = {"cache_client": cache}
 
-        with patch(
-            "app.workers.tasks.popular_recipes.get_settings",
-            return_value=worker_mock_settings,
+        with (
+            patch(
+                "app.workers.tasks.popular_recipes.get_settings",
+                return_value=worker_mock_settings,
+            ),
+            patch(
+                "app.services.popular.service.get_settings",
+                return_value=worker_mock_settings,
+            ),
         ):
             result = await check_and_refresh_popular_recipes(ctx)
 
@@ -0,0 +1,112 @@
+"""Performance benchmarks for rule-based ingredient parsing.
+
+Benchmarks cover:
+- Rule-based parser throughput (lines/second) on typical recipe lines
+- Worst-case lines that fall through to the LLM
+- IngredientParser.parse_batch with a mocked LLM, measuring LLM hand-off
+
+Lines/second are reported in the benchmark's extra_info.
+
+Note: Uses asyncio.run inside the benchmarked function to avoid event
+loop conflicts with pytest-benchmark.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.llm.prompts import IngredientUnit, ParsedIngredient, ParsedIngredientList
+from app.parsing.ingredient import IngredientParser
+from app.parsing.rules import IngredientRuleParser
+from tests.fixtures.ingredient_lines import LLM_BOUND_LINES, TYPICAL_RECIPE_LINES
+
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+pytestmark = pytest.mark.performance
+
+
+def _record_throughput(benchmark: BenchmarkFixture, lines: int) -> None:
+    """Store lines/second for the mean round in the benchmark report."""
+    if benchmark.stats is not None:
+        mean = benchmark.stats.stats.mean
+        benchmark.extra_info["lines_per_second"] = round(lines / mean)
+
+
+class TestRuleParserBenchmarks:
+    """Benchmarks for the table-driven rule parser."""
+
+    def test_typical_lines_throughput(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark parsing a typical recipe corpus."""
+        rules = IngredientRuleParser()
+        corpus = TYPICAL_RECIPE_LINES * 10
+
+        def parse_corpus() -> int:
+            return sum(1 for line in corpus if rules.parse(line).confidence >= 0.8)
+
+        confident = benchmark(parse_corpus)
+        _record_throughput(benchmark, len(corpus))
+
+        # At least half of the lines never reach the LLM
+        assert confident / len(corpus) >= 0.5
+
+    def test_llm_bound_lines_throughput(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark lines that are scored low and handed to the LLM."""
+        rules = IngredientRuleParser()
+        corpus = LLM_BOUND_LINES * 50
+
+        def parse_corpus() -> int:
+            return sum(1 for line in corpus if rules.parse(line).confidence >= 0.8)
+
+        confident = benchmark(parse_corpus)
+        _record_throughput(benchmark, len(corpus))
+
+        assert confident == 0
+
+    def test_table_compilation(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark building a parser (done once per process)."""
+        result = benchmark(IngredientRuleParser)
+        assert result.parse("1 tsp salt").ingredient is not None
+
+
+class TestIngredientParserBenchmarks:
+    """Benchmarks for parse_batch with the rule-based pre-stage."""
+
+    def test_parse_batch_with_rules(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark a recipe import where only low-confidence lines hit the LLM."""
+
+        async def generate(**kwargs: object) -> ParsedIngredientList:
+            count = str(kwargs["prompt"]).count("\n- ")
+            return ParsedIngredientList(
+                ingredients=[
+                    ParsedIngredient(name="x", quantity=1.0, unit=IngredientUnit.UNIT)
+                ]
+                * count
+            )
+
+        llm_client = MagicMock()
+        llm_client.generate_structured = AsyncMock(side_effect=generate)
+        parser = IngredientParser(llm_client)
+
+        def parse_recipe() -> list[ParsedIngredient]:
+            return asyncio.run(parser.parse_batch(TYPICAL_RECIPE_LINES))
+
+        result = benchmark(parse_recipe)
+        _record_throughput(benchmark, len(TYPICAL_RECIPE_LINES))
+
+        assert len(result) == len(TYPICAL_RECIPE_LINES)
+
+        # At least half of the lines never reach the LLM
+        llm_client.generate_structured.reset_mock()
+        asyncio.run(parser.parse_batch(TYPICAL_RECIPE_LINES))
+        llm_lines = sum(
+            str(call.kwargs["prompt"]).count("\n- ")
+            for call in llm_client.generate_structured.call_args_list
+        )
+        assert llm_lines <= len(TYPICAL_RECIPE_LINES) / 2
@@ -0,0 +1,127 @@
+"""Performance benchmarks for the request middleware stack.
+
+Benchmarks cover:
+- Requests/second through the previous BaseHTTPMiddleware stack
+  (SecurityHeaders, RequestID, Timing, Logging)
+- Requests/second through the fused pure-ASGI RequestContextMiddleware
+
+Both stacks sit on top of GZip like in the application, in front of a
+trivial endpoint so the middleware dominates the measurement. Compare the
+``requests_per_second`` extra info of the ``middleware-stack`` group.
+
+Note: Uses synchronous HTTP client to avoid event loop
+conflicts with pytest-benchmark.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.testclient import TestClient
+
+from app.core.middleware import (
+    LoggingMiddleware,
+    RequestContextMiddleware,
+    RequestIDMiddleware,
+    SecurityHeadersMiddleware,
+    TimingMiddleware,
+)
+
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+pytestmark = pytest.mark.performance
+
+REQUESTS_PER_ROUND = 50
+EXCLUDE_PATHS = {"/health"}
+
+
+def _create_app(*, fused: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    if fused:
+        app.add_middleware(RequestContextMiddleware, exclude_paths=EXCLUDE_PATHS)
+    else:
+        app.add_middleware(LoggingMiddleware, exclude_paths=EXCLUDE_PATHS)
+        app.add_middleware(TimingMiddleware)
+        app.add_middleware(RequestIDMiddleware)
+        app.add_middleware(SecurityHeadersMiddleware)
+    return app
+
+
+@pytest.fixture
+def layered_client() -> Generator[TestClient]:
+    """Client for an app using the four BaseHTTPMiddleware layers."""
+    with TestClient(_create_app(fused=False)) as client:
+        yield client
+
+
+@pytest.fixture
+def fused_client() -> Generator[TestClient]:
+    """Client for an app using the fused RequestContextMiddleware."""
+    with TestClient(_create_app(fused=True)) as client:
+        yield client
+
+
+def _run_requests(client: TestClient) -> int:
+    ok = 0
+    for _ in range(REQUESTS_PER_ROUND):
+        response = client.get("/api/ping")
+        if response.status_code == 200 and "x-request-id" in response.headers:
+            ok += 1
+    return ok
+
+
+class TestMiddlewareStackBenchmarks:
+    """Throughput of the layered vs fused middleware stack."""
+
+    @pytest.mark.benchmark(group="middleware-stack")
+    def test_layered_base_http_middleware(
+        self,
+        benchmark: BenchmarkFixture,
+        layered_client: TestClient,
+    ) -> None:
+        """Benchmark the previous four-layer BaseHTTPMiddleware stack."""
+        result = benchmark(_run_requests, layered_client)
+
+        assert result == REQUESTS_PER_ROUND
+        benchmark.extra_info["requests_per_second"] = round(
+            REQUESTS_PER_ROUND / benchmark.stats.stats.mean
+        )
+
+    @pytest.mark.benchmark(group="middleware-stack")
+    def test_fused_request_context_middleware(
+        self,
+        benchmark: BenchmarkFixture,
+        fused_client: TestClient,
+    ) -> None:
+        """Benchmark the fused pure-ASGI RequestContextMiddleware."""
+        result = benchmark(_run_requests, fused_client)
+
+        assert result == REQUESTS_PER_ROUND
+        benchmark.extra_info["requests_per_second"] = round(
+            REQUESTS_PER_ROUND / benchmark.stats.stats.mean
+        )
+
+    def test_stacks_return_same_headers(
+        self,
+        layered_client: TestClient,
+        fused_client: TestClient,
+    ) -> None:
+        """Both stacks should produce the same set of response headers."""
+        layered = layered_client.get("/api/ping").headers
+        fused = fused_client.get("/api/ping").headers
+
+        assert set(layered.keys()) == set(fused.keys())
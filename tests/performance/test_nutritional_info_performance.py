@@ -6,6 +6,7 @@ Benchmarks cover:
 - Fuzzy search overhead compared to exact match
 - Unit conversion throughput
 - Batch lookup performance
+- Batched (MGET) vs sequential recipe cache reads against real Redis
 
 Note: Uses synchronous HTTP client to avoid event loop
 conflicts with pytest-benchmark.
@@ -16,10 +17,13 @@ via FastAPI dependency overrides for isolated performance measurement.
 
 from __future__ import annotations
 
+import statistics
+import time
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock
 
+import orjson
 import pytest
 
 from app.api.dependencies import get_nutrition_service
@@ -40,6 +44,7 @@ from app.schemas.nutrition import (
     NutrientValue,
     Vitamins,
 )
+from app.services.nutrition.service import NutritionService
 
 
 if TYPE_CHECKING:
@@ -47,6 +52,7 @@ if TYPE_CHECKING:
 
     from fastapi import FastAPI
     from pytest_benchmark.fixture import BenchmarkFixture
+    from redis.asyncio import Redis
     from starlette.testclient import TestClient
 
 
@@ -436,3 +442,60 @@ class TestNutrientScalingBenchmarks:
         result = benchmark(calculate_scale_factors)
         assert len(result) == 7
         assert result[2] == Decimal("1.5")  # 150g / 100g
+
+
+# --- Recipe Cache Lookup Benchmarks ---
+
+
+RECIPE_INGREDIENT_COUNT = 25
+CACHE_LOOKUP_ITERATIONS = 50
+
+
+def _p95(samples: list[float]) -> float:
+    """Return the 95th percentile of latency samples."""
+    return statistics.quantiles(samples, n=20)[-1]
+
+
+class TestRecipeCacheLookupBenchmarks:
+    """Batched vs sequential cache reads for a 25-ingredient recipe."""
+
+    @pytest.fixture
+    async def warm_service(
+        self,
+        cache: Redis[bytes],
+        sample_nutrition_data: NutritionData,
+    ) -> NutritionService:
+        """Create a NutritionService whose cache holds every recipe ingredient."""
+        repository = MagicMock()
+        repository.get_by_ingredient_names = AsyncMock(return_value={})
+        repository.get_by_ingredient_names_fuzzy = AsyncMock(return_value={})
+        service = NutritionService(cache_client=cache, repository=repository)
+        await service.initialize()
+
+        payload = orjson.dumps(sample_nutrition_data.model_dump(mode="json"))
+        for i in range(RECIPE_INGREDIENT_COUNT):
+            await cache.setex(f"nutrition:perf ingredient {i}", 600, payload)
+        return service
+
+    async def test_batched_lookup_beats_sequential_p95(
+        self,
+        warm_service: NutritionService,
+    ) -> None:
+        """MGET-based batch lookup should have a lower p95 than per-key GETs."""
+        names = [f"perf ingredient {i}" for i in range(RECIPE_INGREDIENT_COUNT)]
+
+        sequential: list[float] = []
+        for _ in range(CACHE_LOOKUP_ITERATIONS):
+            start = time.perf_counter()
+            for name in names:
+                assert await warm_service._get_from_cache(name) is not None
+            sequential.append(time.perf_counter() - start)
+
+        batched: list[float] = []
+        for _ in range(CACHE_LOOKUP_ITERATIONS):
+            start = time.perf_counter()
+            result = await warm_service._get_batch_nutrition_data(names)
+            batched.append(time.perf_counter() - start)
+            assert len(result) == RECIPE_INGREDIENT_COUNT
+
+        assert _p95(batched) < _p95(sequential)
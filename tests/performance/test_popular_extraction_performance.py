@@ -0,0 +1,96 @@
+"""Performance benchmarks for popular-recipe page analysis.
+
+Benchmarks cover:
+- analyze_recipe_page: one PageDocument per page shared by the recipe-page
+  check and metrics extraction
+- The two-parse call pattern (is_recipe_page and extract_engagement_metrics
+  each parsing the raw HTML) as the baseline
+- PageDocument construction alone
+
+Runs over a corpus of saved-page-shaped recipe and listing pages.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from app.services.popular.extraction import (
+    PageDocument,
+    analyze_recipe_page,
+    extract_engagement_metrics,
+    is_recipe_page,
+)
+from tests.fixtures.recipe_pages import saved_recipe_pages
+
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from app.schemas.recipe import RecipeEngagementMetrics
+
+
+pytestmark = pytest.mark.performance
+
+CORPUS = saved_recipe_pages(sections=300)
+
+
+def _two_parses(html: str) -> RecipeEngagementMetrics | None:
+    if not is_recipe_page(html):
+        return None
+    return extract_engagement_metrics(html)
+
+
+class TestPageAnalysisBenchmarks:
+    """Benchmarks for recipe-page analysis over the corpus."""
+
+    def test_single_parse(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark analyzing each page off one parsed document."""
+
+        def analyze_corpus() -> list[RecipeEngagementMetrics | None]:
+            return [analyze_recipe_page(html) for html in CORPUS]
+
+        results = benchmark(analyze_corpus)
+
+        assert [r is not None for r in results] == [True, True, True, False]
+
+    def test_two_parse_baseline(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark parsing each page separately for check and extraction."""
+
+        def analyze_corpus() -> list[RecipeEngagementMetrics | None]:
+            return [_two_parses(html) for html in CORPUS]
+
+        results = benchmark(analyze_corpus)
+
+        assert results == [analyze_recipe_page(html) for html in CORPUS]
+
+    def test_document_construction(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark parsing and indexing alone."""
+        docs = benchmark(lambda: [PageDocument(html) for html in CORPUS])
+
+        assert all(doc.find_by_class("nav-item") for doc in docs)
+
+
+class TestPageAnalysisSpeedup:
+    """Direct comparison of the single-parse and two-parse paths."""
+
+    def test_single_parse_is_faster(self) -> None:
+        """Single-parse analysis should beat the two-parse baseline."""
+        iterations = 3
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            for html in CORPUS:
+                _two_parses(html)
+        baseline_time = (time.perf_counter() - start) / iterations
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            for html in CORPUS:
+                analyze_recipe_page(html)
+        single_time = (time.perf_counter() - start) / iterations
+
+        # One parse per page instead of two
+        assert single_time < baseline_time
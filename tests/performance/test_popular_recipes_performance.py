@@ -20,6 +20,7 @@ from app.schemas.recipe import (
     RecipeEngagementMetrics,
 )
 from app.services.popular.service import PopularRecipesService
+from app.services.popular.store import PopularRecipesStore
 
 
 if TYPE_CHECKING:
@@ -36,6 +37,7 @@ def mock_settings() -> MagicMock:
     mock.scraping.popular_recipes.enabled = True
     mock.scraping.popular_recipes.cache_ttl = 3600
     mock.scraping.popular_recipes.cache_key = "perf_test"
+    mock.scraping.popular_recipes.page_size = 20
     mock.scraping.popular_recipes.target_total = 500
     mock.scraping.popular_recipes.fetch_timeout = 30.0
     mock.scraping.popular_recipes.max_concurrent_fetches = 5
@@ -313,24 +315,21 @@ class TestEndpointPerformance:
     ) -> None:
         """Endpoint should respond within 50ms on cache hit."""
         # Pre-populate cache
-        cache_key = f"popular:{mock_settings.scraping.popular_recipes.cache_key}"
+        config = mock_settings.scraping.popular_recipes
+        store = PopularRecipesStore(
+            cache, config.cache_key, ttl=3600, page_size=config.page_size
+        )
         test_data = PopularRecipesData(
             recipes=create_test_recipes(100),
             total_count=100,
             sources_fetched=["PerfSource"],
         )
-        await cache.set(
-            cache_key,
-            orjson.dumps(test_data.model_dump()),
-            ex=3600,
-        )
+        await store.save(test_data)
 
-        # Simulate endpoint logic (cache read + pagination + response building)
+        # Simulate endpoint logic (paged cache read + response building)
         async def simulate_endpoint() -> None:
-            cached_bytes = await cache.get(cache_key)
-            if cached_bytes:
-                data = PopularRecipesData.model_validate(orjson.loads(cached_bytes))
-                _ = data.recipes[0:50]  # Pagination
+            cached = await store.get_range(0, 50)
+            assert cached is not None
 
         # Measure average response time
         iterations = 100
@@ -342,6 +341,42 @@ class TestEndpointPerformance:
         # Should respond within 50ms on cache hit
         assert avg_time < 0.05
 
+    @pytest.mark.flaky(reruns=3, reruns_delay=1)
+    async def test_paged_read_faster_than_full_blob(
+        self,
+        cache: Redis[bytes],
+        mock_settings: MagicMock,
+    ) -> None:
+        """Reading one page should beat decoding the whole 500-recipe blob."""
+        config = mock_settings.scraping.popular_recipes
+        store = PopularRecipesStore(
+            cache, config.cache_key, ttl=3600, page_size=config.page_size
+        )
+        test_data = PopularRecipesData(
+            recipes=create_test_recipes(500),
+            total_count=500,
+            sources_fetched=["PerfSource"],
+        )
+        await store.save(test_data)
+        blob_key = f"popular:{config.cache_key}_blob"
+        await cache.set(blob_key, orjson.dumps(test_data.model_dump()), ex=3600)
+
+        iterations = 50
+        start = time.perf_counter()
+        for _ in range(iterations):
+            cached_bytes = await cache.get(blob_key)
+            assert cached_bytes is not None
+            data = PopularRecipesData.model_validate(orjson.loads(cached_bytes))
+            _ = data.recipes[0:20]
+        blob_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await store.get_range(0, 20)
+        paged_time = time.perf_counter() - start
+
+        assert paged_time < blob_time
+
     async def test_endpoint_cache_miss_503_response_time(
         self,
         cache: Redis[bytes],
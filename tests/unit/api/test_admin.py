@@ -1,7 +1,8 @@
 """Unit tests for admin endpoints.
 
 Tests cover:
-- Cache clear endpoint function
+- Cache clear endpoint function (all or selected namespaces)
+- Local cache invalidation endpoint function
 - Error handling
 - Success scenarios with mocked Redis
 """
@@ -13,8 +14,12 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from fastapi import HTTPException
 
-from app.api.v1.endpoints.admin import clear_cache_endpoint
+from app.api.v1.endpoints.admin import (
+    clear_cache_endpoint,
+    clear_local_cache_endpoint,
+)
 from app.auth.dependencies import CurrentUser
+from app.cache.namespaces import CacheNamespace
 
 
 pytestmark = pytest.mark.unit
@@ -49,11 +54,28 @@ class TestClearCacheEndpoint:
         with patch(
             "app.api.v1.endpoints.admin.clear_cache",
             new_callable=AsyncMock,
+            return_value={"nutrition": 2, "popular": 1},
         ) as mock_clear:
             result = await clear_cache_endpoint(admin_user)
 
-            mock_clear.assert_called_once()
+            mock_clear.assert_called_once_with(None)
             assert result.message == "Cache cleared successfully"
+            assert result.generations == {"nutrition": 2, "popular": 1}
+
+    @pytest.mark.asyncio
+    async def test_clears_selected_namespaces(self, admin_user: CurrentUser) -> None:
+        """Should only invalidate the requested namespaces."""
+        with patch(
+            "app.api.v1.endpoints.admin.clear_cache",
+            new_callable=AsyncMock,
+            return_value={"popular": 4},
+        ) as mock_clear:
+            result = await clear_cache_endpoint(
+                admin_user, namespace=[CacheNamespace.POPULAR]
+            )
+
+            mock_clear.assert_called_once_with([CacheNamespace.POPULAR])
+            assert result.generations == {"popular": 4}
 
     @pytest.mark.asyncio
     async def test_clears_cache_with_service_role(
@@ -64,6 +86,7 @@ class TestClearCacheEndpoint:
         with patch(
             "app.api.v1.endpoints.admin.clear_cache",
             new_callable=AsyncMock,
+            return_value={},
         ) as mock_clear:
             result = await clear_cache_endpoint(service_user)
 
@@ -115,6 +138,7 @@ class TestClearCacheEndpoint:
             patch(
                 "app.api.v1.endpoints.admin.clear_cache",
                 new_callable=AsyncMock,
+                return_value={},
             ),
             patch("app.api.v1.endpoints.admin.logger") as mock_logger,
         ):
@@ -125,3 +149,54 @@ class TestClearCacheEndpoint:
             call_args_list = [str(call) for call in mock_logger.info.call_args_list]
             assert any("Cache clear requested" in call for call in call_args_list)
             assert any("Cache cleared successfully" in call for call in call_args_list)
+
+
+class TestClearLocalCacheEndpoint:
+    """Tests for local cache invalidation endpoint function."""
+
+    @pytest.fixture
+    def admin_user(self) -> CurrentUser:
+        """Create an admin user for testing."""
+        return CurrentUser(
+            id="admin-user-123",
+            roles=["admin"],
+            permissions=["admin:system"],
+            token_type="access",
+        )
+
+    @pytest.mark.asyncio
+    async def test_clears_all_local_caches(self, admin_user: CurrentUser) -> None:
+        """Should clear every local cache and report removed entries."""
+        with patch(
+            "app.api.v1.endpoints.admin.clear_local_caches",
+            return_value={"ingredient_portions": 3, "ingredient_pricing": 0},
+        ) as mock_clear:
+            result = await clear_local_cache_endpoint(admin_user)
+
+            mock_clear.assert_called_once_with(None)
+            assert result.message == "Local caches cleared successfully"
+            assert result.cleared == {"ingredient_portions": 3, "ingredient_pricing": 0}
+
+    @pytest.mark.asyncio
+    async def test_clears_named_local_cache(self, admin_user: CurrentUser) -> None:
+        """Should clear only the requested cache."""
+        with patch(
+            "app.api.v1.endpoints.admin.clear_local_caches",
+            return_value={"food_group_pricing": 1},
+        ) as mock_clear:
+            result = await clear_local_cache_endpoint(
+                admin_user, name="food_group_pricing"
+            )
+
+            mock_clear.assert_called_once_with("food_group_pricing")
+            assert result.cleared == {"food_group_pricing": 1}
+
+    @pytest.mark.asyncio
+    async def test_unknown_cache_returns_404(self, admin_user: CurrentUser) -> None:
+        """Should return 404 for unknown cache names."""
+        with pytest.raises(HTTPException) as exc_info:
+            await clear_local_cache_endpoint(admin_user, name="does_not_exist")
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail["error"] == "NOT_FOUND"
+        assert isinstance(exc_info.value.detail["available"], list)
@@ -151,6 +151,21 @@ class TestGetIngredientParser:
         assert result is not None
         assert result._llm_client is mock_llm_client
 
+    async def test_uses_cache_client_for_line_cache(self) -> None:
+        """Should pass the Redis cache client to the parser when available."""
+        mock_cache_client = MagicMock()
+
+        with (
+            patch("app.api.dependencies.get_llm_client", return_value=MagicMock()),
+            patch(
+                "app.api.dependencies.get_cache_client",
+                return_value=mock_cache_client,
+            ),
+        ):
+            result = await get_ingredient_parser()
+
+        assert result._cache_client is mock_cache_client
+
     async def test_raises_503_when_llm_not_available(self) -> None:
         """Should raise 503 when get_llm_client raises RuntimeError."""
         with (
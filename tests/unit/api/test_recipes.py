@@ -8,11 +8,13 @@ Tests cover:
 
 from __future__ import annotations
 
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import orjson
 import pytest
 from fastapi import HTTPException
+from pydantic import ValidationError
 
 from app.api.dependencies import (
     get_ingredient_parser,
@@ -22,19 +24,26 @@ from app.api.dependencies import (
 )
 from app.api.v1.endpoints.recipes import (
     create_recipe,
+    create_recipes_batch,
     get_popular_recipes,
     get_recipe_allergens,
+    get_recipe_import,
     get_recipe_nutritional_info,
     get_recipe_pairings,
     get_recipe_shopping_info,
 )
+from app.core.config.settings import BatchImportSettings, PopularRecipesSettings
 from app.llm.prompts import IngredientUnit as ParsedIngredientUnit
 from app.llm.prompts import ParsedIngredient
 from app.mappers import build_downstream_recipe_request, build_recipe_response
 from app.parsing.exceptions import (
     IngredientParsingError,
 )
-from app.schemas import CreateRecipeRequest, CreateRecipeResponse
+from app.schemas import (
+    BatchCreateRecipesRequest,
+    CreateRecipeRequest,
+    CreateRecipeResponse,
+)
 from app.schemas.allergen import RecipeAllergenResponse
 from app.schemas.enums import Allergen, IngredientUnit, NutrientUnit
 from app.schemas.ingredient import Quantity, WebRecipe
@@ -46,6 +55,7 @@ from app.schemas.nutrition import (
 from app.schemas.recipe import (
     PopularRecipe,
     PopularRecipesData,
+    Recipe,
     RecipeEngagementMetrics,
 )
 from app.schemas.recommendations import PairingSuggestionsResponse
@@ -54,6 +64,8 @@ from app.schemas.shopping import (
     RecipeShoppingInfoResponse,
 )
 from app.services.pairings.exceptions import LLMGenerationError as PairingsLLMError
+from app.services.popular.store import PopularRecipesStore
+from app.services.recipe_import import ImportStage
 from app.services.recipe_management import RecipeResponse
 from app.services.recipe_management.exceptions import (
     RecipeManagementError,
@@ -76,6 +88,7 @@ from app.services.scraping.exceptions import (
     ScrapingTimeoutError,
 )
 from app.services.scraping.models import ScrapedRecipe
+from app.workers.progress import ImportProgress
 
 
 pytestmark = pytest.mark.unit
@@ -665,6 +678,281 @@ class TestCreateRecipeEndpoint:
         assert "Generic scraping failure" in exc_info.value.detail["message"]
 
 
+class TestCreateRecipeAsync:
+    """Tests for create_recipe with async=true and the import status endpoint."""
+
+    @pytest.fixture
+    def mock_request(self) -> MagicMock:
+        """Create a mock HTTP request."""
+        request = MagicMock()
+        request.headers.get.return_value = "Bearer test-token"
+        request.url.path = "/api/v1/recipe-scraper/recipes"
+        return request
+
+    async def _create(self, mock_request: MagicMock) -> Any:
+        scraper = MagicMock()
+        scraper.scrape = AsyncMock()
+        return await create_recipe(
+            request_body=CreateRecipeRequest.model_validate(
+                {"recipeUrl": "https://example.com/cookies"}
+            ),
+            user=MagicMock(id="user-123"),
+            scraper_service=scraper,
+            recipe_client=MagicMock(),
+            parser=MagicMock(),
+            request=mock_request,
+            run_async=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_queues_import_and_returns_202(self, mock_request: MagicMock) -> None:
+        """Should enqueue the import instead of running it."""
+        job = MagicMock(job_id="abc123")
+        with patch(
+            "app.api.v1.endpoints.recipes.enqueue_recipe_scrape",
+            AsyncMock(return_value=job),
+        ) as enqueue:
+            response = await self._create(mock_request)
+
+        enqueue.assert_awaited_once_with(
+            "https://example.com/cookies", "user-123", "test-token"
+        )
+        assert response.status_code == 202
+        assert orjson.loads(response.body) == {
+            "jobId": "abc123",
+            "status": "queued",
+            "stage": "queued",
+            "recipe": None,
+            "error": None,
+            "message": None,
+        }
+        assert response.headers["location"] == (
+            "/api/v1/recipe-scraper/recipes/imports/abc123"
+        )
+
+    @pytest.mark.asyncio
+    async def test_raises_503_when_queue_unavailable(
+        self, mock_request: MagicMock
+    ) -> None:
+        """Should raise 503 when the job cannot be enqueued."""
+        with (
+            patch(
+                "app.api.v1.endpoints.recipes.enqueue_recipe_scrape",
+                AsyncMock(return_value=None),
+            ),
+            pytest.raises(HTTPException) as exc_info,
+        ):
+            await self._create(mock_request)
+
+        assert exc_info.value.status_code == 503
+
+    @staticmethod
+    async def _status(
+        progress: ImportProgress | None, job: dict[str, Any] | None
+    ) -> Any:
+        with (
+            patch(
+                "app.api.v1.endpoints.recipes.get_recipe_import_progress",
+                AsyncMock(return_value=progress),
+            ),
+            patch(
+                "app.api.v1.endpoints.recipes.get_job_status",
+                AsyncMock(return_value=job),
+            ),
+        ):
+            return await get_recipe_import(
+                job_id="abc123", user=MagicMock(id="user-123")
+            )
+
+    @pytest.mark.asyncio
+    async def test_reports_progress_of_running_job(self) -> None:
+        """Should return the current stage while the job runs."""
+        result = await self._status(
+            ImportProgress(stage=ImportStage.PARSING, user_id="user-123"),
+            {"job_id": "abc123", "status": "in_progress"},
+        )
+
+        assert result.status == "in_progress"
+        assert result.stage == "parsing"
+
+    @pytest.mark.asyncio
+    async def test_returns_recipe_when_complete(self) -> None:
+        """Should return the created recipe from the job result."""
+        recipe = Recipe(recipe_id=42, title="Cookies", ingredients=[], steps=[])
+        result = await self._status(
+            ImportProgress(stage=ImportStage.COMPLETE, user_id="user-123"),
+            {
+                "job_id": "abc123",
+                "status": "complete",
+                "result": {
+                    "status": "completed",
+                    "recipe": recipe.model_dump(mode="json"),
+                },
+            },
+        )
+
+        assert result.status == "complete"
+        assert result.recipe == recipe
+
+    @pytest.mark.asyncio
+    async def test_returns_error_when_failed(self) -> None:
+        """Should return the import error from a failed result."""
+        result = await self._status(
+            ImportProgress(stage=ImportStage.FAILED, user_id="user-123"),
+            {
+                "job_id": "abc123",
+                "status": "complete",
+                "result": {"status": "failed", "error": "RECIPE_NOT_FOUND"},
+            },
+        )
+
+        assert result.status == "failed"
+        assert result.error == "RECIPE_NOT_FOUND"
+
+    @pytest.mark.asyncio
+    async def test_hides_jobs_of_other_users(self) -> None:
+        """Should return 404 for another user's job."""
+        with pytest.raises(HTTPException) as exc_info:
+            await self._status(
+                ImportProgress(stage=ImportStage.QUEUED, user_id="someone-else"),
+                {"job_id": "abc123", "status": "queued"},
+            )
+
+        assert exc_info.value.status_code == 404
+
+
+class TestCreateRecipesBatchEndpoint:
+    """Tests for create_recipes_batch endpoint."""
+
+    @pytest.fixture
+    def mock_request(self) -> MagicMock:
+        """Create a mock HTTP request."""
+        request = MagicMock()
+        request.headers.get.return_value = "Bearer test-token"
+        return request
+
+    @pytest.fixture
+    def mock_settings(self) -> MagicMock:
+        """Settings with a small batch limit."""
+        settings = MagicMock()
+        settings.scraping.batch_import = BatchImportSettings(
+            max_urls=3, parse_window=0.01
+        )
+        return settings
+
+    @staticmethod
+    def _scraper() -> MagicMock:
+        async def scrape(url: str) -> ScrapedRecipe:
+            if url.endswith("/missing"):
+                msg = "No recipe found"
+                raise RecipeNotFoundError(msg)
+            return ScrapedRecipe(
+                title="Cookies",
+                ingredients=["2 cups flour", "1 cup sugar"],
+                instructions=["Bake"],
+                source_url=url,
+            )
+
+        scraper = MagicMock()
+        scraper.scrape = AsyncMock(side_effect=scrape)
+        return scraper
+
+    @staticmethod
+    def _parser() -> MagicMock:
+        parser = MagicMock()
+        parser.parse_batch = AsyncMock(
+            side_effect=lambda lines: [
+                ParsedIngredient(name=line, quantity=1.0, unit=ParsedIngredientUnit.CUP)
+                for line in lines
+            ]
+        )
+        return parser
+
+    @staticmethod
+    def _recipe_client() -> MagicMock:
+        client = MagicMock()
+        client.create_recipe = AsyncMock(
+            return_value=RecipeResponse(id=7, title="Cookies", slug="cookies")
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_streams_one_line_per_url(
+        self, mock_request: MagicMock, mock_settings: MagicMock
+    ) -> None:
+        """Should stream NDJSON results, including failures."""
+        parser = self._parser()
+        recipe_client = self._recipe_client()
+        request_body = BatchCreateRecipesRequest.model_validate(
+            {
+                "recipeUrls": [
+                    "https://example.com/cookies",
+                    "https://example.com/missing",
+                    "https://other.com/cake",
+                ]
+            }
+        )
+
+        with patch(
+            "app.api.v1.endpoints.recipes.get_settings", return_value=mock_settings
+        ):
+            response = await create_recipes_batch(
+                request_body=request_body,
+                user=MagicMock(id="user-123"),
+                scraper_service=self._scraper(),
+                recipe_client=recipe_client,
+                parser=parser,
+                request=mock_request,
+            )
+            body = b"".join([chunk async for chunk in response.body_iterator])
+
+        assert response.media_type == "application/x-ndjson"
+        lines = [orjson.loads(line) for line in body.splitlines()]
+        by_index = {line["index"]: line for line in lines}
+        assert sorted(by_index) == [0, 1, 2]
+        assert by_index[0]["status"] == 201
+        assert by_index[0]["recipe"]["recipeId"] == 7
+        assert by_index[1]["status"] == 400
+        assert by_index[1]["error"] == "RECIPE_NOT_FOUND"
+        assert by_index[1]["recipeUrl"] == "https://example.com/missing"
+        # Both recipes' ingredients were parsed in one merged call
+        parser.parse_batch.assert_awaited_once_with(["2 cups flour", "1 cup sugar"])
+        assert recipe_client.create_recipe.await_args.args[1] == "test-token"
+
+    @pytest.mark.asyncio
+    async def test_raises_400_when_too_many_urls(
+        self, mock_request: MagicMock, mock_settings: MagicMock
+    ) -> None:
+        """Should reject batches above the configured size."""
+        request_body = BatchCreateRecipesRequest.model_validate(
+            {"recipeUrls": [f"https://example.com/{i}" for i in range(4)]}
+        )
+
+        with (
+            patch(
+                "app.api.v1.endpoints.recipes.get_settings",
+                return_value=mock_settings,
+            ),
+            pytest.raises(HTTPException) as exc_info,
+        ):
+            await create_recipes_batch(
+                request_body=request_body,
+                user=MagicMock(id="user-123"),
+                scraper_service=self._scraper(),
+                recipe_client=self._recipe_client(),
+                parser=self._parser(),
+                request=mock_request,
+            )
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail["error"] == "TOO_MANY_URLS"
+
+    def test_rejects_empty_batch(self) -> None:
+        """Should require at least one URL."""
+        with pytest.raises(ValidationError):
+            BatchCreateRecipesRequest.model_validate({"recipeUrls": []})
+
+
 class TestCreateRecipeRequestSchema:
     """Tests for request schema validation."""
 
@@ -716,8 +1004,17 @@ class TestGetPopularRecipesEndpoint:
 
     @pytest.fixture
     def mock_cache_client(self) -> AsyncMock:
-        """Create a mock Redis cache client."""
-        return AsyncMock()
+        """Create a dict-backed mock Redis cache client."""
+        stored: dict[str, bytes] = {}
+        client = AsyncMock()
+        client.get = AsyncMock(side_effect=stored.get)
+        client.mget = AsyncMock(side_effect=lambda keys: [stored.get(k) for k in keys])
+        client.pipeline = MagicMock()
+        client.pipeline.return_value.setex = MagicMock(
+            side_effect=lambda key, _ttl, value: stored.__setitem__(key, value)
+        )
+        client.pipeline.return_value.execute = AsyncMock()
+        return client
 
     @pytest.fixture
     def sample_cached_data(self) -> PopularRecipesData:
@@ -753,12 +1050,14 @@ class TestGetPopularRecipesEndpoint:
     ) -> None:
         """Should return list of popular recipes from cache."""
         # Setup mock to return cached data
-        mock_cache_client.get = AsyncMock(
-            return_value=orjson.dumps(sample_cached_data.model_dump())
+        await PopularRecipesStore(mock_cache_client, "test", ttl=3600).save(
+            sample_cached_data
         )
 
         with patch("app.api.v1.endpoints.recipes.get_settings") as mock_settings:
-            mock_settings.return_value.scraping.popular_recipes.cache_key = "test"
+            mock_settings.return_value.scraping.popular_recipes = (
+                PopularRecipesSettings(cache_key="test")
+            )
             response = await get_popular_recipes(
                 cache_client=mock_cache_client,
                 limit=50,
@@ -780,12 +1079,14 @@ class TestGetPopularRecipesEndpoint:
         sample_cached_data: PopularRecipesData,
     ) -> None:
         """Should return only count when count_only is True."""
-        mock_cache_client.get = AsyncMock(
-            return_value=orjson.dumps(sample_cached_data.model_dump())
+        await PopularRecipesStore(mock_cache_client, "test", ttl=3600).save(
+            sample_cached_data
         )
 
         with patch("app.api.v1.endpoints.recipes.get_settings") as mock_settings:
-            mock_settings.return_value.scraping.popular_recipes.cache_key = "test"
+            mock_settings.return_value.scraping.popular_recipes = (
+                PopularRecipesSettings(cache_key="test")
+            )
             response = await get_popular_recipes(
                 cache_client=mock_cache_client,
                 limit=50,
@@ -803,12 +1104,14 @@ class TestGetPopularRecipesEndpoint:
         sample_cached_data: PopularRecipesData,
     ) -> None:
         """Should apply pagination to cached recipes."""
-        mock_cache_client.get = AsyncMock(
-            return_value=orjson.dumps(sample_cached_data.model_dump())
+        await PopularRecipesStore(mock_cache_client, "test", ttl=3600).save(
+            sample_cached_data
         )
 
         with patch("app.api.v1.endpoints.recipes.get_settings") as mock_settings:
-            mock_settings.return_value.scraping.popular_recipes.cache_key = "test"
+            mock_settings.return_value.scraping.popular_recipes = (
+                PopularRecipesSettings(cache_key="test")
+            )
             response = await get_popular_recipes(
                 cache_client=mock_cache_client,
                 limit=1,
@@ -845,12 +1148,12 @@ class TestGetPopularRecipesEndpoint:
             ],
             total_count=1,
         )
-        mock_cache_client.get = AsyncMock(
-            return_value=orjson.dumps(cached_data.model_dump())
-        )
+        await PopularRecipesStore(mock_cache_client, "test", ttl=3600).save(cached_data)
 
         with patch("app.api.v1.endpoints.recipes.get_settings") as mock_settings:
-            mock_settings.return_value.scraping.popular_recipes.cache_key = "test"
+            mock_settings.return_value.scraping.popular_recipes = (
+                PopularRecipesSettings(cache_key="test")
+            )
             response = await get_popular_recipes(
                 cache_client=mock_cache_client,
                 limit=50,
@@ -881,7 +1184,9 @@ class TestGetPopularRecipesEndpoint:
                 "app.api.v1.endpoints.recipes.enqueue_popular_recipes_refresh"
             ) as mock_enqueue,
         ):
-            mock_settings.return_value.scraping.popular_recipes.cache_key = "test"
+            mock_settings.return_value.scraping.popular_recipes = (
+                PopularRecipesSettings(cache_key="test")
+            )
             mock_enqueue.return_value = None
 
             response = await get_popular_recipes(
@@ -905,7 +1210,9 @@ class TestGetPopularRecipesEndpoint:
                 "app.api.v1.endpoints.recipes.enqueue_popular_recipes_refresh"
             ) as mock_enqueue,
         ):
-            mock_settings.return_value.scraping.popular_recipes.cache_key = "test"
+            mock_settings.return_value.scraping.popular_recipes = (
+                PopularRecipesSettings(cache_key="test")
+            )
             mock_enqueue.return_value = None
 
             response = await get_popular_recipes(
@@ -933,7 +1240,9 @@ class TestGetPopularRecipesEndpoint:
                 "app.api.v1.endpoints.recipes.enqueue_popular_recipes_refresh"
             ) as mock_enqueue,
         ):
-            mock_settings.return_value.scraping.popular_recipes.cache_key = "test"
+            mock_settings.return_value.scraping.popular_recipes = (
+                PopularRecipesSettings(cache_key="test")
+            )
             mock_enqueue.return_value = None
 
             response = await get_popular_recipes(
@@ -0,0 +1,76 @@
+"""Unit tests for batched cache operations.
+
+Tests cover:
+- cache_get_many MGET behavior
+- cache_set_many pipelined SETEX behavior
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.cache.batch import cache_get_many, cache_set_many
+
+
+pytestmark = pytest.mark.unit
+
+
+class TestCacheGetMany:
+    """Tests for cache_get_many function."""
+
+    async def test_uses_single_mget(self):
+        """Should fetch all keys with one MGET call."""
+        client = MagicMock()
+        client.mget = AsyncMock(return_value=[b"a", None, b"c"])
+
+        result = await cache_get_many(client, ["k1", "k2", "k3"])
+
+        assert result == [b"a", None, b"c"]
+        client.mget.assert_awaited_once_with(["k1", "k2", "k3"])
+
+    async def test_empty_keys_skips_redis(self):
+        """Should not call Redis when there are no keys."""
+        client = MagicMock()
+        client.mget = AsyncMock()
+
+        result = await cache_get_many(client, [])
+
+        assert result == []
+        client.mget.assert_not_called()
+
+    async def test_propagates_errors(self):
+        """Should let Redis errors reach the caller."""
+        client = MagicMock()
+        client.mget = AsyncMock(side_effect=ConnectionError("down"))
+
+        with pytest.raises(ConnectionError):
+            await cache_get_many(client, ["k1"])
+
+
+class TestCacheSetMany:
+    """Tests for cache_set_many function."""
+
+    async def test_pipelines_setex_for_each_item(self):
+        """Should queue one SETEX per item and execute once."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[True, True])
+        client = MagicMock()
+        client.pipeline.return_value = pipe
+
+        await cache_set_many(client, {"k1": b"v1", "k2": b"v2"}, ttl=60)
+
+        client.pipeline.assert_called_once_with(transaction=False)
+        pipe.setex.assert_any_call("k1", 60, b"v1")
+        pipe.setex.assert_any_call("k2", 60, b"v2")
+        assert pipe.setex.call_count == 2
+        pipe.execute.assert_awaited_once()
+
+    async def test_empty_items_skips_redis(self):
+        """Should not open a pipeline when there is nothing to write."""
+        client = MagicMock()
+
+        await cache_set_many(client, {}, ttl=60)
+
+        client.pipeline.assert_not_called()
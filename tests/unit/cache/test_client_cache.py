@@ -0,0 +1,241 @@
+"""Unit tests for the Redis client-side near cache.
+
+Tests cover:
+- GET/MGET of tracked keys served from memory, untracked keys forwarded
+- Invalidation messages, flushes and writes through the wrapper
+- Reads racing an invalidation
+- Tracking connection setup, reconnects and rejected tracking
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import ResponseError
+
+from app.cache.client_cache import (
+    INVALIDATE_CHANNEL,
+    ClientCachedRedis,
+    RedisClientCache,
+)
+from app.cache.local import MISSING
+
+
+pytestmark = pytest.mark.unit
+
+
+def _near_cache(*, active: bool = True) -> RedisClientCache:
+    """Create a near cache tracking ``hot:`` keys."""
+    with patch("app.cache.client_cache.ConnectionPool.from_url"):
+        near_cache = RedisClientCache(
+            "redis://localhost:6379/0", ["hot:"], max_items=10, max_age=30
+        )
+    near_cache._entries.enabled = active
+    return near_cache
+
+
+def _mock_client(stored: dict[str, str]) -> MagicMock:
+    """Redis mock backed by a dict."""
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=stored.get)
+    client.mget = AsyncMock(side_effect=lambda keys: [stored.get(k) for k in keys])
+    client.set = AsyncMock()
+    client.setex = AsyncMock()
+    client.delete = AsyncMock()
+    return client
+
+
+def _invalidate(keys: list[str] | None) -> list[Any]:
+    return ["message", INVALIDATE_CHANNEL, keys]
+
+
+class TestClientCachedRedis:
+    """Tests for serving reads through the near cache."""
+
+    async def test_serves_repeated_get_from_memory(self) -> None:
+        """Should query Redis once for a tracked key."""
+        client = _mock_client({"hot:a": "1"})
+        wrapped = ClientCachedRedis(client, _near_cache())
+
+        assert await wrapped.get("hot:a") == "1"
+        assert await wrapped.get("hot:a") == "1"
+
+        client.get.assert_awaited_once_with("hot:a")
+
+    async def test_caches_missing_keys(self) -> None:
+        """Should remember that a tracked key does not exist."""
+        client = _mock_client({})
+        wrapped = ClientCachedRedis(client, _near_cache())
+
+        assert await wrapped.get("hot:a") is None
+        assert await wrapped.get("hot:a") is None
+
+        client.get.assert_awaited_once()
+
+    async def test_forwards_untracked_keys(self) -> None:
+        """Should always query Redis for keys outside the tracked prefixes."""
+        client = _mock_client({"cold:a": "1"})
+        wrapped = ClientCachedRedis(client, _near_cache())
+
+        await wrapped.get("cold:a")
+        await wrapped.get("cold:a")
+
+        assert client.get.await_count == 2
+
+    async def test_forwards_while_tracking_inactive(self) -> None:
+        """Should not serve from memory without a tracking connection."""
+        client = _mock_client({"hot:a": "1"})
+        wrapped = ClientCachedRedis(client, _near_cache(active=False))
+
+        await wrapped.get("hot:a")
+        await wrapped.get("hot:a")
+
+        assert client.get.await_count == 2
+
+    async def test_mget_fetches_only_misses(self) -> None:
+        """Should send one MGET for the keys not in memory."""
+        client = _mock_client({"hot:a": "1", "hot:b": "2", "cold:c": "3"})
+        wrapped = ClientCachedRedis(client, _near_cache())
+        await wrapped.get("hot:a")
+
+        values = await wrapped.mget(["hot:a", "hot:b", "cold:c"])
+
+        assert values == ["1", "2", "3"]
+        client.mget.assert_awaited_once_with(["hot:b", "cold:c"])
+        assert await wrapped.mget("hot:a", "hot:b") == ["1", "2"]
+        client.mget.assert_awaited_once()
+
+    async def test_writes_evict_local_entries(self) -> None:
+        """Should drop the local entry when writing through the wrapper."""
+        stored = {"hot:a": "1"}
+        client = _mock_client(stored)
+        wrapped = ClientCachedRedis(client, _near_cache())
+        await wrapped.get("hot:a")
+
+        stored["hot:a"] = "2"
+        await wrapped.setex("hot:a", 60, "2")
+
+        assert await wrapped.get("hot:a") == "2"
+        client.setex.assert_awaited_once_with("hot:a", 60, "2")
+
+    async def test_forwards_other_commands(self) -> None:
+        """Should forward commands it does not intercept."""
+        client = _mock_client({})
+        client.ttl = AsyncMock(return_value=42)
+        wrapped = ClientCachedRedis(client, _near_cache())
+
+        assert await wrapped.ttl("hot:a") == 42
+
+
+class TestInvalidation:
+    """Tests for applying invalidation messages."""
+
+    def test_evicts_invalidated_keys(self) -> None:
+        """Should drop the keys named in an invalidation message."""
+        near_cache = _near_cache()
+        near_cache.store("hot:a", "1", near_cache.epoch)
+        near_cache.store("hot:b", "2", near_cache.epoch)
+
+        near_cache._handle(_invalidate(["hot:a"]))
+
+        assert near_cache.get("hot:a") is MISSING
+        assert near_cache.get("hot:b") == "2"
+
+    def test_flush_clears_everything(self) -> None:
+        """Should empty the near cache on a server flush."""
+        near_cache = _near_cache()
+        near_cache.store("hot:a", "1", near_cache.epoch)
+
+        near_cache._handle(_invalidate(None))
+
+        assert near_cache.get("hot:a") is MISSING
+
+    async def test_does_not_store_read_racing_invalidation(self) -> None:
+        """Should discard a value read before a concurrent invalidation."""
+        near_cache = _near_cache()
+        client = MagicMock()
+
+        async def get(name: str) -> str:
+            near_cache._handle(_invalidate([name]))
+            return "stale"
+
+        client.get = AsyncMock(side_effect=get)
+        wrapped = ClientCachedRedis(client, near_cache)
+
+        assert await wrapped.get("hot:a") == "stale"
+        assert near_cache.get("hot:a") is MISSING
+
+
+class TestTrackingConnection:
+    """Tests for the background tracking connection."""
+
+    @staticmethod
+    def _connection(responses: list[Any]) -> MagicMock:
+        connection = MagicMock()
+        connection.connect = AsyncMock()
+        connection.disconnect = AsyncMock()
+        connection.send_command = AsyncMock()
+        connection.read_response = AsyncMock(side_effect=responses)
+        return connection
+
+    async def test_enables_broadcast_tracking(self) -> None:
+        """Should redirect tracking to itself and subscribe."""
+        near_cache = _near_cache(active=False)
+        near_cache.prefixes = ("hot:", "warm:")
+        connection = self._connection([7, "OK", ["subscribe", INVALIDATE_CHANNEL, 1]])
+
+        await near_cache._enable_tracking(connection)
+
+        commands = [c.args for c in connection.send_command.await_args_list]
+        assert commands == [
+            ("CLIENT", "ID"),
+            (
+                "CLIENT",
+                "TRACKING",
+                "ON",
+                "REDIRECT",
+                7,
+                "BCAST",
+                "PREFIX",
+                "hot:",
+                "PREFIX",
+                "warm:",
+            ),
+            ("SUBSCRIBE", INVALIDATE_CHANNEL),
+        ]
+
+    async def test_reconnects_and_clears_after_connection_loss(self) -> None:
+        """Should empty the near cache and retry when the connection drops."""
+        near_cache = _near_cache(active=False)
+        lost = self._connection(
+            [1, "OK", ["subscribe", INVALIDATE_CHANNEL, 1], RedisConnectionError()]
+        )
+        reconnected = self._connection(
+            [2, "OK", ["subscribe", INVALIDATE_CHANNEL, 1], asyncio.CancelledError()]
+        )
+        near_cache._pool.make_connection = MagicMock(side_effect=[lost, reconnected])
+
+        with (
+            patch("app.cache.client_cache.asyncio.sleep", AsyncMock()) as mock_sleep,
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await near_cache._run()
+
+        mock_sleep.assert_awaited_once()
+        lost.disconnect.assert_awaited_once()
+        assert near_cache.active is False
+
+    async def test_stops_when_tracking_rejected(self) -> None:
+        """Should give up when the server rejects CLIENT TRACKING."""
+        near_cache = _near_cache(active=False)
+        connection = self._connection([1, ResponseError("unknown subcommand")])
+        near_cache._pool.make_connection = MagicMock(return_value=connection)
+
+        await near_cache._run()
+
+        assert near_cache.active is False
+        connection.disconnect.assert_awaited_once()
@@ -0,0 +1,190 @@
+"""Unit tests for the process-local LRU cache tier.
+
+Tests cover:
+- Hit/miss behavior including cached None values
+- LRU and TTL eviction
+- Prometheus counters
+- Registry configuration and invalidation
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.cache.local import (
+    LOCAL_CACHE_EVICTIONS,
+    LOCAL_CACHE_HITS,
+    LOCAL_CACHE_MISSES,
+    MISSING,
+    LocalCache,
+    clear_local_caches,
+    configure_local_caches,
+    disable_local_caches,
+    get_local_cache_names,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def local_cache() -> LocalCache[str, int | None]:
+    """Create an enabled cache holding at most two entries."""
+    cache: LocalCache[str, int | None] = LocalCache("test_local", max_items=2, ttl=60)
+    cache.enabled = True
+    return cache
+
+
+def _count(counter, **labels: str) -> float:
+    """Read the current value of a labelled counter."""
+    return counter.labels(**labels)._value.get()
+
+
+class TestLocalCache:
+    """Tests for LocalCache."""
+
+    def test_miss_then_hit(self, local_cache: LocalCache[str, int | None]):
+        """Should return MISSING before set and the value after."""
+        assert local_cache.get("a") is MISSING
+
+        local_cache.set("a", 1)
+
+        assert local_cache.get("a") == 1
+
+    def test_caches_none(self, local_cache: LocalCache[str, int | None]):
+        """Should store None as a real value (negative caching)."""
+        local_cache.set("a", None)
+
+        assert local_cache.get("a") is None
+
+    def test_disabled_by_default(self):
+        """Should miss and ignore writes until enabled."""
+        cache: LocalCache[str, int] = LocalCache("test_local_disabled")
+
+        cache.set("a", 1)
+
+        assert cache.get("a") is MISSING
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self, local_cache: LocalCache[str, int | None]):
+        """Should evict the least recently used entry when full."""
+        local_cache.set("a", 1)
+        local_cache.set("b", 2)
+        local_cache.get("a")
+        local_cache.set("c", 3)
+
+        assert local_cache.get("b") is MISSING
+        assert local_cache.get("a") == 1
+        assert local_cache.get("c") == 3
+
+    def test_expires_entries(self, local_cache: LocalCache[str, int | None]):
+        """Should drop entries once their TTL has passed."""
+        with patch("app.cache.local.time.monotonic", return_value=1000.0):
+            local_cache.set("a", 1)
+        with patch("app.cache.local.time.monotonic", return_value=1061.0):
+            assert local_cache.get("a") is MISSING
+        assert len(local_cache) == 0
+
+    def test_records_metrics(self, local_cache: LocalCache[str, int | None]):
+        """Should count hits, misses and evictions per cache."""
+        hits = _count(LOCAL_CACHE_HITS, cache="test_local")
+        misses = _count(LOCAL_CACHE_MISSES, cache="test_local")
+        evictions = _count(LOCAL_CACHE_EVICTIONS, cache="test_local", reason="capacity")
+
+        local_cache.get("a")
+        local_cache.set("a", 1)
+        local_cache.get("a")
+        local_cache.set("b", 2)
+        local_cache.set("c", 3)
+
+        assert _count(LOCAL_CACHE_HITS, cache="test_local") == hits + 1
+        assert _count(LOCAL_CACHE_MISSES, cache="test_local") == misses + 1
+        assert (
+            _count(LOCAL_CACHE_EVICTIONS, cache="test_local", reason="capacity")
+            == evictions + 1
+        )
+
+    async def test_get_or_load_loads_once(
+        self, local_cache: LocalCache[str, int | None]
+    ):
+        """Should call the loader only on a miss."""
+        loader = AsyncMock(return_value=None)
+
+        assert await local_cache.get_or_load("a", loader) is None
+        assert await local_cache.get_or_load("a", loader) is None
+
+        loader.assert_awaited_once()
+
+    def test_discard(self, local_cache: LocalCache[str, int | None]):
+        """Should remove a single entry and report whether it existed."""
+        local_cache.set("a", 1)
+
+        assert local_cache.discard("a") is True
+        assert local_cache.discard("a") is False
+        assert local_cache.get("a") is MISSING
+
+    async def test_get_or_load_does_not_cache_errors(
+        self, local_cache: LocalCache[str, int | None]
+    ):
+        """Should propagate loader errors without caching anything."""
+        loader = AsyncMock(side_effect=ConnectionError("down"))
+
+        with pytest.raises(ConnectionError):
+            await local_cache.get_or_load("a", loader)
+
+        assert local_cache.get("a") is MISSING
+
+
+class TestRegistry:
+    """Tests for the local cache registry."""
+
+    def test_configure_applies_settings(self):
+        """Should apply settings to every registered cache."""
+        cache: LocalCache[str, int] = LocalCache("test_local_configure")
+        try:
+            configure_local_caches(enabled=True, max_items=5, ttl=30)
+
+            assert cache.enabled is True
+            assert cache.max_items == 5
+            assert cache.ttl == 30
+        finally:
+            disable_local_caches()
+
+        assert cache.enabled is False
+
+    def test_unregistered_cache_keeps_own_settings(self):
+        """Should leave caches created with register=False alone."""
+        cache: LocalCache[str, int] = LocalCache(
+            "test_local_unregistered", max_items=3, ttl=10, register=False
+        )
+        try:
+            configure_local_caches(enabled=True, max_items=5, ttl=30)
+
+            assert cache.enabled is False
+            assert cache.max_items == 3
+            assert "test_local_unregistered" not in get_local_cache_names()
+        finally:
+            disable_local_caches()
+
+    def test_clear_all(self, local_cache: LocalCache[str, int | None]):
+        """Should clear every cache and report removed entries."""
+        local_cache.set("a", 1)
+
+        cleared = clear_local_caches()
+
+        assert cleared["test_local"] == 1
+        assert len(local_cache) == 0
+        assert "test_local" in get_local_cache_names()
+
+    def test_clear_one(self, local_cache: LocalCache[str, int | None]):
+        """Should clear only the named cache."""
+        local_cache.set("a", 1)
+
+        assert clear_local_caches("test_local") == {"test_local": 1}
+
+    def test_clear_unknown_raises(self):
+        """Should raise KeyError for unknown cache names."""
+        with pytest.raises(KeyError):
+            clear_local_caches("does_not_exist")
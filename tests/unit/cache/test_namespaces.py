@@ -0,0 +1,216 @@
+"""Unit tests for versioned cache namespaces.
+
+Tests cover:
+- Key layout per generation
+- Invalidation by generation bump
+- Loading and background refresh of the generation counters
+- Sweeping keys of superseded generations
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.cache import namespaces
+from app.cache.namespaces import (
+    GENERATIONS_KEY,
+    CacheNamespace,
+    get_generations,
+    invalidate_namespaces,
+    load_generations,
+    namespaced_key,
+    start_generation_refresh,
+    stop_generation_refresh,
+    sweep_orphaned_generations,
+)
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def reset_generations() -> Iterator[None]:
+    """Start and end every test with all namespaces at generation 0."""
+    namespaces._Generations.current = {}
+    yield
+    namespaces._Generations.current = {}
+
+
+def _mock_client(
+    generations: dict[str, int] | None = None,
+    keys: list[bytes] | None = None,
+) -> MagicMock:
+    """Redis mock with a generations hash and a keyspace."""
+    counters = dict(generations or {})
+    keyspace = list(keys or [])
+    client = MagicMock()
+    client.counters = counters
+    client.keyspace = keyspace
+    client.hgetall = AsyncMock(
+        side_effect=lambda _key: {
+            k.encode(): str(v).encode() for k, v in counters.items()
+        }
+    )
+
+    async def scan_iter(match: str, count: int) -> AsyncIterator[bytes]:
+        prefix = match.removesuffix("*").encode()
+        for key in list(keyspace):
+            if key.startswith(prefix):
+                yield key
+
+    def unlink(*names: bytes) -> int:
+        for name in names:
+            keyspace.remove(name)
+        return len(names)
+
+    client.scan_iter = scan_iter
+    client.unlink = AsyncMock(side_effect=unlink)
+
+    pipe = MagicMock()
+    bumped: list[str] = []
+
+    def hincrby(_key: str, field: str, amount: int) -> None:
+        counters[field] = counters.get(field, 0) + amount
+        bumped.append(field)
+
+    pipe.hincrby = MagicMock(side_effect=hincrby)
+    pipe.execute = AsyncMock(side_effect=lambda: [counters[f] for f in bumped])
+    client.pipe = pipe
+    client.pipeline = MagicMock(return_value=pipe)
+    return client
+
+
+class TestNamespacedKey:
+    """Tests for the versioned key layout."""
+
+    def test_generation_zero_keeps_plain_layout(self) -> None:
+        """Should build unversioned keys before any invalidation."""
+        assert namespaced_key("nutrition", "flour") == "nutrition:flour"
+
+    async def test_embeds_current_generation(self) -> None:
+        """Should insert the generation after the namespace."""
+        await load_generations(_mock_client({"nutrition": 3}))
+
+        assert namespaced_key("nutrition", "flour") == "nutrition:g3:flour"
+        assert namespaced_key("allergen", "flour") == "allergen:flour"
+
+
+class TestInvalidateNamespaces:
+    """Tests for invalidation by generation bump."""
+
+    async def test_bumps_only_selected_namespaces(self) -> None:
+        """Should increment the selected counters in one transaction."""
+        client = _mock_client({"nutrition": 1})
+
+        result = await invalidate_namespaces(
+            client, [CacheNamespace.NUTRITION, "allergen"]
+        )
+
+        assert result == {"nutrition": 2, "allergen": 1}
+        client.pipeline.assert_called_once_with(transaction=True)
+        client.pipe.hincrby.assert_any_call(GENERATIONS_KEY, "nutrition", 1)
+        assert namespaced_key("nutrition", "flour") == "nutrition:g2:flour"
+        assert namespaced_key("popular", "popular_recipes") == "popular:popular_recipes"
+
+    async def test_rejects_unknown_namespace(self) -> None:
+        """Should raise for names that are not cache namespaces."""
+        client = _mock_client()
+
+        with pytest.raises(ValueError, match="unknown"):
+            await invalidate_namespaces(client, ["unknown"])
+
+        client.pipe.execute.assert_not_called()
+
+
+class TestGenerationRefresh:
+    """Tests for loading and refreshing the counters."""
+
+    async def test_load_reports_every_namespace(self) -> None:
+        """Should report generation 0 for never invalidated namespaces."""
+        generations = await load_generations(_mock_client({"popular": 2}))
+
+        assert generations["popular"] == 2
+        assert generations["nutrition"] == 0
+        assert set(generations) == {ns.value for ns in CacheNamespace}
+        assert get_generations() == generations
+
+    async def test_background_refresh_picks_up_other_processes(self) -> None:
+        """Should reload counters bumped by another process."""
+        client = _mock_client()
+        start_generation_refresh(client, 0.01)
+        try:
+            client.counters["allergen"] = 4
+            for _ in range(50):
+                if get_generations()["allergen"] == 4:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await stop_generation_refresh()
+
+        assert namespaced_key("allergen", "milk") == "allergen:g4:milk"
+
+    async def test_refresh_disabled_with_zero_interval(self) -> None:
+        """Should not start a task when the interval is 0."""
+        with patch("app.cache.namespaces.asyncio.create_task") as mock_create:
+            start_generation_refresh(_mock_client(), 0)
+
+        mock_create.assert_not_called()
+
+
+class TestSweepOrphanedGenerations:
+    """Tests for the SCAN+UNLINK sweeper."""
+
+    async def test_unlinks_older_generations_only(self) -> None:
+        """Should remove unversioned and older keys, keeping current and newer."""
+        client = _mock_client(
+            {"nutrition": 2},
+            [
+                b"nutrition:flour",
+                b"nutrition:g1:flour",
+                b"nutrition:g2:flour",
+                b"nutrition:g3:flour",
+                b"allergen:flour",
+            ],
+        )
+
+        swept = await sweep_orphaned_generations(client)
+
+        assert swept == {"nutrition": 2}
+        assert client.keyspace == [
+            b"nutrition:g2:flour",
+            b"nutrition:g3:flour",
+            b"allergen:flour",
+        ]
+
+    async def test_skips_never_invalidated_namespaces(self) -> None:
+        """Should not scan namespaces still at generation 0."""
+        client = _mock_client({}, [b"nutrition:flour"])
+
+        assert await sweep_orphaned_generations(client) == {}
+        client.unlink.assert_not_called()
+
+    async def test_unlinks_in_batches(self) -> None:
+        """Should bound the number of keys per UNLINK call."""
+        keys: list[Any] = [f"popular:old:{i}".encode() for i in range(5)]
+        client = _mock_client({"popular": 1}, keys)
+
+        swept = await sweep_orphaned_generations(client, batch_size=2)
+
+        assert swept == {"popular": 5}
+        assert [len(c.args) for c in client.unlink.await_args_list] == [2, 2, 1]
+
+    async def test_reads_generations_from_redis(self) -> None:
+        """Should sweep with the stored counters, not this process's copy."""
+        namespaces._Generations.current = {"nutrition": 5}
+        client = _mock_client({"nutrition": 1}, [b"nutrition:g1:flour"])
+
+        assert await sweep_orphaned_generations(client) == {"nutrition": 0}
+        assert client.keyspace == [b"nutrition:g1:flour"]
@@ -5,6 +5,8 @@ Tests cover:
 - Connection pool closing
 - Client getters
 - Health checks
+- Opt-in client-side near cache wiring
+- Namespace-scoped cache clearing
 """
 
 from __future__ import annotations
@@ -16,8 +18,11 @@ import pytest
 import redis.asyncio as async_redis
 
 import app.cache.redis as redis_module
+from app.cache.client_cache import ClientCachedRedis
+from app.cache.namespaces import CacheNamespace
 from app.cache.redis import (
     check_redis_health,
+    clear_cache,
     close_redis_pools,
     get_cache_client,
     get_queue_client,
@@ -42,6 +47,7 @@ def reset_redis_globals() -> Generator[None]:
     redis_module._cache_client = None
     redis_module._queue_client = None
     redis_module._rate_limit_client = None
+    redis_module._client_cache = None
     yield
     # Cleanup
     redis_module._cache_pool = None
@@ -50,6 +56,24 @@ def reset_redis_globals() -> Generator[None]:
     redis_module._cache_client = None
     redis_module._queue_client = None
     redis_module._rate_limit_client = None
+    redis_module._client_cache = None
+
+
+def _create_mock_settings(*, client_cache_enabled: bool = False) -> MagicMock:
+    """Create mock settings for init_redis_pools."""
+    mock_settings = MagicMock()
+    mock_settings.REDIS_HOST = "localhost"
+    mock_settings.REDIS_PORT = 6379
+    mock_settings.REDIS_CACHE_URL = "redis://localhost:6379/0"
+    mock_settings.REDIS_QUEUE_URL = "redis://localhost:6379/1"
+    mock_settings.REDIS_RATE_LIMIT_URL = "redis://localhost:6379/2"
+    mock_settings.redis_cache_url = "redis://localhost:6379/0"
+    mock_settings.redis.client_cache_enabled = client_cache_enabled
+    mock_settings.redis.client_cache_prefixes = ["nutrition:"]
+    mock_settings.redis.client_cache_max_items = 100
+    mock_settings.redis.client_cache_max_age = 30
+    mock_settings.redis.generation_refresh_interval = 0
+    return mock_settings
 
 
 class TestGetCacheClient:
@@ -109,15 +133,23 @@ class TestGetRateLimitClient:
 class TestInitRedisPools:
     """Tests for init_redis_pools function."""
 
+    @pytest.fixture(autouse=True)
+    def generations(self) -> Generator[tuple[AsyncMock, MagicMock]]:
+        """Stub loading and refreshing the cache namespace generations."""
+        with (
+            patch(
+                "app.cache.redis.load_generations",
+                new_callable=AsyncMock,
+                return_value={},
+            ) as load,
+            patch("app.cache.redis.start_generation_refresh") as start,
+        ):
+            yield load, start
+
     @pytest.mark.asyncio
     async def test_initializes_all_pools(self) -> None:
         """Should initialize all Redis pools."""
-        mock_settings = MagicMock()
-        mock_settings.REDIS_HOST = "localhost"
-        mock_settings.REDIS_PORT = 6379
-        mock_settings.REDIS_CACHE_URL = "redis://localhost:6379/0"
-        mock_settings.REDIS_QUEUE_URL = "redis://localhost:6379/1"
-        mock_settings.REDIS_RATE_LIMIT_URL = "redis://localhost:6379/2"
+        mock_settings = _create_mock_settings()
 
         mock_pool = MagicMock()
         mock_client = AsyncMock()
@@ -137,12 +169,7 @@ class TestInitRedisPools:
     @pytest.mark.asyncio
     async def test_verifies_connections(self) -> None:
         """Should ping all connections to verify."""
-        mock_settings = MagicMock()
-        mock_settings.REDIS_HOST = "localhost"
-        mock_settings.REDIS_PORT = 6379
-        mock_settings.REDIS_CACHE_URL = "redis://localhost:6379/0"
-        mock_settings.REDIS_QUEUE_URL = "redis://localhost:6379/1"
-        mock_settings.REDIS_RATE_LIMIT_URL = "redis://localhost:6379/2"
+        mock_settings = _create_mock_settings()
 
         mock_pool = MagicMock()
         mock_client = AsyncMock()
@@ -158,6 +185,77 @@ class TestInitRedisPools:
             # Should have called ping on all clients (3 times)
             assert mock_client.ping.call_count == 3
 
+    @pytest.mark.asyncio
+    async def test_leaves_cache_client_unwrapped_by_default(self) -> None:
+        """Should not start a near cache unless enabled."""
+        mock_client = AsyncMock()
+
+        with (
+            patch("app.cache.redis.get_settings", return_value=_create_mock_settings()),
+            patch("app.cache.redis.ConnectionPool.from_url", return_value=MagicMock()),
+            patch("app.cache.redis.redis.Redis", return_value=mock_client),
+        ):
+            await init_redis_pools()
+
+        assert get_cache_client() is mock_client
+        assert redis_module._client_cache is None
+
+    @pytest.mark.asyncio
+    async def test_wraps_cache_client_when_near_cache_enabled(self) -> None:
+        """Should put the near cache in front of the cache client."""
+        mock_client = AsyncMock()
+        mock_pool = MagicMock()
+        mock_pool.disconnect = AsyncMock()
+        mock_near_cache = MagicMock()
+        mock_near_cache.close = AsyncMock()
+
+        with (
+            patch(
+                "app.cache.redis.get_settings",
+                return_value=_create_mock_settings(client_cache_enabled=True),
+            ),
+            patch("app.cache.redis.ConnectionPool.from_url", return_value=mock_pool),
+            patch("app.cache.redis.redis.Redis", return_value=mock_client),
+            patch(
+                "app.cache.redis.RedisClientCache", return_value=mock_near_cache
+            ) as mock_cls,
+        ):
+            await init_redis_pools()
+
+        assert isinstance(get_cache_client(), ClientCachedRedis)
+        mock_cls.assert_called_once_with(
+            "redis://localhost:6379/0",
+            ["nutrition:"],
+            max_items=100,
+            max_age=30,
+        )
+        mock_near_cache.start.assert_called_once()
+
+        await close_redis_pools()
+
+        mock_near_cache.close.assert_awaited_once()
+        assert redis_module._client_cache is None
+
+    @pytest.mark.asyncio
+    async def test_loads_cache_generations(
+        self, generations: tuple[AsyncMock, MagicMock]
+    ) -> None:
+        """Should load namespace generations and start refreshing them."""
+        mock_client = AsyncMock()
+        mock_settings = _create_mock_settings()
+        mock_settings.redis.generation_refresh_interval = 5.0
+        load, start = generations
+
+        with (
+            patch("app.cache.redis.get_settings", return_value=mock_settings),
+            patch("app.cache.redis.ConnectionPool.from_url", return_value=MagicMock()),
+            patch("app.cache.redis.redis.Redis", return_value=mock_client),
+        ):
+            await init_redis_pools()
+
+        load.assert_awaited_once_with(mock_client)
+        start.assert_called_once_with(mock_client, 5.0)
+
 
 class TestCloseRedisPools:
     """Tests for close_redis_pools function."""
@@ -263,3 +361,43 @@ class TestCheckRedisHealth:
         assert result["redis_cache"] == "unhealthy"
         assert result["redis_queue"] == "unhealthy"
         assert result["redis_rate_limit"] == "unhealthy"
+
+
+class TestClearCache:
+    """Tests for clear_cache function."""
+
+    @pytest.mark.asyncio
+    async def test_raises_when_not_initialized(self) -> None:
+        """Should raise RuntimeError when client not initialized."""
+        with pytest.raises(RuntimeError, match="not initialized"):
+            await clear_cache()
+
+    @pytest.mark.asyncio
+    async def test_invalidates_all_namespaces_by_default(self) -> None:
+        """Should bump every namespace instead of flushing the database."""
+        mock_client = AsyncMock()
+        redis_module._cache_client = mock_client
+
+        with patch(
+            "app.cache.redis.invalidate_namespaces",
+            new_callable=AsyncMock,
+            return_value={"nutrition": 2},
+        ) as mock_invalidate:
+            result = await clear_cache()
+
+        assert result == {"nutrition": 2}
+        mock_invalidate.assert_awaited_once_with(mock_client, list(CacheNamespace))
+        mock_client.flushdb.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalidates_selected_namespaces(self) -> None:
+        """Should only bump the requested namespaces."""
+        mock_client = AsyncMock()
+        redis_module._cache_client = mock_client
+
+        with patch(
+            "app.cache.redis.invalidate_namespaces", new_callable=AsyncMock
+        ) as mock_invalidate:
+            await clear_cache([CacheNamespace.POPULAR])
+
+        mock_invalidate.assert_awaited_once_with(mock_client, [CacheNamespace.POPULAR])
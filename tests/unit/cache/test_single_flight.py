@@ -0,0 +1,231 @@
+"""Unit tests for single-flight request coalescing.
+
+Tests cover:
+- In-process coalescing of concurrent calls
+- Shared errors and cancellation isolation
+- Redis lock leader, remote follower and fallback paths
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.cache.single_flight import (
+    SINGLE_FLIGHT_CALLS,
+    RedisSingleFlight,
+    SingleFlight,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+def _count(flight: str, role: str) -> float:
+    """Read the current value of the single-flight counter."""
+    return SINGLE_FLIGHT_CALLS.labels(flight=flight, role=role)._value.get()
+
+
+@pytest.fixture
+def mock_redis() -> MagicMock:
+    """Create a mock Redis client for lock operations."""
+    client = MagicMock()
+    client.set = AsyncMock(return_value=True)
+    client.exists = AsyncMock(return_value=1)
+    client.eval = AsyncMock(return_value=1)
+    return client
+
+
+class TestSingleFlight:
+    """Tests for in-process coalescing."""
+
+    async def test_coalesces_concurrent_calls(self):
+        """Should run the work once and share the result with followers."""
+        flight: SingleFlight[str] = SingleFlight("test_flight")
+        release = asyncio.Event()
+        calls = 0
+
+        async def work() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "result"
+
+        followers = _count("test_flight", "follower")
+        pending = [asyncio.create_task(flight.do("key", work)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*pending)
+
+        assert results == ["result"] * 5
+        assert calls == 1
+        assert _count("test_flight", "follower") == followers + 4
+        assert len(flight) == 0
+
+    async def test_different_keys_run_independently(self):
+        """Should not coalesce calls with different keys."""
+        flight: SingleFlight[str] = SingleFlight("test_flight")
+        work = AsyncMock(side_effect=["a", "b"])
+
+        results = await asyncio.gather(flight.do("a", work), flight.do("b", work))
+
+        assert results == ["a", "b"]
+        assert work.await_count == 2
+
+    async def test_errors_are_shared_and_not_remembered(self):
+        """Should raise the leader's error to every caller, then allow retries."""
+        flight: SingleFlight[str] = SingleFlight("test_flight")
+        release = asyncio.Event()
+
+        async def failing() -> str:
+            await release.wait()
+            raise ValueError
+
+        pending = [asyncio.create_task(flight.do("key", failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*pending, return_exceptions=True)
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert await flight.do("key", AsyncMock(return_value="ok")) == "ok"
+
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        """Should keep the shared work running when the leader's caller goes away."""
+        flight: SingleFlight[str] = SingleFlight("test_flight")
+        release = asyncio.Event()
+
+        async def work() -> str:
+            await release.wait()
+            return "result"
+
+        leader = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        release.set()
+
+        assert await follower == "result"
+        assert leader.cancelled()
+
+
+class TestRedisSingleFlight:
+    """Tests for cross-replica coalescing through a Redis lock."""
+
+    async def test_lock_holder_runs_and_releases(self, mock_redis: MagicMock):
+        """Should run the work under the lock and release it afterwards."""
+        flight: RedisSingleFlight[str] = RedisSingleFlight(
+            "test_redis_flight", mock_redis, lock_ttl=30
+        )
+        recheck = AsyncMock(return_value=None)
+
+        result = await flight.do("key", AsyncMock(return_value="fresh"), recheck)
+
+        assert result == "fresh"
+        mock_redis.set.assert_awaited_once()
+        args, kwargs = mock_redis.set.call_args
+        assert args[0] == "lock:key"
+        assert kwargs == {"nx": True, "px": 30_000}
+        recheck.assert_awaited_once()
+        mock_redis.eval.assert_awaited_once()
+        assert mock_redis.eval.call_args.args[2:] == ("lock:key", args[1])
+
+    async def test_lock_holder_uses_result_written_meanwhile(
+        self, mock_redis: MagicMock
+    ):
+        """Should skip the work if the result appeared before the lock was won."""
+        flight: RedisSingleFlight[str] = RedisSingleFlight(
+            "test_redis_flight", mock_redis
+        )
+        work = AsyncMock(return_value="fresh")
+
+        result = await flight.do("key", work, AsyncMock(return_value="cached"))
+
+        assert result == "cached"
+        work.assert_not_awaited()
+
+    async def test_follower_waits_for_remote_result(self, mock_redis: MagicMock):
+        """Should poll the cache instead of generating while another replica works."""
+        mock_redis.set.return_value = None
+        flight: RedisSingleFlight[str] = RedisSingleFlight(
+            "test_redis_flight", mock_redis, poll_interval=0
+        )
+        work = AsyncMock(return_value="fresh")
+        recheck = AsyncMock(side_effect=[None, "remote"])
+        waits = _count("test_redis_flight", "remote_wait")
+
+        result = await flight.do("key", work, recheck)
+
+        assert result == "remote"
+        work.assert_not_awaited()
+        mock_redis.eval.assert_not_awaited()
+        assert _count("test_redis_flight", "remote_wait") == waits + 1
+
+    async def test_follower_falls_back_when_lock_released_without_result(
+        self, mock_redis: MagicMock
+    ):
+        """Should run the work itself when the remote leader gave up."""
+        mock_redis.set.return_value = None
+        mock_redis.exists.return_value = 0
+        flight: RedisSingleFlight[str] = RedisSingleFlight(
+            "test_redis_flight", mock_redis, poll_interval=0
+        )
+        fallbacks = _count("test_redis_flight", "fallback")
+
+        result = await flight.do(
+            "key", AsyncMock(return_value="fresh"), AsyncMock(return_value=None)
+        )
+
+        assert result == "fresh"
+        assert _count("test_redis_flight", "fallback") == fallbacks + 1
+
+    async def test_follower_falls_back_after_timeout(self, mock_redis: MagicMock):
+        """Should stop waiting after wait_timeout."""
+        mock_redis.set.return_value = None
+        flight: RedisSingleFlight[str] = RedisSingleFlight(
+            "test_redis_flight", mock_redis, wait_timeout=0.01, poll_interval=0.005
+        )
+
+        result = await flight.do(
+            "key", AsyncMock(return_value="fresh"), AsyncMock(return_value=None)
+        )
+
+        assert result == "fresh"
+
+    async def test_runs_locally_when_redis_fails(self, mock_redis: MagicMock):
+        """Should not fail the call when the lock cannot be taken."""
+        mock_redis.set.side_effect = ConnectionError("Redis down")
+        flight: RedisSingleFlight[str] = RedisSingleFlight(
+            "test_redis_flight", mock_redis
+        )
+
+        assert await flight.do("key", AsyncMock(return_value="fresh")) == "fresh"
+
+    async def test_release_failure_is_swallowed(self, mock_redis: MagicMock):
+        """Should return the result even if releasing the lock fails."""
+        mock_redis.eval.side_effect = ConnectionError("Redis down")
+        flight: RedisSingleFlight[str] = RedisSingleFlight(
+            "test_redis_flight", mock_redis
+        )
+
+        assert await flight.do("key", AsyncMock(return_value="fresh")) == "fresh"
+
+    async def test_coalesces_in_process_before_locking(self, mock_redis: MagicMock):
+        """Should contend for the lock once per process."""
+        flight: RedisSingleFlight[str] = RedisSingleFlight(
+            "test_redis_flight", mock_redis
+        )
+        release = asyncio.Event()
+
+        async def work() -> str:
+            await release.wait()
+            return "fresh"
+
+        pending = [asyncio.create_task(flight.do("key", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*pending) == ["fresh"] * 3
+        mock_redis.set.assert_awaited_once()
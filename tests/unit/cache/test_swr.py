@@ -0,0 +1,95 @@
+"""Unit tests for stale-while-revalidate cache entries.
+
+Tests cover:
+- Envelope encoding and decoding, including legacy plain entries
+- Staleness
+- Revalidation scheduling and deduplication by job ID
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+
+from app.cache.swr import (
+    SWR_STALE_HITS,
+    decode_swr_entry,
+    encode_swr_entry,
+    schedule_revalidation,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+def _count(cache: str, revalidation: str) -> float:
+    """Read the current value of the stale hit counter."""
+    return SWR_STALE_HITS.labels(cache=cache, revalidation=revalidation)._value.get()
+
+
+class TestEnvelope:
+    """Tests for encoding and decoding entries."""
+
+    def test_round_trip_fresh(self):
+        """Should decode the value and report it fresh before soft expiry."""
+        entry = decode_swr_entry(encode_swr_entry({"a": 1}, 60))
+
+        assert entry.value == {"a": 1}
+        assert entry.stale is False
+
+    def test_stale_after_soft_expiry(self):
+        """Should report the entry stale once the fresh TTL has passed."""
+        with patch("app.cache.swr.time.time", return_value=1000.0):
+            raw = encode_swr_entry([1, 2], 60)
+        entry = decode_swr_entry(raw)
+
+        with patch("app.cache.swr.time.time", return_value=1061.0):
+            assert entry.stale is True
+
+    def test_legacy_entry_is_fresh(self):
+        """Should treat plain JSON written before SWR as a fresh value."""
+        entry = decode_swr_entry(orjson.dumps({"substitutions": []}))
+
+        assert entry.value == {"substitutions": []}
+        assert entry.soft_expires_at is None
+        assert entry.stale is False
+
+    def test_invalid_json_raises(self):
+        """Should raise on corrupted entries so callers treat them as misses."""
+        with pytest.raises(orjson.JSONDecodeError):
+            decode_swr_entry(b"not json")
+
+
+class TestScheduleRevalidation:
+    """Tests for background revalidation scheduling."""
+
+    async def test_enqueues_job_keyed_by_cache_key(self):
+        """Should enqueue the task with a job ID derived from the cache key."""
+        enqueued = _count("test_swr", "enqueued")
+        with patch(
+            "app.workers.jobs.enqueue_job", new_callable=AsyncMock
+        ) as mock_enqueue:
+            mock_enqueue.return_value = MagicMock()
+
+            result = await schedule_revalidation(
+                "test_swr", "key:1", "revalidate_things", "arg", flag=True
+            )
+
+        assert result is True
+        mock_enqueue.assert_awaited_once_with(
+            "revalidate_things", "arg", _job_id="swr:key:1", flag=True
+        )
+        assert _count("test_swr", "enqueued") == enqueued + 1
+
+    async def test_pending_job_is_not_duplicated(self):
+        """Should report a skip when a job for the key is already queued."""
+        skipped = _count("test_swr", "skipped")
+        with patch(
+            "app.workers.jobs.enqueue_job", new_callable=AsyncMock, return_value=None
+        ):
+            result = await schedule_revalidation("test_swr", "key:1", "task")
+
+        assert result is False
+        assert _count("test_swr", "skipped") == skipped + 1
@@ -0,0 +1,374 @@
+"""Unit tests for the shared outbound HTTP client package.
+
+Tests cover:
+- DNS cache hits, expiry, eviction and the caching network backend
+- Per-host request limits, slot release on response close and the pool
+  timeout bounding the wait for a slot
+- New-connection counting through the httpcore trace hook
+- Registry lifecycle and client creation with and without a registry
+- Proxies from the environment
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpcore
+import httpx
+import pytest
+
+from app.clients.http import (
+    CachingNetworkBackend,
+    DnsCache,
+    OutboundTransport,
+    close_http_clients,
+    create_http_client,
+    get_http_client_registry,
+    init_http_clients,
+)
+from app.clients.http.transport import OUTBOUND_CONNECTIONS_OPENED
+from app.core.config.settings import HttpClientSettings
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+pytestmark = pytest.mark.unit
+
+
+def _transport(max_per_host: int = 2) -> OutboundTransport:
+    return OutboundTransport(
+        limits=httpx.Limits(max_connections=10),
+        max_connections_per_host=max_per_host,
+    )
+
+
+class _Body(httpx.AsyncByteStream):
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield b"ok"
+
+
+class _FakeOrigin:
+    """Stands in for httpx's transport, holding requests until released."""
+
+    def __init__(self) -> None:
+        self.started: list[str] = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.started.append(str(request.url))
+        trace = request.extensions["trace"]
+        await trace("connection.connect_tcp.complete", {})
+        await self.release.wait()
+        return httpx.Response(200, stream=_Body())
+
+
+class TestDnsCache:
+    """Tests for DnsCache."""
+
+    async def test_reuses_resolution_within_ttl(self) -> None:
+        """Should resolve a host once while the entry is fresh."""
+        cache = DnsCache(ttl=60)
+        with patch.object(
+            DnsCache, "_lookup", AsyncMock(return_value=["192.0.2.1"])
+        ) as lookup:
+            assert await cache.resolve("example.com", 443) == ["192.0.2.1"]
+            assert await cache.resolve("example.com", 443) == ["192.0.2.1"]
+
+        lookup.assert_awaited_once()
+
+    async def test_resolves_again_after_expiry(self) -> None:
+        """Should not reuse expired entries."""
+        cache = DnsCache(ttl=0)
+        with patch.object(
+            DnsCache, "_lookup", AsyncMock(return_value=["192.0.2.1"])
+        ) as lookup:
+            await cache.resolve("example.com", 443)
+            await cache.resolve("example.com", 443)
+
+        assert lookup.await_count == 2
+
+    async def test_evicts_oldest_entry(self) -> None:
+        """Should keep at most max_entries hosts."""
+        cache = DnsCache(ttl=60, max_entries=2)
+        with patch.object(DnsCache, "_lookup", AsyncMock(return_value=["192.0.2.1"])):
+            for host in ("a.com", "b.com", "c.com"):
+                await cache.resolve(host, 443)
+
+        assert len(cache) == 2
+
+    async def test_resolves_localhost(self) -> None:
+        """Should resolve through the event loop's resolver."""
+        addresses = await DnsCache().resolve("localhost", 80)
+
+        assert addresses
+        assert set(addresses) <= {"127.0.0.1", "::1"}
+
+
+class TestCachingNetworkBackend:
+    """Tests for CachingNetworkBackend."""
+
+    async def test_connects_to_cached_addresses_in_order(self) -> None:
+        """Should fall through to the next address on connect errors."""
+        inner = MagicMock(spec=httpcore.AsyncNetworkBackend)
+        stream = MagicMock()
+        inner.connect_tcp = AsyncMock(
+            side_effect=[httpcore.ConnectError("refused"), stream]
+        )
+        cache = DnsCache()
+        backend = CachingNetworkBackend(cache, inner)
+
+        with patch.object(
+            DnsCache, "_lookup", AsyncMock(return_value=["192.0.2.1", "192.0.2.2"])
+        ):
+            result = await backend.connect_tcp("example.com", 443, timeout=5)
+
+        assert result is stream
+        assert [call.args[0] for call in inner.connect_tcp.await_args_list] == [
+            "192.0.2.1",
+            "192.0.2.2",
+        ]
+
+    async def test_invalidates_when_all_addresses_fail(self) -> None:
+        """Should drop the cached entry and raise the last error."""
+        inner = MagicMock(spec=httpcore.AsyncNetworkBackend)
+        inner.connect_tcp = AsyncMock(side_effect=httpcore.ConnectError("refused"))
+        cache = DnsCache()
+        backend = CachingNetworkBackend(cache, inner)
+
+        with (
+            patch.object(DnsCache, "_lookup", AsyncMock(return_value=["192.0.2.1"])),
+            pytest.raises(httpcore.ConnectError),
+        ):
+            await backend.connect_tcp("example.com", 443)
+
+        assert len(cache) == 0
+
+    async def test_maps_resolution_failure_to_connect_error(self) -> None:
+        """Should raise httpcore.ConnectError so httpx maps it."""
+        backend = CachingNetworkBackend(DnsCache(), MagicMock())
+
+        with (
+            patch.object(DnsCache, "_lookup", AsyncMock(side_effect=OSError("nx"))),
+            pytest.raises(httpcore.ConnectError, match="nx"),
+        ):
+            await backend.connect_tcp("missing.invalid", 443)
+
+    async def test_skips_resolution_for_ip_addresses(self) -> None:
+        """Should connect to literal addresses directly."""
+        inner = MagicMock(spec=httpcore.AsyncNetworkBackend)
+        inner.connect_tcp = AsyncMock()
+        backend = CachingNetworkBackend(DnsCache(), inner)
+
+        with patch.object(DnsCache, "_lookup", AsyncMock()) as lookup:
+            await backend.connect_tcp("127.0.0.1", 8080)
+
+        lookup.assert_not_awaited()
+        assert inner.connect_tcp.await_args.args[0] == "127.0.0.1"
+
+
+class TestOutboundTransport:
+    """Tests for OutboundTransport."""
+
+    async def test_limits_concurrent_requests_per_host(self) -> None:
+        """Should queue requests beyond the per-host limit."""
+        origin = _FakeOrigin()
+        transport = _transport(max_per_host=2)
+
+        with patch.object(httpx.AsyncHTTPTransport, "handle_async_request", origin):
+            tasks = [
+                asyncio.create_task(
+                    transport.handle_async_request(
+                        httpx.Request("GET", f"https://a.com/{i}")
+                    )
+                )
+                for i in range(3)
+            ]
+            other = asyncio.create_task(
+                transport.handle_async_request(httpx.Request("GET", "https://b.com/"))
+            )
+            await asyncio.sleep(0.01)
+
+            assert len(origin.started) == 3
+            assert "https://b.com/" in origin.started
+
+            origin.release.set()
+            responses = await asyncio.gather(*tasks[:2], other)
+            await asyncio.sleep(0)
+            assert len(origin.started) == 3
+
+            # Closing a response frees its slot for the queued request
+            await responses[0].aclose()
+            third = await tasks[2]
+
+        assert len(origin.started) == 4
+        for response in (*responses[1:], third):
+            await response.aclose()
+        assert transport.pool_stats().hosts == 0
+
+    async def test_releases_slot_on_error(self) -> None:
+        """Should free the host slot when sending fails."""
+        transport = _transport(max_per_host=1)
+        fail = AsyncMock(side_effect=httpx.ConnectError("refused"))
+
+        with patch.object(httpx.AsyncHTTPTransport, "handle_async_request", fail):
+            for _ in range(2):
+                with pytest.raises(httpx.ConnectError):
+                    await transport.handle_async_request(
+                        httpx.Request("GET", "https://a.com/")
+                    )
+
+        assert transport.pool_stats().hosts == 0
+
+    async def test_pool_timeout_bounds_wait_for_slot(self) -> None:
+        """Should raise PoolTimeout when no slot frees up in time."""
+        origin = _FakeOrigin()
+        transport = _transport(max_per_host=1)
+
+        with patch.object(httpx.AsyncHTTPTransport, "handle_async_request", origin):
+            first = asyncio.create_task(
+                transport.handle_async_request(httpx.Request("GET", "https://a.com/"))
+            )
+            await asyncio.sleep(0)
+            request = httpx.Request(
+                "GET",
+                "https://a.com/",
+                extensions={"timeout": httpx.Timeout(5.0, pool=0.01).as_dict()},
+            )
+            with pytest.raises(httpx.PoolTimeout):
+                await transport.handle_async_request(request)
+
+            origin.release.set()
+            await (await first).aclose()
+
+        assert len(origin.started) == 1
+        assert transport.pool_stats().hosts == 0
+
+    async def test_unlimited_requests_skip_host_slots(self) -> None:
+        """Should not queue requests of clients exempt from the per-host limit."""
+        origin = _FakeOrigin()
+        transport = _transport(max_per_host=1)
+
+        with patch.object(httpx.AsyncHTTPTransport, "handle_async_request", origin):
+            tasks = [
+                asyncio.create_task(
+                    transport.send_request(
+                        httpx.Request("GET", "https://auth.internal/"),
+                        client="internal",
+                        limit_per_host=False,
+                    )
+                )
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0.01)
+
+            assert len(origin.started) == 2
+            assert transport.pool_stats().hosts == 0
+
+            origin.release.set()
+            for response in await asyncio.gather(*tasks):
+                await response.aclose()
+
+    async def test_counts_new_connections(self) -> None:
+        """Should count connect events reported by httpcore's trace hook."""
+        origin = _FakeOrigin()
+        origin.release.set()
+        transport = _transport()
+        counter = OUTBOUND_CONNECTIONS_OPENED.labels(client="trace_test")
+        before = counter._value.get()  # type: ignore[attr-defined]
+        seen: list[str] = []
+
+        async def inner_trace(event: str, _info: dict[str, Any]) -> None:
+            seen.append(event)
+
+        request = httpx.Request(
+            "GET", "https://a.com/", extensions={"trace": inner_trace}
+        )
+        with patch.object(httpx.AsyncHTTPTransport, "handle_async_request", origin):
+            response = await transport.send_request(request, client="trace_test")
+        await response.aclose()
+
+        assert counter._value.get() == before + 1  # type: ignore[attr-defined]
+        assert seen == ["connection.connect_tcp.complete"]
+
+    def test_reports_empty_pool(self) -> None:
+        """Should report no connections before any request."""
+        stats = _transport().pool_stats()
+
+        assert (stats.active, stats.idle, stats.hosts) == (0, 0, 0)
+
+
+class TestRegistry:
+    """Tests for the global registry."""
+
+    async def test_clients_share_the_transport(self) -> None:
+        """Should route named clients through one transport that outlives them."""
+        registry = init_http_clients(HttpClientSettings(http2=False))
+        try:
+            assert get_http_client_registry() is registry
+            first = create_http_client("first")
+            second = create_http_client("second")
+
+            with patch.object(registry.transport, "send_request", AsyncMock()) as send:
+                send.return_value = httpx.Response(200)
+                await first.get("https://a.com/")
+                await second.get("https://a.com/")
+
+            assert [call.kwargs["client"] for call in send.await_args_list] == [
+                "first",
+                "second",
+            ]
+            assert all(call.kwargs["limit_per_host"] for call in send.await_args_list)
+
+            with patch.object(registry.transport, "aclose", AsyncMock()) as aclose:
+                await first.aclose()
+                await second.aclose()
+            aclose.assert_not_awaited()
+        finally:
+            await close_http_clients()
+
+        assert get_http_client_registry() is None
+
+    async def test_client_without_registry_owns_its_transport(self) -> None:
+        """Should close a standalone client's transport with the client."""
+        client = create_http_client("standalone", timeout=5.0)
+
+        with patch.object(OutboundTransport, "aclose", AsyncMock()) as aclose:
+            await client.aclose()
+
+        aclose.assert_awaited_once()
+        assert client.timeout == httpx.Timeout(5.0)
+
+    async def test_mounts_proxies_from_environment(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should send through HTTPS_PROXY except for NO_PROXY hosts."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+        monkeypatch.setenv("NO_PROXY", "auth.internal")
+        client = create_http_client("proxied")
+
+        try:
+            proxied = client._transport_for_url(httpx.URL("https://a.com/"))
+            direct = client._transport_for_url(httpx.URL("https://auth.internal/"))
+
+            assert isinstance(proxied, httpx.AsyncHTTPTransport)
+            assert direct is client._transport
+        finally:
+            await client.aclose()
+
+    async def test_ignores_proxies_without_trust_env(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should not mount proxies when the client does not trust the environment."""
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+        client = create_http_client("untrusted", trust_env=False)
+
+        try:
+            assert client._transport_for_url(httpx.URL("https://a.com/")) is (
+                client._transport
+            )
+        finally:
+            await client.aclose()
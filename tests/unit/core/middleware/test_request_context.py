@@ -0,0 +1,148 @@
+"""Unit tests for the fused request context middleware.
+
+Tests cover:
+- Request ID generation, propagation and request state
+- Timing header and slow request logging
+- Security headers
+- Request/response logging and excluded paths
+- Non-HTTP scopes
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core.middleware.request_context import RequestContextMiddleware
+from app.core.middleware.security_headers import DEFAULT_CONTENT_SECURITY_POLICY
+
+
+if TYPE_CHECKING:
+    from starlette.requests import Request
+
+
+pytestmark = pytest.mark.unit
+
+
+async def _echo_request_id(request: Request) -> JSONResponse:
+    return JSONResponse({"request_id": request.state.request_id})
+
+
+def _client(**kwargs: object) -> TestClient:
+    app = Starlette(
+        routes=[
+            Route("/api/test", _echo_request_id),
+            Route("/health", _echo_request_id),
+        ]
+    )
+    return TestClient(RequestContextMiddleware(app, **kwargs))  # type: ignore[arg-type]
+
+
+class TestRequestContextMiddleware:
+    """Tests for RequestContextMiddleware."""
+
+    def test_generates_request_id(self) -> None:
+        """Should generate a request ID and expose it in state and headers."""
+        response = _client().get("/api/test")
+
+        request_id = response.headers["X-Request-ID"]
+        assert len(request_id) == 36
+        assert response.json()["request_id"] == request_id
+
+    def test_propagates_request_id(self) -> None:
+        """Should reuse the incoming X-Request-ID header."""
+        response = _client().get("/api/test", headers={"X-Request-ID": "abc-123"})
+
+        assert response.headers["X-Request-ID"] == "abc-123"
+        assert response.json()["request_id"] == "abc-123"
+
+    def test_adds_timing_header(self) -> None:
+        """Should add processing time in milliseconds."""
+        response = _client().get("/api/test")
+
+        timing = response.headers["X-Process-Time"]
+        assert timing.endswith("ms")
+        assert float(timing[:-2]) >= 0
+
+    def test_adds_security_headers(self) -> None:
+        """Should add the security headers to every response."""
+        response = _client().get("/health")
+
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+        assert response.headers["X-Frame-Options"] == "DENY"
+        assert response.headers["X-XSS-Protection"] == "1; mode=block"
+        assert "max-age=31536000" in response.headers["Strict-Transport-Security"]
+        assert response.headers["Content-Security-Policy"] == (
+            DEFAULT_CONTENT_SECURITY_POLICY
+        )
+        assert "camera=()" in response.headers["Permissions-Policy"]
+        assert "Cache-Control" not in response.headers
+
+    def test_adds_no_cache_headers_for_api_paths(self) -> None:
+        """Should prevent caching of /api/ responses."""
+        response = _client().get("/api/test")
+
+        assert "no-store" in response.headers["Cache-Control"]
+        assert response.headers["Pragma"] == "no-cache"
+
+    def test_custom_policies(self) -> None:
+        """Should use custom CSP and permissions policies."""
+        response = _client(
+            content_security_policy="default-src 'none'",
+            permissions_policy="camera=()",
+        ).get("/api/test")
+
+        assert response.headers["Content-Security-Policy"] == "default-src 'none'"
+        assert response.headers["Permissions-Policy"] == "camera=()"
+
+    def test_logs_request_and_response(self) -> None:
+        """Should log start and completion with bound request fields."""
+        with (
+            patch("app.core.middleware.request_context.logger") as mock_logger,
+            patch("app.core.middleware.request_context.bind_context") as mock_bind,
+        ):
+            _client().get(
+                "/api/test?q=1", headers={"X-Forwarded-For": "10.0.0.1, 10.0.0.2"}
+            )
+
+        messages = [c.args[0] for c in mock_logger.info.call_args_list]
+        assert messages == ["Request started", "Request completed"]
+        assert mock_logger.info.call_args_list[0].kwargs["query_params"] == "q=1"
+        assert mock_logger.info.call_args_list[1].kwargs["status_code"] == 200
+        request_fields = mock_bind.call_args_list[1].kwargs
+        assert request_fields["method"] == "GET"
+        assert request_fields["path"] == "/api/test"
+        assert request_fields["client_ip"] == "10.0.0.1"
+
+    def test_skips_logging_for_excluded_paths(self) -> None:
+        """Should not log requests to excluded paths."""
+        with patch("app.core.middleware.request_context.logger") as mock_logger:
+            response = _client(exclude_paths={"/health"}).get("/health")
+
+        mock_logger.info.assert_not_called()
+        assert "X-Request-ID" in response.headers
+
+    def test_logs_slow_requests(self) -> None:
+        """Should warn when a request exceeds the slow threshold."""
+        with patch("app.core.middleware.request_context.logger") as mock_logger:
+            _client(slow_threshold=-1.0).get("/api/test")
+
+        mock_logger.warning.assert_called_once()
+        assert mock_logger.warning.call_args.kwargs["path"] == "/api/test"
+
+    async def test_passes_through_non_http_scopes(self) -> None:
+        """Should forward lifespan and websocket scopes untouched."""
+        app = AsyncMock()
+        middleware = RequestContextMiddleware(app)
+        scope = {"type": "lifespan"}
+        receive, send = AsyncMock(), AsyncMock()
+
+        await middleware(scope, receive, send)
+
+        app.assert_awaited_once_with(scope, receive, send)
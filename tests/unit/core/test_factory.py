@@ -14,6 +14,7 @@ import pytest
 from fastapi import FastAPI
 
 from app.core.config import Settings
+from app.core.middleware.request_context import RequestContextMiddleware
 from app.factory import _setup_middleware, _setup_routers, create_app
 
 
@@ -155,9 +156,9 @@ class TestSetupMiddleware:
 
         _setup_middleware(app, mock_settings)
 
-        # Should have added 5 middleware (no CORS)
-        # GZip, Logging, Timing, RequestID, SecurityHeaders
-        assert len(app.user_middleware) == 5
+        # Should have added 2 middleware (no CORS): GZip, RequestContext
+        assert len(app.user_middleware) == 2
+        assert app.user_middleware[0].cls is RequestContextMiddleware
 
     def test_adds_cors_middleware_when_origins_set(self) -> None:
         """Should add CORS middleware when origins configured."""
@@ -167,8 +168,8 @@ class TestSetupMiddleware:
 
         _setup_middleware(app, mock_settings)
 
-        # Should have added 6 middleware (including CORS)
-        assert len(app.user_middleware) == 6
+        # Should have added 3 middleware (including CORS)
+        assert len(app.user_middleware) == 3
 
 
 class TestSetupRouters:
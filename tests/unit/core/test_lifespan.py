@@ -15,7 +15,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from app.core.config import AuthMode
+from app.core.config.settings import (
+    GroqRateLimitSettings,
+    HttpClientSettings,
+    LLMBatchingSettings,
+)
 from app.core.events.lifespan import (
+    _init_ingredient_index,
     _init_llm_client,
     _LLMClientHolder,
     _shutdown_llm_client,
@@ -67,8 +73,19 @@ def _create_mock_settings(
     mock_settings.llm.groq.timeout = 30.0
     mock_settings.llm.groq.max_retries = 3
     mock_settings.llm.groq.requests_per_minute = 30.0
+    mock_settings.llm.groq.rate_limit = GroqRateLimitSettings()
+    mock_settings.llm.batching = LLMBatchingSettings(enabled=False)
     mock_settings.GROQ_API_KEY = groq_api_key
 
+    # Database reference data settings
+    mock_settings.database.ingredient_index.enabled = False
+    mock_settings.database.reference_cache.enabled = False
+    mock_settings.database.reference_cache.max_items = 100
+    mock_settings.database.reference_cache.ttl = 60
+    mock_settings.scraping.parse_executor.mode = "inline"
+    mock_settings.scraping.parse_executor.max_workers = 1
+    mock_settings.http_client = HttpClientSettings()
+
     return mock_settings
 
 
@@ -786,6 +803,50 @@ class TestGetLLMClient:
 # =============================================================================
 
 
+class TestIngredientIndexInitialization:
+    """Tests for ingredient name index initialization."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_config(self) -> None:
+        """Should not load the index when disabled."""
+        mock_settings = _create_mock_settings()
+        mock_settings.database.ingredient_index.enabled = False
+
+        with patch(
+            "app.core.events.lifespan.init_ingredient_index", new_callable=AsyncMock
+        ) as mock_init:
+            await _init_ingredient_index(mock_settings)
+
+        mock_init.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_loads_with_refresh_interval(self) -> None:
+        """Should load the index with the configured refresh interval."""
+        mock_settings = _create_mock_settings()
+        mock_settings.database.ingredient_index.enabled = True
+        mock_settings.database.ingredient_index.refresh_interval = 600
+
+        with patch(
+            "app.core.events.lifespan.init_ingredient_index", new_callable=AsyncMock
+        ) as mock_init:
+            await _init_ingredient_index(mock_settings)
+
+        mock_init.assert_awaited_once_with(600)
+
+    @pytest.mark.asyncio
+    async def test_failure_continues(self) -> None:
+        """Should swallow load failures and fall back to SQL resolution."""
+        mock_settings = _create_mock_settings()
+        mock_settings.database.ingredient_index.enabled = True
+
+        with patch(
+            "app.core.events.lifespan.init_ingredient_index",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("Database pool not initialized"),
+        ):
+            await _init_ingredient_index(mock_settings)
+
+
 class TestServiceInitializationFailures:
     """Tests for service initialization failure handling."""
 
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.database.ingredient_index import IngredientNameIndex
 from app.database.repositories.allergen import AllergenData, AllergenRepository
 
 
@@ -212,7 +213,6 @@ class TestGetByIngredientNameFuzzy:
     ) -> None:
         """Should return empty list when no fuzzy match found."""
         conn = mock_pool.acquire.return_value.__aenter__.return_value
-        conn.fetchrow.return_value = None
         conn.fetch.return_value = []
 
         result = await repository.get_by_ingredient_name_fuzzy("nonexistent")
@@ -227,8 +227,7 @@ class TestGetByIngredientNameFuzzy:
     ) -> None:
         """Should return allergen data for fuzzy matched ingredient."""
         conn = mock_pool.acquire.return_value.__aenter__.return_value
-        conn.fetchrow.return_value = sample_row
-        conn.fetch.return_value = [sample_row]
+        conn.fetch.return_value = [{"query_name": "flor", **sample_row}]
 
         result = await repository.get_by_ingredient_name_fuzzy("flor")  # Misspelled
 
@@ -243,8 +242,7 @@ class TestGetByIngredientNameFuzzy:
     ) -> None:
         """Should log debug message when fuzzy match differs from query."""
         conn = mock_pool.acquire.return_value.__aenter__.return_value
-        conn.fetchrow.return_value = sample_row
-        conn.fetch.return_value = [sample_row]
+        conn.fetch.return_value = [{"query_name": "flor", **sample_row}]
 
         result = await repository.get_by_ingredient_name_fuzzy("flor")  # Misspelled
 
@@ -259,7 +257,7 @@ class TestGetByIngredientNameFuzzy:
     ) -> None:
         """Should return empty list when pg_trgm extension not available."""
         conn = mock_pool.acquire.return_value.__aenter__.return_value
-        conn.fetchrow.side_effect = Exception(
+        conn.fetch.side_effect = Exception(
             "function similarity(text, text) does not exist"
         )
 
@@ -274,12 +272,68 @@ class TestGetByIngredientNameFuzzy:
     ) -> None:
         """Should raise on non-pg_trgm errors."""
         conn = mock_pool.acquire.return_value.__aenter__.return_value
-        conn.fetchrow.side_effect = Exception("Connection error")
+        conn.fetch.side_effect = Exception("Connection error")
 
         with pytest.raises(Exception, match="Connection error"):
             await repository.get_by_ingredient_name_fuzzy("flour")
 
 
+class TestGetByIngredientNamesFuzzy:
+    """Tests for get_by_ingredient_names_fuzzy method."""
+
+    async def test_returns_empty_dict_for_empty_list(
+        self,
+        repository: AllergenRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Should not query the database for empty input."""
+        result = await repository.get_by_ingredient_names_fuzzy([])
+
+        assert result == {}
+        mock_pool.acquire.assert_not_called()
+
+    async def test_groups_rows_by_query_name(
+        self,
+        repository: AllergenRepository,
+        mock_pool: MagicMock,
+        sample_row: dict[str, object],
+    ) -> None:
+        """Should map each query name to the allergens of its best match."""
+        wheat_row = {**sample_row, "allergen_type": "WHEAT"}
+        null_row = {**sample_row, "allergen_type": None}
+
+        conn = mock_pool.acquire.return_value.__aenter__.return_value
+        conn.fetch.return_value = [
+            {"query_name": "flor", **sample_row},
+            {"query_name": "flor", **wheat_row},
+            {"query_name": "wheat flour", **null_row},
+        ]
+
+        result = await repository.get_by_ingredient_names_fuzzy(
+            ["flor", "wheat flour", "unicorn"]
+        )
+
+        assert set(result) == {"flor"}
+        assert [d.allergen_type for d in result["flor"]] == ["GLUTEN", "WHEAT"]
+
+    async def test_uses_single_statement(
+        self,
+        repository: AllergenRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Should resolve all names with one deduplicated query."""
+        conn = mock_pool.acquire.return_value.__aenter__.return_value
+        conn.fetch.return_value = []
+
+        await repository.get_by_ingredient_names_fuzzy(["flour", "milk", "flour"])
+
+        conn.fetch.assert_awaited_once()
+        conn.fetchrow.assert_not_called()
+        query, names, _ = conn.fetch.call_args.args
+        assert "LATERAL" in query
+        assert names == ["flour", "milk"]
+
+
 class TestPoolProperty:
     """Tests for pool property."""
 
@@ -307,6 +361,71 @@ class TestPoolProperty:
         assert result is mock_global_pool
 
 
+class TestNameIndexResolution:
+    """Tests for exact name resolution through the ingredient index."""
+
+    @pytest.fixture
+    def indexed_repository(self, mock_pool: MagicMock) -> AllergenRepository:
+        """Create repository with an injected name index."""
+        index = IngredientNameIndex([(1, "flour"), (2, "milk")])
+        return AllergenRepository(pool=mock_pool, name_index=index)
+
+    async def test_exact_lookup_queries_by_id(
+        self,
+        indexed_repository: AllergenRepository,
+        mock_pool: MagicMock,
+        sample_row: dict[str, object],
+    ) -> None:
+        """Should resolve the name in-process and query by primary key."""
+        conn = mock_pool.acquire.return_value.__aenter__.return_value
+        conn.fetch.return_value = [sample_row]
+
+        result = await indexed_repository.get_by_ingredient_name("FLOUR")
+
+        assert len(result) == 1
+        query, ingredient_id = conn.fetch.call_args.args
+        assert "i.ingredient_id = $1" in query
+        assert ingredient_id == 1
+
+    async def test_batch_lookup_queries_by_ids(
+        self,
+        indexed_repository: AllergenRepository,
+        mock_pool: MagicMock,
+        sample_row: dict[str, object],
+    ) -> None:
+        """Should query resolved IDs, and names the index misses by name."""
+        conn = mock_pool.acquire.return_value.__aenter__.return_value
+        conn.fetch.side_effect = [[sample_row], []]
+
+        result = await indexed_repository.get_by_ingredient_names(["flour", "tofu"])
+
+        assert list(result) == ["flour"]
+        (id_query, ids), (name_query, names) = (
+            call.args for call in conn.fetch.call_args_list
+        )
+        assert "ANY($1::int[])" in id_query
+        assert ids == [1]
+        assert "LOWER(i.name)" in name_query
+        assert names == ["tofu"]
+
+    async def test_index_miss_falls_back_to_name_query(
+        self,
+        indexed_repository: AllergenRepository,
+        mock_pool: MagicMock,
+        sample_row: dict[str, object],
+    ) -> None:
+        """Should query by name for ingredients added after the snapshot."""
+        conn = mock_pool.acquire.return_value.__aenter__.return_value
+        conn.fetch.return_value = [sample_row]
+
+        result = await indexed_repository.get_by_ingredient_name("tofu")
+
+        assert len(result) == 1
+        query, name = conn.fetch.call_args.args
+        assert "LOWER(i.name) = LOWER($1)" in query
+        assert name == "tofu"
+
+
 class TestBatchLookupEdgeCases:
     """Tests for batch lookup edge cases."""
 
@@ -0,0 +1,235 @@
+"""Unit tests for the in-process ingredient name index.
+
+Tests cover:
+- pg_trgm-compatible trigram extraction and similarity
+- Exact, prefix, contains and trigram resolution ranking
+- Loading and global index lifecycle
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import app.database.ingredient_index as index_module
+from app.database.ingredient_index import (
+    MATCH_RANK_CONTAINS,
+    MATCH_RANK_EXACT,
+    MATCH_RANK_PREFIX,
+    MATCH_RANK_TRIGRAM,
+    IngredientNameIndex,
+    close_ingredient_index,
+    get_ingredient_index,
+    init_ingredient_index,
+    load_ingredient_index,
+    refresh_ingredient_index,
+    similarity,
+    trigrams,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def index() -> IngredientNameIndex:
+    """Create an index over a small catalog."""
+    return IngredientNameIndex(
+        [
+            (1, "Butter, salted"),
+            (2, "Butter, without salt"),
+            (3, "Peanut butter, smooth"),
+            (4, "Chicken breast"),
+            (5, "Garlic"),
+            (6, "Tomatoes, red, ripe, raw"),
+        ]
+    )
+
+
+@pytest.fixture
+def mock_pool() -> MagicMock:
+    """Create a mock asyncpg pool returning catalog rows."""
+    mock_conn = AsyncMock()
+    mock_conn.fetch = AsyncMock(
+        return_value=[
+            {"ingredient_id": 1, "name": "Garlic"},
+            {"ingredient_id": 2, "name": "Onion"},
+        ]
+    )
+    pool = MagicMock()
+    pool.acquire = MagicMock(return_value=AsyncMock())
+    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
+    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+    return pool
+
+
+@pytest.fixture(autouse=True)
+async def reset_global_index():
+    """Ensure the global index does not leak between tests."""
+    yield
+    await close_ingredient_index()
+
+
+class TestTrigrams:
+    """Tests for pg_trgm-compatible trigram functions."""
+
+    def test_pads_words(self):
+        """Should pad each word with two leading and one trailing space."""
+        assert trigrams("cat") == {"  c", " ca", "cat", "at "}
+
+    def test_splits_on_non_alphanumerics(self):
+        """Should treat punctuation as word separators and lowercase input."""
+        assert trigrams("A,b") == {"  a", " a ", "  b", " b "}
+
+    def test_matches_pg_trgm_similarity(self):
+        """Should reproduce the documented pg_trgm example value."""
+        assert similarity("word", "two words") == pytest.approx(0.363636, abs=1e-6)
+
+    def test_similarity_of_empty_string_is_zero(self):
+        """Should return 0.0 when either side has no trigrams."""
+        assert similarity("", "garlic") == 0.0
+
+
+class TestIngredientNameIndex:
+    """Tests for IngredientNameIndex resolution."""
+
+    def test_len(self, index: IngredientNameIndex):
+        """Should report the number of indexed ingredients."""
+        assert len(index) == 6
+
+    def test_resolve_exact_is_case_insensitive(self, index: IngredientNameIndex):
+        """Should resolve exact names regardless of case."""
+        assert index.resolve_exact("GARLIC") == 5
+        assert index.resolve_exact("garlic clove") is None
+
+    def test_split_exact_keeps_misses(self, index: IngredientNameIndex):
+        """Should return the IDs found and the names not in the index."""
+        ids, missing = index.split_exact(["Garlic", "tofu", "chicken breast"])
+
+        assert ids == [5, 4]
+        assert missing == ["tofu"]
+
+    def test_exact_match_ranks_first(self, index: IngredientNameIndex):
+        """Should return an exact match with rank 0."""
+        match = index.resolve("chicken breast")
+
+        assert match is not None
+        assert match.ingredient_id == 4
+        assert match.match_rank == MATCH_RANK_EXACT
+        assert match.similarity == 1.0
+
+    def test_prefix_match_prefers_similarity_then_length(
+        self, index: IngredientNameIndex
+    ):
+        """Should pick the most similar, then shortest, prefix match."""
+        match = index.resolve("butter")
+
+        assert match is not None
+        assert match.ingredient_id == 1
+        assert match.match_rank == MATCH_RANK_PREFIX
+
+    def test_contains_match(self, index: IngredientNameIndex):
+        """Should fall back to substring matches."""
+        match = index.resolve("red, ripe")
+
+        assert match is not None
+        assert match.ingredient_id == 6
+        assert match.match_rank == MATCH_RANK_CONTAINS
+
+    def test_trigram_match(self, index: IngredientNameIndex):
+        """Should fall back to trigram similarity above the threshold."""
+        match = index.resolve("garlick")
+
+        assert match is not None
+        assert match.ingredient_id == 5
+        assert match.match_rank == MATCH_RANK_TRIGRAM
+        assert match.similarity == pytest.approx(similarity("garlick", "garlic"))
+
+    def test_trigram_threshold(self, index: IngredientNameIndex):
+        """Should return None when similarity does not exceed the threshold."""
+        assert index.resolve("garlick", min_similarity=0.99) is None
+        assert index.resolve("zzzz") is None
+        assert index.resolve("") is None
+
+    def test_resolve_many_skips_unmatched(self, index: IngredientNameIndex):
+        """Should map each matched query name to its best match."""
+        matches = index.resolve_many(["garlic", "zzzz", "butter", "garlic"])
+
+        assert set(matches) == {"garlic", "butter"}
+        assert matches["garlic"].ingredient_id == 5
+        assert matches["butter"].ingredient_id == 1
+
+
+class TestIndexLifecycle:
+    """Tests for loading and the global index lifecycle."""
+
+    async def test_load_builds_from_catalog(self, mock_pool: MagicMock):
+        """Should build an index from catalog rows in one query."""
+        loaded = await load_ingredient_index(mock_pool)
+
+        assert len(loaded) == 2
+        assert loaded.resolve_exact("onion") == 2
+
+    async def test_get_returns_none_before_init(self):
+        """Should return None when the index has not been loaded."""
+        assert get_ingredient_index() is None
+
+    async def test_init_and_close(
+        self, mock_pool: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Should load the global index, start refresh and clean up on close."""
+        monkeypatch.setattr(index_module, "get_database_pool", lambda: mock_pool)
+
+        await init_ingredient_index(refresh_interval=3600)
+
+        loaded = get_ingredient_index()
+        assert loaded is not None
+        assert loaded.resolve_exact("garlic") == 1
+        task = index_module._IndexHolder.refresh_task
+        assert task is not None
+
+        await close_ingredient_index()
+
+        assert get_ingredient_index() is None
+        assert task.cancelled()
+
+    async def test_init_without_refresh(
+        self, mock_pool: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Should not start a refresh task when the interval is zero."""
+        monkeypatch.setattr(index_module, "get_database_pool", lambda: mock_pool)
+
+        await init_ingredient_index(refresh_interval=0)
+
+        assert index_module._IndexHolder.refresh_task is None
+
+    async def test_refresh_failure_keeps_previous_snapshot(
+        self, mock_pool: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Should keep serving the old index when a reload fails."""
+        monkeypatch.setattr(index_module, "get_database_pool", lambda: mock_pool)
+        await init_ingredient_index(refresh_interval=0)
+        previous = get_ingredient_index()
+
+        monkeypatch.setattr(
+            index_module,
+            "get_database_pool",
+            MagicMock(side_effect=RuntimeError("Database pool not initialized")),
+        )
+        await refresh_ingredient_index()
+
+        assert get_ingredient_index() is previous
+
+    async def test_periodic_refresh_reloads(
+        self, mock_pool: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Should reload the catalog after each refresh interval."""
+        monkeypatch.setattr(index_module, "get_database_pool", lambda: mock_pool)
+
+        await init_ingredient_index(refresh_interval=0.01)
+        first = get_ingredient_index()
+        await asyncio.sleep(0.05)
+
+        assert get_ingredient_index() is not first
@@ -10,10 +10,13 @@ Tests cover:
 from __future__ import annotations
 
 from decimal import Decimal
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.cache.local import configure_local_caches, disable_local_caches
+from app.database.ingredient_index import IngredientNameIndex
 from app.database.repositories.nutrition import (
     MacronutrientsData,
     MineralsData,
@@ -23,6 +26,9 @@ from app.database.repositories.nutrition import (
 )
 
 
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
 pytestmark = pytest.mark.unit
 
 
@@ -618,22 +624,14 @@ class TestGetByIngredientNamesFuzzy:
             "zinc_mg": None,
         }
 
-        # Mock to return butter_row for "butter", milk_row for "milk", None for "unicorn"
+        # One statement returns the best match per matched query name
         mock_conn = AsyncMock()
-
-        call_count = 0
-
-        async def mock_fetchrow(query: str, *args: object) -> dict | None:
-            nonlocal call_count
-            call_count += 1
-            name = args[0] if args else None
-            if name == "butter":
-                return butter_row
-            if name == "milk":
-                return milk_row
-            return None
-
-        mock_conn.fetchrow = mock_fetchrow
+        mock_conn.fetch = AsyncMock(
+            return_value=[
+                {"query_name": "butter", **butter_row},
+                {"query_name": "milk", **milk_row},
+            ]
+        )
         mock_pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
 
         result = await repository.get_by_ingredient_names_fuzzy(
@@ -647,24 +645,196 @@ class TestGetByIngredientNamesFuzzy:
         assert result["milk"].ingredient_name == "Milk, whole"
 
     @pytest.mark.asyncio
-    async def test_runs_searches_in_parallel(
+    async def test_uses_single_statement(
         self,
         repository: NutritionRepository,
         mock_pool: MagicMock,
     ) -> None:
-        """Should run fuzzy searches in parallel for efficiency."""
+        """Should resolve all names with one query on one connection."""
         mock_conn = AsyncMock()
+        mock_conn.fetch = AsyncMock(return_value=[])
         mock_conn.fetchrow = AsyncMock(return_value=None)
         mock_pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
 
-        # This test just verifies the method doesn't raise an error
-        # In a real integration test, we could verify parallel execution timing
         result = await repository.get_by_ingredient_names_fuzzy(
-            ["butter", "milk", "flour"]
+            ["butter", "milk", "flour", "butter"]
+        )
+
+        assert result == {}
+        mock_pool.acquire.assert_called_once()
+        mock_conn.fetch.assert_awaited_once()
+        mock_conn.fetchrow.assert_not_called()
+        query, names, min_similarity = mock_conn.fetch.call_args.args
+        assert "unnest($1::text[])" in query
+        assert "LATERAL" in query
+        assert names == ["butter", "milk", "flour"]
+        assert min_similarity == 0.3
+
+    @pytest.mark.asyncio
+    async def test_returns_empty_when_pg_trgm_missing(
+        self,
+        repository: NutritionRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Should return empty dict when pg_trgm extension is unavailable."""
+        mock_conn = AsyncMock()
+        mock_conn.fetch = AsyncMock(
+            side_effect=Exception("function similarity(text, text) does not exist")
         )
+        mock_pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
+
+        result = await repository.get_by_ingredient_names_fuzzy(["butter"])
 
         assert result == {}
 
+    @pytest.mark.asyncio
+    async def test_raises_non_pg_trgm_errors(
+        self,
+        repository: NutritionRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Should re-raise non-pg_trgm database errors."""
+        mock_conn = AsyncMock()
+        mock_conn.fetch = AsyncMock(side_effect=Exception("Connection refused"))
+        mock_pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
+
+        with pytest.raises(Exception, match="Connection refused"):
+            await repository.get_by_ingredient_names_fuzzy(["butter"])
+
+
+class TestNameIndexResolution:
+    """Tests for name resolution through the in-process ingredient index."""
+
+    @pytest.fixture
+    def indexed_repository(self, mock_pool: MagicMock) -> NutritionRepository:
+        """Create repository with an injected name index."""
+        index = IngredientNameIndex([(1, "chicken breast"), (2, "Butter, salted")])
+        return NutritionRepository(pool=mock_pool, name_index=index)
+
+    @pytest.mark.asyncio
+    async def test_exact_lookup_queries_by_id(
+        self,
+        indexed_repository: NutritionRepository,
+        mock_pool: MagicMock,
+        sample_nutrition_row: dict,
+    ) -> None:
+        """Should resolve the name in-process and query by primary key."""
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetchrow = AsyncMock(return_value=sample_nutrition_row)
+
+        result = await indexed_repository.get_by_ingredient_name("Chicken Breast")
+
+        assert result is not None
+        query, ingredient_id = mock_conn.fetchrow.call_args.args
+        assert "i.ingredient_id = $1" in query
+        assert "LOWER(i.name)" not in query
+        assert ingredient_id == 1
+
+    @pytest.mark.asyncio
+    async def test_index_miss_falls_back_to_name_query(
+        self,
+        indexed_repository: NutritionRepository,
+        mock_pool: MagicMock,
+        sample_nutrition_row: dict,
+    ) -> None:
+        """Should query by name for ingredients added after the snapshot."""
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetchrow = AsyncMock(return_value=sample_nutrition_row)
+
+        result = await indexed_repository.get_by_ingredient_name("tofu")
+
+        assert result is not None
+        query, name = mock_conn.fetchrow.call_args.args
+        assert "LOWER(i.name) = LOWER($1)" in query
+        assert name == "tofu"
+
+    @pytest.mark.asyncio
+    async def test_fuzzy_index_miss_falls_back_to_sql(
+        self,
+        indexed_repository: NutritionRepository,
+        mock_pool: MagicMock,
+        sample_nutrition_row: dict,
+    ) -> None:
+        """Should run the SQL fuzzy lookup only for names the index misses."""
+        butter_row = {
+            **sample_nutrition_row,
+            "ingredient_id": 2,
+            "ingredient_name": "Butter, salted",
+        }
+        tofu_row = {
+            **sample_nutrition_row,
+            "ingredient_id": 3,
+            "ingredient_name": "Tofu",
+            "query_name": "tofu",
+        }
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetch = AsyncMock(side_effect=[[butter_row], [tofu_row]])
+
+        result = await indexed_repository.get_by_ingredient_names_fuzzy(
+            ["butter", "tofu"]
+        )
+
+        assert result["butter"].ingredient_name == "Butter, salted"
+        assert result["tofu"].ingredient_name == "Tofu"
+        _, query_names, _ = mock_conn.fetch.call_args.args
+        assert query_names == ["tofu"]
+
+    @pytest.mark.asyncio
+    async def test_fuzzy_lookup_queries_by_id(
+        self,
+        indexed_repository: NutritionRepository,
+        mock_pool: MagicMock,
+        sample_nutrition_row: dict,
+    ) -> None:
+        """Should resolve fuzzy matches in-process without pg_trgm."""
+        butter_row = {
+            **sample_nutrition_row,
+            "ingredient_id": 2,
+            "ingredient_name": "Butter, salted",
+        }
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetch = AsyncMock(return_value=[butter_row])
+
+        result = await indexed_repository.get_by_ingredient_names_fuzzy(
+            ["butter", "Butter"]
+        )
+
+        assert set(result) == {"butter", "Butter"}
+        assert result["butter"].ingredient_name == "Butter, salted"
+        mock_conn.fetch.assert_awaited_once()
+        query, ids = mock_conn.fetch.call_args.args
+        assert "ANY($1::int[])" in query
+        assert "similarity" not in query
+        assert ids == [2]
+
+    @pytest.mark.asyncio
+    async def test_batch_exact_lookup_keys_by_ingredient_name(
+        self,
+        indexed_repository: NutritionRepository,
+        mock_pool: MagicMock,
+        sample_nutrition_row: dict,
+    ) -> None:
+        """Should keep keying batch exact results by ingredient name."""
+        tofu_row = {
+            **sample_nutrition_row,
+            "ingredient_id": 3,
+            "ingredient_name": "Tofu",
+        }
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetch = AsyncMock(side_effect=[[sample_nutrition_row], [tofu_row]])
+
+        result = await indexed_repository.get_by_ingredient_names(
+            ["chicken breast", "tofu"]
+        )
+
+        assert list(result) == ["chicken breast", "Tofu"]
+        (_, ids), (query, names) = (
+            call.args for call in mock_conn.fetch.call_args_list
+        )
+        assert ids == [1]
+        assert "LOWER(i.name)" in query
+        assert names == ["tofu"]
+
 
 class TestGetByIngredientNameFuzzyErrors:
     """Tests for error handling in get_by_ingredient_name_fuzzy."""
@@ -765,3 +935,155 @@ class TestGetPortionWeight:
         result = await repository.get_portion_weight("flour", "CUP")
 
         assert result is None
+
+
+class TestGetPortionWeights:
+    """Tests for get_portion_weights batch method."""
+
+    @pytest.mark.asyncio
+    async def test_single_query_for_all_portions(
+        self,
+        repository: NutritionRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Should resolve every request with one statement."""
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetch = AsyncMock(
+            return_value=[
+                {
+                    "ingredient_name": "flour",
+                    "unit": "CUP",
+                    "modifier": None,
+                    "gram_weight": Decimal("125.00"),
+                },
+                {
+                    "ingredient_name": "onion",
+                    "unit": "PIECE",
+                    "modifier": "medium",
+                    "gram_weight": Decimal("110.00"),
+                },
+            ]
+        )
+
+        result = await repository.get_portion_weights(
+            [
+                ("flour", "CUP", None),
+                ("onion", "PIECE", "medium"),
+                ("flour", "CUP", None),
+                ("unicorn", "PIECE", None),
+            ]
+        )
+
+        assert result == {
+            ("flour", "CUP", None): Decimal("125.00"),
+            ("onion", "PIECE", "medium"): Decimal("110.00"),
+        }
+        mock_conn.fetch.assert_awaited_once()
+        query, names, units, modifiers = mock_conn.fetch.call_args.args
+        assert "LATERAL" in query
+        assert names == ["flour", "onion", "unicorn"]
+        assert units == ["CUP", "PIECE", "PIECE"]
+        assert modifiers == [None, "medium", None]
+
+    @pytest.mark.asyncio
+    async def test_empty_requests_skip_database(
+        self,
+        repository: NutritionRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Should not query the database without requests."""
+        assert await repository.get_portion_weights([]) == {}
+        mock_pool.acquire.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_handles_missing_table(
+        self,
+        repository: NutritionRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Should return empty result when table doesn't exist."""
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetch = AsyncMock(
+            side_effect=Exception(
+                'relation "recipe_manager.ingredient_portions" does not exist'
+            )
+        )
+
+        assert await repository.get_portion_weights([("flour", "CUP", None)]) == {}
+
+    @pytest.mark.asyncio
+    async def test_handles_other_errors(
+        self,
+        repository: NutritionRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Should log and return empty result on other database errors."""
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetch = AsyncMock(side_effect=Exception("Connection lost"))
+
+        assert await repository.get_portion_weights([("flour", "CUP", None)]) == {}
+
+
+class TestPortionWeightCache:
+    """Tests for the process-local ingredient_portions cache tier."""
+
+    @pytest.fixture(autouse=True)
+    def local_caches(self) -> Generator[None]:
+        """Enable local caches for the duration of a test."""
+        configure_local_caches(enabled=True, max_items=100, ttl=60)
+        yield
+        disable_local_caches()
+
+    @pytest.mark.asyncio
+    async def test_single_lookup_cached_case_insensitively(
+        self,
+        repository: NutritionRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Should query once for equivalent (name, unit) lookups."""
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetchrow = AsyncMock(return_value={"gram_weight": Decimal(125)})
+
+        assert await repository.get_portion_weight("flour", "CUP") == Decimal(125)
+        assert await repository.get_portion_weight("Flour", "cup") == Decimal(125)
+
+        mock_conn.fetchrow.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(
+        self,
+        repository: NutritionRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Should retry lookups that failed with a database error."""
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetchrow = AsyncMock(
+            side_effect=[Exception("Connection lost"), {"gram_weight": Decimal(3)}]
+        )
+
+        assert await repository.get_portion_weight("garlic", "CLOVE") is None
+        assert await repository.get_portion_weight("garlic", "CLOVE") == Decimal(3)
+
+    @pytest.mark.asyncio
+    async def test_batch_only_queries_uncached_requests(
+        self,
+        repository: NutritionRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Should serve cached requests and misses without querying them again."""
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetchrow = AsyncMock(return_value={"gram_weight": Decimal(125)})
+        mock_conn.fetch = AsyncMock(return_value=[])
+        await repository.get_portion_weight("flour", "CUP")
+
+        first = await repository.get_portion_weights(
+            [("flour", "CUP", None), ("unicorn", "PIECE", None)]
+        )
+        second = await repository.get_portion_weights(
+            [("flour", "CUP", None), ("unicorn", "PIECE", None)]
+        )
+
+        assert first == second == {("flour", "CUP", None): Decimal(125)}
+        mock_conn.fetch.assert_awaited_once()
+        _, names, _, _ = mock_conn.fetch.call_args.args
+        assert names == ["unicorn"]
@@ -4,16 +4,19 @@ Tests cover:
 - Getting pricing data by ingredient ID (Tier 1)
 - Getting pricing data by food group (Tier 2 fallback)
 - Getting ingredient details
+- Batched multi-ingredient lookups
 - Handling missing data and tables
 """
 
 from __future__ import annotations
 
 from decimal import Decimal
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.cache.local import configure_local_caches, disable_local_caches
 from app.database.repositories.shopping import (
     IngredientDetails,
     PricingData,
@@ -21,6 +24,9 @@ from app.database.repositories.shopping import (
 )
 
 
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
 pytestmark = pytest.mark.unit
 
 
@@ -365,6 +371,105 @@ class TestGetPriceByFoodGroupErrorHandling:
             await repository.get_price_by_food_group("VEGETABLES")
 
 
+class TestBatchLookups:
+    """Tests for the multi-ingredient lookup methods."""
+
+    async def test_details_by_ids_single_query(
+        self,
+        repository: PricingRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Test details for several IDs are fetched with one ANY() query."""
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetch.return_value = [
+            {"ingredient_id": 1, "name": "carrot", "food_group": "VEGETABLES"},
+            {"ingredient_id": 2, "name": "salt", "food_group": None},
+        ]
+
+        result = await repository.get_ingredient_details_by_ids([1, 2, 1, 3])
+
+        assert set(result) == {1, 2}
+        assert result[1].food_group == "VEGETABLES"
+        mock_conn.fetch.assert_awaited_once()
+        assert mock_conn.fetch.call_args.args[1] == [1, 2, 3]
+
+    async def test_details_by_ids_empty_skips_query(
+        self,
+        repository: PricingRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Test an empty ID list does not hit the database."""
+        assert await repository.get_ingredient_details_by_ids([]) == {}
+        mock_pool.acquire.assert_not_called()
+
+    async def test_prices_by_ingredient_ids(
+        self,
+        repository: PricingRepository,
+        mock_pool: MagicMock,
+        sample_tier1_pricing_row: dict,
+    ) -> None:
+        """Test Tier 1 prices are keyed by ingredient ID."""
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetch.return_value = [
+            {"ingredient_id": 5, **sample_tier1_pricing_row}
+        ]
+
+        result = await repository.get_prices_by_ingredient_ids([5, 6])
+
+        assert set(result) == {5}
+        assert result[5].tier == 1
+        assert result[5].source_year == 2024
+
+    async def test_prices_by_food_groups(
+        self,
+        repository: PricingRepository,
+        mock_pool: MagicMock,
+        sample_tier2_pricing_row: dict,
+    ) -> None:
+        """Test Tier 2 prices are keyed by food group and unknown groups skipped."""
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetch.return_value = [
+            {"food_group": "VEGETABLES", **sample_tier2_pricing_row}
+        ]
+
+        result = await repository.get_prices_by_food_groups(["VEGETABLES", "BOGUS"])
+
+        assert set(result) == {"VEGETABLES"}
+        assert result["VEGETABLES"].tier == 2
+        assert mock_conn.fetch.call_args.args[1] == ["VEGETABLES", "BOGUS"]
+
+    @pytest.mark.parametrize(
+        "method",
+        [
+            "get_ingredient_details_by_ids",
+            "get_prices_by_ingredient_ids",
+        ],
+    )
+    async def test_handles_missing_table_gracefully(
+        self,
+        repository: PricingRepository,
+        mock_pool: MagicMock,
+        method: str,
+    ) -> None:
+        """Test batch lookups return empty results when tables don't exist."""
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetch.side_effect = Exception('relation "x" does not exist')
+
+        assert await getattr(repository, method)([1]) == {}
+
+    async def test_reraises_unexpected_exceptions(
+        self,
+        repository: PricingRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Test unexpected errors propagate."""
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetch.side_effect = Exception("Database connection lost")
+
+        with pytest.raises(Exception, match="Database connection lost"):
+            await repository.get_prices_by_food_groups(["VEGETABLES"])
+
+
 class TestPricingRepositoryPool:
     """Tests for pool property fallback behavior."""
 
@@ -385,3 +490,102 @@ class TestPricingRepositoryPool:
         ):
             repo = PricingRepository()  # No pool provided
             assert repo.pool is mock_global_pool
+
+
+class TestReferenceCache:
+    """Tests for the process-local pricing cache tier."""
+
+    @pytest.fixture(autouse=True)
+    def local_caches(self) -> Generator[None]:
+        """Enable local caches for the duration of a test."""
+        configure_local_caches(enabled=True, max_items=100, ttl=60)
+        yield
+        disable_local_caches()
+
+    async def test_ingredient_pricing_queried_once(
+        self,
+        repository: PricingRepository,
+        mock_pool: MagicMock,
+        sample_tier1_pricing_row: dict,
+    ) -> None:
+        """Test repeated Tier 1 lookups are served from the local cache."""
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetchrow.return_value = sample_tier1_pricing_row
+
+        first = await repository.get_price_by_ingredient_id(123)
+        second = await PricingRepository(pool=mock_pool).get_price_by_ingredient_id(123)
+
+        assert first == second
+        mock_conn.fetchrow.assert_awaited_once()
+
+    async def test_food_group_miss_is_cached(
+        self,
+        repository: PricingRepository,
+        mock_pool: MagicMock,
+    ) -> None:
+        """Test food groups without pricing are not re-queried."""
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetchrow.return_value = None
+
+        assert await repository.get_price_by_food_group("SPICES") is None
+        assert await repository.get_price_by_food_group("SPICES") is None
+
+        mock_conn.fetchrow.assert_awaited_once()
+
+    async def test_errors_are_not_cached(
+        self,
+        repository: PricingRepository,
+        mock_pool: MagicMock,
+        sample_tier2_pricing_row: dict,
+    ) -> None:
+        """Test a failed lookup is retried on the next call."""
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetchrow.side_effect = [
+            Exception("Database connection lost"),
+            sample_tier2_pricing_row,
+        ]
+
+        with pytest.raises(Exception, match="Database connection lost"):
+            await repository.get_price_by_food_group("VEGETABLES")
+        result = await repository.get_price_by_food_group("VEGETABLES")
+
+        assert result is not None
+        assert mock_conn.fetchrow.await_count == 2
+
+    async def test_batch_lookup_only_queries_uncached(
+        self,
+        repository: PricingRepository,
+        mock_pool: MagicMock,
+        sample_tier1_pricing_row: dict,
+    ) -> None:
+        """Test batch Tier 1 lookups share the cache with single lookups."""
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetchrow.return_value = sample_tier1_pricing_row
+        await repository.get_price_by_ingredient_id(1)
+        mock_conn.fetch.return_value = []
+
+        result = await repository.get_prices_by_ingredient_ids([1, 2])
+        again = await repository.get_prices_by_ingredient_ids([1, 2])
+
+        assert set(result) == {1}
+        assert again == result
+        mock_conn.fetch.assert_awaited_once()
+        assert mock_conn.fetch.call_args.args[1] == [2]
+
+    async def test_batch_food_group_lookup_is_cached(
+        self,
+        repository: PricingRepository,
+        mock_pool: MagicMock,
+        sample_tier2_pricing_row: dict,
+    ) -> None:
+        """Test batch Tier 2 results are served to single lookups."""
+        mock_conn = mock_pool.acquire.return_value.__aenter__.return_value
+        mock_conn.fetch.return_value = [
+            {"food_group": "VEGETABLES", **sample_tier2_pricing_row}
+        ]
+
+        await repository.get_prices_by_food_groups(["VEGETABLES", "SPICES"])
+
+        assert await repository.get_price_by_food_group("VEGETABLES") is not None
+        assert await repository.get_price_by_food_group("SPICES") is None
+        mock_conn.fetchrow.assert_not_awaited()
@@ -0,0 +1,174 @@
+"""Unit tests for LLMBatchScheduler.
+
+Tests cover:
+- Pass-through of single and unstructured requests
+- Merging concurrent compatible requests
+- Separating incompatible requests
+- Fallback to individual requests on batch failure
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from app.llm.batching import LLMBatchScheduler
+from app.llm.exceptions import LLMUnavailableError, LLMValidationError
+from app.llm.rate_limit import LLMPriority, llm_priority
+
+
+pytestmark = pytest.mark.unit
+
+
+class Answer(BaseModel):
+    """Sample schema for testing."""
+
+    value: str
+
+
+def _batch_aware_client() -> MagicMock:
+    """Client answering each task prompt with its own text."""
+    client = MagicMock()
+
+    async def generate_structured(
+        prompt: str, schema: type[BaseModel], **_: Any
+    ) -> BaseModel:
+        if schema is Answer:
+            return Answer(value=prompt)
+        tasks = [part.split("\n", 1)[1] for part in prompt.split("### Task ")[1:]]
+        return schema(results=[Answer(value=t.strip()) for t in tasks])
+
+    client.generate_structured = AsyncMock(side_effect=generate_structured)
+    client.generate = AsyncMock()
+    client.initialize = AsyncMock()
+    client.shutdown = AsyncMock()
+    return client
+
+
+class TestLLMBatchScheduler:
+    """Tests for request batching."""
+
+    async def test_single_request_passes_through(self) -> None:
+        """Should send a lone request unchanged."""
+        client = _batch_aware_client()
+        scheduler = LLMBatchScheduler(client, window=0.001)
+
+        result = await scheduler.generate_structured("butter", Answer)
+
+        assert result == Answer(value="butter")
+        call = client.generate_structured.call_args.kwargs
+        assert call["prompt"] == "butter"
+        assert call["schema"] is Answer
+
+    async def test_merges_concurrent_requests(self) -> None:
+        """Should send concurrent compatible requests as one call."""
+        client = _batch_aware_client()
+        scheduler = LLMBatchScheduler(client, window=0.01, max_batch_size=8)
+
+        results = await asyncio.gather(
+            *[
+                scheduler.generate_structured(name, Answer, options={"num_predict": 10})
+                for name in ("butter", "eggs", "milk")
+            ]
+        )
+
+        assert [r.value for r in results] == ["butter", "eggs", "milk"]
+        client.generate_structured.assert_called_once()
+        call = client.generate_structured.call_args.kwargs
+        assert call["skip_cache"] is True
+        assert call["options"] == {"num_predict": 30}
+
+    async def test_flushes_at_max_batch_size(self) -> None:
+        """Should not wait for the window once a batch is full."""
+        client = _batch_aware_client()
+        scheduler = LLMBatchScheduler(client, window=60.0, max_batch_size=2)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                scheduler.generate_structured("a", Answer),
+                scheduler.generate_structured("b", Answer),
+            ),
+            timeout=1.0,
+        )
+
+        assert [r.value for r in results] == ["a", "b"]
+
+    async def test_keeps_incompatible_requests_apart(self) -> None:
+        """Should not merge requests with different system prompts or priority."""
+        client = _batch_aware_client()
+        scheduler = LLMBatchScheduler(client, window=0.01)
+
+        async def background(prompt: str) -> Answer:
+            with llm_priority(LLMPriority.BACKGROUND):
+                return await scheduler.generate_structured(prompt, Answer)
+
+        await asyncio.gather(
+            scheduler.generate_structured("a", Answer, system="one"),
+            scheduler.generate_structured("b", Answer, system="two"),
+            background("c"),
+        )
+
+        assert client.generate_structured.call_count == 3
+
+    async def test_falls_back_to_individual_requests(self) -> None:
+        """Should retry one by one when the merged response is invalid."""
+        client = _batch_aware_client()
+        single = client.generate_structured.side_effect
+
+        async def fail_batches(prompt: str, schema: type[BaseModel], **kw: Any) -> Any:
+            if schema is not Answer:
+                msg = "wrong number of results"
+                raise LLMValidationError(msg)
+            return await single(prompt, schema, **kw)
+
+        client.generate_structured.side_effect = fail_batches
+        scheduler = LLMBatchScheduler(client, window=0.01)
+
+        results = await asyncio.gather(
+            scheduler.generate_structured("a", Answer),
+            scheduler.generate_structured("b", Answer),
+        )
+
+        assert [r.value for r in results] == ["a", "b"]
+        assert client.generate_structured.call_count == 3
+
+    async def test_propagates_unavailable_to_all_callers(self) -> None:
+        """Should fail every caller when the provider is unavailable."""
+        client = _batch_aware_client()
+        client.generate_structured.side_effect = LLMUnavailableError("down")
+        scheduler = LLMBatchScheduler(client, window=0.01)
+
+        results = await asyncio.gather(
+            scheduler.generate_structured("a", Answer),
+            scheduler.generate_structured("b", Answer),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, LLMUnavailableError) for r in results)
+        client.generate_structured.assert_called_once()
+
+    async def test_generate_is_not_batched(self) -> None:
+        """Should pass unstructured generation straight through."""
+        client = _batch_aware_client()
+        scheduler = LLMBatchScheduler(client)
+
+        await scheduler.generate("prompt", context="test")
+
+        client.generate.assert_awaited_once()
+        assert client.generate.call_args.kwargs["prompt"] == "prompt"
+
+    async def test_shutdown_sends_pending_batches(self) -> None:
+        """Should resolve waiting callers before shutting down the client."""
+        client = _batch_aware_client()
+        scheduler = LLMBatchScheduler(client, window=60.0)
+
+        pending = asyncio.create_task(scheduler.generate_structured("a", Answer))
+        await asyncio.sleep(0)
+        await scheduler.shutdown()
+
+        assert (await pending).value == "a"
+        client.shutdown.assert_awaited_once()
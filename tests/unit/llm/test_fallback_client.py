@@ -8,6 +8,8 @@ Tests cover:
 
 from __future__ import annotations
 
+import asyncio
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -24,6 +26,10 @@ from app.llm.exceptions import (
 from app.llm.models import LLMCompletionResult
 
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
 pytestmark = pytest.mark.unit
 
 
@@ -387,3 +393,147 @@ class TestArgumentPassthrough:
         )
 
         await client.shutdown()
+
+
+class TestLatencyAwareRouting:
+    """Tests for hedging and the circuit breaker."""
+
+    @staticmethod
+    def _respond_after(
+        delay: float, raw_response: str
+    ) -> Callable[..., Awaitable[LLMCompletionResult]]:
+        async def generate(**_: object) -> LLMCompletionResult:
+            await asyncio.sleep(delay)
+            return LLMCompletionResult(
+                raw_response=raw_response, model="test-model", parsed=None
+            )
+
+        return generate
+
+    def _slow_client(self, delay: float, raw_response: str) -> MagicMock:
+        mock = create_mock_client()
+        mock.generate = AsyncMock(side_effect=self._respond_after(delay, raw_response))
+        return mock
+
+    async def test_no_hedge_without_latency_samples(self) -> None:
+        """Should not hedge before the primary has enough samples."""
+        primary = self._slow_client(0.05, "primary")
+        secondary = create_mock_client()
+
+        client = FallbackLLMClient(primary=primary, secondary=secondary)
+        result = await client.generate("test")
+
+        assert result.raw_response == "primary"
+        secondary.generate.assert_not_called()
+
+    async def test_hedges_slow_primary_and_uses_first_response(self) -> None:
+        """Should send a hedge once the primary passes its p95."""
+        primary = self._slow_client(0.0, "primary")
+        secondary = self._slow_client(0.0, "secondary")
+        client = FallbackLLMClient(
+            primary=primary, secondary=secondary, hedge_min_samples=3
+        )
+        for _ in range(3):
+            await client.generate("warm up")
+        secondary.generate.assert_not_called()
+
+        # Primary is now far slower than its p95
+        primary.generate.side_effect = self._respond_after(1.0, "primary")
+        result = await client.generate("test")
+
+        assert result.raw_response == "secondary"
+        secondary.generate.assert_called_once()
+
+    async def test_losing_primary_keeps_its_latency_sample(self) -> None:
+        """Should record a cancelled primary's elapsed time so p95 holds."""
+        primary = self._slow_client(0.0, "primary")
+        secondary = self._slow_client(0.05, "secondary")
+        client = FallbackLLMClient(
+            primary=primary, secondary=secondary, hedge_min_samples=3
+        )
+        for _ in range(3):
+            await client.generate("warm up")
+        primary.generate.side_effect = self._respond_after(1.0, "primary")
+        result = await client.generate("test")
+        await asyncio.sleep(0)
+
+        assert result.raw_response == "secondary"
+        assert len(client._primary.latencies) == 4
+        assert client._primary.latencies[-1] >= 0.05
+
+    async def test_early_cancellation_is_not_a_latency_sample(self) -> None:
+        """Should not record calls cancelled before the primary's p95."""
+        primary = self._slow_client(0.0, "primary")
+        client = FallbackLLMClient(primary=primary)
+        await client.generate("warm up")
+        primary.generate.side_effect = self._respond_after(1.0, "primary")
+        client._primary.latencies[0] = 0.5
+
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.01):
+                await client.generate("test")
+
+        assert list(client._primary.latencies) == [0.5]
+
+    async def test_hedge_disabled(self) -> None:
+        """Should wait for the primary when hedging is disabled."""
+        primary = self._slow_client(0.0, "primary")
+        secondary = create_mock_client()
+        client = FallbackLLMClient(
+            primary=primary,
+            secondary=secondary,
+            hedging_enabled=False,
+            hedge_min_samples=1,
+        )
+        await client.generate("warm up")
+        primary.generate.side_effect = self._respond_after(0.05, "primary")
+
+        result = await client.generate("test")
+
+        assert result.raw_response == "primary"
+        secondary.generate.assert_not_called()
+
+    async def test_circuit_opens_after_repeated_failures(self) -> None:
+        """Should skip a failing primary until its circuit resets."""
+        primary = create_mock_client(generate_error=LLMUnavailableError("Down"))
+        secondary = create_mock_client()
+        client = FallbackLLMClient(
+            primary=primary,
+            secondary=secondary,
+            failure_threshold=2,
+            reset_timeout=60.0,
+        )
+
+        for _ in range(3):
+            await client.generate("test")
+
+        assert primary.generate.call_count == 2
+        assert secondary.generate.call_count == 3
+
+    async def test_circuit_half_open_trial_closes_on_success(self) -> None:
+        """Should use the primary again after a successful trial request."""
+        primary = create_mock_client(generate_error=LLMUnavailableError("Down"))
+        secondary = create_mock_client()
+        client = FallbackLLMClient(
+            primary=primary,
+            secondary=secondary,
+            failure_threshold=1,
+            reset_timeout=0.0,
+        )
+        await client.generate("test")
+
+        primary.generate.side_effect = None
+        await client.generate("test")
+        await client.generate("test")
+
+        assert primary.generate.call_count == 3
+        assert secondary.generate.call_count == 1
+
+    async def test_latency_percentiles(self) -> None:
+        """Should report rolling p50/p95 per provider."""
+        client = FallbackLLMClient(primary=create_mock_client())
+        await client.generate("test")
+
+        percentiles = client.latency_percentiles()
+
+        assert percentiles["magicmock"]["p50"] is not None
@@ -18,6 +18,7 @@ import pytest
 import respx
 from pydantic import BaseModel
 
+from app.cache.swr import encode_swr_entry
 from app.llm.client.groq import GroqClient
 from app.llm.exceptions import (
     LLMRateLimitError,
@@ -27,6 +28,8 @@ from app.llm.exceptions import (
     LLMValidationError,
 )
 from app.llm.models import LLMCompletionResult
+from app.llm.prompts.pairings import PairingListResult
+from app.llm.rate_limit import LLMPriority, LLMRateLimiter, llm_priority
 from tests.fixtures.llm_responses import create_groq_response
 
 
@@ -238,6 +241,32 @@ class TestGroqClientErrors:
 
         await client.shutdown()
 
+    @respx.mock
+    async def test_rate_limit_retry_outlasts_limiter_max_wait(self) -> None:
+        """Should wait out retry-after instead of failing fast on the limiter."""
+        respx.post("https://api.groq.com/openai/v1/chat/completions").mock(
+            side_effect=[
+                httpx.Response(429, headers={"retry-after": "0.05"}),
+                httpx.Response(200, json=create_groq_response("Hello")),
+            ]
+        )
+        limiter = LLMRateLimiter(
+            None, key="groq:test", requests_per_minute=TEST_RATE_LIMIT, max_wait=0.01
+        )
+        client = GroqClient(
+            api_key="test-api-key",
+            model="llama-3.1-8b-instant",
+            cache_enabled=False,
+            max_retries=1,
+            rate_limiter=limiter,
+        )
+
+        with llm_priority(LLMPriority.INTERACTIVE):
+            result = await client.generate("Hello")
+
+        assert result.raw_response == "Hello"
+        await client.shutdown()
+
     @respx.mock
     async def test_http_error(self) -> None:
         """Should raise LLMResponseError on HTTP errors."""
@@ -546,6 +575,106 @@ class TestGroqClientCaching:
 
         await client.shutdown()
 
+    @respx.mock
+    async def test_stale_cache_hit_schedules_revalidation(self) -> None:
+        """Should serve a stale entry and enqueue its regeneration."""
+        mock_redis = MagicMock()
+        cached_result = {
+            "raw_response": "Stale response",
+            "parsed": None,
+            "model": "llama-3.1-8b-instant",
+            "prompt_tokens": 10,
+            "completion_tokens": 5,
+            "cached": False,
+        }
+        mock_redis.get = AsyncMock(return_value=encode_swr_entry(cached_result, -1))
+
+        client = GroqClient(
+            requests_per_minute=TEST_RATE_LIMIT,
+            api_key="test-api-key",
+            model="llama-3.1-8b-instant",
+            cache_client=mock_redis,
+            cache_enabled=True,
+            cache_ttl=3600,
+            cache_stale_ttl=600,
+        )
+
+        with patch(
+            "app.llm.client.groq.schedule_revalidation", new_callable=AsyncMock
+        ) as mock_schedule:
+            result = await client.generate("Hello", schema=PairingListResult)
+
+        assert result.raw_response == "Stale response"
+        assert result.cached is True
+        args, kwargs = mock_schedule.call_args
+        assert args[2] == "revalidate_llm_completion"
+        assert kwargs["model"] == "llama-3.1-8b-instant"
+        assert kwargs["schema"] == "PairingListResult"
+        assert kwargs["fresh_ttl"] == 3600
+        assert kwargs["stale_ttl"] == 600
+
+        await client.shutdown()
+
+    async def test_stale_hit_of_unregistered_schema_not_revalidated(self) -> None:
+        """Should not enqueue a job the worker cannot resolve the schema of."""
+        mock_redis = MagicMock()
+        cached_result = {
+            "raw_response": "Stale response",
+            "parsed": None,
+            "model": "llama-3.1-8b-instant",
+            "prompt_tokens": 10,
+            "completion_tokens": 5,
+            "cached": False,
+        }
+        mock_redis.get = AsyncMock(return_value=encode_swr_entry(cached_result, -1))
+
+        client = GroqClient(
+            requests_per_minute=TEST_RATE_LIMIT,
+            api_key="test-api-key",
+            cache_client=mock_redis,
+            cache_enabled=True,
+        )
+
+        with patch(
+            "app.llm.client.groq.schedule_revalidation", new_callable=AsyncMock
+        ) as mock_schedule:
+            result = await client.generate("Hello", schema=SampleSchema)
+
+        assert result.raw_response == "Stale response"
+        mock_schedule.assert_not_awaited()
+
+        await client.shutdown()
+
+    @respx.mock
+    async def test_cache_write_includes_stale_window(self) -> None:
+        """Should keep entries in Redis for the fresh plus stale TTL."""
+        respx.post("https://api.groq.com/openai/v1/chat/completions").mock(
+            return_value=httpx.Response(
+                200,
+                json=create_groq_response("Fresh response"),
+            )
+        )
+
+        mock_redis = MagicMock()
+        mock_redis.get = AsyncMock(return_value=None)
+        mock_redis.set = AsyncMock()
+
+        client = GroqClient(
+            requests_per_minute=TEST_RATE_LIMIT,
+            api_key="test-api-key",
+            model="llama-3.1-8b-instant",
+            cache_client=mock_redis,
+            cache_enabled=True,
+            cache_ttl=3600,
+            cache_stale_ttl=600,
+        )
+
+        await client.generate("Hello")
+
+        assert mock_redis.set.call_args[1]["ex"] == 4200
+
+        await client.shutdown()
+
 
 class TestGroqClientGenerateStructured:
     """Tests for generate_structured method."""
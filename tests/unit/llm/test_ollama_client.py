@@ -11,13 +11,14 @@ Tests cover:
 from __future__ import annotations
 
 import json
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 import respx
 from pydantic import BaseModel
 
+from app.cache.swr import encode_swr_entry
 from app.llm.client.ollama import OllamaClient
 from app.llm.exceptions import (
     LLMRateLimitError,
@@ -530,6 +531,72 @@ class TestOllamaClientCaching:
 
         await client.shutdown()
 
+    @respx.mock
+    async def test_stale_cache_hit_schedules_revalidation(self) -> None:
+        """Should serve a stale entry and enqueue its regeneration."""
+        mock_redis = MagicMock()
+        cached_result = {
+            "raw_response": "Stale response",
+            "parsed": None,
+            "model": "mistral:7b",
+            "prompt_tokens": 5,
+            "completion_tokens": 3,
+            "cached": False,
+        }
+        mock_redis.get = AsyncMock(return_value=encode_swr_entry(cached_result, -1))
+
+        client = OllamaClient(
+            base_url="http://localhost:11434",
+            model="mistral:7b",
+            cache_client=mock_redis,
+            cache_enabled=True,
+            cache_stale_ttl=600,
+        )
+
+        with patch(
+            "app.llm.client.ollama.schedule_revalidation", new_callable=AsyncMock
+        ) as mock_schedule:
+            result = await client.generate("test prompt")
+
+        assert result.raw_response == "Stale response"
+        assert result.cached is True
+        mock_schedule.assert_awaited_once()
+        assert mock_schedule.call_args.kwargs["schema"] is None
+
+        await client.shutdown()
+
+    @respx.mock
+    async def test_fresh_cache_hit_does_not_revalidate(self) -> None:
+        """Should not enqueue regeneration for fresh entries."""
+        mock_redis = MagicMock()
+        cached_result = {
+            "raw_response": "Cached response",
+            "parsed": None,
+            "model": "mistral:7b",
+            "prompt_tokens": 5,
+            "completion_tokens": 3,
+            "cached": False,
+        }
+        mock_redis.get = AsyncMock(return_value=encode_swr_entry(cached_result, 3600))
+
+        client = OllamaClient(
+            base_url="http://localhost:11434",
+            model="mistral:7b",
+            cache_client=mock_redis,
+            cache_enabled=True,
+            cache_stale_ttl=600,
+        )
+
+        with patch(
+            "app.llm.client.ollama.schedule_revalidation", new_callable=AsyncMock
+        ) as mock_schedule:
+            result = await client.generate("test prompt")
+
+        assert result.cached is True
+        mock_schedule.assert_not_awaited()
+
+        await client.shutdown()
+
 
 class TestCacheKeyGeneration:
     """Tests for cache key generation."""
@@ -0,0 +1,42 @@
+"""Unit tests for the structured output schema registry."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import BaseModel
+
+from app.llm.output_schemas import output_schema_name, resolve_output_schema
+from app.llm.prompts.pairings import PairingListResult
+
+
+pytestmark = pytest.mark.unit
+
+
+class PairingListResultCopy(BaseModel):
+    """Unregistered schema."""
+
+
+class TestOutputSchemas:
+    """Tests for schema names and their resolution."""
+
+    def test_round_trips_registered_schema(self) -> None:
+        """Should resolve the name of a registered schema back to it."""
+        name = output_schema_name(PairingListResult)
+
+        assert name == "PairingListResult"
+        assert resolve_output_schema(name) is PairingListResult
+
+    def test_unregistered_schema_has_no_name(self) -> None:
+        """Should not name schemas outside the registry."""
+        PairingListResultCopy.__name__ = "PairingListResult"
+        try:
+            assert output_schema_name(PairingListResultCopy) is None
+        finally:
+            PairingListResultCopy.__name__ = "PairingListResultCopy"
+
+    def test_unknown_name_resolves_to_none(self) -> None:
+        """Should not resolve module paths or unknown names."""
+        assert resolve_output_schema("os:getcwd") is None
+        assert (
+            resolve_output_schema("app.llm.prompts.pairings:PairingListResult") is None
+        )
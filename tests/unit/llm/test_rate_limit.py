@@ -0,0 +1,213 @@
+"""Unit tests for the shared LLM rate limiter.
+
+Tests cover:
+- Reset header parsing
+- Priority context
+- Local token bucket behavior
+- Adaptation to provider headers
+- Redis script usage and fallback
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.config.settings import GroqSettings
+from app.llm.exceptions import LLMRateLimitError
+from app.llm.rate_limit import (
+    RATE_LIMIT_KEY_PREFIX,
+    LLMPriority,
+    LLMRateLimiter,
+    create_groq_rate_limiter,
+    current_llm_priority,
+    llm_priority,
+    parse_reset_duration,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+def _limiter(redis: MagicMock | None = None, **kwargs: float) -> LLMRateLimiter:
+    options: dict[str, float] = {"requests_per_minute": 60.0, "max_wait": 0.0}
+    options.update(kwargs)
+    return LLMRateLimiter(redis, key="groq:test", **options)  # type: ignore[arg-type]
+
+
+class TestParseResetDuration:
+    """Tests for parse_reset_duration."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("2m59.56s", 179.56),
+            ("7.66s", 7.66),
+            ("120ms", 0.12),
+            ("1h2m", 3720.0),
+            ("30", 30.0),
+        ],
+    )
+    def test_parses_durations(self, value: str, expected: float) -> None:
+        """Should parse Groq duration formats to seconds."""
+        assert parse_reset_duration(value) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("value", [None, "", "soon", "5x"])
+    def test_rejects_invalid_values(self, value: str | None) -> None:
+        """Should return None for missing or malformed values."""
+        assert parse_reset_duration(value) is None
+
+
+class TestLLMPriority:
+    """Tests for the priority context."""
+
+    def test_defaults_to_interactive(self) -> None:
+        """Should treat requests as interactive by default."""
+        assert current_llm_priority() is LLMPriority.INTERACTIVE
+
+    def test_context_manager_sets_and_restores(self) -> None:
+        """Should set the priority inside the block only."""
+        with llm_priority(LLMPriority.BACKGROUND):
+            assert current_llm_priority() is LLMPriority.BACKGROUND
+        assert current_llm_priority() is LLMPriority.INTERACTIVE
+
+
+class TestLocalBucket:
+    """Tests for the limiter without Redis."""
+
+    async def test_allows_burst_then_limits(self) -> None:
+        """Should allow burst requests and then refuse within max_wait."""
+        limiter = _limiter(burst=2)
+
+        await limiter.acquire(LLMPriority.INTERACTIVE)
+        await limiter.acquire(LLMPriority.INTERACTIVE)
+
+        with pytest.raises(LLMRateLimitError):
+            await limiter.acquire(LLMPriority.INTERACTIVE)
+
+    async def test_background_leaves_interactive_reserve(self) -> None:
+        """Should keep the reserve token for interactive requests."""
+        limiter = _limiter(burst=2, interactive_reserve=1)
+
+        # Background takes the first token, then must wait for the reserve
+        assert limiter._local.take(limiter.rate, limiter.capacity, 2.0) == 0
+        assert limiter._local.take(limiter.rate, limiter.capacity, 2.0) > 0
+
+        # Interactive may still take the reserved token
+        assert await limiter.acquire(LLMPriority.INTERACTIVE) < 1
+
+    def test_not_shared_without_redis(self) -> None:
+        """Should report a process-local bucket."""
+        assert _limiter().shared is False
+
+
+class TestObserve:
+    """Tests for adapting to provider headers."""
+
+    async def test_429_pauses_bucket(self) -> None:
+        """Should pause all requests for retry-after seconds."""
+        limiter = _limiter(burst=5)
+
+        await limiter.observe({"retry-after": "10"}, 429)
+
+        with pytest.raises(LLMRateLimitError):
+            await limiter.acquire(LLMPriority.INTERACTIVE)
+
+    async def test_exhausted_budget_pauses_until_reset(self) -> None:
+        """Should pause until the reset when remaining requests hit zero."""
+        limiter = _limiter(burst=5)
+
+        await limiter.observe(
+            {
+                "x-ratelimit-limit-requests": "1000",
+                "x-ratelimit-remaining-requests": "0",
+                "x-ratelimit-reset-requests": "1m",
+            },
+            200,
+        )
+
+        assert limiter._local.take(limiter.rate, limiter.capacity, 1.0) > 50
+
+    async def test_low_budget_slows_rate(self) -> None:
+        """Should scale the refill rate while the budget is low."""
+        limiter = _limiter(slowdown_factor=0.5)
+
+        await limiter.observe(
+            {
+                "x-ratelimit-limit-tokens": "6000",
+                "x-ratelimit-remaining-tokens": "100",
+                "x-ratelimit-reset-tokens": "7.5s",
+            },
+            200,
+        )
+
+        assert limiter._local.factor == 0.5
+        assert limiter._local.slow_until > 0
+
+    async def test_healthy_budget_does_not_adapt(self) -> None:
+        """Should leave the bucket alone when budgets are healthy."""
+        redis = MagicMock()
+        limiter = _limiter(redis)
+        limiter._adapt_script = AsyncMock()
+
+        await limiter.observe(
+            {
+                "x-ratelimit-limit-requests": "1000",
+                "x-ratelimit-remaining-requests": "900",
+                "x-ratelimit-reset-requests": "1m",
+            },
+            200,
+        )
+
+        limiter._adapt_script.assert_not_called()
+
+
+class TestSharedBucket:
+    """Tests for the Redis-backed bucket."""
+
+    async def test_acquire_runs_script_with_need(self) -> None:
+        """Should pass the priority's token requirement to the script."""
+        redis = MagicMock()
+        limiter = _limiter(redis, burst=3, interactive_reserve=1)
+        limiter._acquire_script = AsyncMock(return_value=b"0")
+
+        await limiter.acquire(LLMPriority.BACKGROUND)
+
+        kwargs = limiter._acquire_script.call_args.kwargs
+        assert kwargs["keys"] == [f"{RATE_LIMIT_KEY_PREFIX}:groq:test"]
+        assert kwargs["args"][2] == 2.0
+        assert limiter.shared is True
+
+    async def test_falls_back_to_local_on_redis_error(self) -> None:
+        """Should limit locally when the script fails."""
+        redis = MagicMock()
+        limiter = _limiter(redis, burst=1)
+        limiter._acquire_script = AsyncMock(side_effect=ConnectionError("down"))
+
+        await limiter.acquire(LLMPriority.INTERACTIVE)
+
+        with pytest.raises(LLMRateLimitError):
+            await limiter.acquire(LLMPriority.INTERACTIVE)
+
+    async def test_observe_runs_adapt_script(self) -> None:
+        """Should share pauses with other replicas through Redis."""
+        redis = MagicMock()
+        limiter = _limiter(redis)
+        limiter._adapt_script = AsyncMock()
+
+        await limiter.observe({"retry-after": "5"}, 429)
+
+        args = limiter._adapt_script.call_args.kwargs["args"]
+        assert args[0] == 5.0
+
+
+def test_create_groq_rate_limiter_uses_settings() -> None:
+    """Should key the limiter by model and apply the configured budget."""
+    settings = GroqSettings(model="llama-3.1-8b-instant", requests_per_minute=30.0)
+
+    limiter = create_groq_rate_limiter(None, settings)
+
+    assert limiter.key == f"{RATE_LIMIT_KEY_PREFIX}:groq:llama-3.1-8b-instant"
+    assert limiter.rate == pytest.approx(0.5)
+    assert limiter.capacity == settings.rate_limit.burst
@@ -0,0 +1,101 @@
+"""Unit tests for IngredientParseCoalescer.
+
+Tests cover:
+- Merging concurrent calls into one deduplicated parser call
+- Early flush at the line limit
+- Isolating failures of merged batches
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.llm.prompts import IngredientUnit, ParsedIngredient
+from app.parsing.coalescer import IngredientParseCoalescer
+from app.parsing.exceptions import IngredientParsingError
+
+
+pytestmark = pytest.mark.unit
+
+
+def _ingredient(line: str) -> ParsedIngredient:
+    return ParsedIngredient(name=line, quantity=1.0, unit=IngredientUnit.PIECE)
+
+
+def _echo_parser(bad_line: str | None = None) -> MagicMock:
+    """Parser returning one ingredient named after each line."""
+
+    async def parse_batch(lines: list[str]) -> list[ParsedIngredient]:
+        if bad_line in lines:
+            msg = "bad line"
+            raise IngredientParsingError(msg)
+        return [_ingredient(line) for line in lines]
+
+    parser = MagicMock()
+    parser.parse_batch = AsyncMock(side_effect=parse_batch)
+    return parser
+
+
+class TestIngredientParseCoalescer:
+    """Tests for IngredientParseCoalescer."""
+
+    async def test_merges_concurrent_calls(self) -> None:
+        """Should parse concurrent calls with one deduplicated parser call."""
+        parser = _echo_parser()
+        coalescer = IngredientParseCoalescer(parser, window=0.01)
+
+        first, second = await asyncio.gather(
+            coalescer.parse_batch(["flour", "salt"]),
+            coalescer.parse_batch(["salt", "eggs"]),
+        )
+
+        parser.parse_batch.assert_awaited_once_with(["flour", "salt", "eggs"])
+        assert [i.name for i in first] == ["flour", "salt"]
+        assert [i.name for i in second] == ["salt", "eggs"]
+
+    async def test_flushes_at_line_limit(self) -> None:
+        """Should not wait for the window once max_lines is reached."""
+        parser = _echo_parser()
+        coalescer = IngredientParseCoalescer(parser, window=60, max_lines=2)
+
+        result = await asyncio.wait_for(
+            coalescer.parse_batch(["flour", "salt"]), timeout=1
+        )
+
+        assert [i.name for i in result] == ["flour", "salt"]
+
+    async def test_returns_empty_without_parsing(self) -> None:
+        """Should not call the parser for an empty list."""
+        parser = _echo_parser()
+
+        assert await IngredientParseCoalescer(parser).parse_batch([]) == []
+        parser.parse_batch.assert_not_awaited()
+
+    async def test_isolates_failing_request(self) -> None:
+        """Should retry a failed merged batch per request."""
+        parser = _echo_parser(bad_line="???")
+        coalescer = IngredientParseCoalescer(parser, window=0.01)
+
+        good, bad = await asyncio.gather(
+            coalescer.parse_batch(["flour"]),
+            coalescer.parse_batch(["???"]),
+            return_exceptions=True,
+        )
+
+        assert isinstance(good, list)
+        assert [i.name for i in good] == ["flour"]
+        assert isinstance(bad, IngredientParsingError)
+        assert parser.parse_batch.await_count == 3
+
+    async def test_raises_for_single_request(self) -> None:
+        """Should raise the parser error when the batch had one request."""
+        parser = _echo_parser(bad_line="???")
+        coalescer = IngredientParseCoalescer(parser, window=0)
+
+        with pytest.raises(IngredientParsingError):
+            await coalescer.parse_batch(["???"])
+
+        parser.parse_batch.assert_awaited_once()
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
+import orjson
 import pytest
 
 from app.llm.exceptions import (
@@ -38,8 +40,38 @@ def mock_llm_client() -> MagicMock:
 
 @pytest.fixture
 def parser(mock_llm_client: LLMClientProtocol) -> IngredientParser:
-    """Create an IngredientParser with mock client."""
-    return IngredientParser(mock_llm_client)
+    """Create an IngredientParser with mock client, sending every line to the LLM."""
+    return IngredientParser(mock_llm_client, fast_path=False)
+
+
+@pytest.fixture
+def mock_cache_client() -> MagicMock:
+    """Create a mock Redis client for the per-line cache."""
+    client = MagicMock()
+    client.mget = AsyncMock(side_effect=lambda keys: [None] * len(keys))
+    pipeline = MagicMock()
+    pipeline.execute = AsyncMock(return_value=[])
+    client.pipeline = MagicMock(return_value=pipeline)
+    return client
+
+
+def _echo_llm(mock_llm_client: MagicMock) -> None:
+    """Make the mock LLM return one ingredient per prompt line, named after it."""
+
+    async def generate(**kwargs: object) -> ParsedIngredientList:
+        lines = [
+            line[2:]
+            for line in str(kwargs["prompt"]).splitlines()
+            if line.startswith("- ")
+        ]
+        return ParsedIngredientList(
+            ingredients=[
+                ParsedIngredient(name=line, quantity=1.0, unit=IngredientUnit.UNIT)
+                for line in lines
+            ]
+        )
+
+    mock_llm_client.generate_structured.side_effect = generate
 
 
 class TestIngredientParserParseBatch:
@@ -299,3 +331,192 @@ class TestIngredientParsingPrompt:
     ) -> None:
         """Should use temperature 0 for deterministic parsing."""
         assert parser._prompt.temperature == 0.0
+
+
+class TestRuleBasedFastPath:
+    """Tests for resolving lines with the rule-based parser."""
+
+    async def test_confident_lines_skip_llm(self, mock_llm_client: MagicMock) -> None:
+        """Should not call the LLM when every line parses with high confidence."""
+        parser = IngredientParser(mock_llm_client)
+
+        result = await parser.parse_batch(["2 cups flour", "3 large eggs"])
+
+        assert [r.name for r in result] == ["flour", "eggs"]
+        assert result[1].notes == "large"
+        mock_llm_client.generate_structured.assert_not_called()
+
+    async def test_low_confidence_lines_go_to_llm(
+        self, mock_llm_client: MagicMock
+    ) -> None:
+        """Should send only lines below min_confidence to the LLM."""
+        _echo_llm(mock_llm_client)
+        parser = IngredientParser(mock_llm_client, min_confidence=0.8)
+
+        result = await parser.parse_batch(
+            ["1 tsp salt", "4 cups chicken stock or water", "salt to taste"]
+        )
+
+        assert result[0].name == "salt"
+        assert [r.name for r in result[1:]] == [
+            "4 cups chicken stock or water",
+            "salt to taste",
+        ]
+        prompt = mock_llm_client.generate_structured.call_args.kwargs["prompt"]
+        assert "1 tsp salt" not in prompt
+
+    async def test_min_confidence_is_configurable(
+        self, mock_llm_client: MagicMock
+    ) -> None:
+        """Should accept lower-confidence rule results with a lower threshold."""
+        parser = IngredientParser(mock_llm_client, min_confidence=0.5)
+
+        result = await parser.parse_batch(["4 cups chicken stock or water"])
+
+        assert result[0].unit == IngredientUnit.CUP
+        mock_llm_client.generate_structured.assert_not_called()
+
+
+class TestPerLineCache:
+    """Tests for per-ingredient-line caching."""
+
+    async def test_only_uncached_lines_go_to_llm(
+        self,
+        mock_llm_client: MagicMock,
+        mock_cache_client: MagicMock,
+    ) -> None:
+        """Should serve cached lines and send only the rest to the LLM."""
+        cached = ParsedIngredient(
+            name="all-purpose flour",
+            quantity=2.0,
+            unit=IngredientUnit.CUP,
+            notes="sifted",
+        )
+        mock_cache_client.mget = AsyncMock(
+            return_value=[orjson.dumps(cached.model_dump(mode="json")), None]
+        )
+        _echo_llm(mock_llm_client)
+        parser = IngredientParser(mock_llm_client, cache_client=mock_cache_client)
+
+        result = await parser.parse_batch(
+            ["flour for dusting, sifted", "salt to taste"]
+        )
+
+        assert result[0] == cached
+        assert result[1].name == "salt to taste"
+        prompt = mock_llm_client.generate_structured.call_args.kwargs["prompt"]
+        assert "dusting" not in prompt
+        pipeline = mock_cache_client.pipeline.return_value
+        pipeline.setex.assert_called_once()
+        assert pipeline.setex.call_args.args[0] == parser._make_cache_key(
+            "salt to taste"
+        )
+
+    async def test_cache_key_ignores_case_and_whitespace(self) -> None:
+        """Should map equivalent lines to the same key."""
+        assert IngredientParser._make_cache_key(
+            "Salt  to taste "
+        ) == IngredientParser._make_cache_key("salt to taste")
+
+    async def test_skip_cache_bypasses_line_cache_reads(
+        self,
+        mock_llm_client: MagicMock,
+        mock_cache_client: MagicMock,
+    ) -> None:
+        """Should not read the cache but still store fresh results."""
+        _echo_llm(mock_llm_client)
+        parser = IngredientParser(mock_llm_client, cache_client=mock_cache_client)
+
+        await parser.parse_batch(["salt to taste"], skip_cache=True)
+
+        mock_cache_client.mget.assert_not_called()
+        mock_cache_client.pipeline.return_value.execute.assert_awaited_once()
+
+    async def test_cache_errors_fall_back_to_llm(
+        self,
+        mock_llm_client: MagicMock,
+        mock_cache_client: MagicMock,
+    ) -> None:
+        """Should parse with the LLM when Redis fails."""
+        mock_cache_client.mget = AsyncMock(side_effect=ConnectionError("down"))
+        mock_cache_client.pipeline.return_value.execute = AsyncMock(
+            side_effect=ConnectionError("down")
+        )
+        _echo_llm(mock_llm_client)
+        parser = IngredientParser(mock_llm_client, cache_client=mock_cache_client)
+
+        result = await parser.parse_batch(["salt to taste"])
+
+        assert result[0].name == "salt to taste"
+
+    async def test_invalid_cached_value_is_a_miss(
+        self,
+        mock_llm_client: MagicMock,
+        mock_cache_client: MagicMock,
+    ) -> None:
+        """Should ignore corrupted cache entries."""
+        mock_cache_client.mget = AsyncMock(return_value=[b"not json"])
+        _echo_llm(mock_llm_client)
+        parser = IngredientParser(mock_llm_client, cache_client=mock_cache_client)
+
+        result = await parser.parse_batch(["salt to taste"])
+
+        assert result[0].name == "salt to taste"
+        mock_llm_client.generate_structured.assert_awaited_once()
+
+
+class TestChunkedLLMCalls:
+    """Tests for chunked, concurrent LLM requests."""
+
+    async def test_splits_lines_into_chunks_and_preserves_order(
+        self, mock_llm_client: MagicMock
+    ) -> None:
+        """Should send chunk_size lines per request and reassemble in order."""
+        _echo_llm(mock_llm_client)
+        parser = IngredientParser(mock_llm_client, chunk_size=2, fast_path=False)
+        lines = [f"line {i}" for i in range(5)]
+
+        result = await parser.parse_batch(lines)
+
+        assert [r.name for r in result] == lines
+        assert mock_llm_client.generate_structured.await_count == 3
+
+    async def test_deduplicates_repeated_lines(
+        self, mock_llm_client: MagicMock
+    ) -> None:
+        """Should parse each distinct line once."""
+        _echo_llm(mock_llm_client)
+        parser = IngredientParser(mock_llm_client, fast_path=False)
+
+        result = await parser.parse_batch(["salt", "pepper", "salt"])
+
+        assert [r.name for r in result] == ["salt", "pepper", "salt"]
+        prompt = mock_llm_client.generate_structured.call_args.kwargs["prompt"]
+        assert prompt.count("- salt") == 1
+
+    async def test_limits_concurrent_requests(self, mock_llm_client: MagicMock) -> None:
+        """Should run at most max_concurrency chunk requests at once."""
+        active = 0
+        peak = 0
+
+        async def generate(**kwargs: object) -> ParsedIngredientList:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return ParsedIngredientList(
+                ingredients=[
+                    ParsedIngredient(name="x", quantity=1.0, unit=IngredientUnit.UNIT)
+                ]
+            )
+
+        mock_llm_client.generate_structured.side_effect = generate
+        parser = IngredientParser(
+            mock_llm_client, chunk_size=1, max_concurrency=2, fast_path=False
+        )
+
+        await parser.parse_batch([f"line {i}" for i in range(6)])
+
+        assert peak == 2
+        assert mock_llm_client.generate_structured.await_count == 6
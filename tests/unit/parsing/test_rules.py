@@ -0,0 +1,231 @@
+"""Unit tests for the rule-based ingredient parser.
+
+Tests cover:
+- Quantities (fractions, unicode fractions, number words, ranges)
+- Units (spellings, case-sensitive abbreviations, attached and trailing units)
+- Modifiers, notes and optional markers
+- Confidence scoring and LLM hand-off rate on a typical corpus
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.llm.prompts import IngredientUnit
+from app.parsing.rules import (
+    IngredientRuleParser,
+    RuleParseResult,
+    parse_ingredient_line,
+)
+from tests.fixtures.ingredient_lines import TYPICAL_RECIPE_LINES
+
+
+pytestmark = pytest.mark.unit
+
+DEFAULT_MIN_CONFIDENCE = 0.8
+
+
+def _parse(line: str) -> RuleParseResult:
+    result = parse_ingredient_line(line)
+    assert result.ingredient is not None, line
+    return result
+
+
+class TestQuantities:
+    """Tests for quantity recognition."""
+
+    @pytest.mark.parametrize(
+        ("line", "quantity"),
+        [
+            ("2 cups flour", 2.0),
+            ("2.5 cups flour", 2.5),
+            ("1/2 cup flour", 0.5),
+            ("1 1/2 cups flour", 1.5),
+            ("½ cup flour", 0.5),
+            ("1½ cups flour", 1.5),
+            ("1 ¾ cups flour", 1.75),
+            ("two cups flour", 2.0),
+            ("a cup flour", 1.0),
+        ],
+    )
+    def test_parses_quantity_forms(self, line: str, quantity: float) -> None:
+        """Should read integers, decimals, fractions and number words."""
+        assert _parse(line).ingredient.quantity == pytest.approx(quantity)  # type: ignore[union-attr]
+
+    @pytest.mark.parametrize("line", ["1-2 onions", "1–2 onions", "1 to 2 onions"])  # noqa: RUF001
+    def test_ranges_use_upper_bound(self, line: str) -> None:
+        """Should take the upper bound of a range with reduced confidence."""
+        result = _parse(line)
+
+        assert result.ingredient.quantity == 2.0  # type: ignore[union-attr]
+        assert result.confidence < 1.0
+
+    def test_implied_quantity_for_leading_unit(self) -> None:
+        """Should assume one of a leading unit with reduced confidence."""
+        result = _parse("pinch of salt")
+
+        assert result.ingredient.quantity == 1.0  # type: ignore[union-attr]
+        assert result.ingredient.unit == IngredientUnit.PINCH  # type: ignore[union-attr]
+        assert result.confidence < 1.0
+
+    @pytest.mark.parametrize(
+        "line", ["salt to taste", "0 cups flour", "1/0 cup flour", "", "   "]
+    )
+    def test_unparseable_lines(self, line: str) -> None:
+        """Should return no ingredient and zero confidence."""
+        result = parse_ingredient_line(line)
+
+        assert result.ingredient is None
+        assert result.confidence == 0.0
+
+
+class TestUnits:
+    """Tests for unit recognition."""
+
+    @pytest.mark.parametrize(
+        ("line", "unit"),
+        [
+            ("2 tablespoons sugar", IngredientUnit.TBSP),
+            ("2 Tbsp. sugar", IngredientUnit.TBSP),
+            ("2 T sugar", IngredientUnit.TBSP),
+            ("2 t sugar", IngredientUnit.TSP),
+            ("200g butter", IngredientUnit.G),
+            ("1 kg potatoes", IngredientUnit.KG),
+            ("2 fl oz cream", IngredientUnit.OZ),
+            ("1 litre stock", IngredientUnit.L),
+            ("1 package yeast", IngredientUnit.PACKET),
+            ("1 tin chickpeas", IngredientUnit.CAN),
+            ("3 eggs", IngredientUnit.PIECE),
+        ],
+    )
+    def test_maps_spellings_to_units(self, line: str, unit: IngredientUnit) -> None:
+        """Should map unit spellings to the IngredientUnit vocabulary."""
+        assert _parse(line).ingredient.unit == unit  # type: ignore[union-attr]
+
+    def test_trailing_unit(self) -> None:
+        """Should recognize clove/slice after the name."""
+        ingredient = _parse("2 garlic cloves").ingredient
+
+        assert ingredient is not None
+        assert ingredient.name == "garlic"
+        assert ingredient.unit == IngredientUnit.CLOVE
+
+    def test_trailing_unit_word_of_other_names_stays_in_name(self) -> None:
+        """Should only treat clove/slice as a unit after names they measure."""
+        ingredient = _parse("5 whole cloves").ingredient
+
+        assert ingredient is not None
+        assert ingredient.name == "whole cloves"
+        assert ingredient.quantity == 5.0
+        assert ingredient.unit == IngredientUnit.PIECE
+
+    @pytest.mark.parametrize(
+        ("line", "name", "unit", "notes"),
+        [
+            ("12 oz bag chocolate chips", "chocolate chips", IngredientUnit.OZ, "bag"),
+            ("14 oz can of chickpeas", "chickpeas", IngredientUnit.OZ, "can"),
+            ("8 oz package cream cheese", "cream cheese", IngredientUnit.OZ, "package"),
+        ],
+    )
+    def test_package_after_measured_amount(
+        self, line: str, name: str, unit: IngredientUnit, notes: str
+    ) -> None:
+        """Should keep the package word of a measured amount as a note."""
+        result = _parse(line)
+
+        assert result.ingredient is not None
+        assert result.ingredient.name == name
+        assert result.ingredient.unit == unit
+        assert result.ingredient.notes == notes
+        assert result.confidence == 1.0
+
+    def test_unit_without_name_is_unparseable(self) -> None:
+        """Should not treat a bare unit as the ingredient name."""
+        assert parse_ingredient_line("2 cups").ingredient is None
+
+
+class TestModifiersAndNotes:
+    """Tests for modifiers, notes and optional markers."""
+
+    def test_moves_modifiers_and_comma_clause_to_notes(self) -> None:
+        """Should strip leading modifiers and keep them as notes."""
+        ingredient = _parse("1 cup finely chopped fresh parsley, packed").ingredient
+
+        assert ingredient is not None
+        assert ingredient.name == "parsley"
+        assert ingredient.notes == "finely chopped fresh, packed"
+
+    def test_package_size_parenthetical(self) -> None:
+        """Should keep the package size as a note."""
+        ingredient = _parse("1 (14 oz) can diced tomatoes").ingredient
+
+        assert ingredient is not None
+        assert ingredient.name == "tomatoes"
+        assert ingredient.quantity == 1.0
+        assert ingredient.unit == IngredientUnit.CAN
+        assert ingredient.notes == "diced, 14 oz"
+
+    @pytest.mark.parametrize(
+        "line",
+        ["1 tsp vanilla (optional)", "1 tsp vanilla, optional", "1 tsp vanilla"],
+    )
+    def test_optional_marker(self, line: str) -> None:
+        """Should set is_optional only for optional lines."""
+        ingredient = _parse(line).ingredient
+
+        assert ingredient is not None
+        assert ingredient.name == "vanilla"
+        assert ingredient.is_optional is ("optional" in line)
+        assert ingredient.notes is None
+
+    def test_name_is_lowercased(self) -> None:
+        """Should normalize the name to lowercase."""
+        assert _parse("1 Can Chickpeas").ingredient.name == "chickpeas"  # type: ignore[union-attr]
+
+
+class TestConfidence:
+    """Tests for confidence scoring."""
+
+    def test_simple_line_has_full_confidence(self) -> None:
+        """Should be fully confident for quantity-unit-name lines."""
+        assert _parse("2 cups all-purpose flour, sifted").confidence == 1.0
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "1 cup chicken broth or water",
+            "2 sprigs fresh thyme",
+            "4 boneless skinless chicken breasts cut into strips",
+            "1 cup 2% milk",
+            "4 boneless, skinless chicken breasts",
+            "1 stick butter",
+            "2 jars roasted red peppers",
+        ],
+    )
+    def test_ambiguous_lines_fall_below_threshold(self, line: str) -> None:
+        """Should score alternatives, containers and unusual names low."""
+        assert parse_ingredient_line(line).confidence < DEFAULT_MIN_CONFIDENCE
+
+    def test_custom_tables(self) -> None:
+        """Should use custom unit spellings when given."""
+        rules = IngredientRuleParser(
+            unit_spellings={IngredientUnit.CUP: ("mug",)}, modifiers=frozenset()
+        )
+
+        result = rules.parse("2 mugs tea")
+
+        assert result.ingredient is not None
+        assert result.ingredient.unit == IngredientUnit.PIECE
+        assert rules.parse("2 mug tea").ingredient.unit == IngredientUnit.CUP  # type: ignore[union-attr]
+
+    def test_handles_most_typical_lines_without_llm(self) -> None:
+        """Should resolve well over half of typical recipe lines confidently."""
+        confident = [
+            line
+            for line in TYPICAL_RECIPE_LINES
+            if parse_ingredient_line(line).confidence >= DEFAULT_MIN_CONFIDENCE
+        ]
+
+        assert len(confident) / len(TYPICAL_RECIPE_LINES) >= 0.75
+        assert "Salt and pepper to taste" not in confident
+        assert "2-3 sprigs fresh thyme" not in confident
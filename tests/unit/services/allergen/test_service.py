@@ -33,7 +33,9 @@ def mock_cache_client() -> MagicMock:
     """Create mock Redis cache client."""
     client = MagicMock()
     client.get = AsyncMock(return_value=None)
+    client.mget = AsyncMock(side_effect=lambda keys: [None] * len(keys))
     client.setex = AsyncMock(return_value=True)
+    client.pipeline.return_value.execute = AsyncMock(return_value=[])
     return client
 
 
@@ -363,6 +365,72 @@ class TestGetRecipeAllergens:
 
         await service.shutdown()
 
+    async def test_reads_cache_with_single_mget(
+        self,
+        service: AllergenService,
+        mock_cache_client: MagicMock,
+        mock_repository: MagicMock,
+    ) -> None:
+        """Should resolve cached ingredients from one MGET without tier lookups."""
+        await service.initialize()
+
+        cached = IngredientAllergenResponse(
+            ingredient_name="flour",
+            allergens=[
+                AllergenInfo(
+                    allergen=Allergen.GLUTEN,
+                    presence_type=AllergenPresenceType.CONTAINS,
+                )
+            ],
+        )
+        mock_cache_client.mget.side_effect = None
+        mock_cache_client.mget.return_value = [
+            orjson.dumps(cached.model_dump(mode="json")),
+            None,
+        ]
+
+        ingredients = [
+            Ingredient(ingredient_id=1, name="flour"),
+            Ingredient(ingredient_id=2, name="unknown"),
+        ]
+
+        result = await service.get_recipe_allergens(ingredients)
+
+        assert Allergen.GLUTEN in result.contains
+        assert result.missing_ingredients == [2]
+        mock_cache_client.mget.assert_awaited_once_with(
+            ["allergen:flour", "allergen:unknown"]
+        )
+        mock_cache_client.get.assert_not_called()
+        mock_repository.get_by_ingredient_name.assert_awaited_once_with("unknown")
+
+        await service.shutdown()
+
+    async def test_writes_misses_back_in_one_pipeline(
+        self,
+        service: AllergenService,
+        mock_cache_client: MagicMock,
+        mock_repository: MagicMock,
+        sample_allergen_data: AllergenData,
+    ) -> None:
+        """Should cache all newly resolved ingredients in one pipeline."""
+        await service.initialize()
+        mock_repository.get_by_ingredient_name.return_value = [sample_allergen_data]
+
+        ingredients = [
+            Ingredient(ingredient_id=1, name="flour"),
+            Ingredient(ingredient_id=2, name="bread flour"),
+        ]
+
+        await service.get_recipe_allergens(ingredients)
+
+        pipe = mock_cache_client.pipeline.return_value
+        assert pipe.setex.call_count == 2
+        pipe.execute.assert_awaited_once()
+        mock_cache_client.setex.assert_not_called()
+
+        await service.shutdown()
+
 
 class TestAllergenAggregation:
     """Tests for _aggregate_allergens method."""
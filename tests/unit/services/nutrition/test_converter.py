@@ -20,6 +20,7 @@ def mock_repository() -> MagicMock:
     """Create mock NutritionRepository."""
     repo = MagicMock()
     repo.get_portion_weight = AsyncMock(return_value=None)
+    repo.get_portion_weights = AsyncMock(return_value={})
     return repo
 
 
@@ -231,6 +232,83 @@ class TestUnitTypeChecks:
         assert converter.is_count_unit(IngredientUnit.CUP) is False
 
 
+class TestBatchConversions:
+    """Tests for to_grams_batch."""
+
+    async def test_single_portion_lookup_for_all_items(
+        self,
+        converter_with_repo: UnitConverter,
+        mock_repository: MagicMock,
+    ) -> None:
+        """Should fetch every needed portion weight in one repository call."""
+        mock_repository.get_portion_weights.return_value = {
+            ("flour", "CUP", None): Decimal(125),
+            ("garlic", "CLOVE", None): Decimal(3),
+        }
+
+        result = await converter_with_repo.to_grams_batch(
+            [
+                (Quantity(amount=2, measurement=IngredientUnit.CUP), " Flour "),
+                (Quantity(amount=4, measurement=IngredientUnit.CLOVE), "garlic"),
+                (Quantity(amount=1, measurement=IngredientUnit.KG), "sugar"),
+                (Quantity(amount=1, measurement=IngredientUnit.CUP), "flour"),
+            ]
+        )
+
+        assert result == [Decimal(250), Decimal(12), Decimal(1000), Decimal(125)]
+        mock_repository.get_portion_weights.assert_awaited_once_with(
+            [("flour", "CUP", None), ("garlic", "CLOVE", None)]
+        )
+        mock_repository.get_portion_weight.assert_not_called()
+
+    async def test_falls_back_for_missing_portions(
+        self,
+        converter_with_repo: UnitConverter,
+    ) -> None:
+        """Should apply the same fallbacks as to_grams when no portion exists."""
+        result = await converter_with_repo.to_grams_batch(
+            [
+                (Quantity(amount=100, measurement=IngredientUnit.ML), "water"),
+                (Quantity(amount=2, measurement=IngredientUnit.PIECE), "apple"),
+            ]
+        )
+
+        assert result == [Decimal(100), Decimal(200)]
+
+    async def test_weight_only_skips_repository(
+        self,
+        converter_with_repo: UnitConverter,
+        mock_repository: MagicMock,
+    ) -> None:
+        """Should not query portions when all items are weights."""
+        result = await converter_with_repo.to_grams_batch(
+            [(Quantity(amount=1, measurement=IngredientUnit.G), "salt")]
+        )
+
+        assert result == [Decimal(1)]
+        mock_repository.get_portion_weights.assert_not_called()
+
+    async def test_conversion_error_yields_none(
+        self,
+        converter: UnitConverter,
+    ) -> None:
+        """Should return None in place of items that fail to convert."""
+        from unittest.mock import patch
+
+        with patch(
+            "app.services.nutrition.converter.PINT_UNIT_MAP",
+            {IngredientUnit.G: "gram"},
+        ):
+            result = await converter.to_grams_batch(
+                [
+                    (Quantity(amount=1, measurement=IngredientUnit.G), "flour"),
+                    (Quantity(amount=1, measurement=IngredientUnit.KG), "flour"),
+                ]
+            )
+
+        assert result == [Decimal(1), None]
+
+
 class TestConversionErrors:
     """Tests for conversion error handling."""
 
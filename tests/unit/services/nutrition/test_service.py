@@ -28,7 +28,9 @@ def mock_cache_client() -> MagicMock:
     """Create mock Redis cache client."""
     client = MagicMock()
     client.get = AsyncMock(return_value=None)
+    client.mget = AsyncMock(side_effect=lambda keys: [None] * len(keys))
     client.setex = AsyncMock(return_value=True)
+    client.pipeline.return_value.execute = AsyncMock(return_value=[])
     return client
 
 
@@ -41,6 +43,7 @@ def mock_repository() -> MagicMock:
     repo.get_by_ingredient_name_fuzzy = AsyncMock(return_value=None)
     repo.get_by_ingredient_names_fuzzy = AsyncMock(return_value={})
     repo.get_portion_weight = AsyncMock(return_value=None)
+    repo.get_portion_weights = AsyncMock(return_value={})
     return repo
 
 
@@ -536,6 +539,166 @@ class TestGetRecipeNutrition:
         await service.shutdown()
 
 
+class TestGetRecipeNutritionConversion:
+    """Tests for batched unit conversion in recipe nutrition lookups."""
+
+    async def test_converts_all_quantities_with_one_portion_lookup(
+        self,
+        service: NutritionService,
+        mock_repository: MagicMock,
+        sample_nutrition_data: NutritionData,
+    ) -> None:
+        """Should fetch portion weights for the whole recipe in one call."""
+        await service.initialize()
+
+        sugar = sample_nutrition_data.model_copy(update={"ingredient_name": "sugar"})
+        mock_repository.get_by_ingredient_names.return_value = {
+            "flour": sample_nutrition_data,
+            "sugar": sugar,
+        }
+        mock_repository.get_portion_weights.return_value = {
+            ("flour", "CUP", None): Decimal(125),
+            ("sugar", "TBSP", None): Decimal("12.5"),
+        }
+
+        ingredients = [
+            Ingredient(
+                ingredient_id=1,
+                name="flour",
+                quantity=Quantity(amount=2, measurement=IngredientUnit.CUP),
+            ),
+            Ingredient(
+                ingredient_id=2,
+                name="sugar",
+                quantity=Quantity(amount=2, measurement=IngredientUnit.TBSP),
+            ),
+        ]
+
+        result = await service.get_recipe_nutrition(ingredients)
+
+        assert result.total.quantity.amount == 275.0
+        mock_repository.get_portion_weights.assert_awaited_once()
+        mock_repository.get_portion_weight.assert_not_called()
+
+        await service.shutdown()
+
+
+class TestGetRecipeNutritionCaching:
+    """Tests for batched caching in recipe nutrition lookups."""
+
+    async def test_reads_all_names_with_single_mget(
+        self,
+        service: NutritionService,
+        mock_cache_client: MagicMock,
+        mock_repository: MagicMock,
+        sample_nutrition_data: NutritionData,
+    ) -> None:
+        """Should read every ingredient with one MGET and skip the database."""
+        await service.initialize()
+
+        cached_bytes = orjson.dumps(sample_nutrition_data.model_dump(mode="json"))
+        mock_cache_client.mget.side_effect = None
+        mock_cache_client.mget.return_value = [cached_bytes, cached_bytes]
+
+        ingredients = [
+            Ingredient(
+                ingredient_id=1,
+                name="flour",
+                quantity=Quantity(amount=100, measurement=IngredientUnit.G),
+            ),
+            Ingredient(
+                ingredient_id=2,
+                name="Flour ",
+                quantity=Quantity(amount=50, measurement=IngredientUnit.G),
+            ),
+        ]
+
+        result = await service.get_recipe_nutrition(ingredients)
+
+        assert result.ingredients is not None
+        assert len(result.ingredients) == 2
+        mock_cache_client.mget.assert_awaited_once_with(
+            ["nutrition:flour", "nutrition:flour"]
+        )
+        mock_cache_client.get.assert_not_called()
+        mock_repository.get_by_ingredient_names.assert_not_called()
+
+        await service.shutdown()
+
+    async def test_writes_misses_back_in_one_pipeline(
+        self,
+        service: NutritionService,
+        mock_cache_client: MagicMock,
+        mock_repository: MagicMock,
+        sample_nutrition_data: NutritionData,
+    ) -> None:
+        """Should write exact and fuzzy database hits back in one pipeline."""
+        await service.initialize()
+
+        mock_repository.get_by_ingredient_names.return_value = {
+            "flour": sample_nutrition_data,
+        }
+        mock_repository.get_by_ingredient_names_fuzzy.return_value = {
+            "ap flour": sample_nutrition_data,
+        }
+
+        result = await service._get_batch_nutrition_data(["flour", "ap flour"])
+
+        assert set(result) == {"flour", "ap flour"}
+        pipe = mock_cache_client.pipeline.return_value
+        assert pipe.setex.call_count == 2
+        keys = {call.args[0] for call in pipe.setex.call_args_list}
+        assert keys == {"nutrition:flour", "nutrition:ap flour"}
+        pipe.execute.assert_awaited_once()
+        mock_cache_client.setex.assert_not_called()
+
+        await service.shutdown()
+
+    async def test_cache_read_error_falls_back_to_database(
+        self,
+        service: NutritionService,
+        mock_cache_client: MagicMock,
+        mock_repository: MagicMock,
+        sample_nutrition_data: NutritionData,
+    ) -> None:
+        """Should treat every name as a miss when MGET fails."""
+        await service.initialize()
+
+        mock_cache_client.mget.side_effect = Exception("Redis error")
+        mock_repository.get_by_ingredient_names.return_value = {
+            "flour": sample_nutrition_data,
+        }
+
+        result = await service._get_batch_nutrition_data(["flour"])
+
+        assert result["flour"] == sample_nutrition_data
+
+        await service.shutdown()
+
+    async def test_cache_write_error_is_swallowed(
+        self,
+        service: NutritionService,
+        mock_cache_client: MagicMock,
+        mock_repository: MagicMock,
+        sample_nutrition_data: NutritionData,
+    ) -> None:
+        """Should still return results when the pipelined write fails."""
+        await service.initialize()
+
+        mock_cache_client.pipeline.return_value.execute.side_effect = Exception(
+            "Redis error"
+        )
+        mock_repository.get_by_ingredient_names.return_value = {
+            "flour": sample_nutrition_data,
+        }
+
+        result = await service._get_batch_nutrition_data(["flour"])
+
+        assert result["flour"] == sample_nutrition_data
+
+        await service.shutdown()
+
+
 class TestErrorHandling:
     """Tests for error handling."""
 
@@ -574,16 +737,12 @@ class TestErrorHandling:
             "flour": sample_nutrition_data,
         }
 
-        # Make converter fail for this specific call
-        original_to_grams = service._converter.to_grams
-        error_msg = "Test error"
-
-        async def failing_to_grams(quantity: Quantity, name: str) -> Decimal:
-            if name == "flour":
-                raise ConversionError(error_msg)
-            return await original_to_grams(quantity, name)
-
-        with patch.object(service._converter, "to_grams", side_effect=failing_to_grams):
+        # Make batch conversion fail for flour (None marks a ConversionError)
+        with patch.object(
+            service._converter,
+            "to_grams_batch",
+            AsyncMock(return_value=[None]),
+        ):
             ingredients = [
                 Ingredient(
                     ingredient_id=1,
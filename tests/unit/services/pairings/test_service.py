@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from dataclasses import asdict
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import orjson
 import pytest
 
+from app.cache.swr import decode_swr_entry, encode_swr_entry
 from app.llm.exceptions import (
     LLMRateLimitError,
     LLMTimeoutError,
@@ -28,6 +31,9 @@ def mock_cache_client() -> MagicMock:
     client = MagicMock()
     client.get = AsyncMock(return_value=None)
     client.setex = AsyncMock(return_value=True)
+    client.set = AsyncMock(return_value=True)  # single-flight lock
+    client.exists = AsyncMock(return_value=0)
+    client.eval = AsyncMock(return_value=1)
     return client
 
 
@@ -646,3 +652,113 @@ class TestResponseTransformation:
         assert result.recipe_id == 123
 
         await service.shutdown()
+
+
+class TestRequestCoalescing:
+    """Tests for single-flight coalescing of concurrent cache misses."""
+
+    async def test_concurrent_misses_share_one_generation(
+        self,
+        service: PairingsService,
+        mock_cache_client: MagicMock,
+        mock_llm_client: MagicMock,
+        sample_pairing_result: PairingListResult,
+        sample_recipe_context: RecipeContext,
+    ) -> None:
+        """Should call the LLM once for concurrent requests for one recipe."""
+        await service.initialize()
+        release = asyncio.Event()
+
+        async def generate(**_: object) -> PairingListResult:
+            await release.wait()
+            return sample_pairing_result
+
+        mock_llm_client.generate_structured.side_effect = generate
+
+        pending = [
+            asyncio.create_task(service.get_pairings(sample_recipe_context))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        release.set()
+        results = await asyncio.gather(*pending)
+
+        assert all(r is not None for r in results)
+        mock_llm_client.generate_structured.assert_awaited_once()
+        mock_cache_client.setex.assert_awaited_once()
+        mock_cache_client.set.assert_awaited_once()
+
+
+class TestStaleWhileRevalidate:
+    """Tests for serving stale cache entries while revalidating."""
+
+    async def test_stale_hit_serves_and_schedules_revalidation(
+        self,
+        service: PairingsService,
+        mock_cache_client: MagicMock,
+        mock_llm_client: MagicMock,
+        sample_pairing_result: PairingListResult,
+        sample_recipe_context: RecipeContext,
+    ) -> None:
+        """Should return the stale entry and enqueue a background refresh."""
+        await service.initialize()
+        mock_cache_client.get.return_value = encode_swr_entry(
+            sample_pairing_result.model_dump(mode="json"), -1
+        )
+
+        with patch(
+            "app.services.pairings.service.schedule_revalidation",
+            new_callable=AsyncMock,
+        ) as mock_schedule:
+            result = await service.get_pairings(sample_recipe_context)
+
+        assert result is not None
+        mock_llm_client.generate_structured.assert_not_called()
+        mock_schedule.assert_awaited_once_with(
+            "pairings",
+            f"pairing:{sample_recipe_context.recipe_id}",
+            "revalidate_pairings",
+            asdict(sample_recipe_context),
+        )
+
+    async def test_fresh_hit_does_not_revalidate(
+        self,
+        service: PairingsService,
+        mock_cache_client: MagicMock,
+        sample_pairing_result: PairingListResult,
+        sample_recipe_context: RecipeContext,
+    ) -> None:
+        """Should not enqueue a refresh for fresh entries."""
+        await service.initialize()
+        mock_cache_client.get.return_value = encode_swr_entry(
+            sample_pairing_result.model_dump(mode="json"), 3600
+        )
+
+        with patch(
+            "app.services.pairings.service.schedule_revalidation",
+            new_callable=AsyncMock,
+        ) as mock_schedule:
+            result = await service.get_pairings(sample_recipe_context)
+
+        assert result is not None
+        mock_schedule.assert_not_awaited()
+
+    async def test_refresh_regenerates_and_writes_envelope(
+        self,
+        service: PairingsService,
+        mock_cache_client: MagicMock,
+        mock_llm_client: MagicMock,
+        sample_pairing_result: PairingListResult,
+        sample_recipe_context: RecipeContext,
+    ) -> None:
+        """Should bypass the cache and store a fresh SWR envelope."""
+        await service.initialize()
+        mock_llm_client.generate_structured.return_value = sample_pairing_result
+
+        result = await service.refresh_pairings(sample_recipe_context)
+
+        assert result == sample_pairing_result
+        mock_cache_client.get.assert_not_called()
+        _, ttl, raw = mock_cache_client.setex.call_args.args
+        assert ttl == PAIRINGS_CACHE_TTL_SECONDS
+        assert decode_swr_entry(raw).stale is False
@@ -5,6 +5,8 @@ from __future__ import annotations
 import pytest
 
 from app.services.popular.extraction import (
+    PageDocument,
+    analyze_recipe_page,
     extract_engagement_metrics,
     extract_recipe_links,
     is_recipe_page,
@@ -575,6 +577,27 @@ class TestIsRecipePage:
 # =============================================================================
 
 
+class TestAnalyzeRecipePage:
+    """Tests for analyze_recipe_page."""
+
+    def test_returns_metrics_for_recipe_page_bytes(self) -> None:
+        """Should decode bytes and extract metrics from a recipe page."""
+        html = b"""
+        <script type="application/ld+json">
+        {"@type": "Recipe", "aggregateRating": {"ratingValue": "4.2"}}
+        </script>
+        """
+
+        metrics = analyze_recipe_page(html)
+
+        assert metrics is not None
+        assert metrics.rating == 4.2
+
+    def test_returns_none_for_non_recipe_page(self) -> None:
+        """Should return None when the page is not a recipe page."""
+        assert analyze_recipe_page(b"<html><body>Category</body></html>") is None
+
+
 class TestFindRecipeInJsonld:
     """Tests for _find_recipe_in_jsonld helper."""
 
@@ -1088,14 +1111,11 @@ class TestFindCountInHtml:
 
     def test_finds_count_by_id(self) -> None:
         """Should find count in element with matching id."""
-        from bs4 import BeautifulSoup
-
-        from app.services.popular.extraction import _find_count_in_html
+        from app.services.popular.extraction import PageDocument, _find_count_in_html
 
         html = '<div id="review-count">500</div>'
-        soup = BeautifulSoup(html, "html.parser")
 
-        result = _find_count_in_html(soup, ["review"])
+        result = _find_count_in_html(PageDocument(html), ["review"])
 
         assert result == 500
 
@@ -1317,3 +1337,66 @@ class TestExtractRecipeLinksHelpers:
 
         # Should not crash and may return empty or filtered results
         assert isinstance(links, list)
+
+
+class TestPageDocument:
+    """Tests for the shared parsed-document model."""
+
+    HTML = """
+    <html><head>
+    <script type="application/ld+json">{"@type": "WebSite"}</script>
+    <script type="Application/LD+JSON">
+    {"@graph": [{"@type": "Recipe", "name": "Soup"}]}
+    </script>
+    <script type="application/ld+json">{not json}</script>
+    </head><body>
+    <div itemscope itemtype="https://schema.org/Recipe">
+    <meta itemprop="ratingValue" content="4.1">
+    <meta itemprop="ratingValue" content="2.0">
+    </div>
+    <span class="Review-Count big" id="Reviews-Total">12</span>
+    <span class="stars">4.3</span>
+    </body></html>
+    """
+
+    def test_decodes_jsonld_blocks_once(self) -> None:
+        """Should decode valid JSON-LD blocks and cache the result."""
+        doc = PageDocument(self.HTML)
+
+        assert len(doc.jsonld) == 2
+        assert doc.jsonld is doc.jsonld
+        assert doc.recipe_jsonld == {"@type": "Recipe", "name": "Soup"}
+
+    def test_indexes_microdata(self) -> None:
+        """Should index the first element per itemprop and Recipe itemtypes."""
+        doc = PageDocument(self.HTML)
+
+        elem = doc.itemprop("ratingValue")
+        assert elem is not None
+        assert elem.get("content") == "4.1"
+        assert doc.itemprop("ratingCount") is None
+        assert doc.has_recipe_itemtype
+
+    def test_finds_by_class_and_id_case_insensitively(self) -> None:
+        """Should match keywords as substrings of lowercased names."""
+        doc = PageDocument(self.HTML)
+
+        assert [e.get_text() for e in doc.find_by_class("review-count")] == ["12"]
+        assert [e.get_text() for e in doc.find_by_id("reviews")] == ["12"]
+        assert [e.get_text() for e in doc.find_by_class("star")] == ["4.3"]
+        assert doc.find_by_class("missing") == []
+
+    def test_accepts_bytes(self) -> None:
+        """Should decode page bytes."""
+        doc = PageDocument(self.HTML.encode())
+
+        assert doc.recipe_jsonld is not None
+
+    def test_shared_by_check_and_extraction(self) -> None:
+        """Should run the recipe check and extraction off one document."""
+        doc = PageDocument(self.HTML)
+
+        assert is_recipe_page(doc)
+        metrics = extract_engagement_metrics(doc)
+        assert metrics.rating == 4.1
+        assert metrics.reviews == 12
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -28,9 +29,15 @@ def mock_settings() -> MagicMock:
     mock.scraping.popular_recipes.enabled = True
     mock.scraping.popular_recipes.cache_ttl = 86400
     mock.scraping.popular_recipes.cache_key = "popular_recipes"
+    mock.scraping.popular_recipes.page_size = 20
     mock.scraping.popular_recipes.target_total = 500
     mock.scraping.popular_recipes.fetch_timeout = 30.0
     mock.scraping.popular_recipes.max_concurrent_fetches = 5
+    mock.scraping.popular_recipes.max_body_bytes = 1_000_000
+    mock.scraping.popular_recipes.stop_after_jsonld = True
+    mock.scraping.popular_recipes.source_refresh_interval = 21600
+    mock.scraping.popular_recipes.detail_fresh_ttl = 0
+    mock.scraping.validator_ttl = 604800
 
     # Source config
     source = MagicMock()
@@ -40,6 +47,7 @@ def mock_settings() -> MagicMock:
     source.enabled = True
     source.max_recipes = 10
     source.source_weight = 1.0
+    source.refresh_interval = None
     mock.scraping.popular_recipes.sources = [source]
 
     # Scoring weights
@@ -52,6 +60,27 @@ def mock_settings() -> MagicMock:
     return mock
 
 
+def _paged_cache_client() -> MagicMock:
+    """Create a dict-backed Redis mock for the popular recipes cache layout."""
+    stored: dict[str, bytes] = {}
+    mock_cache = MagicMock()
+    mock_cache.get = AsyncMock(side_effect=stored.get)
+    mock_cache.mget = AsyncMock(side_effect=lambda keys: [stored.get(k) for k in keys])
+    mock_cache.set = AsyncMock(
+        side_effect=lambda key, value, ex: stored.__setitem__(key, value)
+    )
+    mock_cache.pipeline.return_value.setex = MagicMock(
+        side_effect=lambda key, _ttl, value: stored.__setitem__(key, value)
+    )
+    mock_cache.pipeline.return_value.execute = AsyncMock()
+    return mock_cache
+
+
+def _serve(service: PopularRecipesService, handler: Any) -> None:
+    """Route the service's HTTP client through a mock transport."""
+    service._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
 @pytest.fixture
 def service(mock_settings: MagicMock) -> PopularRecipesService:
     """Create a PopularRecipesService instance."""
@@ -175,7 +204,7 @@ class TestCaching:
         self, service: PopularRecipesService, mock_settings: MagicMock
     ) -> None:
         """Should return cached data on cache hit."""
-        mock_cache = AsyncMock()
+        mock_cache = _paged_cache_client()
         cached_data = PopularRecipesData(
             recipes=[
                 PopularRecipe(
@@ -187,18 +216,53 @@ class TestCaching:
             ],
             total_count=1,
         )
-        mock_cache.get = AsyncMock(return_value=cached_data.model_dump_json().encode())
 
         with patch(
             "app.services.popular.service.get_settings", return_value=mock_settings
         ):
             service = PopularRecipesService(cache_client=mock_cache)
+        await service._save_to_cache(cached_data)
 
         data = await service._get_or_refresh_cache()
 
         assert data.total_count == 1
         assert data.recipes[0].recipe_name == "Cached Recipe"
-        mock_cache.get.assert_called_once()
+        mock_cache.mget.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_popular_recipes_reads_cached_pages(
+        self, mock_settings: MagicMock
+    ) -> None:
+        """Should serve a page from the cached pages covering it."""
+        mock_cache = _paged_cache_client()
+        cached_data = PopularRecipesData(
+            recipes=[
+                PopularRecipe(
+                    recipe_name=f"Recipe {i}",
+                    url=f"https://test.com/recipe/{i}",
+                    source="TestSource",
+                    raw_rank=i + 1,
+                )
+                for i in range(100)
+            ],
+            total_count=100,
+        )
+
+        with patch(
+            "app.services.popular.service.get_settings", return_value=mock_settings
+        ):
+            service = PopularRecipesService(cache_client=mock_cache)
+        await service._save_to_cache(cached_data)
+        service._fetch_all_sources = AsyncMock()
+
+        recipes, total = await service.get_popular_recipes(limit=20, offset=40)
+
+        assert total == 100
+        assert [r.recipe_name for r in recipes] == [
+            f"Recipe {i}" for i in range(40, 60)
+        ]
+        assert len(mock_cache.mget.call_args.args[0]) == 1
+        service._fetch_all_sources.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_cache_miss_fetches_fresh_data(
@@ -233,6 +297,7 @@ class TestCaching:
     async def test_invalidate_cache_deletes_key(self, mock_settings: MagicMock) -> None:
         """Should delete cache key on invalidation."""
         mock_cache = AsyncMock()
+        mock_cache.get = AsyncMock(return_value=None)
         mock_cache.delete = AsyncMock()
 
         with patch(
@@ -362,15 +427,7 @@ class TestFetchSource:
         source.popular_endpoint = "/popular"
 
         # Mock HTTP response with error
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        service._http_client.get = AsyncMock(
-            side_effect=httpx.HTTPStatusError(
-                "Not Found",
-                request=MagicMock(),
-                response=mock_response,
-            )
-        )
+        _serve(service, lambda _: httpx.Response(404))
 
         with pytest.raises(PopularRecipesFetchError):
             await service._fetch_source(source)
@@ -386,28 +443,119 @@ class TestRefreshCache:
         self, service: PopularRecipesService
     ) -> None:
         """Should fetch fresh data and save to cache."""
-        fresh_data = PopularRecipesData(
-            recipes=[
-                PopularRecipe(
-                    recipe_name="Fresh Recipe",
-                    url="https://test.com/fresh",
-                    source="TestSource",
-                    raw_rank=1,
-                )
-            ],
-            total_count=1,
-        )
+        fresh_recipes = [
+            PopularRecipe(
+                recipe_name="Fresh Recipe",
+                url="https://test.com/fresh",
+                source="TestSource",
+                raw_rank=1,
+            )
+        ]
 
-        service._fetch_all_sources = AsyncMock(return_value=fresh_data)
+        service._fetch_source = AsyncMock(return_value=fresh_recipes)
         service._save_to_cache = AsyncMock()
 
         result = await service.refresh_cache()
 
         assert result.total_count == 1
-        service._fetch_all_sources.assert_called_once()
+        service._fetch_source.assert_called_once()
         service._save_to_cache.assert_called_once()
 
 
+class TestIncrementalRefresh:
+    """Tests for per-source refreshes rebuilding from cached source results."""
+
+    @staticmethod
+    def _recipe(name: str, source: str) -> PopularRecipe:
+        return PopularRecipe(
+            recipe_name=name,
+            url=f"https://test.com/{name}",
+            source=source,
+            raw_rank=1,
+        )
+
+    @pytest.fixture
+    def cached_service(self, mock_settings: MagicMock) -> PopularRecipesService:
+        """Service with two sources and a dict-backed cache."""
+        source2 = MagicMock()
+        source2.name = "OtherSource"
+        source2.enabled = True
+        source2.source_weight = 1.0
+        source2.refresh_interval = 60
+        mock_settings.scraping.popular_recipes.sources.append(source2)
+        with patch(
+            "app.services.popular.service.get_settings", return_value=mock_settings
+        ):
+            return PopularRecipesService(cache_client=_paged_cache_client())
+
+    @pytest.mark.asyncio
+    async def test_refreshes_one_source_and_reuses_others(
+        self, cached_service: PopularRecipesService
+    ) -> None:
+        """Should fetch only the given source and rank it with cached ones."""
+        await cached_service._save_source_result(
+            "OtherSource", [self._recipe("Kept", "OtherSource")]
+        )
+        cached_service._fetch_source = AsyncMock(
+            return_value=[self._recipe("New", "TestSource")]
+        )
+
+        data = await cached_service.refresh_cache(["TestSource"])
+
+        cached_service._fetch_source.assert_called_once()
+        assert {r.recipe_name for r in data.recipes} == {"New", "Kept"}
+        assert data.sources_fetched == ["TestSource", "OtherSource"]
+        cached = await cached_service._get_from_cache()
+        assert cached is not None
+        assert cached.total_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_source_falls_back_to_cached_result(
+        self, cached_service: PopularRecipesService
+    ) -> None:
+        """Should keep a failing source's last result in the ranking."""
+        await cached_service._save_source_result(
+            "OtherSource", [self._recipe("Kept", "OtherSource")]
+        )
+
+        async def fetch(source: MagicMock) -> list[PopularRecipe]:
+            if source.name == "OtherSource":
+                msg = "Failed"
+                raise PopularRecipesFetchError(msg, source="OtherSource")
+            return [self._recipe("New", "TestSource")]
+
+        cached_service._fetch_source = AsyncMock(side_effect=fetch)
+
+        data = await cached_service.refresh_cache()
+
+        assert {r.recipe_name for r in data.recipes} == {"New", "Kept"}
+        assert "OtherSource" in data.fetch_errors
+        assert "OtherSource" in data.sources_fetched
+
+    @pytest.mark.asyncio
+    async def test_get_stale_sources(
+        self, cached_service: PopularRecipesService
+    ) -> None:
+        """Should report sources without a result or past their interval."""
+        await cached_service._save_source_result("TestSource", [])
+        await cached_service._save_source_result("OtherSource", [])
+        assert await cached_service.get_stale_sources() == []
+
+        with patch("app.services.popular.store.time.time", return_value=1e12):
+            stale = await cached_service.get_stale_sources()
+
+        assert stale == ["TestSource", "OtherSource"]
+
+    @pytest.mark.asyncio
+    async def test_missing_source_result_is_stale(
+        self, cached_service: PopularRecipesService
+    ) -> None:
+        """Should report a source that has never been fetched."""
+        await cached_service._save_source_result("TestSource", [])
+
+        assert await cached_service.get_stale_sources() == ["OtherSource"]
+
+
 class TestCacheOperations:
     """Tests for cache helper methods."""
 
@@ -455,8 +603,10 @@ class TestCacheOperations:
         self, mock_settings: MagicMock
     ) -> None:
         """Should handle cache write exceptions gracefully."""
-        mock_cache = AsyncMock()
-        mock_cache.setex = AsyncMock(side_effect=Exception("Cache error"))
+        mock_cache = _paged_cache_client()
+        mock_cache.pipeline.return_value.execute = AsyncMock(
+            side_effect=Exception("Cache error")
+        )
 
         with patch(
             "app.services.popular.service.get_settings", return_value=mock_settings
@@ -492,10 +642,11 @@ class TestFetchSourceExtended:
         source.base_url = "https://test.com"
         source.popular_endpoint = "/popular"
 
-        assert service._http_client is not None
-        service._http_client.get = AsyncMock(
-            side_effect=httpx.RequestError("Connection failed")
-        )
+        def fail(request: httpx.Request) -> httpx.Response:
+            msg = "Connection failed"
+            raise httpx.ConnectError(msg, request=request)
+
+        _serve(service, fail)
 
         with pytest.raises(PopularRecipesFetchError, match="Request failed"):
             await service._fetch_source(source)
@@ -519,11 +670,10 @@ class TestFetchSourceExtended:
         source.popular_endpoint = "/popular"
 
         # Mock successful HTTP response
-        mock_response = MagicMock()
-        mock_response.raise_for_status = MagicMock()
-        mock_response.text = "<html><body>Test</body></html>"
-        assert service._http_client is not None
-        service._http_client.get = AsyncMock(return_value=mock_response)
+        _serve(
+            service,
+            lambda _: httpx.Response(200, text="<html><body>Test</body></html>"),
+        )
 
         with pytest.raises(PopularRecipesParseError, match="Extractor not initialized"):
             await service._fetch_source(source)
@@ -545,11 +695,10 @@ class TestFetchSourceExtended:
         source.popular_endpoint = "/popular"
 
         # Mock successful HTTP response
-        mock_response = MagicMock()
-        mock_response.raise_for_status = MagicMock()
-        mock_response.text = "<html><body>Test</body></html>"
-        assert service._http_client is not None
-        service._http_client.get = AsyncMock(return_value=mock_response)
+        _serve(
+            service,
+            lambda _: httpx.Response(200, text="<html><body>Test</body></html>"),
+        )
 
         # Mock extractor to raise exception
         service._extractor.extract = AsyncMock(side_effect=Exception("Parse error"))
@@ -572,11 +721,10 @@ class TestFetchSourceExtended:
         source.popular_endpoint = "/popular"
 
         # Mock successful HTTP response
-        mock_response = MagicMock()
-        mock_response.raise_for_status = MagicMock()
-        mock_response.text = "<html><body>Test</body></html>"
-        assert service._http_client is not None
-        service._http_client.get = AsyncMock(return_value=mock_response)
+        _serve(
+            service,
+            lambda _: httpx.Response(200, text="<html><body>Test</body></html>"),
+        )
 
         # Mock extractor to return empty list
         service._extractor.extract = AsyncMock(return_value=[])
@@ -601,11 +749,10 @@ class TestFetchSourceExtended:
         source.source_weight = 1.0
 
         # Mock successful HTTP response
-        mock_response = MagicMock()
-        mock_response.raise_for_status = MagicMock()
-        mock_response.text = "<html><body>Test</body></html>"
-        assert service._http_client is not None
-        service._http_client.get = AsyncMock(return_value=mock_response)
+        _serve(
+            service,
+            lambda _: httpx.Response(200, text="<html><body>Test</body></html>"),
+        )
 
         # Mock extractor to return links
         service._extractor.extract = AsyncMock(
@@ -658,9 +805,7 @@ class TestFetchRecipeDetails:
         source.name = "TestSource"
 
         # Mock successful recipe page response with recipe schema
-        mock_response = MagicMock()
-        mock_response.is_success = True
-        mock_response.text = """
+        page = b"""
         <html>
         <head>
         <script type="application/ld+json">
@@ -672,8 +817,7 @@ class TestFetchRecipeDetails:
         </body>
         </html>
         """
-        assert service._http_client is not None
-        service._http_client.get = AsyncMock(return_value=mock_response)
+        _serve(service, lambda _: httpx.Response(200, content=page))
 
         result = await service._fetch_recipe_details(
             [("Recipe 1", "https://test.com/recipe/1")], source
@@ -692,11 +836,12 @@ class TestFetchRecipeDetails:
         source.name = "TestSource"
 
         # Mock response without recipe schema
-        mock_response = MagicMock()
-        mock_response.is_success = True
-        mock_response.text = "<html><body>Not a recipe</body></html>"
-        assert service._http_client is not None
-        service._http_client.get = AsyncMock(return_value=mock_response)
+        _serve(
+            service,
+            lambda _: httpx.Response(
+                200, text="<html><body>Not a recipe</body></html>"
+            ),
+        )
 
         result = await service._fetch_recipe_details(
             [("Not Recipe", "https://test.com/category")], source
@@ -716,8 +861,11 @@ class TestFetchRecipeDetails:
         source.name = "TestSource"
 
         # Mock HTTP error
-        assert service._http_client is not None
-        service._http_client.get = AsyncMock(side_effect=Exception("Connection error"))
+        def fail(request: httpx.Request) -> httpx.Response:
+            msg = "Connection error"
+            raise RuntimeError(msg)
+
+        _serve(service, fail)
 
         result = await service._fetch_recipe_details(
             [("Recipe 1", "https://test.com/recipe/1")], source
@@ -728,6 +876,92 @@ class TestFetchRecipeDetails:
         assert result[0].recipe_name == "Recipe 1"
         await service.shutdown()
 
+    @pytest.mark.asyncio
+    async def test_reuses_metrics_when_page_not_modified(
+        self, mock_settings: MagicMock
+    ) -> None:
+        """Should answer a 304 from the stored metrics without parsing."""
+        stored: dict[str, bytes] = {}
+        mock_cache = MagicMock()
+        mock_cache.get = AsyncMock(side_effect=stored.get)
+        mock_cache.set = AsyncMock(
+            side_effect=lambda key, value, ex: stored.__setitem__(key, value)
+        )
+        with patch(
+            "app.services.popular.service.get_settings", return_value=mock_settings
+        ):
+            service = PopularRecipesService(cache_client=mock_cache)
+        await service.initialize()
+
+        source = MagicMock()
+        source.name = "TestSource"
+        page = b"""
+        <script type="application/ld+json">
+        {"@type": "Recipe", "aggregateRating": {"ratingValue": "4.5"}}
+        </script>
+        """
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=page, headers={"etag": '"v1"'})
+
+        _serve(service, handler)
+        links = [("Recipe 1", "https://test.com/recipe/1")]
+
+        first = await service._fetch_recipe_details(links, source)
+        with patch("app.services.popular.service.analyze_recipe_page") as mock_analyze:
+            second = await service._fetch_recipe_details(links, source)
+
+        mock_analyze.assert_not_called()
+        assert len(requests) == 2
+        assert first[0].metrics.rating == 4.5
+        assert second[0].metrics == first[0].metrics
+        await service.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_reuses_fresh_metrics_without_request(
+        self, mock_settings: MagicMock
+    ) -> None:
+        """Should skip the request for metrics within detail_fresh_ttl."""
+        mock_settings.scraping.popular_recipes.detail_fresh_ttl = 3600
+        stored: dict[str, bytes] = {}
+        mock_cache = MagicMock()
+        mock_cache.get = AsyncMock(side_effect=stored.get)
+        mock_cache.set = AsyncMock(
+            side_effect=lambda key, value, ex: stored.__setitem__(key, value)
+        )
+        with patch(
+            "app.services.popular.service.get_settings", return_value=mock_settings
+        ):
+            service = PopularRecipesService(cache_client=mock_cache)
+        await service.initialize()
+
+        source = MagicMock()
+        source.name = "TestSource"
+        page = b"""
+        <script type="application/ld+json">
+        {"@type": "Recipe", "aggregateRating": {"ratingValue": "4.5"}}
+        </script>
+        """
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, content=page, headers={"etag": '"v1"'})
+
+        _serve(service, handler)
+        links = [("Recipe 1", "https://test.com/recipe/1")]
+
+        first = await service._fetch_recipe_details(links, source)
+        second = await service._fetch_recipe_details(links, source)
+
+        assert len(requests) == 1
+        assert second[0].metrics == first[0].metrics
+        await service.shutdown()
+
 
 class TestScoring:
     """Tests for scoring methods."""
@@ -0,0 +1,310 @@
+"""Unit tests for PopularRecipesStore and PopularSourceStore.
+
+Tests cover:
+- Paged save layout and metadata
+- Range reads touching only the covering pages
+- Version switch and expiry of the previous version
+- Process-local page cache
+- Legacy blobs and missing pages
+- Per-source results and their age
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+
+from app.cache.local import configure_local_caches, disable_local_caches
+from app.schemas.recipe import (
+    PopularRecipe,
+    PopularRecipesData,
+    RecipeEngagementMetrics,
+)
+from app.services.popular.store import (
+    PREVIOUS_VERSION_GRACE,
+    PopularRecipesStore,
+    PopularSourceStore,
+)
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+pytestmark = pytest.mark.unit
+
+
+def _recipes(count: int) -> list[PopularRecipe]:
+    return [
+        PopularRecipe(
+            recipe_name=f"Recipe {i}",
+            url=f"https://test.com/recipe/{i}",
+            source="TestSource",
+            raw_rank=i + 1,
+            metrics=RecipeEngagementMetrics(rating=4.5 if i == 0 else None),
+            normalized_score=round(1.0 - i / (count + 1), 4),
+        )
+        for i in range(count)
+    ]
+
+
+def _data(count: int) -> PopularRecipesData:
+    return PopularRecipesData(
+        recipes=_recipes(count),
+        total_count=count,
+        last_updated="2026-01-01T00:00:00+00:00",
+        sources_fetched=["TestSource"],
+        fetch_errors={"Broken": "HTTP 500"},
+    )
+
+
+def _mock_client() -> MagicMock:
+    """Redis mock backed by a dict, recording pipeline commands."""
+    stored: dict[str, bytes] = {}
+    client = MagicMock()
+    client.stored = stored
+    client.get = AsyncMock(side_effect=stored.get)
+    client.mget = AsyncMock(side_effect=lambda keys: [stored.get(k) for k in keys])
+    client.set = AsyncMock(
+        side_effect=lambda key, value, ex: stored.__setitem__(key, value)
+    )
+    client.delete = AsyncMock(
+        side_effect=lambda *keys: [stored.pop(k, None) for k in keys]
+    )
+
+    pipe = MagicMock()
+    pipe.setex = MagicMock(
+        side_effect=lambda key, _ttl, value: stored.__setitem__(key, value)
+    )
+    pipe.execute = AsyncMock()
+    client.pipe = pipe
+    client.pipeline = MagicMock(return_value=pipe)
+    return client
+
+
+@pytest.fixture
+def local_pages() -> Iterator[None]:
+    """Enable the process-local page cache for a test."""
+    configure_local_caches(enabled=True, max_items=100, ttl=60)
+    yield
+    disable_local_caches()
+
+
+class TestSave:
+    """Tests for saving the paged layout."""
+
+    async def test_writes_pages_and_metadata(self) -> None:
+        """Should write one key per page and a small metadata record."""
+        client = _mock_client()
+        store = PopularRecipesStore(client, "popular_recipes", ttl=3600, page_size=20)
+
+        meta = await store.save(_data(45))
+
+        assert meta.page_count == 3
+        stored_meta = orjson.loads(client.stored["popular:popular_recipes"])
+        assert stored_meta["version"] == meta.version
+        assert stored_meta["total_count"] == 45
+        assert stored_meta["fetch_errors"] == {"Broken": "HTTP 500"}
+        last_page = orjson.loads(client.stored[store.page_key(meta.version, 2)])
+        assert len(last_page) == 5
+        client.pipeline.assert_called_once_with(transaction=True)
+
+    async def test_metadata_carries_cache_ttl(self) -> None:
+        """Should give the metadata the cache TTL and pages a longer one."""
+        client = _mock_client()
+        store = PopularRecipesStore(client, "popular_recipes", ttl=3600)
+
+        await store.save(_data(5))
+
+        ttls = {c.args[0]: c.args[1] for c in client.pipe.setex.call_args_list}
+        assert ttls.pop("popular:popular_recipes") == 3600
+        assert set(ttls.values()) == {3600 + PREVIOUS_VERSION_GRACE}
+
+    async def test_stores_compact_records(self) -> None:
+        """Should leave default-valued fields out of stored records."""
+        client = _mock_client()
+        store = PopularRecipesStore(client, "popular_recipes", ttl=3600)
+
+        meta = await store.save(_data(2))
+
+        records = orjson.loads(client.stored[store.page_key(meta.version, 0)])
+        assert records[0]["metrics"] == {"rating": 4.5}
+        assert "metrics" not in records[1]
+
+    async def test_expires_previous_version(self) -> None:
+        """Should switch to a new version and expire the old pages."""
+        client = _mock_client()
+        store = PopularRecipesStore(client, "popular_recipes", ttl=3600, page_size=2)
+
+        first = await store.save(_data(3))
+        second = await store.save(_data(3))
+
+        assert second.version != first.version
+        expired = [c.args for c in client.pipe.expire.call_args_list]
+        assert expired == [
+            (store.page_key(first.version, 0), PREVIOUS_VERSION_GRACE),
+            (store.page_key(first.version, 1), PREVIOUS_VERSION_GRACE),
+        ]
+
+
+class TestGetRange:
+    """Tests for paged reads."""
+
+    async def test_reads_only_covering_pages(self) -> None:
+        """Should fetch only the pages overlapping the requested slice."""
+        client = _mock_client()
+        store = PopularRecipesStore(client, "popular_recipes", ttl=3600, page_size=20)
+        meta = await store.save(_data(500))
+
+        result = await store.get_range(30, 20)
+
+        assert result is not None
+        recipes, total = result
+        assert [r.recipe_name for r in recipes] == [
+            f"Recipe {i}" for i in range(30, 50)
+        ]
+        assert total == 500
+        client.mget.assert_awaited_once_with(
+            [store.page_key(meta.version, 1), store.page_key(meta.version, 2)]
+        )
+
+    async def test_round_trips_records(self) -> None:
+        """Should return records equal to the saved ones."""
+        client = _mock_client()
+        store = PopularRecipesStore(client, "popular_recipes", ttl=3600)
+        data = _data(3)
+        await store.save(data)
+
+        result = await store.get_range(0, 10)
+
+        assert result is not None
+        assert result[0] == data.recipes
+
+    async def test_count_only_skips_pages(self) -> None:
+        """Should return the count without reading pages."""
+        client = _mock_client()
+        store = PopularRecipesStore(client, "popular_recipes", ttl=3600)
+        await store.save(_data(30))
+
+        assert await store.get_range(0, 20, count_only=True) == ([], 30)
+        assert await store.get_range(40, 20) == ([], 30)
+        client.mget.assert_not_called()
+
+    async def test_returns_none_when_empty(self) -> None:
+        """Should report a miss when nothing is stored."""
+        store = PopularRecipesStore(_mock_client(), "popular_recipes", ttl=3600)
+
+        assert await store.get_range(0, 20) is None
+
+    async def test_ignores_legacy_blob(self) -> None:
+        """Should treat a blob of the single-key layout as a miss."""
+        client = _mock_client()
+        client.stored["popular:popular_recipes"] = orjson.dumps(_data(2).model_dump())
+        store = PopularRecipesStore(client, "popular_recipes", ttl=3600)
+
+        assert await store.get_range(0, 20) is None
+
+    async def test_returns_none_when_page_missing(self) -> None:
+        """Should report a miss when a page of the version has expired."""
+        client = _mock_client()
+        store = PopularRecipesStore(client, "popular_recipes", ttl=3600)
+        meta = await store.save(_data(5))
+        del client.stored[store.page_key(meta.version, 0)]
+
+        assert await store.get_range(0, 5) is None
+
+    @pytest.mark.usefixtures("local_pages")
+    async def test_serves_repeated_reads_from_local_cache(self) -> None:
+        """Should decode a page of a version only once per process."""
+        client = _mock_client()
+        store = PopularRecipesStore(client, "popular_recipes", ttl=3600)
+        await store.save(_data(40))
+
+        first = await store.get_range(0, 20)
+        second = await store.get_range(0, 20)
+
+        assert first == second
+        client.mget.assert_awaited_once()
+        assert client.get.await_count == 3  # save, then metadata per read
+
+    @pytest.mark.usefixtures("local_pages")
+    async def test_new_version_bypasses_local_cache(self) -> None:
+        """Should read the pages of a new version after a save."""
+        client = _mock_client()
+        store = PopularRecipesStore(client, "popular_recipes", ttl=3600)
+        await store.save(_data(5))
+        await store.get_range(0, 5)
+
+        refreshed = _data(5)
+        refreshed.recipes[0].recipe_name = "Updated"
+        await store.save(refreshed)
+        result = await store.get_range(0, 5)
+
+        assert result is not None
+        assert result[0][0].recipe_name == "Updated"
+
+
+class TestLoadAndDelete:
+    """Tests for whole-ranking reads and deletion."""
+
+    async def test_load_returns_full_data(self) -> None:
+        """Should rebuild the stored data from all pages."""
+        client = _mock_client()
+        store = PopularRecipesStore(client, "popular_recipes", ttl=3600, page_size=4)
+        data = _data(10)
+        await store.save(data)
+
+        assert await store.load() == data
+
+    async def test_delete_removes_metadata_and_pages(self) -> None:
+        """Should delete the metadata and every page of the version."""
+        client = _mock_client()
+        store = PopularRecipesStore(client, "popular_recipes", ttl=3600, page_size=4)
+        await store.save(_data(10))
+
+        await store.delete()
+
+        assert client.stored == {}
+        assert await store.load() is None
+
+
+class TestSourceStore:
+    """Tests for per-source results."""
+
+    async def test_round_trips_results(self) -> None:
+        """Should return stored recipes with their fetch time."""
+        client = _mock_client()
+        store = PopularSourceStore(client, "popular_recipes", ttl=3600)
+        recipes = _recipes(3)
+
+        with patch("app.services.popular.store.time.time", return_value=1000.0):
+            await store.put("TestSource", recipes)
+        with patch("app.services.popular.store.time.time", return_value=1060.0):
+            results = await store.get_many(["TestSource", "Other"])
+            age = results["TestSource"].age
+
+        assert list(results) == ["TestSource"]
+        assert results["TestSource"].recipes == recipes
+        assert age == 60.0
+        client.set.assert_awaited_once()
+        key, _value = client.set.call_args.args
+        assert key == "popular:popular_recipes:source:TestSource"
+        assert client.set.call_args.kwargs["ex"] == 3600
+
+    async def test_get_many_reads_in_one_round_trip(self) -> None:
+        """Should read all requested sources with a single MGET."""
+        client = _mock_client()
+        store = PopularSourceStore(client, "popular_recipes", ttl=3600)
+        await store.put("A", _recipes(1))
+        await store.put("B", _recipes(2))
+
+        results = await store.get_many(["A", "B"])
+
+        assert {name: len(r.recipes) for name, r in results.items()} == {
+            "A": 1,
+            "B": 2,
+        }
+        client.mget.assert_awaited_once_with([store.key("A"), store.key("B")])
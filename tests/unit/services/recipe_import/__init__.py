@@ -0,0 +1 @@
+"""Recipe import unit tests."""
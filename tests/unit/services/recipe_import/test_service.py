@@ -0,0 +1,241 @@
+"""Unit tests for RecipeImporter.
+
+Tests cover:
+- Mapping step failures to import errors
+- Concurrent batch import with overall and per-host limits
+- Partial results and early cancellation
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.llm.prompts import IngredientUnit, ParsedIngredient
+from app.parsing.exceptions import IngredientParsingError
+from app.services.recipe_import import RecipeImporter, RecipeImportError
+from app.services.recipe_management import RecipeResponse
+from app.services.recipe_management.exceptions import (
+    RecipeManagementUnavailableError,
+)
+from app.services.scraping.exceptions import RecipeNotFoundError, ScrapingTimeoutError
+from app.services.scraping.models import ScrapedRecipe
+
+
+pytestmark = pytest.mark.unit
+
+
+def _scraped(url: str) -> ScrapedRecipe:
+    return ScrapedRecipe(
+        title=f"Recipe {url}",
+        ingredients=["2 cups flour"],
+        instructions=["Bake"],
+        source_url=url,
+    )
+
+
+@pytest.fixture
+def scraper() -> MagicMock:
+    """Scraper returning a recipe for any URL."""
+    service = MagicMock()
+
+    async def scrape(url: str) -> ScrapedRecipe:
+        return _scraped(url)
+
+    service.scrape = AsyncMock(side_effect=scrape)
+    return service
+
+
+@pytest.fixture
+def parser() -> MagicMock:
+    """Parser returning one ingredient per line."""
+    mock = MagicMock()
+    mock.parse_batch = AsyncMock(
+        side_effect=lambda lines: [
+            ParsedIngredient(name="flour", quantity=2.0, unit=IngredientUnit.CUP)
+            for _ in lines
+        ]
+    )
+    return mock
+
+
+@pytest.fixture
+def recipe_client() -> MagicMock:
+    """Recipe Management client creating every recipe."""
+    client = MagicMock()
+    client.create_recipe = AsyncMock(
+        return_value=RecipeResponse(id=1, title="Recipe", slug="recipe")
+    )
+    return client
+
+
+@pytest.fixture
+def importer(
+    scraper: MagicMock, parser: MagicMock, recipe_client: MagicMock
+) -> RecipeImporter:
+    """Importer over the mocks."""
+    return RecipeImporter(scraper, parser, recipe_client)
+
+
+class TestImportRecipe:
+    """Tests for RecipeImporter.import_recipe."""
+
+    async def test_creates_recipe(
+        self, importer: RecipeImporter, recipe_client: MagicMock
+    ) -> None:
+        """Should scrape, parse and save the recipe."""
+        response = await importer.import_recipe("https://a.com/1", "token")
+
+        assert response.recipe.recipe_id == 1
+        assert recipe_client.create_recipe.await_args.args[1] == "token"
+
+    @pytest.mark.parametrize(
+        ("error", "status_code", "code"),
+        [
+            (RecipeNotFoundError("none"), 400, "RECIPE_NOT_FOUND"),
+            (ScrapingTimeoutError("slow"), 504, "SCRAPING_TIMEOUT"),
+        ],
+    )
+    async def test_maps_scraping_errors(
+        self,
+        importer: RecipeImporter,
+        scraper: MagicMock,
+        error: Exception,
+        status_code: int,
+        code: str,
+    ) -> None:
+        """Should raise RecipeImportError with the endpoint's status."""
+        scraper.scrape.side_effect = error
+
+        with pytest.raises(RecipeImportError) as exc_info:
+            await importer.import_recipe("https://a.com/1", "token")
+
+        assert exc_info.value.status_code == status_code
+        assert exc_info.value.detail["error"] == code
+
+    async def test_maps_parsing_error(
+        self, importer: RecipeImporter, parser: MagicMock
+    ) -> None:
+        """Should map parser failures to 500."""
+        parser.parse_batch.side_effect = IngredientParsingError("bad")
+
+        with pytest.raises(RecipeImportError) as exc_info:
+            await importer.import_recipe("https://a.com/1", "token")
+
+        assert exc_info.value.status_code == 500
+
+    async def test_maps_downstream_unavailable(
+        self, importer: RecipeImporter, recipe_client: MagicMock
+    ) -> None:
+        """Should map an unavailable Recipe Management Service to 503."""
+        recipe_client.create_recipe.side_effect = RecipeManagementUnavailableError(
+            "down"
+        )
+
+        with pytest.raises(RecipeImportError) as exc_info:
+            await importer.import_recipe("https://a.com/1", "token")
+
+        assert exc_info.value.status_code == 503
+
+
+class TestImportMany:
+    """Tests for RecipeImporter.import_many."""
+
+    async def test_returns_partial_results(
+        self, importer: RecipeImporter, scraper: MagicMock
+    ) -> None:
+        """Should report each URL's outcome without failing the batch."""
+
+        async def scrape(url: str) -> ScrapedRecipe:
+            if url.endswith("/bad"):
+                msg = "none"
+                raise RecipeNotFoundError(msg)
+            return _scraped(url)
+
+        scraper.scrape.side_effect = scrape
+        urls = ["https://a.com/1", "https://a.com/bad", "https://b.com/2"]
+
+        results = [r async for r in importer.import_many(urls, "token")]
+
+        by_index = {r.index: r for r in results}
+        assert sorted(by_index) == [0, 1, 2]
+        assert by_index[0].status_code == 201
+        assert by_index[0].response is not None
+        assert by_index[1].status_code == 400
+        assert by_index[1].error is not None
+        assert by_index[1].url == "https://a.com/bad"
+
+    async def test_reports_unexpected_errors(
+        self, importer: RecipeImporter, scraper: MagicMock
+    ) -> None:
+        """Should turn unexpected exceptions into 500 results."""
+        scraper.scrape.side_effect = RuntimeError("boom")
+
+        results = [r async for r in importer.import_many(["https://a.com/1"], "t")]
+
+        assert results[0].status_code == 500
+        assert results[0].error is not None
+        assert results[0].error.error == "INTERNAL_ERROR"
+
+    async def test_limits_concurrency_per_host(
+        self, importer: RecipeImporter, scraper: MagicMock
+    ) -> None:
+        """Should cap imports per host and overall."""
+        running: dict[str, int] = {}
+        peaks: dict[str, int] = {}
+        total = {"now": 0, "peak": 0}
+
+        async def scrape(url: str) -> ScrapedRecipe:
+            host = url.split("/")[2]
+            running[host] = running.get(host, 0) + 1
+            total["now"] += 1
+            peaks[host] = max(peaks.get(host, 0), running[host])
+            total["peak"] = max(total["peak"], total["now"])
+            await asyncio.sleep(0.01)
+            running[host] -= 1
+            total["now"] -= 1
+            return _scraped(url)
+
+        scraper.scrape.side_effect = scrape
+        urls = [f"https://{host}/{i}" for host in ("a.com", "b.com") for i in range(5)]
+        urls += [f"https://c{i}.com/" for i in range(4)]
+
+        results = [
+            r
+            async for r in importer.import_many(
+                urls, "token", max_concurrency=4, max_per_host=2
+            )
+        ]
+
+        assert len(results) == len(urls)
+        assert peaks["a.com"] == 2
+        assert peaks["b.com"] == 2
+        assert total["peak"] == 4
+
+    async def test_cancels_remaining_imports_when_closed(
+        self, importer: RecipeImporter, scraper: MagicMock
+    ) -> None:
+        """Should cancel running imports when the consumer stops early."""
+        cancelled = asyncio.Event()
+
+        async def scrape(url: str) -> ScrapedRecipe:
+            if url.endswith("/slow"):
+                try:
+                    await asyncio.sleep(60)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return _scraped(url)
+
+        scraper.scrape.side_effect = scrape
+        results = importer.import_many(
+            ["https://a.com/fast", "https://b.com/slow"], "t"
+        )
+
+        first = await anext(results)
+        await results.aclose()  # type: ignore[attr-defined]
+
+        assert first.url == "https://a.com/fast"
+        assert cancelled.is_set()
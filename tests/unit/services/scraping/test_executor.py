@@ -0,0 +1,179 @@
+"""Unit tests for the HTML parse executor.
+
+Tests cover:
+- Inline, thread and process execution modes
+- Queue depth and duration metrics
+- Byte decoding
+- Global executor lifecycle
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from app.services.popular.extraction import analyze_recipe_page
+from app.services.scraping.executor import (
+    PARSE_DURATION,
+    HtmlParseExecutor,
+    ParseExecutorMode,
+    close_parse_executor,
+    decode_html,
+    get_parse_executor,
+    init_parse_executor,
+)
+from app.services.scraping.jsonld import extract_recipe_from_jsonld
+
+
+pytestmark = pytest.mark.unit
+
+
+RECIPE_PAGE = b"""
+<html><head>
+<script type="application/ld+json">
+{"@type": "Recipe", "name": "Cr\xc3\xa8me Br\xc3\xbbl\xc3\xa9e",
+ "aggregateRating": {"ratingValue": "4.7", "ratingCount": "120"},
+ "recipeIngredient": ["2 cups cream"], "recipeInstructions": ["Bake"]}
+</script>
+</head><body></body></html>
+"""
+
+
+def _thread_name() -> str:
+    return threading.current_thread().name
+
+
+def _fail() -> None:
+    msg = "bad markup"
+    raise ValueError(msg)
+
+
+class TestHtmlParseExecutor:
+    """Tests for HtmlParseExecutor."""
+
+    async def test_inline_runs_on_event_loop_thread(self) -> None:
+        """Should run on the calling thread when inline."""
+        executor = HtmlParseExecutor(ParseExecutorMode.INLINE)
+        executor.start()
+
+        assert await executor.run("test", _thread_name) == _thread_name()
+
+    async def test_thread_mode_runs_off_loop(self) -> None:
+        """Should run in the pool's threads."""
+        executor = HtmlParseExecutor(ParseExecutorMode.THREAD, max_workers=1)
+        executor.start()
+        try:
+            name = await executor.run("test", _thread_name)
+        finally:
+            await executor.shutdown()
+
+        assert name.startswith("html-parser")
+
+    async def test_process_mode_returns_models(self) -> None:
+        """Should ship bytes to a worker process and return pydantic models."""
+        executor = HtmlParseExecutor(ParseExecutorMode.PROCESS, max_workers=1)
+        executor.start()
+        try:
+            metrics = await executor.run("engagement", analyze_recipe_page, RECIPE_PAGE)
+            recipe = await executor.run(
+                "jsonld", extract_recipe_from_jsonld, RECIPE_PAGE, "https://x.com/r"
+            )
+        finally:
+            await executor.shutdown()
+
+        assert metrics is not None
+        assert metrics.rating == 4.7
+        assert recipe is not None
+        assert recipe.title == "Crème Brûlée"
+
+    async def test_exceptions_propagate(self) -> None:
+        """Should raise the function's exception to the caller."""
+        executor = HtmlParseExecutor(ParseExecutorMode.THREAD, max_workers=1)
+        executor.start()
+        try:
+            with pytest.raises(ValueError, match="bad markup"):
+                await executor.run("test", _fail)
+        finally:
+            await executor.shutdown()
+
+        assert executor.queue_depth == 0
+
+    async def test_tracks_queue_depth(self) -> None:
+        """Should count tasks until they finish."""
+        executor = HtmlParseExecutor(ParseExecutorMode.THREAD, max_workers=1)
+        executor.start()
+        release = threading.Event()
+        try:
+            tasks = [
+                asyncio.create_task(executor.run("test", release.wait, 5))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0.05)
+            assert executor.queue_depth == 3
+
+            release.set()
+            await asyncio.gather(*tasks)
+        finally:
+            await executor.shutdown()
+
+        assert executor.queue_depth == 0
+
+    async def test_records_duration_per_task(self) -> None:
+        """Should observe the duration histogram under the task label."""
+        executor = HtmlParseExecutor(ParseExecutorMode.INLINE)
+        histogram = PARSE_DURATION.labels(task="duration_test")
+        before = histogram._sum.get()  # type: ignore[attr-defined]
+
+        await executor.run("duration_test", sum, [1, 2])
+
+        assert histogram._sum.get() > before  # type: ignore[attr-defined]
+
+    async def test_runs_inline_before_start(self) -> None:
+        """Should not require start() for inline fallback."""
+        executor = HtmlParseExecutor(ParseExecutorMode.PROCESS)
+
+        assert await executor.run("test", _thread_name) == _thread_name()
+
+
+class TestDecodeHtml:
+    """Tests for decode_html."""
+
+    def test_passes_text_through(self) -> None:
+        """Should return str input unchanged."""
+        assert decode_html("<p>ok</p>") == "<p>ok</p>"
+
+    def test_decodes_utf8(self) -> None:
+        """Should decode UTF-8 bytes."""
+        assert decode_html("<p>café</p>".encode()) == "<p>café</p>"
+
+    def test_uses_declared_charset(self) -> None:
+        """Should fall back to the page's declared charset."""
+        html = '<meta charset="iso-8859-1"><p>café</p>'.encode("latin-1")
+
+        assert "café" in decode_html(html)
+
+
+class TestGlobalExecutor:
+    """Tests for the global executor lifecycle."""
+
+    async def test_init_and_close(self) -> None:
+        """Should register the started executor and drop it on close."""
+        executor = init_parse_executor("thread", 1)
+        try:
+            assert get_parse_executor() is executor
+            assert executor.mode == ParseExecutorMode.THREAD
+        finally:
+            await close_parse_executor()
+
+        assert get_parse_executor() is not executor
+
+    def test_defaults_to_inline(self) -> None:
+        """Should fall back to an inline executor when not initialized."""
+        assert get_parse_executor().mode == ParseExecutorMode.INLINE
+
+    def test_rejects_unknown_mode(self) -> None:
+        """Should raise for an unknown mode."""
+        with pytest.raises(ValueError, match="fibers"):
+            init_parse_executor("fibers")
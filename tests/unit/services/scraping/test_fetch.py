@@ -0,0 +1,212 @@
+"""Unit tests for streaming, size-capped HTML fetching.
+
+Tests cover:
+- Full reads, charset handling and HTTP errors
+- Size cap enforcement (rejecting or truncating)
+- Early termination on a rated Recipe JSON-LD block
+- Conditional requests with cached validators
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from app.services.scraping.fetch import (
+    FetchedPage,
+    RecipeJsonLdDetector,
+    ResponseTooLargeError,
+    fetch_html,
+)
+from app.services.scraping.validators import PageValidators
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+pytestmark = pytest.mark.unit
+
+URL = "https://example.com/recipe"
+
+RATED_RECIPE_JSONLD = (
+    b'<script type="application/ld+json">'
+    b'{"@type": ["Recipe"], "name": "Soup",'
+    b' "aggregateRating": {"ratingValue": "4.5"}}</script>'
+)
+
+
+class _ChunkedBody:
+    """Response body yielding chunks and counting how many were read."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+        self.read = 0
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+
+def _client(
+    response: httpx.Response | None = None, **kwargs: object
+) -> httpx.AsyncClient:
+    """Create a client answering every request with the given response."""
+    resolved = response or httpx.Response(200, **kwargs)  # type: ignore[arg-type]
+    return httpx.AsyncClient(transport=httpx.MockTransport(lambda _: resolved))
+
+
+class TestFetchHtml:
+    """Tests for fetch_html."""
+
+    async def test_reads_full_body(self) -> None:
+        """Should return the whole body with the response charset."""
+        async with _client(
+            content="café".encode("latin-1"),
+            headers={"content-type": "text/html; charset=latin-1"},
+        ) as client:
+            page = await fetch_html(client, URL)
+
+        assert page == FetchedPage("café".encode("latin-1"), "latin-1")
+        assert page.text == "café"
+
+    async def test_raises_on_http_error(self) -> None:
+        """Should raise HTTPStatusError on non-2xx responses."""
+        async with _client(httpx.Response(503)) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await fetch_html(client, URL)
+
+    async def test_rejects_oversized_body(self) -> None:
+        """Should raise once the streamed body exceeds max_bytes."""
+        body = _ChunkedBody([b"x" * 10] * 10)
+        async with _client(content=body) as client:
+            with pytest.raises(ResponseTooLargeError, match="exceeds 25 bytes"):
+                await fetch_html(client, URL, max_bytes=25)
+
+        assert body.read == 3
+
+    async def test_rejects_oversized_content_length_before_reading(self) -> None:
+        """Should raise from the Content-Length header without reading."""
+        body = _ChunkedBody([b"x" * 10])
+        async with _client(content=body, headers={"content-length": "100"}) as client:
+            with pytest.raises(ResponseTooLargeError):
+                await fetch_html(client, URL, max_bytes=50)
+
+        assert body.read == 0
+
+    async def test_truncates_oversized_body(self) -> None:
+        """Should return the first max_bytes when truncating."""
+        async with _client(content=_ChunkedBody([b"abcdef"] * 5)) as client:
+            page = await fetch_html(client, URL, max_bytes=8, truncate=True)
+
+        assert page.content == b"abcdefab"
+        assert page.truncated
+
+    async def test_stops_when_condition_met(self) -> None:
+        """Should stop reading once the stop condition returns True."""
+        body = _ChunkedBody([b"<html><head>", RATED_RECIPE_JSONLD, b"<body>" * 1000])
+        async with _client(content=body) as client:
+            page = await fetch_html(client, URL, stop_when=RecipeJsonLdDetector())
+
+        assert page.stopped_early
+        assert body.read == 2
+        assert page.content.endswith(b"</script>")
+
+    async def test_records_response_validators(self) -> None:
+        """Should keep the response's ETag and Last-Modified."""
+        async with _client(
+            content=b"<html></html>",
+            headers={"etag": '"v1"', "last-modified": "Wed, 01 Jan 2025"},
+        ) as client:
+            page = await fetch_html(client, URL)
+
+        assert page.validators == PageValidators('"v1"', "Wed, 01 Jan 2025")
+        assert not page.not_modified
+
+    async def test_conditional_request_not_modified(self) -> None:
+        """Should send validators and report a 304 without a body."""
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(304, headers={"etag": '"v1"'})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            page = await fetch_html(
+                client, URL, validators=PageValidators('"v1"', "Wed, 01 Jan 2025")
+            )
+
+        assert page.not_modified
+        assert page.content == b""
+        assert page.validators == PageValidators(etag='"v1"')
+        assert seen[0].headers["if-none-match"] == '"v1"'
+        assert seen[0].headers["if-modified-since"] == "Wed, 01 Jan 2025"
+
+    async def test_unsolicited_not_modified_is_an_error(self) -> None:
+        """Should raise on a 304 to an unconditional request."""
+        async with _client(httpx.Response(304)) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await fetch_html(client, URL)
+
+
+class TestRecipeJsonLdDetector:
+    """Tests for RecipeJsonLdDetector."""
+
+    def test_detects_rated_recipe_split_across_chunks(self) -> None:
+        """Should only fire once the block is complete."""
+        detect = RecipeJsonLdDetector()
+        buffer = bytearray(RATED_RECIPE_JSONLD[:40])
+
+        assert not detect(buffer)
+
+        buffer += RATED_RECIPE_JSONLD[40:]
+        assert detect(buffer)
+
+    def test_detects_block_whose_opening_tag_is_split(self) -> None:
+        """Should resume at a partially received opening tag."""
+        detect = RecipeJsonLdDetector()
+        buffer = bytearray(b"<p>padding</p>" + RATED_RECIPE_JSONLD[:12])
+
+        assert not detect(buffer)
+
+        buffer += RATED_RECIPE_JSONLD[12:]
+        assert detect(buffer)
+
+    def test_does_not_rescan_content_without_blocks(self) -> None:
+        """Should resume past padding instead of rescanning from the start."""
+        detect = RecipeJsonLdDetector()
+        buffer = bytearray()
+        for _ in range(3):
+            buffer += b"<div>" + b"x" * 1000 + b"</div>"
+            assert not detect(buffer)
+            assert detect._scanned == len(buffer) - len(b"</div>")
+
+        buffer += RATED_RECIPE_JSONLD
+        assert detect(buffer)
+
+    @pytest.mark.parametrize(
+        "block",
+        [
+            b'{"@type": "Recipe", "name": "Soup"}',
+            b'{"@type": "WebSite", "aggregateRating": {}}',
+        ],
+    )
+    def test_ignores_unrated_or_non_recipe_blocks(self, block: bytes) -> None:
+        """Should keep reading without a rated Recipe block."""
+        detect = RecipeJsonLdDetector()
+        html = b'<script type="application/ld+json">' + block + b"</script>"
+
+        assert not detect(bytearray(html))
+
+    def test_detects_recipe_in_graph(self) -> None:
+        """Should find a rated Recipe inside an @graph block."""
+        html = (
+            b'<script type="application/ld+json">{"@graph": ['
+            b'{"@type": "WebPage"}, {"@type": "Recipe",'
+            b' "aggregateRating": {"ratingValue": 5}}]}</script>'
+        )
+
+        assert RecipeJsonLdDetector()(bytearray(html))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -15,6 +16,7 @@ from app.services.scraping.exceptions import (
     ScrapingParseError,
     ScrapingTimeoutError,
 )
+from app.services.scraping.fetch import FetchedPage
 from app.services.scraping.models import ScrapedRecipe
 from app.services.scraping.service import RecipeScraperService
 
@@ -29,9 +31,16 @@ def mock_settings() -> MagicMock:
     settings.scraping.fetch_timeout = 30.0
     settings.scraping.cache_enabled = False
     settings.scraping.cache_ttl = 3600
+    settings.scraping.max_body_bytes = 1_000_000
+    settings.scraping.validator_ttl = 604800
     return settings
 
 
+def _serve(service: RecipeScraperService, handler: Any) -> None:
+    """Route the service's HTTP client through a mock transport."""
+    service._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
 @pytest.fixture
 def service(mock_settings: MagicMock) -> RecipeScraperService:
     """Create a RecipeScraperService with mocked settings."""
@@ -89,9 +98,12 @@ class TestRecipeScraperServiceFetchHtml:
     ) -> None:
         """Should raise ScrapingTimeoutError on timeout."""
         await service.initialize()
-        service._http_client.get = AsyncMock(  # type: ignore[union-attr]
-            side_effect=httpx.TimeoutException("timeout")
-        )
+
+        def timeout(request: httpx.Request) -> httpx.Response:
+            msg = "timeout"
+            raise httpx.ReadTimeout(msg, request=request)
+
+        _serve(service, timeout)
 
         with pytest.raises(ScrapingTimeoutError):
             await service._fetch_html("https://example.com")
@@ -104,13 +116,7 @@ class TestRecipeScraperServiceFetchHtml:
     ) -> None:
         """Should raise ScrapingFetchError on HTTP error."""
         await service.initialize()
-        response = MagicMock()
-        response.status_code = 404
-        service._http_client.get = AsyncMock(  # type: ignore[union-attr]
-            side_effect=httpx.HTTPStatusError(
-                "Not found", request=MagicMock(), response=response
-            )
-        )
+        _serve(service, lambda _: httpx.Response(404))
 
         with pytest.raises(ScrapingFetchError, match="404"):
             await service._fetch_html("https://example.com")
@@ -123,9 +129,12 @@ class TestRecipeScraperServiceFetchHtml:
     ) -> None:
         """Should raise ScrapingFetchError on request error."""
         await service.initialize()
-        service._http_client.get = AsyncMock(  # type: ignore[union-attr]
-            side_effect=httpx.RequestError("Connection failed")
-        )
+
+        def fail(request: httpx.Request) -> httpx.Response:
+            msg = "Connection failed"
+            raise httpx.ConnectError(msg, request=request)
+
+        _serve(service, fail)
 
         with pytest.raises(ScrapingFetchError, match="Failed to fetch"):
             await service._fetch_html("https://example.com")
@@ -227,7 +236,7 @@ class TestRecipeScraperServiceScrape:
                 new_callable=AsyncMock,
             ) as mock_extract,
         ):
-            mock_fetch.return_value = "<html>content</html>"
+            mock_fetch.return_value = FetchedPage(b"<html>content</html>")
             mock_extract.return_value = mock_recipe
 
             result = await service.scrape("https://example.com/recipe")
@@ -262,7 +271,7 @@ class TestRecipeScraperServiceScrape:
                 service, "_extract_with_jsonld", new_callable=AsyncMock
             ) as mock_jsonld,
         ):
-            mock_fetch.return_value = "<html>content</html>"
+            mock_fetch.return_value = FetchedPage(b"<html>content</html>")
             mock_scrapers.return_value = None  # recipe-scrapers fails
             mock_jsonld.return_value = mock_recipe
 
@@ -291,7 +300,7 @@ class TestRecipeScraperServiceScrape:
                 service, "_extract_with_jsonld", new_callable=AsyncMock
             ) as mock_jsonld,
         ):
-            mock_fetch.return_value = "<html>content</html>"
+            mock_fetch.return_value = FetchedPage(b"<html>content</html>")
             mock_scrapers.return_value = None
             mock_jsonld.return_value = None
 
@@ -678,7 +687,7 @@ class TestRecipeScraperServiceCaching:
                 new_callable=AsyncMock,
             ) as mock_extract,
         ):
-            mock_fetch.return_value = "<html>content</html>"
+            mock_fetch.return_value = FetchedPage(b"<html>content</html>")
             mock_extract.return_value = mock_recipe
             mock_cache_client.set = AsyncMock()
 
@@ -721,7 +730,7 @@ class TestRecipeScraperServiceCaching:
                 new_callable=AsyncMock,
             ) as mock_extract,
         ):
-            mock_fetch.return_value = "<html>content</html>"
+            mock_fetch.return_value = FetchedPage(b"<html>content</html>")
             mock_extract.return_value = mock_recipe
 
             result = await service_with_cache.scrape("https://example.com/recipe")
@@ -763,7 +772,7 @@ class TestRecipeScraperServiceCaching:
                 new_callable=AsyncMock,
             ) as mock_extract,
         ):
-            mock_fetch.return_value = "<html>content</html>"
+            mock_fetch.return_value = FetchedPage(b"<html>content</html>")
             mock_extract.return_value = mock_recipe
 
             # Should not raise, should continue to fetch
@@ -802,7 +811,7 @@ class TestRecipeScraperServiceCaching:
                 new_callable=AsyncMock,
             ) as mock_extract,
         ):
-            mock_fetch.return_value = "<html>content</html>"
+            mock_fetch.return_value = FetchedPage(b"<html>content</html>")
             mock_extract.return_value = mock_recipe
 
             # Should not raise, should return result despite cache failure
@@ -811,6 +820,91 @@ class TestRecipeScraperServiceCaching:
 
         await service_with_cache.shutdown()
 
+    async def test_revalidates_expired_entry_not_modified(
+        self,
+        service_with_cache: RecipeScraperService,
+        mock_cache_client: MagicMock,
+    ) -> None:
+        """Should refresh an expired entry on 304 without parsing."""
+        cached_recipe = ScrapedRecipe(
+            title="Cached Recipe",
+            source_url="https://example.com/recipe",
+            ingredients=["flour"],
+            instructions=["bake"],
+        )
+        mock_cache_client.get = AsyncMock(
+            return_value=orjson.dumps(
+                {
+                    "__validators__": 0,
+                    "value": cached_recipe.model_dump(),
+                    "validators": {"etag": '"v1"', "last_modified": None},
+                }
+            )
+        )
+        mock_cache_client.set = AsyncMock()
+        await service_with_cache.initialize()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.headers["if-none-match"] == '"v1"'
+            return httpx.Response(304)
+
+        _serve(service_with_cache, handler)
+
+        with patch.object(
+            service_with_cache,
+            "_extract_with_recipe_scrapers",
+            new_callable=AsyncMock,
+        ) as mock_extract:
+            result = await service_with_cache.scrape("https://example.com/recipe")
+
+        mock_extract.assert_not_called()
+        assert result == cached_recipe
+        saved = orjson.loads(mock_cache_client.set.call_args.args[1])
+        assert saved["validators"]["etag"] == '"v1"'
+        assert saved["__validators__"] > 0
+
+        await service_with_cache.shutdown()
+
+    async def test_revalidates_expired_entry_modified(
+        self,
+        service_with_cache: RecipeScraperService,
+        mock_cache_client: MagicMock,
+    ) -> None:
+        """Should re-parse and store the new validators on 200."""
+        mock_cache_client.get = AsyncMock(
+            return_value=orjson.dumps(
+                {
+                    "__validators__": 0,
+                    "value": {"title": "Old", "source_url": "https://x.com"},
+                    "validators": {"etag": '"v1"', "last_modified": None},
+                }
+            )
+        )
+        mock_cache_client.set = AsyncMock()
+        fresh_recipe = ScrapedRecipe(
+            title="New Recipe", source_url="https://example.com/recipe"
+        )
+        await service_with_cache.initialize()
+        _serve(
+            service_with_cache,
+            lambda _: httpx.Response(200, content=b"<html/>", headers={"etag": '"v2"'}),
+        )
+
+        with patch.object(
+            service_with_cache,
+            "_extract_with_recipe_scrapers",
+            new_callable=AsyncMock,
+            return_value=fresh_recipe,
+        ):
+            result = await service_with_cache.scrape("https://example.com/recipe")
+
+        assert result == fresh_recipe
+        saved = orjson.loads(mock_cache_client.set.call_args.args[1])
+        assert saved["value"]["title"] == "New Recipe"
+        assert saved["validators"]["etag"] == '"v2"'
+
+        await service_with_cache.shutdown()
+
 
 class TestRecipeScraperServiceFetchHtmlSuccess:
     """Tests for successful HTML fetching."""
@@ -822,16 +916,31 @@ class TestRecipeScraperServiceFetchHtmlSuccess:
         """Should return HTML content on successful fetch."""
         await service.initialize()
 
-        mock_response = MagicMock()
-        mock_response.text = "<html><body>Recipe content</body></html>"
-        mock_response.raise_for_status = MagicMock()
-
-        service._http_client.get = AsyncMock(return_value=mock_response)  # type: ignore[union-attr]
+        _serve(
+            service,
+            lambda _: httpx.Response(
+                200, content=b"<html><body>Recipe content</body></html>"
+            ),
+        )
 
         result = await service._fetch_html("https://example.com/recipe")
 
-        assert result == "<html><body>Recipe content</body></html>"
-        mock_response.raise_for_status.assert_called_once()
+        assert result.content == b"<html><body>Recipe content</body></html>"
+
+        await service.shutdown()
+
+    async def test_fetch_html_rejects_oversized_page(
+        self,
+        service: RecipeScraperService,
+        mock_settings: MagicMock,
+    ) -> None:
+        """Should raise ScrapingFetchError when the page exceeds the cap."""
+        await service.initialize()
+        mock_settings.scraping.max_body_bytes = 16
+        _serve(service, lambda _: httpx.Response(200, content=b"x" * 17))
+
+        with pytest.raises(ScrapingFetchError, match="exceeds 16 bytes"):
+            await service._fetch_html("https://example.com/recipe")
 
         await service.shutdown()
 
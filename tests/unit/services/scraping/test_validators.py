@@ -0,0 +1,145 @@
+"""Unit tests for the HTTP validator store.
+
+Tests cover:
+- Reading validators from response headers and building conditional headers
+- Envelope round trip, freshness and retention TTLs
+- Entries written before validators were stored
+- Redis failure handling
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import orjson
+import pytest
+
+from app.services.scraping.validators import (
+    PageValidators,
+    PageValidatorStore,
+    ValidatedEntry,
+)
+
+
+pytestmark = pytest.mark.unit
+
+URL = "https://example.com/recipe"
+VALIDATORS = PageValidators(etag='"abc"', last_modified="Wed, 01 Jan 2025 00:00:00 GMT")
+
+
+def _redis(stored: bytes | None = None) -> MagicMock:
+    client = MagicMock()
+    client.get = AsyncMock(return_value=stored)
+    client.set = AsyncMock()
+    return client
+
+
+class TestPageValidators:
+    """Tests for PageValidators."""
+
+    def test_from_headers(self) -> None:
+        """Should read ETag and Last-Modified."""
+        headers = httpx.Headers(
+            {"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+        )
+
+        assert PageValidators.from_headers(headers) == VALIDATORS
+
+    def test_from_headers_without_validators(self) -> None:
+        """Should return None when neither header is present."""
+        assert PageValidators.from_headers(httpx.Headers()) is None
+
+    def test_request_headers(self) -> None:
+        """Should map validators to conditional request headers."""
+        assert VALIDATORS.request_headers() == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+        assert PageValidators(etag='W/"1"').request_headers() == {
+            "If-None-Match": 'W/"1"'
+        }
+
+
+class TestValidatedEntry:
+    """Tests for ValidatedEntry freshness."""
+
+    def test_fresh_until_expiry(self) -> None:
+        """Should be fresh before fresh_until and stale after."""
+        assert ValidatedEntry(value={}, fresh_until=2**40).fresh
+        assert not ValidatedEntry(value={}, fresh_until=0).fresh
+
+    def test_entry_without_envelope_is_fresh(self) -> None:
+        """Should treat entries without an expiry as fresh."""
+        assert ValidatedEntry(value={}).fresh
+
+
+class TestPageValidatorStore:
+    """Tests for PageValidatorStore."""
+
+    async def test_put_and_get_round_trip(self) -> None:
+        """Should store the value with validators under the prefixed key."""
+        client = _redis()
+        store = PageValidatorStore(client, "pages", fresh_ttl=60, retention_ttl=600)
+
+        await store.put(URL, {"title": "Soup"}, VALIDATORS)
+
+        key, raw = client.set.call_args.args
+        assert key == f"pages:{URL}"
+        assert client.set.call_args.kwargs["ex"] == 660
+
+        client.get.return_value = raw
+        entry = await store.get(URL)
+
+        assert entry is not None
+        assert entry.value == {"title": "Soup"}
+        assert entry.validators == VALIDATORS
+        assert entry.fresh
+
+    async def test_without_validators_kept_only_while_fresh(self) -> None:
+        """Should not retain entries that cannot be revalidated."""
+        client = _redis()
+        store = PageValidatorStore(client, "pages", fresh_ttl=60, retention_ttl=600)
+
+        await store.put(URL, {"title": "Soup"}, None)
+
+        assert client.set.call_args.kwargs["ex"] == 60
+
+    async def test_skips_write_with_nothing_to_keep(self) -> None:
+        """Should not write entries that are neither fresh nor revalidatable."""
+        client = _redis()
+        store = PageValidatorStore(client, "pages", fresh_ttl=0, retention_ttl=600)
+
+        await store.put(URL, None, None)
+
+        client.set.assert_not_called()
+
+    async def test_reads_plain_entries_as_fresh(self) -> None:
+        """Should serve values cached before validators were stored."""
+        store = PageValidatorStore(
+            _redis(orjson.dumps({"title": "Soup"})),
+            "pages",
+            fresh_ttl=60,
+            retention_ttl=600,
+        )
+
+        entry = await store.get(URL)
+
+        assert entry == ValidatedEntry(value={"title": "Soup"})
+
+    async def test_swallows_redis_errors(self) -> None:
+        """Should treat read and write failures as misses."""
+        client = _redis()
+        client.get.side_effect = ConnectionError("down")
+        client.set.side_effect = ConnectionError("down")
+        store = PageValidatorStore(client, "pages", fresh_ttl=60, retention_ttl=600)
+
+        assert await store.get(URL) is None
+        await store.put(URL, {}, VALIDATORS)
+
+    async def test_disabled_without_client(self) -> None:
+        """Should be a no-op without a Redis client."""
+        store = PageValidatorStore(None, "pages", fresh_ttl=60, retention_ttl=600)
+
+        await store.put(URL, {}, VALIDATORS)
+        assert await store.get(URL) is None
@@ -5,6 +5,7 @@ Tests cover:
 - Two-tier pricing lookup (Tier 1 → Tier 2 fallback)
 - Price calculation based on quantity
 - Cache behavior
+- Batched recipe-level lookups
 - Error handling
 """
 
@@ -19,6 +20,8 @@ import pytest
 from app.database.repositories.shopping import IngredientDetails, PricingData
 from app.schemas.enums import IngredientUnit
 from app.schemas.ingredient import Ingredient, Quantity
+from app.schemas.shopping import IngredientShoppingInfoResponse
+from app.services.nutrition.exceptions import ConversionError
 from app.services.shopping.constants import TIER_1_CONFIDENCE, TIER_2_CONFIDENCE
 from app.services.shopping.exceptions import IngredientNotFoundError
 from app.services.shopping.service import ShoppingService
@@ -28,11 +31,13 @@ pytestmark = pytest.mark.unit
 
 
 @pytest.fixture
-def mock_cache_client() -> AsyncMock:
+def mock_cache_client() -> MagicMock:
     """Create a mock Redis cache client."""
-    client = AsyncMock()
-    client.get.return_value = None
-    client.setex.return_value = True
+    client = MagicMock()
+    client.get = AsyncMock(return_value=None)
+    client.mget = AsyncMock(side_effect=lambda keys: [None] * len(keys))
+    client.setex = AsyncMock(return_value=True)
+    client.pipeline.return_value.execute = AsyncMock(return_value=[])
     return client
 
 
@@ -43,6 +48,9 @@ def mock_repository() -> AsyncMock:
     repo.get_ingredient_details.return_value = None
     repo.get_price_by_ingredient_id.return_value = None
     repo.get_price_by_food_group.return_value = None
+    repo.get_ingredient_details_by_ids.return_value = {}
+    repo.get_prices_by_ingredient_ids.return_value = {}
+    repo.get_prices_by_food_groups.return_value = {}
     return repo
 
 
@@ -70,6 +78,9 @@ def service(
     svc._initialized = True
     svc._converter = MagicMock()
     svc._converter.to_grams = AsyncMock(return_value=Decimal(100))
+    svc._converter.to_grams_batch = AsyncMock(
+        side_effect=lambda items: [Decimal(100)] * len(items)
+    )
     return svc
 
 
@@ -350,12 +361,17 @@ class TestGetRecipeShoppingInfo:
         self,
         service: ShoppingService,
         mock_repository: AsyncMock,
-        sample_ingredient_details: IngredientDetails,
         sample_tier1_pricing: PricingData,
     ) -> None:
         """Test aggregates shopping info for all ingredients."""
-        mock_repository.get_ingredient_details.return_value = sample_ingredient_details
-        mock_repository.get_price_by_ingredient_id.return_value = sample_tier1_pricing
+        mock_repository.get_ingredient_details_by_ids.return_value = {
+            1: IngredientDetails(ingredient_id=1, name="chicken"),
+            2: IngredientDetails(ingredient_id=2, name="rice"),
+        }
+        mock_repository.get_prices_by_ingredient_ids.return_value = {
+            1: sample_tier1_pricing,
+            2: sample_tier1_pricing,
+        }
 
         ingredients = [
             Ingredient(
@@ -383,12 +399,17 @@ class TestGetRecipeShoppingInfo:
         self,
         service: ShoppingService,
         mock_repository: AsyncMock,
-        sample_ingredient_details: IngredientDetails,
         sample_tier1_pricing: PricingData,
     ) -> None:
         """Test calculates total cost from all ingredients."""
-        mock_repository.get_ingredient_details.return_value = sample_ingredient_details
-        mock_repository.get_price_by_ingredient_id.return_value = sample_tier1_pricing
+        mock_repository.get_ingredient_details_by_ids.return_value = {
+            1: IngredientDetails(ingredient_id=1, name="chicken"),
+            2: IngredientDetails(ingredient_id=2, name="rice"),
+        }
+        mock_repository.get_prices_by_ingredient_ids.return_value = {
+            1: sample_tier1_pricing,
+            2: sample_tier1_pricing,
+        }
 
         ingredients = [
             Ingredient(
@@ -414,28 +435,21 @@ class TestGetRecipeShoppingInfo:
         self,
         service: ShoppingService,
         mock_repository: AsyncMock,
-        sample_ingredient_details: IngredientDetails,
     ) -> None:
         """Test handles ingredients with no pricing data."""
         # First ingredient has no pricing
-        no_price_details = IngredientDetails(
-            ingredient_id=1,
-            name="exotic spice",
-            food_group=None,
-        )
-        mock_repository.get_ingredient_details.side_effect = [
-            no_price_details,
-            sample_ingredient_details,
-        ]
-        mock_repository.get_price_by_ingredient_id.side_effect = [
-            None,
-            PricingData(
+        mock_repository.get_ingredient_details_by_ids.return_value = {
+            1: IngredientDetails(ingredient_id=1, name="exotic spice"),
+            2: IngredientDetails(ingredient_id=2, name="chicken"),
+        }
+        mock_repository.get_prices_by_ingredient_ids.return_value = {
+            2: PricingData(
                 price_per_100g=Decimal("0.50"),
                 currency="USD",
                 data_source="USDA_MEAT",
                 tier=1,
             ),
-        ]
+        }
 
         ingredients = [
             Ingredient(
@@ -461,15 +475,15 @@ class TestGetRecipeShoppingInfo:
         self,
         service: ShoppingService,
         mock_repository: AsyncMock,
-        sample_ingredient_details: IngredientDetails,
         sample_tier1_pricing: PricingData,
     ) -> None:
         """Test handles ingredients that don't exist in database."""
-        mock_repository.get_ingredient_details.side_effect = [
-            None,  # First ingredient not found
-            sample_ingredient_details,
-        ]
-        mock_repository.get_price_by_ingredient_id.return_value = sample_tier1_pricing
+        mock_repository.get_ingredient_details_by_ids.return_value = {
+            2: IngredientDetails(ingredient_id=2, name="chicken"),
+        }
+        mock_repository.get_prices_by_ingredient_ids.return_value = {
+            2: sample_tier1_pricing,
+        }
 
         ingredients = [
             Ingredient(
@@ -509,12 +523,15 @@ class TestGetRecipeShoppingInfo:
         self,
         service: ShoppingService,
         mock_repository: AsyncMock,
-        sample_ingredient_details: IngredientDetails,
         sample_tier1_pricing: PricingData,
     ) -> None:
         """Test skips ingredients without ID or name."""
-        mock_repository.get_ingredient_details.return_value = sample_ingredient_details
-        mock_repository.get_price_by_ingredient_id.return_value = sample_tier1_pricing
+        mock_repository.get_ingredient_details_by_ids.return_value = {
+            2: IngredientDetails(ingredient_id=2, name="chicken"),
+        }
+        mock_repository.get_prices_by_ingredient_ids.return_value = {
+            2: sample_tier1_pricing,
+        }
 
         ingredients = [
             Ingredient(ingredient_id=None, name="no-id"),  # Missing ID
@@ -532,6 +549,168 @@ class TestGetRecipeShoppingInfo:
 
         assert len(result.ingredients) == 1
         assert "chicken" in result.ingredients
+        mock_repository.get_ingredient_details_by_ids.assert_awaited_once_with([2])
+
+
+class TestBatchedRecipeShopping:
+    """Tests for the batched recipe shopping computation."""
+
+    @pytest.fixture
+    def ingredients(self) -> list[Ingredient]:
+        """Create recipe ingredients with mixed pricing tiers."""
+        return [
+            Ingredient(
+                ingredient_id=1,
+                name="chicken",
+                quantity=Quantity(amount=200, measurement=IngredientUnit.G),
+            ),
+            Ingredient(
+                ingredient_id=2,
+                name="carrot",
+                quantity=Quantity(amount=1, measurement=IngredientUnit.CUP),
+            ),
+            Ingredient(ingredient_id=3, name="salt"),
+        ]
+
+    @pytest.fixture(autouse=True)
+    def batch_data(
+        self,
+        mock_repository: AsyncMock,
+        sample_tier1_pricing: PricingData,
+        sample_tier2_pricing: PricingData,
+    ) -> None:
+        """Configure chicken with Tier 1 and carrot/salt with Tier 2 pricing."""
+        mock_repository.get_ingredient_details_by_ids.return_value = {
+            1: IngredientDetails(ingredient_id=1, name="chicken", food_group="POULTRY"),
+            2: IngredientDetails(
+                ingredient_id=2, name="carrot", food_group="VEGETABLES"
+            ),
+            3: IngredientDetails(ingredient_id=3, name="salt", food_group="SPICES"),
+        }
+        mock_repository.get_prices_by_ingredient_ids.return_value = {
+            1: sample_tier1_pricing,
+        }
+        mock_repository.get_prices_by_food_groups.return_value = {
+            "VEGETABLES": sample_tier2_pricing,
+        }
+
+    async def test_uses_fixed_number_of_round_trips(
+        self,
+        service: ShoppingService,
+        mock_cache_client: MagicMock,
+        mock_repository: AsyncMock,
+        ingredients: list[Ingredient],
+    ) -> None:
+        """Should issue one call per lookup stage regardless of ingredient count."""
+        await service.get_recipe_shopping_info(recipe_id=1, ingredients=ingredients)
+
+        mock_cache_client.mget.assert_awaited_once()
+        mock_cache_client.get.assert_not_awaited()
+        mock_repository.get_ingredient_details_by_ids.assert_awaited_once_with(
+            [1, 2, 3]
+        )
+        mock_repository.get_prices_by_ingredient_ids.assert_awaited_once_with([1, 2, 3])
+        mock_repository.get_prices_by_food_groups.assert_awaited_once_with(
+            ["VEGETABLES", "SPICES"]
+        )
+        mock_repository.get_ingredient_details.assert_not_awaited()
+        mock_repository.get_price_by_ingredient_id.assert_not_awaited()
+        service._converter.to_grams_batch.assert_awaited_once()
+        service._converter.to_grams.assert_not_awaited()
+
+    async def test_applies_tier_fallback(
+        self,
+        service: ShoppingService,
+        ingredients: list[Ingredient],
+    ) -> None:
+        """Should price each ingredient from its own tier."""
+        result = await service.get_recipe_shopping_info(
+            recipe_id=1, ingredients=ingredients
+        )
+
+        chicken = result.ingredients["chicken"]
+        carrot = result.ingredients["carrot"]
+        assert chicken.price_confidence == float(TIER_1_CONFIDENCE)
+        assert chicken.data_source == "USDA_MEAT"
+        assert carrot.price_confidence == float(TIER_2_CONFIDENCE)
+        assert carrot.data_source == "USDA_FMAP"
+        assert result.ingredients["salt"].estimated_price is None
+        assert result.missing_ingredients == [3]
+        # Only priced ingredients are converted, defaulting to 100g
+        items = service._converter.to_grams_batch.await_args.args[0]
+        assert [name for _, name in items] == ["chicken", "carrot"]
+
+    async def test_serves_cached_ingredients_without_queries(
+        self,
+        service: ShoppingService,
+        mock_cache_client: MagicMock,
+        mock_repository: AsyncMock,
+        ingredients: list[Ingredient],
+    ) -> None:
+        """Should only compute ingredients missing from the cache."""
+        cached = IngredientShoppingInfoResponse(
+            ingredient_name="chicken",
+            quantity=Quantity(amount=200, measurement=IngredientUnit.G),
+            estimated_price="1.05",
+            price_confidence=0.95,
+            data_source="USDA_MEAT",
+        )
+        mock_cache_client.mget.side_effect = None
+        mock_cache_client.mget.return_value = [
+            orjson.dumps(cached.model_dump(by_alias=True)),
+            None,
+            None,
+        ]
+
+        result = await service.get_recipe_shopping_info(
+            recipe_id=1, ingredients=ingredients
+        )
+
+        assert result.ingredients["chicken"].estimated_price == "1.05"
+        mock_repository.get_ingredient_details_by_ids.assert_awaited_once_with([2, 3])
+
+    async def test_writes_results_back_in_one_pipeline(
+        self,
+        service: ShoppingService,
+        mock_cache_client: MagicMock,
+        ingredients: list[Ingredient],
+    ) -> None:
+        """Should cache every computed response with one pipeline."""
+        await service.get_recipe_shopping_info(recipe_id=1, ingredients=ingredients)
+
+        pipe = mock_cache_client.pipeline.return_value
+        assert pipe.setex.call_count == 3
+        pipe.execute.assert_awaited_once()
+        mock_cache_client.setex.assert_not_awaited()
+
+    async def test_raises_on_conversion_error(
+        self,
+        service: ShoppingService,
+        ingredients: list[Ingredient],
+    ) -> None:
+        """Should propagate conversion failures for priced ingredients."""
+        service._converter.to_grams_batch.side_effect = None
+        service._converter.to_grams_batch.return_value = [Decimal(200), None]
+
+        with pytest.raises(ConversionError) as exc_info:
+            await service.get_recipe_shopping_info(recipe_id=1, ingredients=ingredients)
+
+        assert exc_info.value.ingredient == "carrot"
+
+    async def test_cache_read_failure_falls_back_to_database(
+        self,
+        service: ShoppingService,
+        mock_cache_client: MagicMock,
+        ingredients: list[Ingredient],
+    ) -> None:
+        """Should compute everything when the batch cache read fails."""
+        mock_cache_client.mget.side_effect = Exception("Redis error")
+
+        result = await service.get_recipe_shopping_info(
+            recipe_id=1, ingredients=ingredients
+        )
+
+        assert len(result.ingredients) == 3
 
 
 class TestShoppingServiceInitialization:
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import orjson
 import pytest
 
+from app.cache.swr import decode_swr_entry, encode_swr_entry
 from app.database.repositories.nutrition import NutritionData
 from app.llm.exceptions import (
     LLMRateLimitError,
@@ -31,6 +33,9 @@ def mock_cache_client() -> MagicMock:
     client = MagicMock()
     client.get = AsyncMock(return_value=None)
     client.setex = AsyncMock(return_value=True)
+    client.set = AsyncMock(return_value=True)  # single-flight lock
+    client.exists = AsyncMock(return_value=0)
+    client.eval = AsyncMock(return_value=1)
     return client
 
 
@@ -660,3 +665,132 @@ class TestCacheKeyGeneration:
 
         assert key1 == key2 == key3
         assert key1 == "substitution:butter"
+
+
+class TestRequestCoalescing:
+    """Tests for single-flight coalescing of concurrent cache misses."""
+
+    async def test_concurrent_misses_share_one_generation(
+        self,
+        service: SubstitutionService,
+        mock_cache_client: MagicMock,
+        mock_llm_client: MagicMock,
+        sample_substitution_result: SubstitutionListResult,
+    ) -> None:
+        """Should call the LLM once for concurrent requests for one ingredient."""
+        await service.initialize()
+        release = asyncio.Event()
+
+        async def generate(**_: object) -> SubstitutionListResult:
+            await release.wait()
+            return sample_substitution_result
+
+        mock_llm_client.generate_structured.side_effect = generate
+
+        pending = [
+            asyncio.create_task(service.get_substitutions("butter")) for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        release.set()
+        results = await asyncio.gather(*pending)
+
+        assert all(r is not None and r.count == 3 for r in results)
+        mock_llm_client.generate_structured.assert_awaited_once()
+        mock_cache_client.setex.assert_awaited_once()
+        mock_cache_client.set.assert_awaited_once()
+        assert mock_cache_client.set.call_args.args[0] == "lock:substitution:butter"
+
+    async def test_uses_result_from_other_replica(
+        self,
+        service: SubstitutionService,
+        mock_cache_client: MagicMock,
+        mock_llm_client: MagicMock,
+        sample_substitution_result: SubstitutionListResult,
+    ) -> None:
+        """Should wait for the lock holder's cached result instead of generating."""
+        await service.initialize()
+        service._single_flight.poll_interval = 0  # type: ignore[attr-defined]
+        mock_cache_client.set.return_value = None  # Lock held elsewhere
+        mock_cache_client.exists.return_value = 1
+        cached = orjson.dumps(sample_substitution_result.model_dump(mode="json"))
+        mock_cache_client.get.side_effect = [None, cached]
+
+        result = await service.get_substitutions("butter")
+
+        assert result is not None
+        assert result.count == 3
+        mock_llm_client.generate_structured.assert_not_called()
+
+
+class TestStaleWhileRevalidate:
+    """Tests for serving stale cache entries while revalidating."""
+
+    async def test_stale_hit_serves_and_schedules_revalidation(
+        self,
+        service: SubstitutionService,
+        mock_cache_client: MagicMock,
+        mock_llm_client: MagicMock,
+        sample_substitution_result: SubstitutionListResult,
+    ) -> None:
+        """Should return the stale entry and enqueue a background refresh."""
+        await service.initialize()
+        mock_cache_client.get.return_value = encode_swr_entry(
+            sample_substitution_result.model_dump(mode="json"), -1
+        )
+
+        with patch(
+            "app.services.substitution.service.schedule_revalidation",
+            new_callable=AsyncMock,
+        ) as mock_schedule:
+            result = await service.get_substitutions("butter")
+
+        assert result is not None
+        assert result.count == 3
+        mock_llm_client.generate_structured.assert_not_called()
+        mock_schedule.assert_awaited_once_with(
+            "substitution",
+            "substitution:butter",
+            "revalidate_substitutions",
+            "butter",
+            None,
+        )
+
+    async def test_fresh_hit_does_not_revalidate(
+        self,
+        service: SubstitutionService,
+        mock_cache_client: MagicMock,
+        sample_substitution_result: SubstitutionListResult,
+    ) -> None:
+        """Should not enqueue a refresh for fresh entries."""
+        await service.initialize()
+        mock_cache_client.get.return_value = encode_swr_entry(
+            sample_substitution_result.model_dump(mode="json"), 3600
+        )
+
+        with patch(
+            "app.services.substitution.service.schedule_revalidation",
+            new_callable=AsyncMock,
+        ) as mock_schedule:
+            result = await service.get_substitutions("butter")
+
+        assert result is not None
+        mock_schedule.assert_not_awaited()
+
+    async def test_refresh_regenerates_and_writes_envelope(
+        self,
+        service: SubstitutionService,
+        mock_cache_client: MagicMock,
+        mock_llm_client: MagicMock,
+        sample_substitution_result: SubstitutionListResult,
+    ) -> None:
+        """Should bypass the cache and store a fresh SWR envelope."""
+        await service.initialize()
+        mock_llm_client.generate_structured.return_value = sample_substitution_result
+
+        result = await service.refresh_substitutions("butter")
+
+        assert result == sample_substitution_result
+        mock_cache_client.get.assert_not_called()
+        key, _, raw = mock_cache_client.setex.call_args.args
+        assert key == "substitution:butter"
+        assert decode_swr_entry(raw).stale is False
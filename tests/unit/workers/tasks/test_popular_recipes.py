@@ -2,7 +2,8 @@
 
 Tests cover:
 - refresh_popular_recipes task
-- check_and_refresh_popular_recipes cron job
+- check_and_refresh_popular_recipes cron job (per-source scheduling and
+  TTL-based rebuilds)
 """
 
 from __future__ import annotations
@@ -60,6 +61,14 @@ def _create_mock_settings() -> MagicMock:
     return mock_settings
 
 
+def _create_mock_service(stale_sources: list[str] | None = None) -> AsyncMock:
+    """Create a mock service with the given sources due for a refetch."""
+    mock_service = AsyncMock()
+    mock_service.get_stale_sources.return_value = stale_sources or []
+    mock_service.refresh_cache.return_value = _create_mock_popular_recipes_data()
+    return mock_service
+
+
 class TestRefreshPopularRecipes:
     """Tests for refresh_popular_recipes task."""
 
@@ -91,9 +100,23 @@ class TestRefreshPopularRecipes:
         assert result["sources_fetched"] == ["Taste of Home", "AllRecipes"]
         assert result["sources_failed"] == []
         mock_service.initialize.assert_called_once()
-        mock_service.refresh_cache.assert_called_once()
+        mock_service.refresh_cache.assert_called_once_with(None)
         mock_service.shutdown.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_refresh_given_sources(self) -> None:
+        """Should refresh only the sources passed to the job."""
+        mock_service = _create_mock_service()
+
+        with patch(
+            "app.workers.tasks.popular_recipes.PopularRecipesService",
+            return_value=mock_service,
+        ):
+            result = await refresh_popular_recipes({}, sources=["AllRecipes"])
+
+        assert result["status"] == "completed"
+        mock_service.refresh_cache.assert_called_once_with(["AllRecipes"])
+
     @pytest.mark.asyncio
     async def test_refresh_with_partial_failures(self) -> None:
         """Should handle partial source failures and report them."""
@@ -202,9 +225,15 @@ class TestCheckAndRefreshPopularRecipes:
 
         ctx = {"cache_client": mock_cache_client}
 
-        with patch(
-            "app.workers.tasks.popular_recipes.get_settings",
-            return_value=mock_settings,
+        with (
+            patch(
+                "app.workers.tasks.popular_recipes.get_settings",
+                return_value=mock_settings,
+            ),
+            patch(
+                "app.workers.tasks.popular_recipes.PopularRecipesService",
+                return_value=_create_mock_service(),
+            ),
         ):
             result = await check_and_refresh_popular_recipes(ctx)
 
@@ -218,9 +247,7 @@ class TestCheckAndRefreshPopularRecipes:
         mock_cache_client = AsyncMock()
         mock_cache_client.ttl.return_value = 1800  # 30 minutes remaining
         mock_settings = _create_mock_settings()
-        mock_service = AsyncMock()
-        mock_data = _create_mock_popular_recipes_data()
-        mock_service.refresh_cache.return_value = mock_data
+        mock_service = _create_mock_service()
 
         ctx = {"cache_client": mock_cache_client}
 
@@ -237,7 +264,7 @@ class TestCheckAndRefreshPopularRecipes:
             result = await check_and_refresh_popular_recipes(ctx)
 
         assert result["status"] == "completed"
-        mock_service.refresh_cache.assert_called_once()
+        mock_service.refresh_cache.assert_called_once_with([])
 
     @pytest.mark.asyncio
     async def test_refreshes_when_cache_missing(self) -> None:
@@ -245,9 +272,7 @@ class TestCheckAndRefreshPopularRecipes:
         mock_cache_client = AsyncMock()
         mock_cache_client.ttl.return_value = -2  # Key doesn't exist
         mock_settings = _create_mock_settings()
-        mock_service = AsyncMock()
-        mock_data = _create_mock_popular_recipes_data()
-        mock_service.refresh_cache.return_value = mock_data
+        mock_service = _create_mock_service()
 
         ctx = {"cache_client": mock_cache_client}
 
@@ -264,7 +289,7 @@ class TestCheckAndRefreshPopularRecipes:
             result = await check_and_refresh_popular_recipes(ctx)
 
         assert result["status"] == "completed"
-        mock_service.refresh_cache.assert_called_once()
+        mock_service.refresh_cache.assert_called_once_with([])
 
     @pytest.mark.asyncio
     async def test_refreshes_when_no_expiry(self) -> None:
@@ -272,9 +297,7 @@ class TestCheckAndRefreshPopularRecipes:
         mock_cache_client = AsyncMock()
         mock_cache_client.ttl.return_value = -1  # No expiry set
         mock_settings = _create_mock_settings()
-        mock_service = AsyncMock()
-        mock_data = _create_mock_popular_recipes_data()
-        mock_service.refresh_cache.return_value = mock_data
+        mock_service = _create_mock_service()
 
         ctx = {"cache_client": mock_cache_client}
 
@@ -291,7 +314,7 @@ class TestCheckAndRefreshPopularRecipes:
             result = await check_and_refresh_popular_recipes(ctx)
 
         assert result["status"] == "completed"
-        mock_service.refresh_cache.assert_called_once()
+        mock_service.refresh_cache.assert_called_once_with([])
 
     @pytest.mark.asyncio
     async def test_skips_when_no_cache_client(self) -> None:
@@ -319,9 +342,15 @@ class TestCheckAndRefreshPopularRecipes:
 
         ctx = {"cache_client": mock_cache_client}
 
-        with patch(
-            "app.workers.tasks.popular_recipes.get_settings",
-            return_value=mock_settings,
+        with (
+            patch(
+                "app.workers.tasks.popular_recipes.get_settings",
+                return_value=mock_settings,
+            ),
+            patch(
+                "app.workers.tasks.popular_recipes.PopularRecipesService",
+                return_value=_create_mock_service(),
+            ),
         ):
             await check_and_refresh_popular_recipes(ctx)
 
@@ -333,9 +362,7 @@ class TestCheckAndRefreshPopularRecipes:
         mock_cache_client = AsyncMock()
         mock_cache_client.ttl.return_value = 3600  # Exactly at threshold
         mock_settings = _create_mock_settings()
-        mock_service = AsyncMock()
-        mock_data = _create_mock_popular_recipes_data()
-        mock_service.refresh_cache.return_value = mock_data
+        mock_service = _create_mock_service()
 
         ctx = {"cache_client": mock_cache_client}
 
@@ -360,9 +387,7 @@ class TestCheckAndRefreshPopularRecipes:
         mock_cache_client = AsyncMock()
         mock_cache_client.ttl.return_value = 3599  # Just below threshold
         mock_settings = _create_mock_settings()
-        mock_service = AsyncMock()
-        mock_data = _create_mock_popular_recipes_data()
-        mock_service.refresh_cache.return_value = mock_data
+        mock_service = _create_mock_service()
 
         ctx = {"cache_client": mock_cache_client}
 
@@ -379,4 +404,57 @@ class TestCheckAndRefreshPopularRecipes:
             result = await check_and_refresh_popular_recipes(ctx)
 
         assert result["status"] == "completed"
-        mock_service.refresh_cache.assert_called_once()
+        mock_service.refresh_cache.assert_called_once_with([])
+
+    @pytest.mark.asyncio
+    async def test_schedules_stale_sources(self) -> None:
+        """Should enqueue one refresh job per due source."""
+        mock_cache_client = AsyncMock()
+        mock_service = _create_mock_service(stale_sources=["AllRecipes", "Food52"])
+        mock_enqueue = AsyncMock(return_value=MagicMock())
+
+        ctx = {"cache_client": mock_cache_client}
+
+        with (
+            patch(
+                "app.workers.tasks.popular_recipes.get_settings",
+                return_value=_create_mock_settings(),
+            ),
+            patch(
+                "app.workers.tasks.popular_recipes.PopularRecipesService",
+                return_value=mock_service,
+            ),
+            patch("app.workers.jobs.enqueue_popular_source_refresh", mock_enqueue),
+        ):
+            result = await check_and_refresh_popular_recipes(ctx)
+
+        assert result == {"status": "scheduled", "sources": ["AllRecipes", "Food52"]}
+        assert [c.args for c in mock_enqueue.await_args_list] == [
+            ("AllRecipes",),
+            ("Food52",),
+        ]
+        mock_service.refresh_cache.assert_not_called()
+        mock_cache_client.ttl.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reports_only_newly_scheduled_sources(self) -> None:
+        """Should leave out sources whose refresh job is already pending."""
+        mock_service = _create_mock_service(stale_sources=["AllRecipes", "Food52"])
+        mock_enqueue = AsyncMock(side_effect=[None, MagicMock()])
+
+        ctx = {"cache_client": AsyncMock()}
+
+        with (
+            patch(
+                "app.workers.tasks.popular_recipes.get_settings",
+                return_value=_create_mock_settings(),
+            ),
+            patch(
+                "app.workers.tasks.popular_recipes.PopularRecipesService",
+                return_value=mock_service,
+            ),
+            patch("app.workers.jobs.enqueue_popular_source_refresh", mock_enqueue),
+        ):
+            result = await check_and_refresh_popular_recipes(ctx)
+
+        assert result == {"status": "scheduled", "sources": ["Food52"]}
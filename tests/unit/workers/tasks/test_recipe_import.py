@@ -0,0 +1,189 @@
+"""Unit tests for the asynchronous recipe import task.
+
+Tests cover:
+- Running the import pipeline and recording each stage
+- Returning failures without retrying them
+- Retrying timeouts and an unavailable downstream service
+- Reporting workers without import clients
+- Reading the caller's token outside the job arguments and dropping it
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from arq import Retry
+
+from app.llm.prompts import IngredientUnit, ParsedIngredient
+from app.services.recipe_import import ImportStage
+from app.services.recipe_management import RecipeResponse
+from app.services.recipe_management.exceptions import (
+    RecipeManagementUnavailableError,
+)
+from app.services.scraping.exceptions import RecipeNotFoundError
+from app.services.scraping.models import ScrapedRecipe
+from app.workers.tasks.recipe_import import process_recipe_scrape
+
+
+pytestmark = pytest.mark.unit
+
+URL = "https://example.com/cookies"
+
+
+def _queue() -> MagicMock:
+    """Queue database mock holding the caller's token of job-1."""
+    queue = MagicMock()
+    queue.get = AsyncMock(return_value=b"token")
+    queue.delete = AsyncMock()
+    return queue
+
+
+@pytest.fixture
+def worker_ctx() -> dict[str, Any]:
+    """ARQ worker context with import clients."""
+    scraper = MagicMock()
+    scraper.scrape = AsyncMock(
+        return_value=ScrapedRecipe(
+            title="Cookies",
+            ingredients=["2 cups flour"],
+            instructions=["Bake"],
+            source_url=URL,
+        )
+    )
+    recipe_client = MagicMock()
+    recipe_client.create_recipe = AsyncMock(
+        return_value=RecipeResponse(id=42, title="Cookies", slug="cookies")
+    )
+    return {
+        "scraper_service": scraper,
+        "recipe_client": recipe_client,
+        "llm_client": MagicMock(),
+        "cache_client": None,
+        "redis": _queue(),
+        "job_id": "job-1",
+        "job_try": 1,
+    }
+
+
+@pytest.fixture
+def parsed() -> list[ParsedIngredient]:
+    """Parsed ingredients returned by the parser."""
+    return [ParsedIngredient(name="flour", quantity=2.0, unit=IngredientUnit.CUP)]
+
+
+@pytest.fixture
+def stages() -> Any:
+    """Patch stage recording, collecting the recorded stages."""
+    with patch(
+        "app.workers.tasks.recipe_import.set_import_stage", new_callable=AsyncMock
+    ) as record:
+        yield record
+
+
+def _recorded(record: AsyncMock) -> list[ImportStage]:
+    return [call.args[2] for call in record.await_args_list]
+
+
+class TestProcessRecipeScrape:
+    """Tests for the process_recipe_scrape task."""
+
+    async def test_imports_recipe(
+        self,
+        worker_ctx: dict[str, Any],
+        parsed: list[ParsedIngredient],
+        stages: AsyncMock,
+    ) -> None:
+        """Should run the pipeline and return the created recipe."""
+        with patch(
+            "app.parsing.ingredient.IngredientParser.parse_batch",
+            AsyncMock(return_value=parsed),
+        ):
+            result = await process_recipe_scrape(worker_ctx, URL, "user-1")
+
+        assert result["status"] == "completed"
+        assert result["recipe"]["recipeId"] == 42
+        assert "token" not in str(result)
+        assert worker_ctx["recipe_client"].create_recipe.await_args.args[1] == "token"
+        worker_ctx["redis"].get.assert_awaited_once_with(
+            "scraper:queue:import-credential:job-1"
+        )
+        worker_ctx["redis"].delete.assert_awaited_once_with(
+            "scraper:queue:import-credential:job-1"
+        )
+        assert _recorded(stages) == [
+            ImportStage.SCRAPING,
+            ImportStage.PARSING,
+            ImportStage.SAVING,
+            ImportStage.COMPLETE,
+        ]
+
+    async def test_returns_failure_without_retry(
+        self, worker_ctx: dict[str, Any], stages: AsyncMock
+    ) -> None:
+        """Should return non-retryable failures as a failed result."""
+        worker_ctx["scraper_service"].scrape.side_effect = RecipeNotFoundError("none")
+
+        result = await process_recipe_scrape(worker_ctx, URL, "user-1")
+
+        assert result["status"] == "failed"
+        assert result["status_code"] == 400
+        assert result["error"] == "RECIPE_NOT_FOUND"
+        assert _recorded(stages)[-1] == ImportStage.FAILED
+
+    async def test_retries_when_downstream_unavailable(
+        self,
+        worker_ctx: dict[str, Any],
+        parsed: list[ParsedIngredient],
+        stages: AsyncMock,
+    ) -> None:
+        """Should ask ARQ to retry while attempts are left."""
+        worker_ctx[
+            "recipe_client"
+        ].create_recipe.side_effect = RecipeManagementUnavailableError("down")
+
+        with (
+            patch(
+                "app.parsing.ingredient.IngredientParser.parse_batch",
+                AsyncMock(return_value=parsed),
+            ),
+            pytest.raises(Retry),
+        ):
+            await process_recipe_scrape(worker_ctx, URL, "user-1")
+
+        assert _recorded(stages)[-1] == ImportStage.QUEUED
+        worker_ctx["redis"].delete.assert_not_called()
+
+    async def test_reports_failure_on_last_attempt(
+        self,
+        worker_ctx: dict[str, Any],
+        parsed: list[ParsedIngredient],
+        stages: AsyncMock,
+    ) -> None:
+        """Should stop retrying once attempts are exhausted."""
+        worker_ctx["job_try"] = 3
+        worker_ctx[
+            "recipe_client"
+        ].create_recipe.side_effect = RecipeManagementUnavailableError("down")
+
+        with patch(
+            "app.parsing.ingredient.IngredientParser.parse_batch",
+            AsyncMock(return_value=parsed),
+        ):
+            result = await process_recipe_scrape(worker_ctx, URL, "user-1")
+
+        assert result["status"] == "failed"
+        assert result["status_code"] == 503
+        assert _recorded(stages)[-1] == ImportStage.FAILED
+        worker_ctx["redis"].delete.assert_awaited_once()
+
+    async def test_fails_without_import_clients(self, stages: AsyncMock) -> None:
+        """Should report a worker without import clients as unavailable."""
+        result = await process_recipe_scrape(
+            {"redis": _queue(), "job_id": "job-1"}, URL, "user-1"
+        )
+
+        assert result["status"] == "failed"
+        assert result["error"] == "SERVICE_UNAVAILABLE"
+        assert _recorded(stages) == [ImportStage.FAILED]
@@ -0,0 +1,139 @@
+"""Unit tests for stale-while-revalidate worker tasks.
+
+Tests cover:
+- revalidate_substitutions task
+- revalidate_pairings task
+- revalidate_llm_completion task
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.cache.swr import decode_swr_entry
+from app.llm.models import LLMCompletionResult
+from app.llm.prompts.pairings import PairingListResult
+from app.workers.tasks.revalidation import (
+    revalidate_llm_completion,
+    revalidate_pairings,
+    revalidate_substitutions,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def worker_ctx() -> dict[str, MagicMock]:
+    """Create an ARQ worker context with cache and LLM clients."""
+    cache_client = MagicMock()
+    cache_client.set = AsyncMock()
+    llm_client = MagicMock()
+    llm_client.generate = AsyncMock()
+    return {"cache_client": cache_client, "llm_client": llm_client}
+
+
+class TestRevalidateSubstitutions:
+    """Tests for the revalidate_substitutions task."""
+
+    async def test_refreshes_through_service(self, worker_ctx: dict[str, MagicMock]):
+        """Should regenerate substitutions with the worker's clients."""
+        with patch(
+            "app.workers.tasks.revalidation.SubstitutionService"
+        ) as mock_service_class:
+            service = mock_service_class.return_value
+            service.initialize = AsyncMock()
+            service.shutdown = AsyncMock()
+            service.refresh_substitutions = AsyncMock(
+                return_value=MagicMock(substitutions=[1, 2])
+            )
+
+            result = await revalidate_substitutions(worker_ctx, "butter", "DAIRY")
+
+        assert result == {
+            "status": "completed",
+            "ingredient": "butter",
+            "substitution_count": 2,
+        }
+        service.refresh_substitutions.assert_awaited_once_with("butter", "DAIRY")
+        service.shutdown.assert_awaited_once()
+
+    async def test_skips_without_llm_client(self, worker_ctx: dict[str, MagicMock]):
+        """Should skip when the worker has no LLM client."""
+        worker_ctx["llm_client"] = None  # type: ignore[assignment]
+
+        result = await revalidate_substitutions(worker_ctx, "butter")
+
+        assert result == {"status": "skipped", "reason": "no_clients"}
+
+
+class TestRevalidatePairings:
+    """Tests for the revalidate_pairings task."""
+
+    async def test_refreshes_through_service(self, worker_ctx: dict[str, MagicMock]):
+        """Should rebuild the recipe context and regenerate pairings."""
+        context = {
+            "recipe_id": 7,
+            "title": "Soup",
+            "description": None,
+            "ingredients": ["water"],
+        }
+        with patch(
+            "app.workers.tasks.revalidation.PairingsService"
+        ) as mock_service_class:
+            service = mock_service_class.return_value
+            service.initialize = AsyncMock()
+            service.shutdown = AsyncMock()
+            service.refresh_pairings = AsyncMock(return_value=None)
+
+            result = await revalidate_pairings(worker_ctx, context)
+
+        assert result == {"status": "failed", "recipe_id": 7}
+        assert service.refresh_pairings.call_args.args[0].title == "Soup"
+
+
+class TestRevalidateLLMCompletion:
+    """Tests for the revalidate_llm_completion task."""
+
+    async def test_regenerates_and_writes_entry(self, worker_ctx: dict[str, MagicMock]):
+        """Should bypass the cache, resolve the schema and store a fresh entry."""
+        worker_ctx["llm_client"].generate.return_value = LLMCompletionResult(
+            raw_response="{}", model="m"
+        )
+
+        result = await revalidate_llm_completion(
+            worker_ctx,
+            "llm:abc",
+            "prompt",
+            model="m",
+            schema="PairingListResult",
+            fresh_ttl=60,
+            stale_ttl=30,
+        )
+
+        assert result["status"] == "completed"
+        generate_kwargs = worker_ctx["llm_client"].generate.call_args.kwargs
+        assert generate_kwargs["schema"] is PairingListResult
+        assert generate_kwargs["skip_cache"] is True
+        args, kwargs = worker_ctx["cache_client"].set.call_args
+        assert args[0] == "llm:abc"
+        assert decode_swr_entry(args[1]).value["raw_response"] == "{}"
+        assert kwargs == {"ex": 90}
+
+    async def test_skips_unknown_schema(self, worker_ctx: dict[str, MagicMock]):
+        """Should only resolve registered schemas, never import from job data."""
+        result = await revalidate_llm_completion(
+            worker_ctx,
+            "llm:abc",
+            "prompt",
+            model="m",
+            schema="os:getcwd",
+            fresh_ttl=60,
+            stale_ttl=30,
+        )
+
+        assert result == {"status": "skipped", "reason": "unknown_schema"}
+        worker_ctx["llm_client"].generate.assert_not_called()
+        worker_ctx["cache_client"].set.assert_not_called()
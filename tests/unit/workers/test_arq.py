@@ -8,13 +8,23 @@ Tests cover:
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.core.config.settings import (
+    GroqRateLimitSettings,
+    HttpClientSettings,
+    LLMBatchingSettings,
+)
 from app.workers.arq import WorkerSettings, get_redis_settings, shutdown, startup
 
 
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
 pytestmark = pytest.mark.unit
 
 
@@ -37,19 +47,31 @@ def _create_mock_settings(
     mock_settings.is_development = False
     mock_settings.APP_ENV = "test"
     mock_settings.redis_cache_url = "redis://localhost:6379/0"
+    mock_settings.redis_rate_limit_url = "redis://localhost:6379/2"
+    mock_settings.redis.generation_refresh_interval = 0
     mock_settings.llm.enabled = llm_enabled
     mock_settings.llm.provider = llm_provider
     mock_settings.llm.groq.model = "llama3-70b-8192"
     mock_settings.llm.groq.timeout = 30
     mock_settings.llm.groq.max_retries = 3
     mock_settings.llm.groq.requests_per_minute = 30
+    mock_settings.llm.groq.rate_limit = GroqRateLimitSettings()
+    mock_settings.llm.batching = LLMBatchingSettings(enabled=False)
     mock_settings.llm.ollama.url = "http://localhost:11434"
     mock_settings.llm.ollama.model = "llama2"
     mock_settings.llm.ollama.timeout = 60
     mock_settings.llm.ollama.max_retries = 2
     mock_settings.llm.fallback.enabled = fallback_enabled
     mock_settings.llm.fallback.secondary_provider = fallback_secondary_provider
+    mock_settings.llm.fallback.hedging_enabled = True
+    mock_settings.llm.fallback.hedge_min_samples = 20
+    mock_settings.llm.fallback.latency_window = 100
+    mock_settings.llm.fallback.circuit_failure_threshold = 5
+    mock_settings.llm.fallback.circuit_reset_seconds = 30.0
     mock_settings.GROQ_API_KEY = groq_api_key
+    mock_settings.scraping.parse_executor.mode = "inline"
+    mock_settings.scraping.parse_executor.max_workers = 1
+    mock_settings.http_client = HttpClientSettings()
     return mock_settings
 
 
@@ -92,6 +114,25 @@ class TestGetRedisSettings:
 class TestStartup:
     """Tests for startup handler."""
 
+    @pytest.fixture(autouse=True)
+    def generations(self) -> Generator[tuple[AsyncMock, MagicMock]]:
+        """Stub loading and refreshing the cache namespace generations."""
+        with (
+            patch(
+                "app.workers.arq.load_generations",
+                new_callable=AsyncMock,
+                return_value={},
+            ) as load,
+            patch("app.workers.arq.start_generation_refresh") as start,
+        ):
+            yield load, start
+
+    @pytest.fixture(autouse=True)
+    def groq_rate_limiter(self) -> Generator[MagicMock]:
+        """Stub the Redis-backed Groq limiter (scripts register synchronously)."""
+        with patch("app.workers.arq.create_groq_rate_limiter") as create:
+            yield create
+
     @pytest.mark.asyncio
     async def test_sets_up_logging(self) -> None:
         """Should set up logging with correct settings."""
@@ -145,6 +186,27 @@ class TestStartup:
 
             assert ctx["cache_client"] is mock_redis
 
+    @pytest.mark.asyncio
+    async def test_loads_cache_generations(
+        self, generations: tuple[AsyncMock, MagicMock]
+    ) -> None:
+        """Should load namespace generations and start refreshing them."""
+        ctx: dict[str, MagicMock] = {}
+        mock_settings = _create_mock_settings()
+        mock_settings.redis.generation_refresh_interval = 5.0
+        mock_redis = AsyncMock()
+        load, start = generations
+
+        with (
+            patch("app.workers.arq.get_settings", return_value=mock_settings),
+            patch("app.workers.arq.setup_logging"),
+            patch("app.workers.arq.Redis.from_url", return_value=mock_redis),
+        ):
+            await startup(ctx)
+
+        load.assert_awaited_once_with(mock_redis)
+        start.assert_called_once_with(mock_redis, 5.0)
+
     @pytest.mark.asyncio
     async def test_llm_client_none_when_disabled(self) -> None:
         """Should set llm_client to None when LLM is disabled."""
@@ -271,6 +333,11 @@ class TestStartup:
                 primary=mock_ollama_client,
                 secondary=mock_groq_client,
                 fallback_enabled=True,
+                hedging_enabled=True,
+                hedge_min_samples=20,
+                latency_window=100,
+                failure_threshold=5,
+                reset_timeout=30.0,
             )
 
     @pytest.mark.asyncio
@@ -304,6 +371,11 @@ class TestStartup:
                 primary=mock_groq_client,
                 secondary=None,
                 fallback_enabled=True,
+                hedging_enabled=True,
+                hedge_min_samples=20,
+                latency_window=100,
+                failure_threshold=5,
+                reset_timeout=30.0,
             )
 
 
@@ -355,6 +427,21 @@ class TestShutdown:
         mock_cache_client.close.assert_called_once()
         mock_llm_client.shutdown.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_closes_import_clients_when_present(self) -> None:
+        """Should shut down the recipe import clients."""
+        scraper_service = AsyncMock()
+        recipe_client = AsyncMock()
+        ctx: dict[str, AsyncMock] = {
+            "scraper_service": scraper_service,
+            "recipe_client": recipe_client,
+        }
+
+        await shutdown(ctx)
+
+        scraper_service.shutdown.assert_awaited_once()
+        recipe_client.shutdown.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_handles_empty_context(self) -> None:
         """Should handle empty context without errors."""
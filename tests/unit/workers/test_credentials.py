@@ -0,0 +1,61 @@
+"""Unit tests for recipe import credentials.
+
+Tests cover:
+- Storing the token with the job's expiry
+- Reading tokens stored as bytes and missing tokens
+- Tolerating Redis failures on delete
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.workers.credentials import (
+    IMPORT_JOB_EXPIRES,
+    delete_import_credential,
+    get_import_credential,
+    store_import_credential,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+class TestImportCredential:
+    """Tests for the import credential lifecycle."""
+
+    async def test_stores_token_expiring_with_job(self) -> None:
+        """Should store the token under its own key with the job's expiry."""
+        redis = MagicMock()
+        redis.set = AsyncMock()
+
+        await store_import_credential(redis, "job-1", "token")
+
+        redis.set.assert_awaited_once_with(
+            "scraper:queue:import-credential:job-1", "token", ex=IMPORT_JOB_EXPIRES
+        )
+
+    async def test_reads_token(self) -> None:
+        """Should decode the stored token."""
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value=b"token")
+
+        assert await get_import_credential(redis, "job-1") == "token"
+
+    async def test_missing_token_is_empty(self) -> None:
+        """Should return an empty token when none is stored or it expired."""
+        redis = MagicMock()
+        redis.get = AsyncMock(return_value=None)
+
+        assert await get_import_credential(redis, "job-1") == ""
+
+    async def test_delete_swallows_redis_errors(self) -> None:
+        """Should not fail the import when the token cannot be deleted."""
+        redis = MagicMock()
+        redis.delete = AsyncMock(side_effect=ConnectionError("refused"))
+
+        await delete_import_credential(redis, "job-1")
+
+        redis.delete.assert_awaited_once_with("scraper:queue:import-credential:job-1")
@@ -3,20 +3,18 @@
 Tests cover:
 - send_notification task
 - cleanup_expired_cache task
-- process_recipe_scrape task
 - get_job_result helper
 """
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.workers.tasks.example import (
     cleanup_expired_cache,
     get_job_result,
-    process_recipe_scrape,
     send_notification,
 )
 
@@ -66,33 +64,31 @@ class TestCleanupExpiredCache:
     """Tests for cleanup_expired_cache task."""
 
     @pytest.mark.asyncio
-    async def test_returns_completed_status(self) -> None:
-        """Should return completed status."""
-        ctx: dict[str, MagicMock] = {}
-
-        result = await cleanup_expired_cache(ctx)
-
+    async def test_sweeps_orphaned_generations(self) -> None:
+        """Should sweep with the worker cache client and report the count."""
+        mock_cache_client = MagicMock()
+        ctx: dict[str, MagicMock] = {"cache_client": mock_cache_client}
+
+        with patch(
+            "app.workers.tasks.example.sweep_orphaned_generations",
+            new_callable=AsyncMock,
+            return_value={"nutrition": 3, "popular": 2},
+        ) as mock_sweep:
+            result = await cleanup_expired_cache(ctx)
+
+        mock_sweep.assert_awaited_once_with(mock_cache_client)
         assert result["status"] == "completed"
-        assert "cleaned_count" in result
-
-
-class TestProcessRecipeScrape:
-    """Tests for process_recipe_scrape task."""
+        assert result["cleaned_count"] == 5
+        assert result["namespaces"] == {"nutrition": 3, "popular": 2}
 
     @pytest.mark.asyncio
-    async def test_returns_completed_status(self) -> None:
-        """Should return completed status."""
+    async def test_skips_without_cache_client(self) -> None:
+        """Should skip the sweep when no cache client is available."""
         ctx: dict[str, MagicMock] = {}
 
-        result = await process_recipe_scrape(
-            ctx,
-            url="https://example.com/recipe",
-            user_id="user-123",
-        )
+        result = await cleanup_expired_cache(ctx)
 
-        assert result["status"] == "completed"
-        assert result["url"] == "https://example.com/recipe"
-        assert result["user_id"] == "user-123"
+        assert result == {"status": "skipped", "reason": "no_cache_client"}
 
 
 # =============================================================================
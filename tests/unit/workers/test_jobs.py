@@ -15,6 +15,8 @@ import pytest
 from arq.jobs import JobStatus
 
 import app.workers.jobs as jobs_module
+from app.services.recipe_import import ImportStage
+from app.workers.credentials import IMPORT_JOB_EXPIRES
 from app.workers.jobs import (
     close_arq_pool,
     enqueue_job,
@@ -182,18 +184,68 @@ class TestEnqueueRecipeScrape:
 
     @pytest.mark.asyncio
     async def test_enqueues_scrape_job(self) -> None:
-        """Should enqueue process_recipe_scrape job."""
-        with patch("app.workers.jobs.enqueue_job") as mock_enqueue:
+        """Should record the queued stage, then enqueue process_recipe_scrape."""
+        jobs_module._arq_pool = AsyncMock()
+        with (
+            patch("app.workers.jobs.enqueue_job") as mock_enqueue,
+            patch(
+                "app.workers.jobs.set_import_stage", new_callable=AsyncMock
+            ) as mock_stage,
+        ):
             mock_enqueue.return_value = MagicMock()
 
-            await enqueue_recipe_scrape("https://example.com/recipe", "user-456")
+            await enqueue_recipe_scrape(
+                "https://example.com/recipe", "user-456", "token"
+            )
+
+        job_id = mock_enqueue.call_args.kwargs["_job_id"]
+        mock_enqueue.assert_called_once_with(
+            "process_recipe_scrape",
+            "https://example.com/recipe",
+            "user-456",
+            _job_id=job_id,
+            _expires=IMPORT_JOB_EXPIRES,
+        )
+        mock_stage.assert_awaited_once_with(
+            jobs_module._arq_pool, job_id, ImportStage.QUEUED, user_id="user-456"
+        )
+        jobs_module._arq_pool.set.assert_awaited_once_with(
+            f"scraper:queue:import-credential:{job_id}",
+            "token",
+            ex=IMPORT_JOB_EXPIRES,
+        )
 
-            mock_enqueue.assert_called_once_with(
-                "process_recipe_scrape",
-                "https://example.com/recipe",
-                "user-456",
+    @pytest.mark.asyncio
+    async def test_drops_token_when_enqueue_fails(self) -> None:
+        """Should not keep the caller's token for a job that was not queued."""
+        jobs_module._arq_pool = AsyncMock()
+        with (
+            patch("app.workers.jobs.enqueue_job", AsyncMock(return_value=None)),
+            patch("app.workers.jobs.set_import_stage", new_callable=AsyncMock),
+        ):
+            job = await enqueue_recipe_scrape(
+                "https://example.com/recipe", "user-456", "token"
             )
 
+        assert job is None
+        key = jobs_module._arq_pool.set.await_args.args[0]
+        jobs_module._arq_pool.delete.assert_awaited_once_with(key)
+
+    @pytest.mark.asyncio
+    async def test_returns_none_when_queue_unreachable(self) -> None:
+        """Should not enqueue when the queue cannot be reached."""
+        with (
+            patch(
+                "app.workers.jobs.create_pool",
+                AsyncMock(side_effect=ConnectionError("refused")),
+            ),
+            patch("app.workers.jobs.enqueue_job") as mock_enqueue,
+        ):
+            job = await enqueue_recipe_scrape("https://example.com/recipe", "u")
+
+        assert job is None
+        mock_enqueue.assert_not_called()
+
 
 class TestGetJobStatus:
     """Tests for get_job_status function."""
@@ -0,0 +1,75 @@
+"""Unit tests for recipe import progress records.
+
+Tests cover:
+- Writing the stage and owner with an expiry
+- Reading records stored as bytes
+- Tolerating Redis failures on write
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.recipe_import import ImportStage
+from app.workers.progress import (
+    IMPORT_PROGRESS_TTL,
+    get_import_progress,
+    set_import_stage,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+class TestSetImportStage:
+    """Tests for set_import_stage."""
+
+    async def test_writes_stage_and_owner(self) -> None:
+        """Should store the stage and owner and refresh the expiry."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        redis = MagicMock()
+        redis.pipeline.return_value = pipe
+
+        await set_import_stage(redis, "job-1", ImportStage.QUEUED, user_id="user-1")
+
+        pipe.hset.assert_called_once_with(
+            "scraper:queue:import:job-1",
+            mapping={"stage": "queued", "user_id": "user-1"},
+        )
+        pipe.expire.assert_called_once_with(
+            "scraper:queue:import:job-1", IMPORT_PROGRESS_TTL
+        )
+
+    async def test_swallows_redis_errors(self) -> None:
+        """Should not fail the caller when Redis is unavailable."""
+        redis = MagicMock()
+        redis.pipeline.side_effect = ConnectionError("refused")
+
+        await set_import_stage(redis, "job-1", ImportStage.SCRAPING)
+
+
+class TestGetImportProgress:
+    """Tests for get_import_progress."""
+
+    async def test_reads_record(self) -> None:
+        """Should decode the stored stage and owner."""
+        redis = MagicMock()
+        redis.hgetall = AsyncMock(
+            return_value={b"stage": b"parsing", b"user_id": b"user-1"}
+        )
+
+        progress = await get_import_progress(redis, "job-1")
+
+        assert progress is not None
+        assert progress.stage is ImportStage.PARSING
+        assert progress.user_id == "user-1"
+
+    async def test_returns_none_when_missing(self) -> None:
+        """Should return None for unknown or expired jobs."""
+        redis = MagicMock()
+        redis.hgetall = AsyncMock(return_value={})
+
+        assert await get_import_progress(redis, "job-1") is None